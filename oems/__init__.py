@@ -0,0 +1,4 @@
+"""
+Shared tooling for the OEM dealer collectors.
+Common paths, record helpers and analytics used across the per-OEM scripts.
+"""
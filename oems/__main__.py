@@ -0,0 +1,5 @@
+import sys
+
+from oems.cli import main
+
+sys.exit(main())
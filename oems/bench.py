@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Offline parser benchmarks over frozen fixtures.
+Runs each HTML/snapshot parser against a recorded page (hyundai.txt,
+bentley.txt, infiniti_page_source.html, ...) and reports throughput, peak
+memory and output record counts. Results are compared with a stored baseline
+and the run fails on a slowdown, a memory increase or changed output, so
+parser speedups are measurable and regressions are caught. A case that is
+skipped (a missing parser dependency) or has no baseline entry also fails the
+run, unless --allow-missing says a partial comparison is fine.
+
+Usage:
+    python -m oems bench                    # compare against the baseline
+    python -m oems bench --update-baseline  # record a new baseline
+    python -m oems bench hyundai bentley -n 10
+    python -m oems bench --allow-missing    # compare whatever can run here
+"""
+
+import argparse
+import ast
+import contextlib
+import gc
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from oems.dealers import REPO_ROOT
+from oems.profiling import Profiler, parse_modes
+
+logger = logging.getLogger(__name__)
+
+BASELINE_FILE = REPO_ROOT / "utils" / "config" / "parser_baseline.json"
+DEFAULT_REPEAT = 5
+# Allowed slowdown and memory growth over the baseline before a case fails
+DEFAULT_TIME_TOLERANCE = 0.25
+DEFAULT_MEMORY_TOLERANCE = 0.10
+# Differences below this are timer noise, whatever the ratio
+MIN_TIME_DELTA = 0.002
+
+
+class ParserCase:
+    """One parser run over one fixture"""
+
+    def __init__(self, name: str, script: Optional[str], fixture: Optional[str], run: Callable):
+        self.name = name
+        self.script = script
+        self.fixture = fixture
+        self.run = run
+
+    @property
+    def script_path(self) -> Optional[Path]:
+        return REPO_ROOT / self.script if self.script else None
+
+    @property
+    def fixture_path(self) -> Optional[Path]:
+        return REPO_ROOT / self.fixture if self.fixture else None
+
+
+def _embedded_html(script: Path, function: str = "main", variable: str = "html_content") -> str:
+    """The HTML literal a script's function assigns to a variable (its built-in sample page)"""
+    tree = ast.parse(script.read_text(encoding="utf-8"))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef) and node.name == function:
+            for stmt in ast.walk(node):
+                if (isinstance(stmt, ast.Assign) and isinstance(stmt.value, ast.Constant)
+                        and any(isinstance(t, ast.Name) and t.id == variable for t in stmt.targets)):
+                    return stmt.value.value
+    raise ValueError(f"No {variable} literal in {script.name}:{function}")
+
+
+def _run_genesis(module, html: str, path: Path) -> List[Dict]:
+    parser = module.GenesisComprehensiveParser()
+    parser.parse_html(html)
+    return parser.dealerships
+
+
+def _run_soup(module, html: str, path: Path) -> List[Dict]:
+    # Reference cost of the bare html.parser tree build the other parsers all pay
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+    return [{"tag": tag.name} for tag in soup.find_all(True)]
+
+
+CASES = [
+    ParserCase("hyundai", "scripts/hyundai_final_parser.py", "hyundai.txt",
+               lambda m, html, path: m.parse_hyundai_html_final(str(path))),
+    ParserCase("hyundai_clean", "scripts/hyundai_clean_parser.py", "hyundai.txt",
+               lambda m, html, path: m.parse_hyundai_html_clean(str(path))),
+    # Its raw entries: the fixture has no 'complete_dealer' entries, so the cleaned list is always empty
+    ParserCase("hyundai_html", "scripts/hyundai_html_parser.py", "hyundai.txt",
+               lambda m, html, path: m.parse_hyundai_html(str(path))),
+    ParserCase("genesis", "scripts/genesis_comprehensive_parser.py", "scripts/genesis_comprehensive_parser.py",
+               _run_genesis),
+    ParserCase("bentley", "scripts/extract_bentley_dealers.py", "bentley.txt",
+               lambda m, html, path: m.extract_dealer_info(html)),
+    ParserCase("infiniti_soup", None, "infiniti_page_source.html", _run_soup),
+    ParserCase("tesla", "tesla_browser_scraper.py", None,
+               lambda m, html, path: m.parse_tesla_dealerships_from_browser_data()),
+]
+
+
+def _load_script(path: Path):
+    """Import a collector script as a module without running its main()"""
+    spec = importlib.util.spec_from_file_location(f"_bench_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _fixture_text(case: ParserCase) -> str:
+    if case.fixture_path is None:
+        return ""
+    if case.fixture_path.suffix == ".py":
+        return _embedded_html(case.fixture_path)
+    return case.fixture_path.read_text(encoding="utf-8")
+
+
+def _digest(records: List[Dict]) -> str:
+    return hashlib.sha1(json.dumps(records, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+def run_case(case: ParserCase, repeat: int = DEFAULT_REPEAT, profiler: Optional[Profiler] = None) -> Dict:
+    """Benchmark one case: best-of-N wall time, then one traced run for peak memory,
+    then (with a profiler) one profiled run recorded as a stage named after the case"""
+    html = _fixture_text(case)
+    size = len(html.encode("utf-8"))
+
+    # Parsers print progress; keep it out of the timings and the terminal
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        try:
+            module = _load_script(case.script_path) if case.script_path else None
+            records = case.run(module, html, case.fixture_path)
+        except ImportError as e:
+            return {"name": case.name, "skipped": f"missing dependency: {e.name or e}"}
+        times = []
+        # As timeit does: a collection pass landing in one run is noise, not parser cost
+        enabled = gc.isenabled()
+        try:
+            for _ in range(repeat):
+                gc.collect()
+                gc.disable()
+                start = time.perf_counter()
+                case.run(module, html, case.fixture_path)
+                times.append(time.perf_counter() - start)
+                gc.enable()
+        finally:
+            if enabled:
+                gc.enable()
+            else:
+                gc.disable()
+
+        tracemalloc.start()
+        try:
+            case.run(module, html, case.fixture_path)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        if profiler:
+            profiler.start()
+            try:
+                with profiler.stage(case.name):
+                    case.run(module, html, case.fixture_path)
+            finally:
+                profiler.stop()
+
+    best = min(times)
+    return {
+        "name": case.name,
+        "fixture": case.fixture,
+        "fixture_bytes": size,
+        "records": len(records),
+        "digest": _digest(records),
+        "best_seconds": round(best, 6),
+        "mean_seconds": round(sum(times) / len(times), 6),
+        "mb_per_second": round(size / best / 1e6, 3) if size and best else None,
+        "records_per_second": round(len(records) / best, 1) if best else None,
+        "peak_memory_bytes": peak,
+    }
+
+
+def compare(result: Dict, baseline: Optional[Dict], time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+            memory_tolerance: float = DEFAULT_MEMORY_TOLERANCE) -> List[str]:
+    """Regressions of one result against its baseline entry (empty if none or no baseline)"""
+    if baseline is None or "skipped" in result or "skipped" in baseline:
+        return []
+    problems = []
+    if result["records"] != baseline["records"]:
+        problems.append(f"records {baseline['records']} -> {result['records']}")
+    elif result["digest"] != baseline["digest"]:
+        problems.append("output changed with the same record count")
+    slower = result["best_seconds"] - baseline["best_seconds"]
+    if slower > MIN_TIME_DELTA and result["best_seconds"] > baseline["best_seconds"] * (1 + time_tolerance):
+        problems.append(f"time {baseline['best_seconds'] * 1000:.1f}ms -> {result['best_seconds'] * 1000:.1f}ms")
+    if result["peak_memory_bytes"] > baseline["peak_memory_bytes"] * (1 + memory_tolerance):
+        problems.append(f"peak memory {baseline['peak_memory_bytes'] / 1e3:.0f}KB -> "
+                        f"{result['peak_memory_bytes'] / 1e3:.0f}KB")
+    return problems
+
+
+def load_baseline(path: Path) -> Dict[str, Dict]:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("cases", {})
+
+
+def save_baseline(path: Path, results: List[Dict]):
+    """Store results over the existing baseline; cases skipped or not run keep their previous entry"""
+    cases = load_baseline(path)
+    cases.update((r["name"], r) for r in results if "skipped" not in r)
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "cases": cases,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="oems bench", description="Benchmark the HTML parsers over frozen fixtures")
+    parser.add_argument("cases", nargs="*", help=f"Only these cases ({', '.join(c.name for c in CASES)})")
+    parser.add_argument("-n", "--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per case (best is kept)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--allow-missing", action="store_true",
+                        help="Pass even if the baseline is missing, a case is skipped or has no baseline entry")
+    parser.add_argument("--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE,
+                        help="Allowed slowdown before failing (0.25 = 25%%)")
+    parser.add_argument("--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE,
+                        help="Allowed peak-memory growth before failing")
+    parser.add_argument("--json", type=Path, default=None, help="Also write the results here")
+    parser.add_argument("--profile", default=None, metavar="MODES",
+                        help="Also profile each case (cpu, memory or both); written next to --json")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    unknown = set(args.cases) - {c.name for c in CASES}
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+    cases = [c for c in CASES if not args.cases or c.name in args.cases]
+    profiler = None
+    if args.profile:
+        try:
+            modes = parse_modes(args.profile)
+        except ValueError as e:
+            parser.error(str(e))
+        profiler = Profiler(modes, args.json.with_suffix("") if args.json else Path("parser_bench"))
+    baseline = {} if args.update_baseline else load_baseline(args.baseline)
+
+    results, failed, missing = [], 0, []
+    print(f"{'case':<15} {'records':>7} {'best ms':>9} {'MB/s':>7} {'rec/s':>9} {'peak MB':>8}  status")
+    for case in cases:
+        result = run_case(case, args.repeat, profiler)
+        results.append(result)
+        if "skipped" in result:
+            print(f"{case.name:<15} {'-':>7} {'-':>9} {'-':>7} {'-':>9} {'-':>8}  ⏭️  {result['skipped']}")
+            missing.append(case.name)
+            continue
+        if case.name not in baseline and not args.update_baseline:
+            missing.append(case.name)
+        problems = compare(result, baseline.get(case.name), args.time_tolerance, args.memory_tolerance)
+        failed += bool(problems)
+        status = "❌ " + "; ".join(problems) if problems else ("✅" if case.name in baseline else "new")
+        print(f"{case.name:<15} {result['records']:>7} {result['best_seconds'] * 1000:>9.1f} "
+              f"{result['mb_per_second'] or 0:>7.2f} {result['records_per_second'] or 0:>9.0f} "
+              f"{result['peak_memory_bytes'] / 1e6:>8.1f}  {status}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if profiler:
+        print(f"\n📈 Profile saved to: {profiler.write()}")
+    if args.update_baseline:
+        save_baseline(args.baseline, results)
+        print(f"\n📌 Baseline saved to: {args.baseline}")
+    elif not baseline:
+        print(f"\nNo baseline at {args.baseline}; record one with --update-baseline")
+    if missing:
+        print(f"\n⚠️  Not compared: {', '.join(missing)}" + (" (allowed)" if args.allow_missing else
+                                                            "; pass --allow-missing to accept a partial run"))
+    return 1 if failed or (missing and not args.allow_missing) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Command-line entry point for the OEM collectors.
+
+Usage:
+    python -m oems list
+    python -m oems crawl                    # every OEM in utils/config/OEMs.txt
+    python -m oems crawl Toyota Subaru -j 4 --per-host 1
+    python -m oems crawl --dashboard        # live per-OEM progress while crawling
+    python -m oems crawl --pretty           # indented output files (default compact)
+    python -m oems status --watch           # the same view from another terminal
+    python -m oems coverage --radii 10,25,50
+    python -m oems refresh --record && python -m oems crawl --due-only
+    python -m oems bench
+    python -m oems validate data --repair
+    python -m oems queue work sqlite:///toyota.db --out queue-results
+    python -m oems loadtest -c 16 --rate-limit 40 --error-rate 0.02
+
+Heavy modules (asyncio scheduler, numpy, collector dependencies) are imported
+inside the subcommand that needs them so `list` starts instantly.
+"""
+
+import argparse
+import logging
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from oems import registry
+from oems.dealers import DATA_DIR, OEMS_FILE, ZIP_CODES_FILE
+
+logger = logging.getLogger(__name__)
+
+PASSTHROUGH_COMMANDS = ("coverage", "bench", "mock", "loadtest", "validate")
+
+
+def _load_strategies():
+    # Importing the collectors package populates the registry
+    import oems.collectors  # noqa: F401
+
+
+def cmd_list(args) -> int:
+    _load_strategies()
+    strategies, unmatched = registry.resolve_config(args.config)
+    for s in strategies:
+        missing = s.missing_requirements()
+        deps = ",".join(s.requires) + (f" (missing: {','.join(missing)})" if missing else "")
+        print(f"{s.name:<14} {s.kind:<10} {s.api_host:<40} {s.entry:<50} {deps}")
+    for url in unmatched:
+        print(f"{'-':<14} {'none':<10} {url}")
+    print(f"\n{len(strategies)} OEMs with a strategy, {len(unmatched)} URLs without one")
+    return 0
+
+
+def cmd_crawl(args) -> int:
+    _load_strategies()
+    strategies, unmatched = registry.resolve_config(args.config)
+    if args.oems:
+        wanted = [registry.get(name) for name in args.oems]
+        strategies = [s for s in strategies if s in wanted] + [s for s in wanted if s not in strategies]
+    elif unmatched:
+        logger.warning(f"{len(unmatched)} URLs in {args.config} have no strategy yet (see `oems list`)")
+
+    plans = {}
+    if args.due_only:
+        from oems.refresh import REFRESH_ENV, RefreshPlanner, output_oems, write_plans
+        planner = RefreshPlanner(args.state_file)
+        outputs = {s.name: output_oems(s.output) for s in strategies}
+        plans = {s.name: planner.plan_many(s.name, outputs[s.name]) for s in strategies}
+        due = [s for s in strategies if plans[s.name].is_due()]
+        logger.info(f"{len(due)}/{len(strategies)} OEMs are due for a refresh")
+        strategies = due
+        # Collectors look their plan up under the names in their output files
+        by_output = {oem: plans[s.name] for s in due for oem in outputs[s.name] if oem}
+        os.environ[REFRESH_ENV] = str(write_plans(by_output, args.log_dir / "refresh_plans.json").resolve())
+
+    runnable = []
+    for s in strategies:
+        missing = s.missing_requirements()
+        if missing:
+            logger.error(f"Skipping {s.name}: missing {', '.join(missing)}")
+        else:
+            runnable.append(s)
+    skipped = len(strategies) - len(runnable)
+    strategies = runnable
+
+    if args.dry_run:
+        for s in strategies:
+            plan = plans.get(s.name)
+            scope = "" if not plan or plan.full_refresh else (
+                f", {len(plan.hot_regions)} hot regions, spot-check {plan.spot_check_rate:.0%} of the rest")
+            print(f"would crawl {s.name} ({s.kind}) -> {s.output}{scope}")
+        return 0
+
+    import asyncio
+    import json
+    from oems import profiling, serialize
+    from oems.scheduler import CrawlScheduler
+
+    # Collectors pick the output format up from the environment they inherit
+    if args.pretty:
+        os.environ[serialize.MODE_ENV] = serialize.PRETTY
+    if args.compress:
+        os.environ[serialize.COMPRESSION_ENV] = args.compress
+
+    profiler = profile_prefix = None
+    try:
+        modes = profiling.parse_modes(args.profile) if args.profile else []
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if modes:
+        # Profiles go next to the run report: run.profile.json, run.<oem>.profile.json, ...
+        profile_prefix = args.report.with_suffix("") if args.report else args.log_dir / "crawl"
+        profiler = profiling.Profiler(modes, profile_prefix)
+        profiling.activate(profiler)
+
+    scheduler = CrawlScheduler(args.jobs, args.per_host, args.log_dir, args.timeout, modes, profile_prefix)
+    dashboard = stop_dashboard = None
+    if args.dashboard:
+        import threading
+        from oems.progress import show
+        # Log lines would scroll the dashboard away; keep only warnings and errors
+        logging.getLogger().setLevel(logging.WARNING)
+        stop_dashboard = threading.Event()
+        status_files = scheduler.status_files(strategies)
+        dashboard = threading.Thread(target=show, args=(lambda: status_files, True, 1.0, stop_dashboard), daemon=True)
+        dashboard.start()
+    try:
+        with profiling.stage("crawl"):
+            results = asyncio.run(scheduler.run(strategies))
+    finally:
+        if dashboard:
+            stop_dashboard.set()
+            dashboard.join()
+            from oems.progress import load_statuses, render
+            print("\x1b[H\x1b[2J" + render(load_statuses(status_files)))
+    if profiler:
+        profiling.activate(None)
+        print(f"📈 Profile saved to: {profiler.write()}")
+
+    failed = [r for r in results if not r.ok]
+    print(f"\n🎉 Crawl complete: {len(results) - len(failed)}/{len(results)} OEMs succeeded")
+    for r in failed:
+        print(f"  ❌ {r.strategy.name}: exit {r.returncode}" + (f" (see {r.log_file})" if r.log_file else ""))
+
+    telemetry = scheduler.telemetry
+    for oem, row in telemetry.summary("oem").items():
+        print(f"  📈 {oem}: {row['requests']} requests in {row['seconds']:.1f}s, {row['new_dealers']} new dealers, "
+              f"{row['wasted']} wasted, {row['errors']} errors, {row['retries']} retries")
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump({"oems": [r.to_dict() for r in results], "telemetry": telemetry.to_dict()}, f, indent=2)
+        print(f"📋 Run report saved to: {args.report}")
+    if args.metrics:
+        telemetry.write_prometheus(args.metrics)
+        print(f"📊 Prometheus metrics saved to: {args.metrics}")
+    return 1 if failed or skipped else 0
+
+
+def cmd_status(args) -> int:
+    from oems.progress import show
+    try:
+        show(lambda: sorted(args.log_dir.glob("*.status.json")), args.watch, args.interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_refresh(args) -> int:
+    from oems.refresh import RefreshPlanner, record_outputs
+    planner = RefreshPlanner(args.state_file)
+    if args.record:
+        counts = record_outputs(planner, args.data_dir)
+        planner.save()
+        print(f"📸 Recorded snapshots for {len(counts)} OEMs in {args.state_file}")
+
+    for oem in sorted(planner.state["oems"]):
+        plan = planner.plan(oem)
+        status = "DUE" if plan.is_due() else f"in {(plan.due_at - datetime.now()).days}d"
+        if plan.full_refresh:
+            print(f"{oem:<14} {status:<8} full refresh (no churn history yet)")
+        else:
+            print(f"{oem:<14} {status:<8} every {plan.interval_days:.1f}d, "
+                  f"{len(plan.hot_regions)} hot regions, spot-check {plan.spot_check_rate:.0%} of "
+                  f"{len(plan.quiet_regions)} quiet ones")
+            if args.verbose and plan.hot_regions:
+                print(f"{'':<23} hot: {', '.join(plan.hot_regions)}")
+    return 0
+
+
+def cmd_queue(args) -> int:
+    from oems.workqueue import open_queue, run_worker, zip_query_handler
+    queue = open_queue(args.url)
+    if args.action == "seed":
+        from oems.dealers import load_zip_codes
+        zips = load_zip_codes(args.zips)[:args.limit] if args.limit else load_zip_codes(args.zips)
+        count = queue.put_many({"oem": args.oem, "zip": z} for z in zips)
+        print(f"📥 Queued {count} {args.oem} ZIP units in {args.url}")
+    elif args.action == "dead":
+        letters = queue.dead_letters()
+        for letter in letters:
+            print(f"{letter['id']}: {letter['payload']} after {letter['attempts']} attempts: {letter['error']}")
+        if args.requeue:
+            print(f"♻️  Requeued {queue.requeue_dead()} dead-lettered units")
+    elif args.action == "work":
+        counts = run_worker(queue, zip_query_handler(args.out, args.base_url), batch_size=args.batch,
+                            exit_when_idle=not args.wait)
+        print(f"🧺 {counts['acked']} units done, {counts['failed']} failed, {counts['lost']} lost leases; "
+              f"dealers in {args.out}")
+    stats = queue.stats()
+    print(" ".join(f"{state}={count}" for state, count in stats.items()))
+    return 0
+
+
+def cmd_coverage(args) -> int:
+    from oems import coverage
+    return coverage.main(args.passthrough_args)
+
+
+def cmd_bench(args) -> int:
+    from oems import bench
+    return bench.main(args.passthrough_args)
+
+
+def cmd_mock(args) -> int:
+    from oems import mockserver
+    mockserver.main(args.passthrough_args)
+    return 0
+
+
+def cmd_loadtest(args) -> int:
+    from oems import loadtest
+    return loadtest.main(args.passthrough_args)
+
+
+def cmd_validate(args) -> int:
+    from oems import validate
+    return validate.main(args.passthrough_args)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="oems", description="OEM dealer collection tools")
+    parser.add_argument("--config", type=Path, default=OEMS_FILE, help="OEM locator list (default: utils/config/OEMs.txt)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("list", help="Show the registered strategy for every OEM in the config")
+    p.set_defaults(func=cmd_list)
+
+    p = sub.add_parser("crawl", help="Crawl OEMs concurrently")
+    p.add_argument("oems", nargs="*", help="Only crawl these OEMs (default: all in the config)")
+    p.add_argument("-j", "--jobs", type=int, default=8, help="Max OEMs crawled at once")
+    p.add_argument("--per-host", type=int, default=1, help="Max concurrent crawls per API host")
+    p.add_argument("--timeout", type=float, default=None, help="Per-OEM timeout in seconds")
+    p.add_argument("--log-dir", type=Path, default=Path("logs"), help="Per-OEM collector output")
+    p.add_argument("--report", type=Path, default=None, help="Write a JSON run report (results and telemetry) here")
+    p.add_argument("--metrics", type=Path, default=None, help="Write request telemetry as a Prometheus text file here")
+    p.add_argument("--profile", default=None, metavar="MODES",
+                   help="Profile the run: comma-separated cpu, memory, lag (or all); written next to --report")
+    p.add_argument("--dry-run", action="store_true", help="Print the plan without crawling")
+    p.add_argument("--due-only", action="store_true", help="Only crawl OEMs the refresh planner says are due")
+    p.add_argument("--state-file", type=Path, default=DATA_DIR / ".refresh_state.json")
+    p.add_argument("--dashboard", action="store_true", help="Show live per-OEM progress instead of log lines")
+    p.add_argument("--pretty", action="store_true", help="Write indented output files for review (default compact)")
+    p.add_argument("--compress", choices=["gzip", "zstd"], default=None, help="Compress output files (.gz/.zst)")
+    p.set_defaults(func=cmd_crawl)
+
+    p = sub.add_parser("status", help="Show live crawl progress from the collectors' status files")
+    p.add_argument("--log-dir", type=Path, default=Path("logs"), help="Where the crawl writes <oem>.status.json")
+    p.add_argument("-w", "--watch", action="store_true", help="Redraw until interrupted")
+    p.add_argument("--interval", type=float, default=2.0, help="Seconds between redraws with --watch")
+    p.set_defaults(func=cmd_status)
+
+    p = sub.add_parser("refresh", help="Record output snapshots and show change-rate-based refresh plans")
+    p.add_argument("--record", action="store_true", help="Snapshot the current outputs before planning")
+    p.add_argument("--data-dir", type=Path, default=DATA_DIR)
+    p.add_argument("--state-file", type=Path, default=DATA_DIR / ".refresh_state.json")
+    p.add_argument("-v", "--verbose", action="store_true", help="List hot regions")
+    p.set_defaults(func=cmd_refresh)
+
+    p = sub.add_parser("queue", help="Seed, work and inspect a distributed work queue")
+    p.add_argument("action", choices=["seed", "work", "stats", "dead"])
+    p.add_argument("url", help="sqlite:///queue.db or file:////shared/dir")
+    p.add_argument("--oem", help="OEM name stored in each seeded unit")
+    p.add_argument("--zips", type=Path, default=ZIP_CODES_FILE, help="ZIP list to seed from")
+    p.add_argument("--limit", type=int, default=None, help="Only seed the first N ZIPs")
+    p.add_argument("--requeue", action="store_true", help="With 'dead': put dead letters back on the queue")
+    p.add_argument("--out", type=Path, default=Path("queue-results"), help="With 'work': where <oem>/<zip>.json go")
+    p.add_argument("--base-url", default=None, help="With 'work': send the ZIP queries here (e.g. `oems mock`)")
+    p.add_argument("--batch", type=int, default=1, help="With 'work': units leased at a time")
+    p.add_argument("--wait", action="store_true", help="With 'work': keep polling once the queue is empty")
+    p.set_defaults(func=cmd_queue)
+
+    # Options after these commands are passed straight through to their modules
+    p = sub.add_parser("coverage", help="Per-ZIP dealer coverage grid", add_help=False)
+    p.set_defaults(func=cmd_coverage)
+    p = sub.add_parser("bench", help="Benchmark the HTML parsers against a stored baseline", add_help=False)
+    p.set_defaults(func=cmd_bench)
+    p = sub.add_parser("mock", help="Serve mocked OEM dealer APIs locally", add_help=False)
+    p.set_defaults(func=cmd_mock)
+    p = sub.add_parser("loadtest", help="Benchmark the collectors against the mock APIs", add_help=False)
+    p.set_defaults(func=cmd_loadtest)
+    p = sub.add_parser("validate", help="Validate output files against the dealer schema and repair truncation",
+                       add_help=False)
+    p.set_defaults(func=cmd_validate)
+    return parser
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args, rest = parser.parse_known_args(argv)
+    if args.command in PASSTHROUGH_COMMANDS:
+        args.passthrough_args = rest
+    elif rest:
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    try:
+        return args.func(args)
+    except KeyError as e:
+        print(f"Error: {e.args[0]}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Strategy table for every OEM we can collect.
+Entries are strings only: script entries run from the repo root so their
+relative output paths land in the usual place, and module:callable entries
+are imported on first use. Keep this file free of collector imports.
+"""
+
+from oems.registry import BROWSER, BULK_API, ZIP_SWEEP, register
+
+register("Acura", ZIP_SWEEP, ["www.acura.com"], "www.acura.com",
+         entry="oems.collectors.honda:collect_acura", output="data/mainstream/acura.json",
+         requires=["aiohttp"])
+register("BMW", BULK_API, ["www.bmwusa.com", "www.miniusa.com"], "www.bmwusa.com",
+         entry="oems.collectors.bmw:collect", output="data/luxury/{bmw,mini}.json",
+         requires=["aiohttp"])
+register("Exotic", BULK_API,
+         ["www.bentleymotors.com", "www.astonmartin.com", "www.ferrari.com", "retailers.mclaren.com",
+          "www.porsche.com", "www.pagani.com"], "resources-nav.porsche.services",
+         entry="oems.collectors.exotic:collect",
+         output="data/exotic/{ferrari,mclaren,pagani}.json, data/luxury/{bentley,aston-martin,porsche}.json",
+         requires=["aiohttp"])
+register("Ford", ZIP_SWEEP, ["www.ford.com", "www.lincoln.com"], "www.ford.com",
+         entry="oems.collectors.ford:collect", output="data/mainstream/ford.json, data/luxury/lincoln.json",
+         requires=["aiohttp"])
+register("GM", ZIP_SWEEP, ["www.chevrolet.com", "www.buick.com", "www.gmc.com", "www.cadillac.com"],
+         "www.chevrolet.com",
+         entry="oems.collectors.gm:collect",
+         output="data/gmc.json, data/mainstream/{chevrolet,buick}.json, data/luxury/cadillac.json",
+         requires=["aiohttp", "playwright"])
+register("HMG", ZIP_SWEEP, ["www.hyundaiusa.com", "www.genesis.com", "www.kia.com"], "www.hyundaiusa.com",
+         entry="oems.collectors.hmg:collect",
+         output="data/mainstream/{hyundai,kia}.json, data/luxury/genesis.json",
+         requires=["aiohttp"])
+register("Honda", ZIP_SWEEP, ["automobiles.honda.com"], "automobiles.honda.com",
+         entry="oems.collectors.honda:collect_honda", output="data/honda.json",
+         requires=["aiohttp"])
+register("INFINITI", BULK_API, ["www.infinitiusa.com"], "graphql.nissanusa.com",
+         entry="oems.collectors.nissan:collect_infiniti", output="data/luxury/infiniti.json",
+         requires=["aiohttp"])
+register("JLR", ZIP_SWEEP, ["www.jaguarusa.com", "www.landroverusa.com"], "retailerlocator.jaguarlandrover.com",
+         entry="oems.collectors.jlr:collect", output="data/luxury/{jaguar,land-rover}.json",
+         requires=["aiohttp"])
+register("Lexus", BROWSER, ["www.lexus.com"], "www.lexus.com",
+         entry="scripts/lexus_scraper.py", output="Lexus.json",
+         requires=["playwright"])
+register("Mitsubishi", ZIP_SWEEP, ["www.mitsubishicars.com"], "www-graphql.prod.mipulse.co",
+         entry="oems.collectors.mitsubishi:collect", output="data/mainstream/mitsubishi.json",
+         requires=["aiohttp"])
+register("Nissan", BULK_API, ["www.nissanusa.com"], "graphql.nissanusa.com",
+         entry="oems.collectors.nissan:collect_nissan", output="data/nissan.json",
+         requires=["aiohttp", "playwright"])
+register("Stellantis", ZIP_SWEEP,
+         ["www.jeep.com", "www.chrysler.com", "www.dodge.com", "www.ramtrucks.com", "www.alfaromeousa.com",
+          "www.fiatusa.com"], "www.jeep.com",
+         entry="oems.collectors.stellantis:collect",
+         output="data/{jeep,FIAT}.json, data/mainstream/{chrysler,dodge,ram}.json, data/luxury/alfa-romeo.json",
+         requires=["aiohttp"])
+register("Subaru", ZIP_SWEEP, ["www.subaru.com"], "www.subaru.com",
+         entry="subaru_comprehensive_scraper.py", output="subaru_comprehensive.json",
+         requires=["requests"])
+register("Tesla", BULK_API, ["www.tesla.com"], "www.tesla.com",
+         entry="tesla_scraper.py", output="tesla_dealerships_usa.json",
+         requires=["requests", "bs4"])
+register("Toyota", ZIP_SWEEP, ["www.toyota.com"], "dealers.prod.webservices.toyota.com",
+         entry="scripts/collect_all_toyota_dealers.py", output="data/toyota_comprehensive.json",
+         requires=["requests"])
+register("Volkswagen", ZIP_SWEEP, ["www.vw.com"], "v3-35-3.ds.dcc.feature-app.io",
+         entry="oems.collectors.volkswagen:collect", output="data/mainstream/volkswagen.json",
+         requires=["aiohttp", "playwright"])
@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+Shared plumbing for the API collectors in this package.
+A sweep gets one aiohttp session (a single bounded connection pool); JSON
+requests are retried with jittered exponential backoff on 429/5xx and network
+errors, honouring Retry-After, and every attempt is recorded in telemetry.
+With cache=True identical requests are sent once: concurrent duplicates wait
+for the first, and later ones reuse its decoded body. APIs that only answer
+the site's own app take auth=TokenSession(...): its captured headers and
+cookies go on every request and are re-captured when they expire or the API
+answers 401/403 (see oems.collectors.auth for capturing them in a browser).
+Query points are fanned out under the same concurrency limit with progress
+reported per point. Also here: the planned ZIP grid (and its coordinates, for
+locators searched by latitude/longitude), the standard output envelope the
+collectors write, which refuses to replace a previous file with the result
+of a run that collected nothing or had most of its queries fail, and the
+command-line scaffolding the collectors' mains share.
+
+    async with APIClient("Ford", headers={"Referer": ...}) as client:
+        async def visit(zip_code):
+            body = await client.get_json(url, params={...}, query=zip_code, results=extract)
+        await client.sweep(zip3_points(load_zip_codes()), visit)
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import math
+import random
+import time
+from collections import Counter
+from pathlib import Path
+from typing import (Any, Awaitable, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence,
+                    Tuple, Union)
+
+import aiohttp
+import numpy as np
+
+from oems.coverage import haversine_miles
+from oems.dealers import (ZIP_CENTROIDS_FILE, approximate_zip_point, dealer_key, dealer_state,
+                          load_zip_centroids, prefix_centroids)
+from oems.profiling import stage
+from oems.progress import get_progress
+from oems.refresh import carry_quiet
+from oems.serialize import stream_dealers
+from oems.telemetry import get_telemetry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 1.0
+DEFAULT_TIMEOUT = 30.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Answers that mean the credentials were rejected rather than the request
+AUTH_STATUSES = (401, 403)
+# Credentials without an expiry of their own are re-captured after this long
+DEFAULT_CREDENTIALS_TTL = 1800.0
+# Re-capture this long before the expiry so requests in flight do not race it
+EXPIRY_MARGIN = 30.0
+EARTH_RADIUS_MILES = 3958.8
+# Grid gaps are closed with this much of the search radius to spare: a dealer is not at its ZIP's centroid
+COVER_MARGIN_MILES = 10.0
+# ZIPs per block of the distance matrix when checking grid coverage
+COVER_CHUNK = 4096
+# A run with more than this share of its queries failed is partial: its output is not written
+MAX_FAILED_SHARE = 0.5
+# Runs of fewer requests are a few bulk or probe calls, each answer complete on its own, so their
+# failed share is not judged (no dealers at all still is)
+MIN_JUDGED_REQUESTS = 10
+USER_AGENT = ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36")
+
+
+def zip3_points(zip_codes: Iterable[str]) -> List[str]:
+    """One ZIP per 3-digit prefix: enough query points for locators searched at ~100 miles"""
+    points = {}
+    for zip_code in zip_codes:
+        points.setdefault(zip_code[:3], zip_code)
+    return list(points.values())
+
+
+def locate_points(zip_codes: Iterable[str]) -> List[Tuple[str, Tuple[float, float]]]:
+    """(ZIP, (latitude, longitude)) for locators searched by coordinates: the ZIP's centroid, or its
+    3-digit prefix's for a ZIP the centroid file lacks. The few points only a state-center
+    approximation can place are warned about; ZIPs that cannot be placed at all are dropped."""
+    if ZIP_CENTROIDS_FILE.exists():
+        centroids = load_zip_centroids(ZIP_CENTROIDS_FILE)
+    else:
+        logger.warning(f"No ZIP centroid file at {ZIP_CENTROIDS_FILE}; every query point is approximate. "
+                       f"Restore it or run scripts/utilities/fetch_us_zipcodes.py")
+        centroids = {}
+    prefixes = prefix_centroids(centroids)
+    located, approximate = [], []
+    for zip_code in zip_codes:
+        point = centroids.get(zip_code) or prefixes.get(zip_code[:3])
+        if point is None:
+            point = approximate_zip_point(zip_code)
+            if point is not None:
+                approximate.append(zip_code)
+        if point is not None:
+            located.append((zip_code, point))
+    if approximate:
+        logger.warning(f"{len(approximate)} of {len(located)} ZIPs have no centroid and are placed "
+                       f"approximately, e.g. {', '.join(approximate[:5])}")
+    return located
+
+
+def miles(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+    """Great-circle distance between two (latitude, longitude) points"""
+    lat1, lng1, lat2, lng2 = map(math.radians, (*a, *b))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(min(h, 1.0)))
+
+
+def spread_points(located: Sequence[Tuple[str, Tuple[float, float]]],
+                  spacing_miles: float) -> List[Tuple[str, Tuple[float, float]]]:
+    """Thin located points so no two kept points are within spacing_miles, for locators
+    whose search radius is far wider than the ZIP grid"""
+    kept = []
+    for zip_code, point in located:
+        if all(miles(point, other) >= spacing_miles for _, other in kept):
+            kept.append((zip_code, point))
+    return kept
+
+
+def fill_gaps(points: Sequence[str], zip_codes: Iterable[str], radius_miles: float,
+              margin_miles: float = COVER_MARGIN_MILES) -> List[str]:
+    """The ZIP query points plus the ZIPs needed for every located ZIP to lie within radius_miles
+    (less margin_miles) of one. One ZIP per 3-digit prefix leaves holes where prefixes are large
+    and sparse (Alaska, Nevada, west Texas, Hawaii, Guam); the points closing them are picked greedily."""
+    located = locate_points(zip_codes)
+    where = dict(located)
+    centers = np.array([where[p] for p in points if p in where], dtype=np.float64).reshape(-1, 2)
+    reach = radius_miles - margin_miles
+    if not located or reach <= 0:
+        return list(points)
+    coords = np.array([point for _, point in located], dtype=np.float64)
+    nearest = np.full(len(located), np.inf)
+    if len(centers):
+        for start in range(0, len(located), COVER_CHUNK):
+            block = coords[start:start + COVER_CHUNK]
+            nearest[start:start + COVER_CHUNK] = haversine_miles(block[:, 0], block[:, 1], centers[:, 0],
+                                                                 centers[:, 1]).min(axis=1)
+    added: List[Tuple[str, Tuple[float, float]]] = []
+    for i in np.flatnonzero(nearest > reach):
+        zip_code, point = located[i]
+        if all(miles(point, other) > reach for _, other in added):
+            added.append((zip_code, point))
+    if added:
+        logger.info(f"Adding {len(added)} query points where the grid leaves ZIPs beyond {reach:.0f} miles")
+    return list(points) + [zip_code for zip_code, _ in added]
+
+
+class CollectionFailed(RuntimeError):
+    """A run whose output must not replace the previous file: it collected nothing, or most of
+    its queries failed"""
+
+
+def write_dealers(oem: str, dealers: List[Dict], path: Path, method: str, failed_share: float = 0.0) -> Path:
+    """Write dealers in the standard envelope, sorted by state, city and name. With no dealers, or
+    more than MAX_FAILED_SHARE of the run's queries failed, the previous file is kept and
+    CollectionFailed raised instead. Under a refresh plan the previous file's dealers in quiet
+    regions the sweep only spot-checked are kept."""
+    if not dealers:
+        logger.error(f"{oem}: no dealers collected; keeping {path}")
+        raise CollectionFailed(f"{oem}: no dealers collected; previous output kept")
+    if failed_share > MAX_FAILED_SHARE:
+        logger.error(f"{oem}: {failed_share:.0%} of queries failed, {len(dealers)} dealers; keeping {path}")
+        raise CollectionFailed(f"{oem}: {failed_share:.0%} of queries failed; previous output kept")
+    dealers = sorted(carry_quiet(oem, dealers, path),
+                     key=lambda d: (d.get("State") or "", d.get("City") or "", d.get("Dealer") or ""))
+    envelope = {"oem": oem, "zip_code": "multiple", "total_dealers_found": len(dealers), "method": method}
+    with stream_dealers(path, envelope) as out:
+        for dealer in dealers:
+            out.write(dealer)
+    logger.info(f"{oem}: {len(dealers)} dealers -> {out.path}")
+    return out.path
+
+
+def pick_brands(requested: Iterable[str], table: Mapping[str, Any], noun: str = "brands") -> List[str]:
+    """The requested keys of a collector's brand table, in order; ValueError names any it lacks"""
+    requested = list(requested)
+    unknown = set(requested) - set(table)
+    if unknown:
+        raise ValueError(f"Unknown {noun}: {', '.join(sorted(unknown))}")
+    return requested
+
+
+def save_brands(found: Mapping[str, List[Dict]], outputs: Mapping[str, Tuple[str, str]], method: str,
+                root: Path, http: Optional["APIClient"] = None) -> Dict[str, Path]:
+    """write_dealers for each brand of a multi-brand run. found holds each brand's dealers in standard
+    form; outputs maps the brand's key to its name and its output file relative to root; http, the
+    client that swept them, gives each brand's failed share. Brands write_dealers refuses keep their
+    previous file, and CollectionFailed names them once the rest are written."""
+    written, refused = {}, []
+    for key, dealers in found.items():
+        name, output = outputs[key]
+        try:
+            written[key] = write_dealers(name, dealers, root / output, method,
+                                         http.failed_share(name) if http else 0.0)
+        except CollectionFailed as e:
+            refused.append(str(e))
+    if refused:
+        raise CollectionFailed("; ".join(refused))
+    return written
+
+
+def collector_parser(module: str, doc: str, base_url: Optional[str] = None,
+                     base_url_help: str = "Send every brand's queries here instead") -> argparse.ArgumentParser:
+    """Argument parser for a collector's main, with the --base-url and --concurrency options they all take"""
+    parser = argparse.ArgumentParser(prog=f"python -m {module}", description=doc.split("\n")[1])
+    parser.add_argument("--base-url", default=base_url, help=base_url_help)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    return parser
+
+
+def add_header_option(parser: argparse.ArgumentParser,
+                      help: str = "Send this header instead of capturing credentials in a browser (repeatable)"):
+    parser.add_argument("--header", action="append", default=[], metavar="NAME: VALUE", help=help)
+
+
+def parse_headers(values: Iterable[str]) -> Optional[Dict[str, str]]:
+    """{name: value} from "NAME: VALUE" options, or None if none were given"""
+    return dict((part.strip() for part in h.split(":", 1)) for h in values if ":" in h) or None
+
+
+def run_collector(collection: Awaitable[Union[Path, Dict[str, Path]]], oem: Optional[str] = None,
+                  labels: Optional[Mapping[str, str]] = None) -> int:
+    """Run a collect() coroutine for a collector's main and report the files it wrote: under oem for a
+    single file, else under each key's label. Bad input exits 2 and a failed run 1."""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    try:
+        written = asyncio.run(collection)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+    if isinstance(written, Path):
+        written = {oem: written}
+    for key, path in written.items():
+        print(f"💾 {(labels or {}).get(key, key)}: {path}")
+    return 0
+
+
+class Credentials(NamedTuple):
+    """What a locator app sends to its API: auth headers, cookies, the request URL it was
+    seen on (for collectors that replay it) and when they stop working, as a Unix time"""
+    headers: Dict[str, str]
+    cookies: Dict[str, str]
+    url: Optional[str] = None
+    expires: Optional[float] = None
+
+    def apply(self, kwargs: Dict) -> Dict:
+        """Request kwargs with these credentials added; headers given per request win"""
+        headers = dict(self.headers, **(kwargs.get("headers") or {}))
+        if self.cookies:
+            headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in self.cookies.items())
+        return dict(kwargs, headers=headers)
+
+
+def token_expiry(token: str) -> Optional[float]:
+    """The exp claim of a JWT, or None if the token is not one"""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4)))
+        return float(claims["exp"])
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+class TokenSession:
+    """Current credentials for an APIClient. capture() is called on first use, when the
+    credentials expire and when the API rejects them; concurrent requests share one capture."""
+
+    def __init__(self, capture: Optional[Callable[[], Awaitable[Credentials]]],
+                 ttl: float = DEFAULT_CREDENTIALS_TTL):
+        self.capture = capture
+        self.ttl = ttl
+        self.current: Optional[Credentials] = None
+        self.captures = 0
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def fixed(cls, headers: Dict[str, str]) -> "TokenSession":
+        """Credentials given up front (copied from a browser, say), never re-captured"""
+        session = cls(None)
+        session.current = Credentials(dict(headers), {})
+        return session
+
+    def _valid(self, credentials: Optional[Credentials]) -> bool:
+        return credentials is not None and (credentials.expires is None
+                                            or time.time() < credentials.expires - EXPIRY_MARGIN)
+
+    async def get(self) -> Credentials:
+        if self._valid(self.current):
+            return self.current
+        return await self.refresh(self.current)
+
+    async def refresh(self, stale: Optional[Credentials]) -> Credentials:
+        """New credentials in place of stale, unless another request has already replaced them"""
+        async with self._lock:
+            if self.current is not stale and self._valid(self.current):
+                return self.current
+            if self.capture is None:
+                return self.current
+            fresh = await self.capture()
+            if fresh.expires is None:
+                fresh = fresh._replace(expires=time.time() + self.ttl)
+            self.current = fresh
+            self.captures += 1
+            logger.info(f"Captured credentials ({', '.join(sorted(fresh.headers)) or 'cookies only'}), "
+                        f"valid for {fresh.expires - time.time():.0f}s")
+            return fresh
+
+
+class APIClient:
+    """One session, retries and telemetry for an OEM's API sweep; use as an async context manager"""
+
+    def __init__(self, oem: str, concurrency: int = DEFAULT_CONCURRENCY, retries: int = DEFAULT_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF, headers: Optional[Dict[str, str]] = None,
+                 timeout: float = DEFAULT_TIMEOUT, cache: bool = False, auth: Optional[TokenSession] = None):
+        self.oem = oem
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.headers = dict({"Accept": "application/json", "User-Agent": USER_AGENT}, **(headers or {}))
+        self.timeout = timeout
+        self.telemetry = get_telemetry()
+        self.progress = get_progress()
+        self.failed: List[str] = []
+        # Requests sent and requests that failed after retries, per telemetry OEM
+        self.sent: Counter = Counter()
+        self.unanswered: Counter = Counter()
+        # request key -> future of its decoded body; None when caching is off
+        self.cache: Optional[Dict[str, asyncio.Future]] = {} if cache else None
+        self.cache_hits = 0
+        self.auth = auth
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "APIClient":
+        connector = aiohttp.TCPConnector(limit=self.concurrency, ttl_dns_cache=300)
+        self.session = aiohttp.ClientSession(connector=connector, headers=self.headers,
+                                             timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+        self.session = None
+
+    async def request_json(self, method: str, url: str, query: Optional[str] = None,
+                           results: Optional[Callable[[Any], Optional[List[Dict]]]] = None,
+                           key: Callable[[Dict], str] = dealer_key,
+                           state: Callable[[Dict], Optional[str]] = dealer_state, oem: Optional[str] = None,
+                           **kwargs) -> Optional[Any]:
+        """Decoded JSON body, or None if the request failed after retries. results extracts the
+        dealers from a body for telemetry; a body it returns None for counts as a failure.
+        oem names the brand in telemetry when one client serves several."""
+        if self.cache is None:
+            body = await self._request(method, url, query, results, key, state, oem or self.oem, kwargs)
+            return self._count(oem, body)
+        cache_key = json.dumps([method, url, kwargs.get("params"), kwargs.get("json")], sort_keys=True, default=str)
+        if cache_key in self.cache:
+            self.cache_hits += 1
+            return await asyncio.shield(self.cache[cache_key])
+        future = self.cache[cache_key] = asyncio.get_running_loop().create_future()
+        try:
+            body = await self._request(method, url, query, results, key, state, oem or self.oem, kwargs)
+        except BaseException as e:
+            del self.cache[cache_key]
+            future.set_exception(e)
+            future.exception()  # retrieved here so unawaited failures are not logged
+            raise
+        self._count(oem, body)
+        if body is None:
+            # Failures are not remembered; a later identical request tries again
+            del self.cache[cache_key]
+        future.set_result(body)
+        return body
+
+    def _count(self, oem: Optional[str], body: Optional[Any]) -> Optional[Any]:
+        self.sent[oem or self.oem] += 1
+        if body is None:
+            self.unanswered[oem or self.oem] += 1
+        return body
+
+    def failed_share(self, oem: Optional[str] = None) -> float:
+        """Share of requests that failed after retries: those sent for oem when any were, else all of
+        them; 0 below MIN_JUDGED_REQUESTS"""
+        if oem and self.sent[oem]:
+            sent, unanswered = self.sent[oem], self.unanswered[oem]
+        else:
+            sent, unanswered = sum(self.sent.values()), sum(self.unanswered.values())
+        return unanswered / sent if sent >= MIN_JUDGED_REQUESTS else 0.0
+
+    async def _request(self, method: str, url: str, query: Optional[str], results, key, state, oem: str,
+                       kwargs: Dict) -> Optional[Any]:
+        for attempt in range(self.retries + 1):
+            retry_after = None
+            rejected = False
+            credentials = await self.auth.get() if self.auth else None
+            with self.telemetry.request(oem, url, query=query) as req:
+                # Each span is one attempt; telemetry sums the field, so a retry counts once
+                req.retries = 1 if attempt else 0
+                try:
+                    with stage("fetch"):
+                        async with self.session.request(method, url, **(credentials.apply(kwargs) if credentials
+                                                                         else kwargs)) as response:
+                            req.response(response)
+                            if response.status == 200:
+                                await response.read()
+                                # The body is read, so json() decodes without yielding to the loop
+                                with stage("parse"):
+                                    body = await response.json(content_type=None)
+                                    dealers = None if results is None else results(body)
+                                if results is None:
+                                    return body
+                                if dealers is None:
+                                    logger.debug(f"{oem} {query}: unexpected response layout")
+                                    return None
+                                req.results(dealers, key, state)
+                                return body
+                            if response.status in AUTH_STATUSES and self.auth and self.auth.capture:
+                                logger.debug(f"{oem} {query}: HTTP {response.status}; refreshing credentials")
+                                rejected = True
+                            elif response.status not in RETRY_STATUSES:
+                                logger.debug(f"{oem} {query}: HTTP {response.status}")
+                                return None
+                            else:
+                                retry_after = response.headers.get("Retry-After")
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                    logger.debug(f"{oem} {query}: {type(e).__name__}: {e}")
+            if rejected:
+                # Straight back with new credentials; backing off would not help
+                await self.auth.refresh(credentials)
+                continue
+            if attempt < self.retries:
+                delay = float(retry_after) if retry_after and retry_after.isdigit() else self.backoff * 2 ** attempt
+                await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+        return None
+
+    async def get_json(self, url: str, **kwargs) -> Optional[Any]:
+        return await self.request_json("GET", url, **kwargs)
+
+    async def post_json(self, url: str, **kwargs) -> Optional[Any]:
+        return await self.request_json("POST", url, **kwargs)
+
+    async def sweep(self, points: Sequence[str], visit: Callable[[str], Awaitable[None]], oem: Optional[str] = None):
+        """Run visit(point) for every point, at most `concurrency` at a time, reporting progress
+        and failures under oem (default the client's)"""
+        oem = oem or self.oem
+        semaphore = asyncio.Semaphore(self.concurrency)
+        self.progress.start(oem, total=len(points))
+
+        async def one(point: str):
+            async with semaphore:
+                await visit(point)
+            self.progress.advance(oem)
+
+        await asyncio.gather(*(one(point) for point in points))
+        self.progress.finish(oem)
+        # A client shared by several brands records their failures as "<brand>:<query>"
+        failed = list(dict.fromkeys(f for f in self.failed if oem == self.oem or f.startswith(f"{oem}:")))
+        if failed:
+            logger.warning(f"{oem}: {len(failed)} queries failed after retries, e.g. {', '.join(failed[:5])}")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Browser-once credentials for locator APIs that only answer the site's own app.
+Nissan's GraphQL API and the VW dealer-search feature app reject plain
+requests: the page's app adds a bearer token, API key or session cookie.
+BrowserBootstrap opens the locator page in headless Chromium, waits for the
+app's first request to the API and captures that request's URL, the headers
+the app set on it and the cookies the API would receive. A TokenSession built
+on its capture() hands them to APIClient, so the dealer queries themselves go
+over plain aiohttp; they are captured again only when they expire or the API
+answers 401/403. The browser stays open for the run, so a refresh reloads the
+page instead of launching another browser.
+
+    async with BrowserBootstrap(LOCATOR_PAGE, "graphql.nissanusa.com") as browser:
+        async with APIClient("Nissan", auth=TokenSession(browser.capture)) as client:
+            ...
+
+Usage:
+    python -m oems.collectors.auth https://www.nissanusa.com/dealer-locator.html graphql.nissanusa.com
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from oems.collectors.api import USER_AGENT, Credentials, token_expiry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPTURE_TIMEOUT = 45.0
+# Headers the browser adds for itself; everything else on the app's request is replayed
+BROWSER_HEADERS = {"host", "content-length", "content-type", "cookie", "connection", "accept-encoding",
+                   "user-agent", "accept", "accept-language"}
+
+
+def captured_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    """The headers the app set on its request, without the ones the browser adds"""
+    return {name: value for name, value in headers.items()
+            if name.lower() not in BROWSER_HEADERS and not name.startswith((":", "sec-"))}
+
+
+def credentials_expiry(headers: Dict[str, str], cookies: List[Dict]) -> Optional[float]:
+    """When captured credentials stop working: the earliest JWT exp in a header or cookie
+    expiry, or None if nothing says"""
+    expiries = [token_expiry(value.split()[-1]) for value in headers.values() if value.split()]
+    expiries += [float(cookie["expires"]) for cookie in cookies if (cookie.get("expires") or -1) > 0]
+    expiries = [e for e in expiries if e is not None]
+    return min(expiries) if expiries else None
+
+
+class BrowserBootstrap:
+    """One headless browser for the run; use as an async context manager. capture() loads the
+    locator page (running trigger(page) for apps that only call the API after a search) and
+    returns the credentials of the app's first request whose URL contains api_match."""
+
+    def __init__(self, page_url: str, api_match: str,
+                 trigger: Optional[Callable[[object], Awaitable[None]]] = None,
+                 timeout: float = DEFAULT_CAPTURE_TIMEOUT, headless: bool = True):
+        self.page_url = page_url
+        self.api_match = api_match
+        self.trigger = trigger
+        self.timeout = timeout
+        self.headless = headless
+        self._playwright = None
+        self.browser = None
+        self.context = None
+
+    async def __aenter__(self) -> "BrowserBootstrap":
+        # Playwright is only imported once a browser is actually needed
+        try:
+            from playwright.async_api import async_playwright
+        except ModuleNotFoundError:
+            raise RuntimeError("Capturing credentials needs Playwright (pip install playwright && "
+                               "playwright install chromium); or pass --header to send known ones") from None
+
+        self._playwright = await async_playwright().start()
+        self.browser = await self._playwright.chromium.launch(headless=self.headless)
+        self.context = await self.browser.new_context(user_agent=USER_AGENT)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.browser.close()
+        await self._playwright.stop()
+        self.browser = self.context = self._playwright = None
+
+    async def capture(self) -> Credentials:
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        started = time.perf_counter()
+        page = await self.context.new_page()
+        try:
+            async with page.expect_request(lambda r: self.api_match in r.url, timeout=self.timeout * 1000) as seen:
+                await page.goto(self.page_url, wait_until="domcontentloaded")
+                if self.trigger:
+                    await self.trigger(page)
+            request = await seen.value
+            headers = captured_headers(await request.all_headers())
+            cookies = await self.context.cookies([request.url])
+        except PlaywrightTimeoutError:
+            raise RuntimeError(f"No request to {self.api_match} from {self.page_url} "
+                               f"within {self.timeout:g}s") from None
+        finally:
+            await page.close()
+        logger.info(f"Captured {self.api_match} credentials from {self.page_url} "
+                    f"in {time.perf_counter() - started:.1f}s")
+        return Credentials(headers, {c["name"]: c["value"] for c in cookies}, request.url,
+                           credentials_expiry(headers, cookies))
+
+
+async def show(page_url: str, api_match: str, headless: bool = True) -> Credentials:
+    async with BrowserBootstrap(page_url, api_match, headless=headless) as browser:
+        return await browser.capture()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m oems.collectors.auth", description=__doc__.split("\n")[1])
+    parser.add_argument("page_url", help="Locator page whose app calls the API")
+    parser.add_argument("api_match", help="Part of the API request URL to wait for")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    try:
+        credentials = asyncio.run(show(args.page_url, args.api_match, not args.headed))
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+    print(f"📋 Request: {credentials.url}")
+    print(f"📋 Headers: {', '.join(sorted(credentials.headers)) or 'none'}")
+    print(f"📋 Cookies: {', '.join(sorted(credentials.cookies)) or 'none'}")
+    if credentials.expires:
+        print(f"📋 Expires in {credentials.expires - time.time():.0f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+BMW and MINI dealers from the brands' radius-search services:
+
+    BMW   GET bmwusa.com /bin/dealerLocatorServlet?getdealerdetailsByRadius/{zip}/{radius}
+    MINI  GET miniusa.com /bin/services/dealer-locator/getAllDealerByZip.json/{zip}/{distance}
+
+Both return every dealer within the radius of a ZIP, so a handful of calls
+covers the country when the radius is large. How large a radius an endpoint
+really honours is found out rather than assumed: each brand first asks for
+MAX_RADIUS_MILES from the most central query point, then plans the fewest
+centers (greedy set cover over the ZIP grid, Alaska and Hawaii included)
+whose discs hold every grid point, and checks the answers against each other.
+A dealer that one answer returned but another left out although it lies
+inside that answer's radius shows the radius was cut; the honoured radius is
+then taken as the farthest any answer reached, and uncovered points get new
+centers. A brand is done when every grid point lies inside an answer's
+honoured radius and at least two answers agree where they overlap.
+Dealers are deduplicated per brand by dealer id.
+
+Usage:
+    python -m oems.collectors.bmw                          # BMW and MINI
+    python -m oems.collectors.bmw --brands MINI --radius 1000
+    python -m oems.collectors.bmw --base-url http://127.0.0.1:8765   # against `oems mock`
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+from statistics import median
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+
+from oems.collectors.api import (DEFAULT_CONCURRENCY, APIClient, collector_parser, locate_points, miles, pick_brands,
+                                 run_collector, save_brands, zip3_points)
+from oems.dealers import REPO_ROOT, first_value, load_zip_codes
+from oems.profiling import stage
+
+logger = logging.getLogger(__name__)
+
+OEM = "BMW"
+# brand -> (site, output file)
+BRANDS = {
+    "BMW": ("https://www.bmwusa.com", "data/luxury/bmw.json"),
+    "MINI": ("https://www.miniusa.com", "data/luxury/mini.json"),
+}
+BMW_PATH = "/bin/dealerLocatorServlet"
+MINI_PATH = "/bin/services/dealer-locator/getAllDealerByZip.json"
+REFERERS = {
+    "BMW": "https://www.bmwusa.com/dealer-locator.html",
+    "MINI": "https://www.miniusa.com/tools/shopping/find-a-dealer.html",
+}
+MAX_RADIUS_MILES = 5000
+# Planned discs are shrunk by this factor so neighbouring answers overlap
+COVER_MARGIN = 0.9
+# Plan-and-check rounds per brand before giving up on uncovered points
+MAX_ROUNDS = 6
+
+Point = Tuple[str, Tuple[float, float]]
+
+
+class Answer(NamedTuple):
+    """One radius query's result: where it was asked, the dealer ids it returned, and how far
+    the farthest of them is"""
+    point: Tuple[float, float]
+    keys: FrozenSet[str]
+    reach: float
+
+
+def extract_dealers(body) -> Optional[List[Dict]]:
+    """Dealer records from either service: a list, or an object holding one (possibly one level down)"""
+    if isinstance(body, list):
+        return body
+    if isinstance(body, dict):
+        for key in ("Dealers", "dealers", "Dealer", "dealerList", "results", "ReturnObject"):
+            value = body.get(key)
+            if isinstance(value, list):
+                return value
+            if isinstance(value, dict):
+                return extract_dealers(value)
+    return None
+
+
+def dealer_id(record: Dict) -> str:
+    return str(first_value(record, "centerId", "CenterID", "dealerId", "DealerID", "dealerCode", "id") or "")
+
+
+def _address(record: Dict) -> Dict:
+    address = first_value(record, "address", "Address")
+    return address if isinstance(address, dict) else record
+
+
+def _state(record: Dict) -> Optional[str]:
+    return first_value(_address(record), "state", "State", "stateCode")
+
+
+def _location(record: Dict) -> Optional[Tuple[float, float]]:
+    location = first_value(record, "location", "geo", "coordinates")
+    location = location if isinstance(location, dict) else record
+    try:
+        return (float(first_value(location, "latitude", "Latitude", "lat")),
+                float(first_value(location, "longitude", "Longitude", "lng", "long")))
+    except (TypeError, ValueError):
+        return None
+
+
+def to_standard(record: Dict) -> Dict:
+    """Standard dealer fields plus the dealer id and coordinates"""
+    address = _address(record)
+    location = _location(record)
+    street = " ".join(str(p).strip() for p in (first_value(address, "address1", "addressLine1", "street", "Street"),
+                                                first_value(address, "address2", "addressLine2"))
+                      if p and str(p).strip())
+    return {
+        "Dealer": str(first_value(record, "dealerName", "DealerName", "name") or "").strip(),
+        "Website": first_value(record, "url", "dealerURL", "dealerUrl", "website", "DealerURL"),
+        "Phone": first_value(record, "phone", "phoneNumber", "Phone", "salesPhone"),
+        "Email": first_value(record, "email", "Email"),
+        "Street": street,
+        "City": str(first_value(address, "city", "City") or "").strip(),
+        "State": str(_state(record) or "").strip(),
+        "ZIP": str(first_value(address, "zip", "zipCode", "ZipCode", "postalCode") or "")[:5],
+        "dealer_code": dealer_id(record),
+        "latitude": location[0] if location else None,
+        "longitude": location[1] if location else None,
+    }
+
+
+def central(points: Sequence[Point]) -> Point:
+    """The point nearest the median latitude and longitude: inside the dense part of the grid, so
+    the first answer is not cut short by empty country around it"""
+    middle = (median(p[1][0] for p in points), median(p[1][1] for p in points))
+    return min(points, key=lambda p: miles(p[1], middle))
+
+
+def cover(candidates: Sequence[Point], targets: Sequence[Point], radius: float) -> List[Point]:
+    """Greedy set cover: few candidates whose radius-discs hold every target, each pick being
+    the candidate that holds the most targets not yet held. Targets no candidate reaches are left out."""
+    holds = {zip_code: {i for i, (_, target) in enumerate(targets) if miles(point, target) <= radius}
+             for zip_code, point in candidates}
+    points = dict(candidates)
+    left = set(range(len(targets)))
+    picked = []
+    while left and holds:
+        best = max(holds, key=lambda z: len(holds[z] & left))
+        if not holds[best] & left:
+            break
+        picked.append((best, points[best]))
+        left -= holds.pop(best)
+    return picked
+
+
+class RadiusSearchClient:
+    """Both brands' radius searches over one APIClient; each brand plans and checks its own centers"""
+
+    def __init__(self, brands: Sequence[str] = tuple(BRANDS), base_url: Optional[str] = None,
+                 concurrency: int = DEFAULT_CONCURRENCY, radius: float = MAX_RADIUS_MILES):
+        self.brands = pick_brands(brands, BRANDS)
+        # A base URL (the mock server) replaces every site
+        self.sites = {brand: (base_url or BRANDS[brand][0]).rstrip("/") for brand in self.brands}
+        self.radius = radius
+        self.http = APIClient(OEM, concurrency)
+        self.dealers: Dict[str, Dict[str, Dict]] = {brand: {} for brand in self.brands}
+        self.located: Dict[str, Dict[str, Tuple[float, float]]] = {brand: {} for brand in self.brands}
+        self.answers: Dict[str, Dict[str, Answer]] = {brand: {} for brand in self.brands}
+        self.honoured: Dict[str, float] = {brand: radius for brand in self.brands}
+        self.uncovered: Dict[str, List[str]] = {brand: [] for brand in self.brands}
+
+    def _url(self, brand: str, zip_code: str) -> str:
+        radius = f"{self.radius:g}"
+        if brand == "BMW":
+            # The servlet takes its arguments as a path inside the query string
+            return (f"{self.sites[brand]}{BMW_PATH}?getdealerdetailsByRadius/{zip_code}/{radius}"
+                    f"?includeSatelliteDealers=true")
+        return (f"{self.sites[brand]}{MINI_PATH}/{zip_code}/{radius}"
+                f"?excludeServiceOnlyDealers=false&includeSatelliteDealers=true")
+
+    async def fetch(self, brand: str, zip_code: str, point: Tuple[float, float]):
+        """Ask for every dealer within the radius of one point and record the answer"""
+        body = await self.http.get_json(self._url(brand, zip_code), query=zip_code, results=extract_dealers,
+                                        key=lambda d: f"{brand}:{dealer_id(d)}", state=_state, oem=brand,
+                                        headers={"Referer": REFERERS[brand]})
+        rows = extract_dealers(body) if body is not None else None
+        if rows is None:
+            self.http.failed.append(f"{brand}:{zip_code}")
+            return
+        keys, reach = set(), 0.0
+        for record in rows:
+            key = dealer_id(record)
+            if not key:
+                continue
+            keys.add(key)
+            self.dealers[brand].setdefault(key, record)
+            location = _location(record)
+            if location:
+                self.located[brand][key] = location
+                reach = max(reach, miles(point, location))
+        self.answers[brand][zip_code] = Answer(point, frozenset(keys), reach)
+
+    def _cuts(self, brand: str) -> Dict[str, float]:
+        """Per answer, the distance to the nearest known dealer inside its radius that it left out
+        (the requested radius if there is none)"""
+        cuts = {}
+        for zip_code, answer in self.answers[brand].items():
+            cuts[zip_code] = min([miles(answer.point, location) for key, location in self.located[brand].items()
+                                  if key not in answer.keys] + [self.radius])
+        return cuts
+
+    def _radii(self, brand: str) -> Dict[str, float]:
+        """How far each answer can be trusted, updating the brand's honoured radius from the overlap"""
+        cuts = self._cuts(brand)
+        if any(c < self.radius for c in cuts.values()):
+            # No answer goes past the endpoint's limit, so the farthest any of them reached is within it
+            self.honoured[brand] = max(a.reach for a in self.answers[brand].values())
+        return {z: min(c, self.honoured[brand]) for z, c in cuts.items()}
+
+    async def _brand(self, brand: str, targets: Sequence[Point], probe: Point):
+        answers = self.answers[brand]
+
+        async def visit(zip_code: str):
+            await self.fetch(brand, zip_code, planned[zip_code])
+
+        planned = dict([probe])
+        await self.http.sweep([probe[0]], visit, oem=brand)
+        for _ in range(MAX_ROUNDS):
+            radii = self._radii(brand)
+            uncovered = [t for t in targets
+                         if not any(miles(t[1], answers[z].point) <= r for z, r in radii.items())]
+            if not uncovered and len(answers) > 1:
+                break
+            candidates = [t for t in targets if t[0] not in answers]
+            centers = cover(candidates, uncovered, self.honoured[brand] * COVER_MARGIN)
+            if not centers:
+                if not candidates:
+                    break
+                # One answer covers everything; check it from the point farthest away
+                origin = next(iter(answers.values())).point if answers else probe[1]
+                centers = [max(candidates, key=lambda t: miles(t[1], origin))]
+            planned = dict(centers)
+            logger.info(f"{brand}: querying {len(centers)} centers at a {self.honoured[brand]:g}-mile "
+                        f"honoured radius")
+            await self.http.sweep(list(planned), visit, oem=brand)
+        radii = self._radii(brand)
+        self.uncovered[brand] = [z for z, point in targets
+                                 if not any(miles(point, answers[c].point) <= r for c, r in radii.items())]
+        if self.uncovered[brand]:
+            logger.warning(f"{brand}: {len(self.uncovered[brand])} points not inside any checked answer, "
+                           f"e.g. {', '.join(self.uncovered[brand][:5])}")
+
+    async def sweep(self, targets: Sequence[Point]) -> Dict[str, List[Dict]]:
+        probe = central(targets)
+        async with self.http:
+            await asyncio.gather(*(self._brand(brand, targets, probe) for brand in self.brands))
+        return {brand: list(records.values()) for brand, records in self.dealers.items()}
+
+
+async def collect(brands: Sequence[str] = tuple(BRANDS), base_url: Optional[str] = None,
+                  concurrency: int = DEFAULT_CONCURRENCY, radius: float = MAX_RADIUS_MILES,
+                  root: Path = REPO_ROOT) -> Dict[str, Path]:
+    """Registry entry point: both brands in one run, one output file each"""
+    targets = locate_points(zip3_points(load_zip_codes()))
+    client = RadiusSearchClient(brands, base_url, concurrency, radius)
+    found = await client.sweep(targets)
+    for brand in client.brands:
+        logger.info(f"{brand}: {len(found[brand])} dealers from {len(client.answers[brand])} answers, "
+                    f"honoured radius {client.honoured[brand]:g} miles")
+    with stage("parse"):
+        standard = {brand: [to_standard(r) for r in records] for brand, records in found.items()}
+    return save_brands(standard, {brand: (brand, output) for brand, (_, output) in BRANDS.items()}, "radius_search",
+                       root, client.http)
+
+
+def main(argv=None) -> int:
+    parser = collector_parser("oems.collectors.bmw", __doc__)
+    parser.add_argument("--brands", default=",".join(BRANDS), help="Brands to collect (default: both)")
+    parser.add_argument("--radius", type=float, default=MAX_RADIUS_MILES, help="Radius to ask for, in miles")
+    args = parser.parse_args(argv)
+    return run_collector(collect(args.brands.split(","), args.base_url, args.concurrency, args.radius))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
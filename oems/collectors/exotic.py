@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Exotic and luxury tier dealers from each brand's full-list locator call.
+The low-volume brands each publish their whole network in one request, so
+one run fires them all concurrently over a single session:
+
+    Bentley       GET  bentleymotors.com /.api/retailers
+    Aston Martin  GET  astonmartin.com /api/v1/dealers?take=5000
+    Ferrari       GET  api.onthemap.io /server/v1/api/location
+    McLaren       GET  retailers.mclaren.com /bin/api/locator?locale=en
+    Porsche       GET  resources-nav.porsche.services /dealers/US
+    Pagani        GET  pagani.com admin-ajax.php?action=desktop_map_ajax_request
+
+The global lists are cut down to dealers with a US country, state code or
+ZIP; a record with none of them is dropped rather than assumed American.
+Porsche's service searches
+around a point, so it is asked once with a continent-wide radius and only
+swept over spread-out points at PORSCHE_RADIUS_MILES when that does not
+return a national-sized list. A brand whose call fails keeps its previous
+output file.
+
+Usage:
+    python -m oems.collectors.exotic                       # the whole tier
+    python -m oems.collectors.exotic --brands Ferrari,McLaren
+    python -m oems.collectors.exotic --base-url http://127.0.0.1:8765   # against `oems mock`
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+from oems.collectors.api import (DEFAULT_CONCURRENCY, APIClient, collector_parser, locate_points, pick_brands,
+                                 run_collector, save_brands, spread_points, zip3_points)
+from oems.dealers import REPO_ROOT, ZIP3_STATES, first_value, load_zip_codes
+from oems.profiling import stage
+
+logger = logging.getLogger(__name__)
+
+OEM = "Exotic"
+# Geographic center of the contiguous US, for services that sort or search around a point
+US_CENTER = (39.83, -98.58)
+PORSCHE_BULK_RADIUS_MILES = 3000
+PORSCHE_RADIUS_MILES = 200
+PORSCHE_SPACING_MILES = 150
+# A Porsche answer this large is the national list, so no sweep is needed
+PORSCHE_BULK_THRESHOLD = 150
+# brand -> (full-list URL, query parameters, locator page sent as Referer, output file)
+BRANDS = {
+    "Bentley": ("https://www.bentleymotors.com/.api/retailers", {},
+                "https://www.bentleymotors.com/en/apps/dealer-locator.html", "data/luxury/bentley.json"),
+    "Aston Martin": ("https://www.astonmartin.com/api/v1/dealers",
+                     {"latitude": US_CENTER[0], "longitude": US_CENTER[1], "cultureName": "en-US", "take": 5000},
+                     "https://www.astonmartin.com/en-us/dealers", "data/luxury/aston-martin.json"),
+    "Ferrari": ("https://api.onthemap.io/server/v1/api/location", {},
+                "https://www.ferrari.com/en-EN/auto/dealers", "data/exotic/ferrari.json"),
+    "McLaren": ("https://retailers.mclaren.com/bin/api/locator", {"locale": "en"},
+                "https://retailers.mclaren.com/en", "data/exotic/mclaren.json"),
+    "Porsche": ("https://resources-nav.porsche.services/dealers/US",
+                {"coordinates": f"{US_CENTER[0]},{US_CENTER[1]}", "radius": PORSCHE_BULK_RADIUS_MILES, "unit": "MI"},
+                "https://www.porsche.com/us/en-US/dealersearch/", "data/luxury/porsche.json"),
+    "Pagani": ("https://www.pagani.com/wp/wp-admin/admin-ajax.php", {"action": "desktop_map_ajax_request"},
+               "https://www.pagani.com/dealers/", "data/exotic/pagani.json"),
+}
+# Services answering for the whole world; Porsche's /dealers/US only ever answers US dealers
+GLOBAL_LISTS = {"Bentley", "Aston Martin", "Ferrari", "McLaren", "Pagani"}
+US_COUNTRIES = {"US", "USA", "UNITED STATES", "UNITED STATES OF AMERICA"}
+US_STATE_CODES = {state for _, state in ZIP3_STATES}
+
+
+def extract_dealers(body) -> Optional[List[Dict]]:
+    """Dealer records from any of the services: a list, or an object holding one (one level down at most)"""
+    if isinstance(body, list):
+        return body
+    if isinstance(body, dict):
+        for key in ("dealers", "retailers", "locations", "markers", "items", "results", "data"):
+            value = body.get(key)
+            if isinstance(value, list):
+                return value
+            if isinstance(value, dict):
+                nested = extract_dealers(value)
+                if nested is not None:
+                    return nested
+    return None
+
+
+def _address(record: Dict) -> Dict:
+    address = record.get("address")
+    return address if isinstance(address, dict) else record
+
+
+def dealer_id(record: Dict) -> str:
+    code = first_value(record, "id", "dealerId", "retailerId", "dealerCode", "code")
+    if code is not None:
+        return str(code)
+    return f"{first_value(record, 'name', 'title', 'dealerName') or ''}|{_zip(record)}"
+
+
+def _state(record: Dict) -> Optional[str]:
+    return first_value(_address(record), "state", "stateCode", "region", "province")
+
+
+def _zip(record: Dict) -> str:
+    return str(first_value(_address(record), "postalCode", "postCode", "zipCode", "zip") or "")[:5]
+
+
+def _country(record: Dict) -> str:
+    value = first_value(_address(record), "countryCode", "country", "countryIso") or first_value(record, "country")
+    if isinstance(value, dict):
+        value = first_value(value, "code", "isoCode", "name")
+    return str(value or "").strip().upper()
+
+
+def is_us(record: Dict) -> bool:
+    """Whether a record from a global list is a US dealer: a US country, or with no country at all
+    a US state code or a 5-digit ZIP"""
+    country = _country(record)
+    if country:
+        return country in US_COUNTRIES
+    state = str(_state(record) or "").strip().upper()
+    return state in US_STATE_CODES or (len(_zip(record)) == 5 and _zip(record).isdigit())
+
+
+def _coordinates(record: Dict):
+    for key in ("coordinates", "location", "geolocation", "geo", "position"):
+        if isinstance(record.get(key), dict):
+            return record[key]
+    return record
+
+
+def to_standard(record: Dict) -> Dict:
+    """Standard dealer fields plus the dealer id and coordinates"""
+    address = _address(record)
+    location = _coordinates(record)
+    try:
+        latitude = float(first_value(location, "latitude", "lat"))
+        longitude = float(first_value(location, "longitude", "lng", "lon"))
+    except (TypeError, ValueError):
+        latitude = longitude = None
+    contact = record.get("contact") if isinstance(record.get("contact"), dict) else record
+    street = address.get("address") if isinstance(address.get("address"), str) else None
+    street = " ".join(str(p).strip() for p in (first_value(address, "street", "addressLine1", "address1", "line1"),
+                                                first_value(address, "addressLine2", "address2", "line2"))
+                      if p and str(p).strip()) or street or ""
+    return {
+        "Dealer": str(first_value(record, "name", "dealerName", "title") or "").strip(),
+        "Website": first_value(contact, "website", "url", "websiteUrl", "homepage"),
+        "Phone": first_value(contact, "phone", "phoneNumber", "telephone", "salesPhone"),
+        "Email": first_value(contact, "email", "emailAddress"),
+        "Street": street.strip(),
+        "City": str(first_value(address, "city", "town", "locality") or "").strip(),
+        "State": str(_state(record) or "").strip(),
+        "ZIP": _zip(record),
+        "dealer_code": dealer_id(record),
+        "latitude": latitude,
+        "longitude": longitude,
+    }
+
+
+class ExoticClient:
+    """Every brand's full-list call, fired concurrently over one APIClient"""
+
+    def __init__(self, brands: Sequence[str] = tuple(BRANDS), base_url: Optional[str] = None,
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        self.brands = pick_brands(brands, BRANDS)
+        # A base URL (the mock server) replaces every service's host, keeping its path
+        self.urls = {brand: base_url.rstrip("/") + urlsplit(BRANDS[brand][0]).path if base_url else BRANDS[brand][0]
+                     for brand in self.brands}
+        self.http = APIClient(OEM, concurrency)
+        self.dealers: Dict[str, Dict[str, Dict]] = {brand: {} for brand in self.brands}
+
+    async def fetch(self, brand: str, query: str, **params) -> Optional[List[Dict]]:
+        """US dealer records from one call, or None if it failed"""
+        body = await self.http.get_json(self.urls[brand], params=dict(BRANDS[brand][1], **params), query=query,
+                                        results=extract_dealers, key=dealer_id, state=_state, oem=brand,
+                                        headers={"Referer": BRANDS[brand][2]})
+        if body is None:
+            return None
+        records = [r for r in extract_dealers(body)
+                   if isinstance(r, dict) and (brand not in GLOBAL_LISTS or is_us(r))]
+        for record in records:
+            self.dealers[brand].setdefault(dealer_id(record), record)
+        return records
+
+    async def bulk(self, brand: str):
+        if await self.fetch(brand, "all") is None:
+            self.http.failed.append(f"{brand}:all")
+
+    async def porsche(self):
+        everything = await self.fetch("Porsche", "all")
+        if everything is not None and len(everything) >= PORSCHE_BULK_THRESHOLD:
+            return
+        located = spread_points(locate_points(zip3_points(load_zip_codes())), PORSCHE_SPACING_MILES)
+        logger.info(f"Porsche: {len(everything or [])} dealers from one call; sweeping {len(located)} points")
+        centers = dict(located)
+
+        async def visit(zip_code: str):
+            lat, lng = centers[zip_code]
+            if await self.fetch("Porsche", zip_code, coordinates=f"{lat},{lng}", radius=PORSCHE_RADIUS_MILES) is None:
+                self.http.failed.append(f"Porsche:{zip_code}")
+
+        await self.http.sweep(list(centers), visit, oem="Porsche")
+
+    async def sweep(self) -> Dict[str, List[Dict]]:
+        """brand -> US dealer records; none for a brand whose call failed"""
+        async with self.http:
+            await asyncio.gather(*(self.porsche() if brand == "Porsche" else self.bulk(brand)
+                                   for brand in self.brands))
+        return {brand: list(records.values()) for brand, records in self.dealers.items()}
+
+
+async def collect(brands: Sequence[str] = tuple(BRANDS), base_url: Optional[str] = None,
+                  concurrency: int = DEFAULT_CONCURRENCY, root: Path = REPO_ROOT) -> Dict[str, Path]:
+    """Registry entry point: the whole tier in one run, one output file per brand"""
+    client = ExoticClient(brands, base_url, concurrency)
+    found = await client.sweep()
+    with stage("parse"):
+        standard = {brand: [to_standard(r) for r in records] for brand, records in found.items()}
+    return save_brands(standard, {brand: (brand, entry[3]) for brand, entry in BRANDS.items()}, "exotic_bulk_api", root,
+                       client.http)
+
+
+def main(argv=None) -> int:
+    parser = collector_parser("oems.collectors.exotic", __doc__, base_url_help="Send every brand's call here instead")
+    parser.add_argument("--brands", default=",".join(BRANDS), help="Brands to collect (default: all of them)")
+    args = parser.parse_args(argv)
+    return run_collector(collect(args.brands.split(","), args.base_url, args.concurrency))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Ford and Lincoln dealers from the cxservices Dealers.json locator.
+ford.com and lincoln.com serve the same /cxservices/dealer/Dealers.json
+endpoint, filtered by `make`. One pass over the planned ZIP grid queries both
+brands at every point through one connection pool, and dealers are
+deduplicated per brand by their PA code. The grid is one ZIP per 3-digit
+prefix, plus points wherever that leaves ZIPs out of RADIUS_MILES reach.
+This replaces the generated Ford records and the hand-built Lincoln list with
+a real crawl.
+
+The response is read leniently: dealers are taken from Response.Dealer (a
+single dealer may come back as an object rather than a list) or a top-level
+Dealers/dealers list, and fields from both the PascalCase and camelCase
+spellings the locator has used.
+
+Usage:
+    python -m oems.collectors.ford                         # Ford and Lincoln
+    python -m oems.collectors.ford --makes Lincoln --limit 50
+    python -m oems.collectors.ford --base-url http://127.0.0.1:8765   # against `oems mock`
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from oems.collectors.api import (DEFAULT_CONCURRENCY, APIClient, collector_parser, fill_gaps, pick_brands,
+                                 run_collector, save_brands, zip3_points)
+from oems.dealers import REPO_ROOT, first_value, load_zip_codes
+from oems.profiling import stage
+from oems.refresh import plan_points
+
+logger = logging.getLogger(__name__)
+
+OEM = "Ford"
+PATH = "/cxservices/dealer/Dealers.json"
+# make -> (site, output file)
+MAKES = {
+    "Ford": ("https://www.ford.com", "data/mainstream/ford.json"),
+    "Lincoln": ("https://www.lincoln.com", "data/luxury/lincoln.json"),
+}
+RADIUS_MILES = 100
+MAX_DEALERS = 250
+
+
+def extract_dealers(body) -> Optional[List[Dict]]:
+    """Dealer records from a Dealers.json body, or None if it does not look like one"""
+    if isinstance(body, list):
+        return body
+    if not isinstance(body, dict):
+        return None
+    response = body.get("Response")
+    if isinstance(response, dict):
+        if "Dealer" not in response:
+            # No dealers near this point
+            return []
+        dealers = response["Dealer"]
+        return [dealers] if isinstance(dealers, dict) else dealers if isinstance(dealers, list) else None
+    dealers = first_value(body, "Dealers", "dealers")
+    return dealers if isinstance(dealers, list) else None
+
+
+def dealer_code(record: Dict) -> str:
+    return str(first_value(record, "PACode", "paCode", "DealerCode", "dealerCode", "DealerID", "id") or "")
+
+
+def to_standard(record: Dict, make: str) -> Dict:
+    """Standard dealer fields plus the PA code and coordinates"""
+    address = first_value(record, "Address", "address") or {}
+    if not isinstance(address, dict):
+        address = {"Street1": str(address)}
+    street = " ".join(str(p).strip() for p in (first_value(address, "Street1", "street1", "Street"),
+                                                first_value(address, "Street2", "street2")) if p and str(p).strip())
+    try:
+        latitude = float(first_value(record, "Latitude", "latitude"))
+        longitude = float(first_value(record, "Longitude", "longitude"))
+    except (TypeError, ValueError):
+        latitude = longitude = None
+    return {
+        "Dealer": str(first_value(record, "Name", "name", "DealerName") or "").strip(),
+        "Website": first_value(record, "URL", "Url", "url", "WebsiteURL"),
+        "Phone": first_value(record, "Phone", "phone", "PrimaryPhone"),
+        "Email": first_value(record, "Email", "email"),
+        "Street": street,
+        "City": str(first_value(address, "City", "city") or "").strip(),
+        "State": str(first_value(address, "State", "state", "StateCode") or "").strip(),
+        "ZIP": str(first_value(address, "PostalCode", "postalCode", "Zip") or "")[:5],
+        "dealer_code": dealer_code(record),
+        "latitude": latitude,
+        "longitude": longitude,
+        "make": make,
+    }
+
+
+def _state(record: Dict) -> Optional[str]:
+    address = first_value(record, "Address", "address")
+    return first_value(address, "State", "state", "StateCode") if isinstance(address, dict) else None
+
+
+class DealersJSONClient:
+    """One pass over the grid for every make, deduplicating by PA code per make"""
+
+    def __init__(self, makes: Sequence[str] = tuple(MAKES), base_url: Optional[str] = None,
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        self.makes = pick_brands(makes, MAKES, "makes")
+        # A base URL (the mock server) replaces both sites
+        self.urls = {make: (base_url or MAKES[make][0]).rstrip("/") + PATH for make in self.makes}
+        self.http = APIClient(OEM, concurrency)
+        self.dealers: Dict[str, Dict[str, Dict]] = {make: {} for make in self.makes}
+        self.saturated = 0
+
+    async def _query(self, make: str, zip_code: str):
+        params = {"make": make, "radius": RADIUS_MILES, "filter": "", "minDealers": 1,
+                  "maxDealers": MAX_DEALERS, "postalCode": zip_code}
+        site = MAKES[make][0]
+        body = await self.http.get_json(self.urls[make], params=params, query=zip_code, results=extract_dealers,
+                                        headers={"Referer": f"{site}/dealerships/"},
+                                        key=lambda d: f"{make}:{dealer_code(d)}", state=_state)
+        if body is None:
+            self.http.failed.append(f"{make}:{zip_code}")
+            return
+        records = extract_dealers(body)
+        if len(records) >= MAX_DEALERS:
+            # The radius held more dealers than one answer returns; nearby points usually cover the rest
+            self.saturated += 1
+        for record in records:
+            code = dealer_code(record)
+            if code:
+                self.dealers[make].setdefault(code, record)
+
+    async def _point(self, zip_code: str):
+        await asyncio.gather(*(self._query(make, zip_code) for make in self.makes))
+
+    async def sweep(self, points: Sequence[str]) -> Dict[str, List[Dict]]:
+        async with self.http:
+            await self.http.sweep(points, self._point)
+        if self.saturated:
+            logger.warning(f"{self.saturated} queries hit maxDealers={MAX_DEALERS}")
+        return {make: list(records.values()) for make, records in self.dealers.items()}
+
+
+async def collect(makes: Sequence[str] = tuple(MAKES), base_url: Optional[str] = None,
+                  concurrency: int = DEFAULT_CONCURRENCY, limit: Optional[int] = None,
+                  root: Path = REPO_ROOT) -> Dict[str, Path]:
+    """Registry entry point: Ford and Lincoln in one sweep, one output file each"""
+    client = DealersJSONClient(makes, base_url, concurrency)
+    zip_codes = load_zip_codes()
+    points = zip3_points(zip_codes)[:limit]
+    if limit is None:
+        points = fill_gaps(points, zip_codes, RADIUS_MILES)
+    points = plan_points(client.makes, points)
+    logger.info(f"Sweeping {len(points)} points for {', '.join(client.makes)}")
+    found = await client.sweep(points)
+    with stage("parse"):
+        standard = {make: [to_standard(r, make) for r in records] for make, records in found.items()}
+    return save_brands(standard, {make: (make, output) for make, (_, output) in MAKES.items()},
+                       "cxservices_dealers_json", root, client.http)
+
+
+def main(argv=None) -> int:
+    parser = collector_parser("oems.collectors.ford", __doc__, base_url_help="Send every make's queries here instead")
+    parser.add_argument("--makes", default=",".join(MAKES), help="Makes to collect (default: Ford,Lincoln)")
+    parser.add_argument("--limit", type=int, default=None, help="Only sweep the first N query points")
+    args = parser.parse_args(argv)
+    return run_collector(collect(args.makes.split(","), args.base_url, args.concurrency, args.limit))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Chevrolet, Buick, GMC and Cadillac dealers from GM's quantum dealer locator.
+The brands' locator maps are fed by one JSON service,
+/bypass/pcf/quantum-dealer-locator/v1/getDealers, whose answers are the
+marker and list payloads the map draws. It only answers the locator app's
+own requests (clientapplicationid and locale headers), so one headless
+browser loads the first brand's locator page once and hands the captured
+request to an aiohttp sweep (oems.collectors.auth).
+
+All four brands share one sweep: each query point is asked once with every
+requested make code, and a dealer is credited to each brand in its
+makeCodes, so a Buick GMC store is listed under both. If the service will
+not take several make codes, the sweep falls back to one request per brand
+at each point. Answers are kept raw during the sweep and decoded in bulk.
+
+Query points are ZIP grid points thinned to one per SPACING_MILES, searched
+at RADIUS_MILES. An answer holding DESIRED_COUNT dealers was cut short, so
+grid points around it beyond its farthest dealer are queried as well.
+
+Usage:
+    python -m oems.collectors.gm                           # all four brands
+    python -m oems.collectors.gm --brands Buick,GMC --radius 200
+    python -m oems.collectors.gm --base-url http://127.0.0.1:8765   # against `oems mock`
+"""
+
+import contextlib
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from oems.collectors.api import (DEFAULT_CONCURRENCY, APIClient, TokenSession, add_header_option, collector_parser,
+                                 locate_points, miles, parse_headers, pick_brands, run_collector, save_brands,
+                                 spread_points, zip3_points)
+from oems.collectors.auth import BrowserBootstrap
+from oems.dealers import REPO_ROOT, first_value, load_zip_codes
+from oems.profiling import stage
+from oems.refresh import plan_points
+
+logger = logging.getLogger(__name__)
+
+OEM = "GM"
+# brand -> (site, locator page, make code, output file)
+BRANDS = {
+    "Chevrolet": ("https://www.chevrolet.com", "/dealer-locator", "001", "data/mainstream/chevrolet.json"),
+    "Buick": ("https://www.buick.com", "/locate-buick-dealer", "004", "data/mainstream/buick.json"),
+    "GMC": ("https://www.gmc.com", "/dealer-locator", "048", "data/gmc.json"),
+    "Cadillac": ("https://www.cadillac.com", "/dealer-locator", "006", "data/luxury/cadillac.json"),
+}
+API_PATH = "/bypass/pcf/quantum-dealer-locator/v1/getDealers"
+RADIUS_MILES = 250
+SPACING_MILES = 120
+DESIRED_COUNT = 100
+# Spacing of the extra points queried where answers were cut short
+REFINE_SPACING_MILES = 40
+# Set per query; any other parameter on the app's own request is sent unchanged
+QUERY_PARAMS = ("latitude", "longitude", "distance", "desiredCount", "makeCodes")
+# Points tried when checking whether combined make-code queries work
+PROBE_POINTS = 5
+# Searched in the locator in case the map waits for a location before loading dealers
+SEARCH_ZIP = "48226"
+SEARCH_TIMEOUT_MS = 5000
+
+
+def extract_dealers(body) -> Optional[List[Dict]]:
+    """Dealer records from a getDealers body ({"payload": {"dealers": [...]}}), or a bare list"""
+    if isinstance(body, list):
+        return body
+    if isinstance(body, dict):
+        payload = body.get("payload")
+        if isinstance(payload, dict) and isinstance(payload.get("dealers"), list):
+            return payload["dealers"]
+        if isinstance(body.get("dealers"), list):
+            return body["dealers"]
+    return None
+
+
+def dealer_id(record: Dict) -> str:
+    """The BAC (business associate code) identifies a store across the brands it sells"""
+    return str(first_value(record, "bac", "id", "dealerCode") or "")
+
+
+def record_brands(record: Dict) -> List[str]:
+    """Brands a record's make codes say it sells, as BRANDS names"""
+    codes = record.get("makeCodes") or []
+    return [brand for brand, (_, _, code, _) in BRANDS.items() if code in codes]
+
+
+def _address(record: Dict) -> Dict:
+    address = record.get("address")
+    return address if isinstance(address, dict) else record
+
+
+def _state(record: Dict) -> Optional[str]:
+    return first_value(_address(record), "countrySubdivisionCode", "state")
+
+
+def _point(record: Dict) -> Optional[Tuple[float, float]]:
+    location = record.get("geolocation") if isinstance(record.get("geolocation"), dict) else record
+    try:
+        return float(first_value(location, "latitude", "lat")), float(first_value(location, "longitude", "lng"))
+    except (TypeError, ValueError):
+        return None
+
+
+def to_standard(record: Dict) -> Dict:
+    """Standard dealer fields plus the BAC, coordinates and the brands the store sells"""
+    address = _address(record)
+    contact = record.get("generalContact") if isinstance(record.get("generalContact"), dict) else record
+    point = _point(record) or (None, None)
+    street = " ".join(str(p).strip() for p in (first_value(address, "addressLine1", "street"),
+                                                first_value(address, "addressLine2"))
+                      if p and str(p).strip())
+    return {
+        "Dealer": str(first_value(record, "dealerName", "name") or "").strip(),
+        "Website": first_value(record, "dealerUrl", "url"),
+        "Phone": first_value(contact, "phone1", "phone"),
+        "Email": first_value(contact, "email"),
+        "Street": street,
+        "City": str(first_value(address, "cityName", "city") or "").strip(),
+        "State": str(_state(record) or "").strip(),
+        "ZIP": str(first_value(address, "postalCode", "zip") or "")[:5],
+        "dealer_code": dealer_id(record),
+        "latitude": point[0],
+        "longitude": point[1],
+        "brands": record_brands(record),
+    }
+
+
+async def search(page):
+    """The map usually loads dealers near the visitor by itself; search a ZIP in case it waits for one"""
+    from playwright.async_api import Error as PlaywrightError
+
+    field = page.locator('input[type="search"], input[name*="zip" i], input[placeholder*="ZIP" i]').first
+    try:
+        await field.fill(SEARCH_ZIP, timeout=SEARCH_TIMEOUT_MS)
+        await field.press("Enter")
+    except PlaywrightError:
+        logger.debug("No ZIP search box on the locator page; waiting for its own request")
+
+
+def request_template(url: Optional[str], default: str) -> Tuple[str, Dict[str, str]]:
+    """API URL and the parameters to keep from the app's captured request"""
+    if not url:
+        return default, {"serviceCodes": "", "searchType": "latLongSearch"}
+    parts = urlsplit(url)
+    params = {k: v for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in QUERY_PARAMS}
+    return f"{parts.scheme}://{parts.netloc}{parts.path}", params
+
+
+class DealerLocatorClient:
+    """One sweep of getDealers for every requested brand: one session, raw answers decoded at the end"""
+
+    def __init__(self, url: str, params: Dict[str, str], brands: Sequence[str] = tuple(BRANDS),
+                 auth: Optional[TokenSession] = None, concurrency: int = DEFAULT_CONCURRENCY,
+                 radius: float = RADIUS_MILES):
+        self.brands = pick_brands(brands, BRANDS)
+        self.url = url
+        self.params = params
+        self.radius = radius
+        self.http = APIClient(OEM, concurrency, auth=auth)
+        self.combined = len(self.brands) > 1
+        # (brand asked for, or None for all of them; dealer records) per answer
+        self.payloads: List[Tuple[Optional[str], List[Dict]]] = []
+        # ZIP -> distance of the farthest dealer in an answer that hit DESIRED_COUNT; farther ones may be missing
+        self.capped: Dict[str, float] = {}
+        self.queried: Dict[str, Tuple[float, float]] = {}
+        self.requests = 0
+
+    async def fetch(self, brand: Optional[str], zip_code: str, point: Tuple[float, float]) -> Optional[List[Dict]]:
+        """Records near one point, for one brand or (brand=None) all of them; None if the query failed"""
+        codes = [BRANDS[b][2] for b in ([brand] if brand else self.brands)]
+        params = dict(self.params, latitude=point[0], longitude=point[1], distance=self.radius,
+                      desiredCount=DESIRED_COUNT, makeCodes=",".join(codes))
+        self.requests += 1
+        body = await self.http.get_json(self.url, params=params, query=zip_code, results=extract_dealers,
+                                        key=dealer_id, state=_state)
+        rows = None if body is None else extract_dealers(body)
+        if rows is None:
+            return None
+        self.payloads.append((brand, rows))
+        if len(rows) >= DESIRED_COUNT:
+            reach = max((miles(point, p) for p in map(_point, rows) if p), default=0.0)
+            self.capped[zip_code] = min(self.capped.get(zip_code, reach), reach)
+        return rows
+
+    async def _probe(self, located: Sequence[Tuple[str, Tuple[float, float]]]):
+        """Check that combined queries come back tagged by make before relying on them"""
+        if not self.combined:
+            return
+        for zip_code, point in located[:PROBE_POINTS]:
+            rows = await self.fetch(None, zip_code, point)
+            if rows and all(record_brands(r) for r in rows):
+                return
+            if rows or await self.fetch(self.brands[0], zip_code, point):
+                # Untagged records, or a single-make query answered where the combined one failed
+                logger.warning("Combined make-code queries are not usable; querying each brand separately")
+                self.combined = False
+                return
+
+    async def _sweep(self, located: Sequence[Tuple[str, Tuple[float, float]]]):
+        centers = dict(located)
+        self.queried.update(centers)
+
+        async def visit(zip_code: str):
+            for brand in ([None] if self.combined else self.brands):
+                if await self.fetch(brand, zip_code, centers[zip_code]) is None:
+                    self.http.failed.append(f"{zip_code}:{brand or 'all'}")
+
+        await self.http.sweep(list(centers), visit)
+
+    def refinement(self, grid: Sequence[Tuple[str, Tuple[float, float]]]) -> List[Tuple[str, Tuple[float, float]]]:
+        """Unqueried grid points within SPACING_MILES beyond the farthest dealer of a cut-short
+        answer, thinned to one per REFINE_SPACING_MILES"""
+        capped = [(self.queried[z], reach) for z, reach in self.capped.items()]
+        return spread_points([(zip_code, point) for zip_code, point in grid if zip_code not in self.queried
+                              and any(reach < miles(point, c) < reach + SPACING_MILES for c, reach in capped)],
+                             REFINE_SPACING_MILES)
+
+    def decode(self) -> Dict[str, List[Dict]]:
+        """Brand -> dealer records, deduplicated by BAC across every answer"""
+        found: Dict[str, Dict[str, Dict]] = {brand: {} for brand in self.brands}
+        for queried, rows in self.payloads:
+            for record in rows:
+                code = dealer_id(record)
+                for brand in record_brands(record) or ([queried] if queried else []):
+                    if code and brand in found:
+                        found[brand].setdefault(code, record)
+        return {brand: list(records.values()) for brand, records in found.items()}
+
+    async def sweep(self, located: Sequence[Tuple[str, Tuple[float, float]]],
+                    grid: Sequence[Tuple[str, Tuple[float, float]]] = ()) -> Dict[str, List[Dict]]:
+        """Query every located point, then the grid points around cut-short answers"""
+        async with self.http:
+            await self._probe(located)
+            await self._sweep(located)
+            extra = self.refinement(grid)
+            if extra:
+                logger.info(f"{len(self.capped)} points hit {DESIRED_COUNT} dealers; "
+                            f"querying {len(extra)} grid points around them")
+                await self._sweep(extra)
+        with stage("parse"):
+            return self.decode()
+
+
+async def collect(brands: Sequence[str] = tuple(BRANDS), base_url: Optional[str] = None,
+                  concurrency: int = DEFAULT_CONCURRENCY, radius: float = RADIUS_MILES,
+                  headers: Optional[Dict[str, str]] = None, root: Path = REPO_ROOT) -> Dict[str, Path]:
+    """Registry entry point: one browser capture, one sweep for every brand, one output file per brand"""
+    site, page, _, _ = BRANDS[pick_brands(brands, BRANDS)[0]]
+    site = (base_url or site).rstrip("/")
+    grid = locate_points(zip3_points(load_zip_codes()))
+    located = spread_points(grid, min(SPACING_MILES, radius))
+    async with contextlib.AsyncExitStack() as stack:
+        if headers:
+            auth = TokenSession.fixed(headers)
+        else:
+            browser = await stack.enter_async_context(BrowserBootstrap(site + page, API_PATH, trigger=search))
+            auth = TokenSession(browser.capture)
+        url, params = request_template((await auth.get()).url, site + API_PATH)
+        client = DealerLocatorClient(url, params, brands, auth, concurrency, radius)
+        located = plan_points(client.brands, located)
+        logger.info(f"Sweeping {len(located)} points for {', '.join(client.brands)} via {url}")
+        found = await client.sweep(located, grid)
+    mode = "combined" if client.combined else "per-brand"
+    logger.info(f"{len(client.payloads)} answers from {client.requests} requests ({mode}); "
+                f"{', '.join(f'{b} {len(r)}' for b, r in found.items())}")
+    # Multi-brand stores appear in the file of each brand they sell
+    with stage("parse"):
+        standard = {brand: [to_standard(r) for r in records] for brand, records in found.items()}
+    return save_brands(standard, {brand: (brand, entry[3]) for brand, entry in BRANDS.items()},
+                       "gm_quantum_dealer_locator", root, client.http)
+
+
+def main(argv=None) -> int:
+    parser = collector_parser("oems.collectors.gm", __doc__,
+                              base_url_help="Load the locator page and send queries here instead")
+    parser.add_argument("--brands", default=",".join(BRANDS), help="Brands to collect (default: all four)")
+    parser.add_argument("--radius", type=float, default=RADIUS_MILES, help="Search radius per point, in miles")
+    add_header_option(parser, "Send this header instead of capturing the app's request in a browser (repeatable)")
+    args = parser.parse_args(argv)
+    return run_collector(collect(args.brands.split(","), args.base_url, args.concurrency, args.radius,
+                                 parse_headers(args.header)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
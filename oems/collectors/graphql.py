@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Batched GraphQL queries for the locators that speak GraphQL.
+Many location queries go out in one POST, either as aliased fields of a
+single document (b0: getDealersByLatLng(...) b1: ... each with its own
+variables) or, for servers that only accept persisted queries, as an array of
+operations. Selections name only the fields the collectors store. Results are
+yielded per query as each batch answers, so a collector can process dealers
+while later batches are still in flight.
+
+    client = GraphQLClient(http, "https://graphql.nissanusa.com/graphql", extract=rows)
+    operations = [Operation(zip_code, "getDealersByLatLng", {"location": ("Location!", {...})}, FIELDS)
+                  for zip_code, ... in points]
+    async for operation, dealers in client.run(operations, shared={"market": ("Market!", MARKET)}):
+        ...
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from oems.collectors.api import APIClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 25
+
+
+class Operation(NamedTuple):
+    """One query in a batch: label for logs and telemetry, root field, its variables
+    as name -> (GraphQL type, value), and the field selection"""
+    label: str
+    field: str
+    variables: Dict[str, Tuple[str, Any]]
+    selection: str = ""
+
+
+def alias_document(operations: Sequence[Operation],
+                   shared: Optional[Dict[str, Tuple[str, Any]]] = None) -> Tuple[str, Dict[str, Any]]:
+    """One query document asking for every operation under alias b<i>. Shared variables
+    (the market, say) are declared once; the rest get an _<i> suffix."""
+    shared = shared or {}
+    definitions = [f"${name}: {kind}" for name, (kind, _) in shared.items()]
+    values = {name: value for name, (_, value) in shared.items()}
+    fields = []
+    for i, operation in enumerate(operations):
+        arguments = [f"{name}: ${name}" for name in shared]
+        for name, (kind, value) in operation.variables.items():
+            definitions.append(f"${name}_{i}: {kind}")
+            values[f"{name}_{i}"] = value
+            arguments.append(f"{name}: ${name}_{i}")
+        fields.append(f"b{i}: {operation.field}({', '.join(arguments)}) {{ {operation.selection} }}")
+    return f"query Batch({', '.join(definitions)}) {{ {' '.join(fields)} }}", values
+
+
+def _field(data: Any, field: str) -> Any:
+    """A persisted query's root field, when the response names it as expected"""
+    return data[field] if isinstance(data, dict) and field in data else data
+
+
+def _error_aliases(body: Dict) -> set:
+    """Aliases a GraphQL response reports errors for; other aliases in the batch are still good"""
+    return {str(error["path"][0]) for error in body.get("errors") or []
+            if isinstance(error, dict) and error.get("path")}
+
+
+class GraphQLClient:
+    """Sends operations to one GraphQL endpoint in batches through an APIClient's session.
+    extract(value) turns one operation's result into dealer rows, or None if it is not one."""
+
+    def __init__(self, http: APIClient, url: str, extract: Callable[[Any], Optional[List[Dict]]],
+                 batch_size: int = DEFAULT_BATCH_SIZE, key: Optional[Callable[[Dict], str]] = None,
+                 state: Optional[Callable[[Dict], Optional[str]]] = None):
+        self.http = http
+        self.url = url
+        self.extract = extract
+        self.batch_size = batch_size
+        # Cleared the first time the server refuses an array of persisted operations
+        self.array_batches = True
+        # Telemetry identity of a dealer row, passed through to the APIClient
+        self.telemetry = {k: v for k, v in (("key", key), ("state", state)) if v is not None}
+
+    def _batches(self, operations: Sequence[Operation]) -> List[Sequence[Operation]]:
+        return [operations[i:i + self.batch_size] for i in range(0, len(operations), self.batch_size)]
+
+    @staticmethod
+    def _label(batch: Sequence[Operation]) -> str:
+        return batch[0].label if len(batch) == 1 else f"{batch[0].label}..{batch[-1].label}"
+
+    async def _aliased(self, batch: Sequence[Operation], shared: Dict[str, Tuple[str, Any]],
+                       headers: Optional[Dict[str, str]]) -> List[Tuple[Operation, Optional[List[Dict]]]]:
+        query, variables = alias_document(batch, shared)
+
+        def rows(body) -> Optional[List[Dict]]:
+            data = body.get("data") if isinstance(body, dict) else None
+            if not isinstance(data, dict):
+                return None
+            return [row for i in range(len(batch)) for row in self.extract(data.get(f"b{i}")) or []]
+
+        body = await self.http.post_json(self.url, json={"query": query, "variables": variables},
+                                         headers=headers, query=self._label(batch), results=rows,
+                                         **self.telemetry)
+        if body is None:
+            return [(operation, None) for operation in batch]
+        failed = _error_aliases(body)
+        return [(operation, None if f"b{i}" in failed else self.extract(body["data"].get(f"b{i}")))
+                for i, operation in enumerate(batch)]
+
+    async def _persisted(self, batch: Sequence[Operation], operation_name: str, sha256: str,
+                         headers: Optional[Dict[str, str]]) -> List[Tuple[Operation, Optional[List[Dict]]]]:
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": sha256}}
+        payload = [{"operationName": operation_name, "extensions": extensions,
+                    "variables": {name: value for name, (_, value) in operation.variables.items()}}
+                   for operation in batch]
+
+        def rows(body) -> Optional[List[Dict]]:
+            if not isinstance(body, list) or len(body) != len(batch):
+                return None
+            return [row for operation, item in zip(batch, body)
+                    for row in self.extract(_field(item.get("data"), operation.field)) or []]
+
+        if self.array_batches:
+            body = await self.http.post_json(self.url, json=payload, headers=headers, query=self._label(batch),
+                                             results=rows, **self.telemetry)
+            if body is not None:
+                return [(operation, None if item.get("errors")
+                         else self.extract(_field(item.get("data"), operation.field)))
+                        for operation, item in zip(batch, body)]
+            if self.array_batches:
+                logger.info(f"{self.http.oem}: array batch refused; sending persisted queries one by one")
+                self.array_batches = False
+
+        # Not every server batches persisted queries over POST; GET them one at a time instead
+        async def single(operation: Operation, variables: Dict) -> Optional[List[Dict]]:
+            params = {"operationName": operation_name, "variables": json.dumps(variables),
+                      "extensions": json.dumps(extensions)}
+            body = await self.http.get_json(self.url, params=params, headers=headers, query=operation.label,
+                                            results=lambda b: self.extract(_field(b.get("data"), operation.field)),
+                                            **self.telemetry)
+            return None if body is None else self.extract(_field(body.get("data"), operation.field))
+
+        rows_each = await asyncio.gather(*(single(op, item["variables"]) for op, item in zip(batch, payload)))
+        return list(zip(batch, rows_each))
+
+    async def run(self, operations: Sequence[Operation], shared: Optional[Dict[str, Tuple[str, Any]]] = None,
+                  persisted: Optional[Tuple[str, str]] = None, headers: Optional[Dict[str, str]] = None
+                  ) -> AsyncIterator[Tuple[Operation, Optional[List[Dict]]]]:
+        """Yield (operation, dealer rows or None if it failed) as each batch answers.
+        persisted=(operationName, sha256Hash) sends array batches of that persisted query instead
+        of aliased documents."""
+        progress = self.http.progress
+        progress.start(self.http.oem, total=len(operations))
+        if persisted:
+            pending = [self._persisted(batch, *persisted, headers) for batch in self._batches(operations)]
+        else:
+            pending = [self._aliased(batch, shared or {}, headers) for batch in self._batches(operations)]
+        for finished in asyncio.as_completed(pending):
+            results = await finished
+            for operation, rows in results:
+                if rows is None:
+                    self.http.failed.append(operation.label)
+                yield operation, rows
+            progress.advance(self.http.oem, len(results))
+        progress.finish(self.http.oem)
+        if self.http.failed:
+            logger.warning(f"{self.http.oem}: {len(self.http.failed)} queries failed, "
+                           f"e.g. {', '.join(self.http.failed[:5])}")
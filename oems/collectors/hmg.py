@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Hyundai, Genesis and Kia dealers from the brands' own locator services.
+All three brands are collected over HTTP in one run that shares a single
+connection pool and response cache:
+
+    Hyundai  GET  hyundaiusa.com dealer.dealerByZip.service?maxdealers=5000
+    Genesis  GET  genesis.com /bin/api/v2/alldealers (ZIP search as fallback)
+    Kia      POST kia.com /us/services/en/dealers/search, over the ZIP grid
+
+Hyundai and Genesis try one bulk call first and only sweep the ZIP grid when
+that does not return a national-sized list; the grid's first query is then a
+cache hit. Dealers are deduplicated per brand by dealer code.
+
+Usage:
+    python -m oems.collectors.hmg                          # all three brands
+    python -m oems.collectors.hmg --brands Kia --limit 50
+    python -m oems.collectors.hmg --base-url http://127.0.0.1:8765   # against `oems mock`
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from oems.collectors.api import (DEFAULT_CONCURRENCY, APIClient, collector_parser, pick_brands, run_collector,
+                                 save_brands, zip3_points)
+from oems.dealers import REPO_ROOT, first_value, load_zip_codes
+from oems.profiling import stage
+from oems.refresh import plan_points
+
+logger = logging.getLogger(__name__)
+
+OEM = "HMG"
+# brand -> (site, output file)
+BRANDS = {
+    "Hyundai": ("https://www.hyundaiusa.com", "data/mainstream/hyundai.json"),
+    "Genesis": ("https://www.genesis.com", "data/luxury/genesis.json"),
+    "Kia": ("https://www.kia.com", "data/mainstream/kia.json"),
+}
+HYUNDAI_PATH = "/var/hyundai/services/dealer.dealerByZip.service"
+GENESIS_ALL_PATH = "/bin/api/v2/alldealers"
+GENESIS_ZIP_PATH = "/bin/api/v2/dealers"
+KIA_PATH = "/us/services/en/dealers/search"
+MAX_DEALERS = 5000
+KIA_RADIUS_MILES = 100
+# An answer this large is the national list, so no grid sweep is needed
+BULK_THRESHOLD = 150
+# Points tried for Hyundai's bulk call before giving up on it
+PROBE_POINTS = 5
+
+
+def extract_dealers(body) -> Optional[List[Dict]]:
+    """Dealer records from any of the three services: a list, or an object holding one"""
+    if isinstance(body, list):
+        return body
+    if isinstance(body, dict):
+        for key in ("dealers", "Dealers", "dealerList", "results", "data"):
+            if isinstance(body.get(key), list):
+                return body[key]
+    return None
+
+
+def dealer_code(record: Dict) -> str:
+    return str(first_value(record, "dealerCd", "dealerCode", "code", "id") or "")
+
+
+def _address(record: Dict) -> Dict:
+    address = record.get("address")
+    # Kia nests the address; Hyundai and Genesis keep it on the record
+    return address if isinstance(address, dict) else record
+
+
+def _state(record: Dict) -> Optional[str]:
+    return first_value(_address(record), "state", "stateCode")
+
+
+def to_standard(record: Dict) -> Dict:
+    """Standard dealer fields plus the dealer code and coordinates"""
+    address = _address(record)
+    location = record.get("location") if isinstance(record.get("location"), dict) else record
+    try:
+        latitude = float(first_value(location, "latitude", "lat"))
+        longitude = float(first_value(location, "longitude", "lng"))
+    except (TypeError, ValueError):
+        latitude = longitude = None
+    street = " ".join(str(p).strip() for p in (first_value(address, "address1", "addressLine1", "street1", "street"),
+                                                first_value(address, "address2", "addressLine2", "street2"))
+                      if p and str(p).strip())
+    return {
+        "Dealer": str(first_value(record, "dealerNm", "dealerName", "name") or "").strip(),
+        "Website": first_value(record, "dealerUrl", "webSite", "website", "url"),
+        "Phone": first_value(record, "phone", "salesPhone", "phoneNumber"),
+        "Email": first_value(record, "email", "dealerEmail"),
+        "Street": street,
+        "City": str(first_value(address, "city") or "").strip(),
+        "State": str(_state(record) or "").strip(),
+        "ZIP": str(first_value(address, "zipCd", "zipCode", "zip", "postalCode") or "")[:5],
+        "dealer_code": dealer_code(record),
+        "latitude": latitude,
+        "longitude": longitude,
+    }
+
+
+class HMGClient:
+    """The three brands' sweeps, run concurrently over one pooled, caching APIClient"""
+
+    def __init__(self, brands: Sequence[str] = tuple(BRANDS), base_url: Optional[str] = None,
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        self.brands = pick_brands(brands, BRANDS)
+        # A base URL (the mock server) replaces every site
+        self.sites = {brand: (base_url or BRANDS[brand][0]).rstrip("/") for brand in self.brands}
+        self.http = APIClient(OEM, concurrency, cache=True)
+        self.dealers: Dict[str, Dict[str, Dict]] = {brand: {} for brand in self.brands}
+
+    async def _get(self, brand: str, method: str, path: str, query: str, **kwargs) -> Optional[List[Dict]]:
+        body = await self.http.request_json(method, self.sites[brand] + path, query=query, results=extract_dealers,
+                                            key=lambda d: f"{brand}:{dealer_code(d)}", state=_state, oem=brand,
+                                            headers={"Referer": BRANDS[brand][0] + "/"}, **kwargs)
+        if body is None:
+            self.http.failed.append(f"{brand}:{query}")
+            return None
+        records = extract_dealers(body)
+        for record in records:
+            code = dealer_code(record)
+            if code:
+                self.dealers[brand].setdefault(code, record)
+        return records
+
+    async def _grid(self, brand: str, points: Sequence[str], visit):
+        logger.info(f"{brand}: sweeping {len(points)} points")
+        await self.http.sweep(points, visit, oem=brand)
+
+    async def hyundai(self, points: Sequence[str]):
+        async def visit(zip_code: str) -> Optional[List[Dict]]:
+            return await self._get("Hyundai", "GET", HYUNDAI_PATH, zip_code, params={
+                "brand": "hyundai", "model": "all", "lang": "en-us", "zip": zip_code, "maxdealers": MAX_DEALERS})
+
+        for zip_code in points[:PROBE_POINTS]:
+            if await visit(zip_code) is not None:
+                break
+        if len(self.dealers["Hyundai"]) < BULK_THRESHOLD:
+            await self._grid("Hyundai", points, visit)
+
+    async def genesis(self, points: Sequence[str]):
+        everything = await self._get("Genesis", "GET", GENESIS_ALL_PATH, "all")
+        if everything is not None and len(everything) >= BULK_THRESHOLD:
+            return
+        if everything is not None:
+            # A short list is still real; the grid only adds to it
+            logger.info(f"Genesis: alldealers returned {len(everything)}; checking the ZIP grid too")
+        else:
+            self.http.failed.remove("Genesis:all")
+
+        async def visit(zip_code: str):
+            await self._get("Genesis", "GET", GENESIS_ZIP_PATH, zip_code, params={"zip": zip_code})
+
+        await self._grid("Genesis", points, visit)
+
+    async def kia(self, points: Sequence[str]):
+        async def visit(zip_code: str):
+            await self._get("Kia", "POST", KIA_PATH, zip_code, json={"zipCode": zip_code, "radius": KIA_RADIUS_MILES})
+
+        await self._grid("Kia", points, visit)
+
+    async def sweep(self, points: Sequence[str]) -> Dict[str, List[Dict]]:
+        async with self.http:
+            await asyncio.gather(*(getattr(self, brand.lower())(points) for brand in self.brands))
+        return {brand: list(records.values()) for brand, records in self.dealers.items()}
+
+
+async def collect(brands: Sequence[str] = tuple(BRANDS), base_url: Optional[str] = None,
+                  concurrency: int = DEFAULT_CONCURRENCY, limit: Optional[int] = None,
+                  root: Path = REPO_ROOT) -> Dict[str, Path]:
+    """Registry entry point: all three brands in one run, one output file each"""
+    client = HMGClient(brands, base_url, concurrency)
+    points = plan_points(client.brands, zip3_points(load_zip_codes())[:limit])
+    found = await client.sweep(points)
+    logger.info(f"{sum(map(len, found.values()))} dealers, {client.http.cache_hits} requests served from cache")
+    with stage("parse"):
+        standard = {brand: [to_standard(r) for r in records] for brand, records in found.items()}
+    return save_brands(standard, {brand: (brand, output) for brand, (_, output) in BRANDS.items()}, "hmg_api", root,
+                       client.http)
+
+
+def main(argv=None) -> int:
+    parser = collector_parser("oems.collectors.hmg", __doc__)
+    parser.add_argument("--brands", default=",".join(BRANDS), help="Brands to collect (default: all three)")
+    parser.add_argument("--limit", type=int, default=None, help="Only sweep the first N query points")
+    args = parser.parse_args(argv)
+    return run_collector(collect(args.brands.split(","), args.base_url, args.concurrency, args.limit))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Honda and Acura dealers from the American Honda platform API.
+automobiles.honda.com (/platform/api/v2/dealer, division A) and acura.com
+(/platform/api/v1/dealers, division B) answer the locator's own JSON queries,
+so both divisions are collected over plain HTTP instead of driving the locator
+page in a browser. Each division is queried at every point of the planned ZIP
+grid through one connection pool and dealers are deduplicated by their
+DealerNumber, keeping the distance to the nearest query point.
+
+Queries ask for maxResults=5000. When a division's first answer already holds
+a national-sized list the service is honouring it, and the rest of that
+division's points are skipped.
+
+Usage:
+    python -m oems.collectors.honda                        # Honda and Acura
+    python -m oems.collectors.honda --divisions B --limit 50
+    python -m oems.collectors.honda --base-url http://127.0.0.1:8765   # against `oems mock`
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from oems.collectors.api import (DEFAULT_CONCURRENCY, APIClient, collector_parser, pick_brands, run_collector,
+                                 save_brands, zip3_points)
+from oems.dealers import REPO_ROOT, first_value, load_zip_codes
+from oems.profiling import stage
+from oems.refresh import plan_points
+
+logger = logging.getLogger(__name__)
+
+OEM = "Honda"
+# productDivisionCode -> (make, site, path, ZIP parameter, extra parameters, locator page, output file)
+DIVISIONS = {
+    "A": ("Honda", "https://automobiles.honda.com", "/platform/api/v2/dealer", "zip",
+          {"excludeServiceCenters": "true"}, "/tools/dealership-locator", "data/honda.json"),
+    "B": ("Acura", "https://www.acura.com", "/platform/api/v1/dealers", "zipCode",
+          {"getDDPOnly": "false"}, "/dealer-locator", "data/mainstream/acura.json"),
+}
+MAX_RESULTS = 5000
+# An answer this large means maxResults is honoured nationally and one query is enough
+BULK_THRESHOLD = 500
+
+
+def extract_dealers(body) -> Optional[List[Dict]]:
+    """Dealer records from a platform API body, or None if it does not look like one"""
+    if isinstance(body, list):
+        return body
+    if not isinstance(body, dict) or not ("Dealers" in body or "dealers" in body):
+        return None
+    # null when there are no dealers near this point
+    dealers = body.get("Dealers", body.get("dealers")) or []
+    return dealers if isinstance(dealers, list) else None
+
+
+def dealer_number(record: Dict) -> str:
+    return str(first_value(record, "DealerNumber", "dealerNumber", "DealerCode", "DealerId") or "")
+
+
+def _float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def distance(record: Dict) -> Optional[float]:
+    return _float(first_value(record, "Distance", "DrivingDistanceMiles", "distance"))
+
+
+def to_standard(record: Dict) -> Dict:
+    """Standard dealer fields plus the DealerNumber, coordinates and distance"""
+    return {
+        "Dealer": str(first_value(record, "Name", "name", "DealerName") or "").strip(),
+        "Website": first_value(record, "WebAddress", "Website", "URL"),
+        "Phone": first_value(record, "Phone", "SalesPhone", "phone"),
+        "Email": first_value(record, "Email", "email"),
+        "Street": " ".join(str(p).strip() for p in (first_value(record, "Address", "Address1"),
+                                                    first_value(record, "Address2")) if p and str(p).strip()),
+        "City": str(first_value(record, "City", "city") or "").strip(),
+        "State": str(first_value(record, "State", "state") or "").strip(),
+        "ZIP": str(first_value(record, "ZipCode", "Zip", "PostalCode") or "")[:5],
+        "dealer_code": dealer_number(record),
+        "latitude": _float(first_value(record, "Latitude", "latitude")),
+        "longitude": _float(first_value(record, "Longitude", "longitude")),
+        "distance_miles": distance(record),
+    }
+
+
+class PlatformAPIClient:
+    """One pass over the grid for every division, deduplicating by DealerNumber per division"""
+
+    def __init__(self, divisions: Sequence[str] = tuple(DIVISIONS), base_url: Optional[str] = None,
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        self.divisions = pick_brands(divisions, DIVISIONS, "division codes")
+        # A base URL (the mock server) replaces both sites
+        self.urls = {code: (base_url or DIVISIONS[code][1]).rstrip("/") + DIVISIONS[code][2]
+                     for code in self.divisions}
+        self.http = APIClient(OEM, concurrency)
+        self.dealers: Dict[str, Dict[str, Dict]] = {code: {} for code in self.divisions}
+        self.bulk = set()
+
+    async def _query(self, code: str, zip_code: str):
+        if code in self.bulk:
+            return
+        make, site, _, zip_param, extra, locator, _ = DIVISIONS[code]
+        params = dict(extra, productDivisionCode=code, maxResults=MAX_RESULTS, **{zip_param: zip_code})
+        body = await self.http.get_json(self.urls[code], params=params, query=zip_code, results=extract_dealers,
+                                        headers={"Referer": site + locator},
+                                        key=lambda d: f"{code}:{dealer_number(d)}", state=lambda d: d.get("State"))
+        if body is None:
+            self.http.failed.append(f"{make}:{zip_code}")
+            return
+        records = extract_dealers(body)
+        if len(records) >= BULK_THRESHOLD and code not in self.bulk:
+            logger.info(f"{make}: {len(records)} dealers in one answer; skipping the remaining points")
+            self.bulk.add(code)
+        for record in records:
+            number = dealer_number(record)
+            if not number:
+                continue
+            known = self.dealers[code].get(number)
+            if known is None or (distance(record) or 0) < (distance(known) or 0):
+                self.dealers[code][number] = record
+
+    async def _point(self, zip_code: str):
+        await asyncio.gather(*(self._query(code, zip_code) for code in self.divisions))
+
+    async def sweep(self, points: Sequence[str]) -> Dict[str, List[Dict]]:
+        async with self.http:
+            await self.http.sweep(points, self._point)
+        return {code: list(records.values()) for code, records in self.dealers.items()}
+
+
+async def collect(divisions: Sequence[str] = tuple(DIVISIONS), base_url: Optional[str] = None,
+                  concurrency: int = DEFAULT_CONCURRENCY, limit: Optional[int] = None,
+                  root: Path = REPO_ROOT) -> Dict[str, Path]:
+    """Sweep the given divisions, one output file each"""
+    client = PlatformAPIClient(divisions, base_url, concurrency)
+    points = plan_points([DIVISIONS[c][0] for c in client.divisions], zip3_points(load_zip_codes())[:limit])
+    logger.info(f"Sweeping {len(points)} points for {', '.join(DIVISIONS[c][0] for c in client.divisions)}")
+    found = await client.sweep(points)
+    with stage("parse"):
+        standard = {code: [to_standard(r) for r in records] for code, records in found.items()}
+    return save_brands(standard, {code: (division[0], division[6]) for code, division in DIVISIONS.items()},
+                       "honda_platform_api", root, client.http)
+
+
+async def collect_honda() -> Dict[str, Path]:
+    """Registry entry point for Honda (division A)"""
+    return await collect(["A"])
+
+
+async def collect_acura() -> Dict[str, Path]:
+    """Registry entry point for Acura (division B)"""
+    return await collect(["B"])
+
+
+def main(argv=None) -> int:
+    parser = collector_parser("oems.collectors.honda", __doc__,
+                              base_url_help="Send every division's queries here instead")
+    parser.add_argument("--divisions", default=",".join(DIVISIONS),
+                        help="productDivisionCodes to collect: A Honda, B Acura (default: both)")
+    parser.add_argument("--limit", type=int, default=None, help="Only sweep the first N query points")
+    args = parser.parse_args(argv)
+    return run_collector(collect(args.divisions.split(","), args.base_url, args.concurrency, args.limit),
+                         labels={code: division[0] for code, division in DIVISIONS.items()})
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Jaguar and Land Rover retailers from the shared JLR retailer locator.
+retailerlocator.jaguarlandrover.com/dealers serves both brands, so one sweep
+queries each planned point once without a brand filter and tags every
+record by the brand it reports. Most retailers sell both brands and are
+listed once per brand under separate ids; those records are merged into one
+retailer (matched by dealer id, else by street and ZIP) carrying both brand
+flags. If the locator insists on a brand, the sweep falls back to one request
+per brand at each point, tagging records by the brand asked for.
+
+Query points are ZIP grid points thinned to one per SPACING_MILES, searched
+at RADIUS_MILES. The locator answers at most MAX_RESULTS listings, nearest
+first, so an answer that long was cut short: grid points around it beyond its
+farthest listing are queried as well, as in oems.collectors.gm.
+
+Usage:
+    python -m oems.collectors.jlr                          # Jaguar and Land Rover
+    python -m oems.collectors.jlr --radius 500 --concurrency 4
+    python -m oems.collectors.jlr --base-url http://127.0.0.1:8765   # against `oems mock`
+"""
+
+import logging
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from oems.collectors.api import (DEFAULT_CONCURRENCY, APIClient, collector_parser, locate_points, miles,
+                                 pick_brands, run_collector, save_brands, spread_points, zip3_points)
+from oems.dealers import REPO_ROOT, first_value, load_zip_codes
+from oems.profiling import stage
+from oems.refresh import plan_points
+
+logger = logging.getLogger(__name__)
+
+OEM = "JLR"
+BASE_URL = "https://retailerlocator.jaguarlandrover.com"
+PATH = "/dealers"
+# brand -> (output file, output flag)
+BRANDS = {
+    "Jaguar": ("data/luxury/jaguar.json", "jaguar"),
+    "Land Rover": ("data/luxury/land-rover.json", "land_rover"),
+}
+RADIUS_MILES = 300
+SPACING_MILES = 250
+# Listings per answer at most; an answer this long may have left farther retailers out
+MAX_RESULTS = 50
+# Grid points queried around a cut-short answer are at least this far apart
+REFINE_SPACING_MILES = 60
+# Points tried when checking whether unfiltered queries work
+PROBE_POINTS = 5
+REFERER = "https://www.landroverusa.com/national-dealer-locator.html"
+
+
+def extract_dealers(body) -> Optional[List[Dict]]:
+    """Retailer records from a locator body: a list, or an object holding one"""
+    if isinstance(body, list):
+        return body
+    if isinstance(body, dict):
+        for key in ("dealers", "retailers", "results", "items"):
+            if isinstance(body.get(key), list):
+                return body[key]
+    return None
+
+
+def record_brands(record: Dict) -> List[str]:
+    """Brands a record says it sells, as BRANDS names"""
+    value = first_value(record, "brand", "brands", "brandName", "franchises")
+    values = value if isinstance(value, list) else [value] if value else []
+    found = []
+    for item in values:
+        if isinstance(item, dict):
+            item = first_value(item, "name", "brand", "code")
+        text = re.sub(r"[^a-z]", "", str(item or "").lower())
+        for brand in BRANDS:
+            if text in (re.sub(r"[^a-z]", "", brand.lower()), brand[0].lower()) and brand not in found:
+                found.append(brand)
+    return found
+
+
+def _address(record: Dict) -> Dict:
+    address = first_value(record, "address", "Address") or {}
+    return address if isinstance(address, dict) else {"addressLine1": str(address)}
+
+
+def _street(record: Dict) -> str:
+    address = _address(record)
+    return " ".join(str(p).strip() for p in (first_value(address, "addressLine1", "street", "line1"),
+                                              first_value(address, "addressLine2", "line2")) if p and str(p).strip())
+
+
+def _zip(record: Dict) -> str:
+    return str(first_value(_address(record), "postCode", "postalCode", "zipCode") or "")[:5]
+
+
+def _location(record: Dict) -> Optional[Tuple[float, float]]:
+    try:
+        return float(first_value(record, "latitude", "lat")), float(first_value(record, "longitude", "lng"))
+    except (TypeError, ValueError):
+        return None
+
+
+def retailer_key(record: Dict) -> str:
+    """Street and ZIP identify a retailer across its per-brand listings; the id only if those are missing"""
+    street = re.sub(r"[^a-z0-9]", "", _street(record).lower())
+    if street and _zip(record):
+        return f"{street}|{_zip(record)}"
+    return str(first_value(record, "dealerId", "id", "ciCode") or "")
+
+
+def to_standard(record: Dict) -> Dict:
+    """Standard dealer fields plus ids, coordinates and one flag per brand"""
+    address = _address(record)
+    latitude, longitude = _location(record) or (None, None)
+    dealer = {
+        "Dealer": str(first_value(record, "name", "dealerName") or "").strip(),
+        "Website": first_value(record, "url", "website", "primaryUrl"),
+        "Phone": first_value(record, "phone", "phoneNumber", "salesPhone"),
+        "Email": first_value(record, "email"),
+        "Street": _street(record),
+        "City": str(first_value(address, "city", "town") or "").strip(),
+        "State": str(first_value(address, "state", "region", "county") or "").strip(),
+        "ZIP": _zip(record),
+        "dealer_code": ",".join(record["dealer_ids"]),
+        "latitude": latitude,
+        "longitude": longitude,
+        "brands": record["brands"],
+    }
+    for brand, (_, flag) in BRANDS.items():
+        dealer[flag] = brand in record["brands"]
+    return dealer
+
+
+class RetailerLocatorClient:
+    """Sweep of the shared locator: one session and one retailer table for both brands"""
+
+    def __init__(self, brands: Sequence[str] = tuple(BRANDS), base_url: str = BASE_URL,
+                 concurrency: int = DEFAULT_CONCURRENCY, radius: float = RADIUS_MILES):
+        self.brands = pick_brands(brands, BRANDS)
+        self.url = base_url.rstrip("/") + PATH
+        self.radius = radius
+        self.http = APIClient(OEM, concurrency, headers={"Referer": REFERER})
+        self.combined = len(self.brands) > 1
+        self.retailers: Dict[str, Dict] = {}
+        # ZIP -> distance of the farthest listing in an answer that hit MAX_RESULTS; farther ones may be missing
+        self.capped: Dict[str, float] = {}
+        self.queried: Dict[str, Tuple[float, float]] = {}
+        # (brand asked for, or None for all of them; ZIP) already answered
+        self.answered = set()
+        self.requests = 0
+
+    async def fetch(self, brand: Optional[str], zip_code: str, point: Tuple[float, float]) -> Optional[List[Dict]]:
+        """Records near one point, for one brand or (brand=None) all of them, added to the retailer
+        table as they come; None if the query failed"""
+        params = {"postCode": zip_code, "requestMarketLocale": "en_us", "country": "us",
+                  "filter": "dealer,approvedPreOwned", "radius": self.radius, "unitOfMeasure": "Miles"}
+        if brand:
+            params["brand"] = brand
+        self.requests += 1
+        body = await self.http.get_json(self.url, params=params, query=zip_code, results=extract_dealers,
+                                        key=lambda d: str(first_value(d, "dealerId", "id") or ""),
+                                        state=lambda d: first_value(_address(d), "state"))
+        rows = None if body is None else extract_dealers(body)
+        if rows is None:
+            return None
+        self.answered.add((brand, zip_code))
+        self._add(rows, brand)
+        if len(rows) >= MAX_RESULTS:
+            reach = max((miles(point, p) for p in map(_location, rows) if p), default=0.0)
+            self.capped[zip_code] = min(self.capped.get(zip_code, reach), reach)
+        return rows
+
+    def _add(self, rows: List[Dict], queried: Optional[str]):
+        for record in rows:
+            # An untagged record from an unfiltered query could be either brand's
+            brands = record_brands(record) or ([queried] if queried else [])
+            key = retailer_key(record)
+            if not key or not brands:
+                continue
+            known = self.retailers.setdefault(key, dict(record, brands=[], dealer_ids=[]))
+            known["brands"] = [b for b in BRANDS if b in known["brands"] or b in brands]
+            dealer_id = str(first_value(record, "dealerId", "id", "ciCode") or "")
+            if dealer_id and dealer_id not in known["dealer_ids"]:
+                known["dealer_ids"].append(dealer_id)
+
+    async def _probe(self, located: Sequence[Tuple[str, Tuple[float, float]]]):
+        """Check that unfiltered queries come back tagged by brand before relying on them; the
+        answers it gets are kept like any other"""
+        if not self.combined:
+            return
+        for zip_code, point in located[:PROBE_POINTS]:
+            rows = await self.fetch(None, zip_code, point)
+            if rows and all(record_brands(r) for r in rows):
+                return
+            if rows or await self.fetch(self.brands[0], zip_code, point):
+                # Untagged records, or a brand query answered where the unfiltered one failed
+                logger.warning("Unfiltered queries are not usable; querying each brand separately")
+                self.combined = False
+                return
+
+    async def _sweep(self, located: Sequence[Tuple[str, Tuple[float, float]]]):
+        centers = dict(located)
+        self.queried.update(centers)
+
+        async def visit(zip_code: str):
+            for brand in ([None] if self.combined else self.brands):
+                if (brand, zip_code) in self.answered:
+                    continue
+                if await self.fetch(brand, zip_code, centers[zip_code]) is None:
+                    self.http.failed.append(f"{zip_code}:{brand or 'all'}")
+
+        await self.http.sweep(list(centers), visit)
+
+    def refinement(self, grid: Sequence[Tuple[str, Tuple[float, float]]]) -> List[Tuple[str, Tuple[float, float]]]:
+        """Unqueried grid points within SPACING_MILES beyond the farthest listing of a cut-short
+        answer, thinned to one per REFINE_SPACING_MILES"""
+        capped = [(self.queried[z], reach) for z, reach in self.capped.items() if z in self.queried]
+        return spread_points([(zip_code, point) for zip_code, point in grid if zip_code not in self.queried
+                              and any(reach < miles(point, c) < reach + SPACING_MILES for c, reach in capped)],
+                             REFINE_SPACING_MILES)
+
+    async def sweep(self, located: Sequence[Tuple[str, Tuple[float, float]]],
+                    grid: Sequence[Tuple[str, Tuple[float, float]]] = ()) -> Dict[str, List[Dict]]:
+        """Query every located point, then the grid points around cut-short answers, and return
+        brand -> merged retailer records"""
+        async with self.http:
+            await self._probe(located)
+            await self._sweep(located)
+            extra = self.refinement(grid)
+            if extra:
+                logger.info(f"{len(self.capped)} points hit {MAX_RESULTS} listings; "
+                            f"querying {len(extra)} grid points around them")
+                await self._sweep(extra)
+        return {brand: [r for r in self.retailers.values() if brand in r["brands"]] for brand in self.brands}
+
+
+async def collect(brands: Sequence[str] = tuple(BRANDS), base_url: str = BASE_URL,
+                  concurrency: int = DEFAULT_CONCURRENCY, radius: float = RADIUS_MILES,
+                  root: Path = REPO_ROOT) -> Dict[str, Path]:
+    """Registry entry point: one sweep for both brands, one output file per brand"""
+    grid = locate_points(zip3_points(load_zip_codes()))
+    located = spread_points(grid, min(SPACING_MILES, radius))
+    client = RetailerLocatorClient(brands, base_url, concurrency, radius)
+    located = plan_points(client.brands, located)
+    logger.info(f"Sweeping {len(located)} points for {', '.join(client.brands)}")
+    split = await client.sweep(located, grid)
+    dual = sum(1 for r in client.retailers.values() if len(r["brands"]) > 1)
+    mode = "unfiltered" if client.combined else "per-brand"
+    logger.info(f"{len(client.retailers)} retailers ({dual} dual-brand) from {client.requests} requests ({mode})")
+    # Dual-brand retailers appear in both files
+    with stage("parse"):
+        standard = {brand: [to_standard(r) for r in records] for brand, records in split.items()}
+    return save_brands(standard, {brand: (brand, output) for brand, (output, _) in BRANDS.items()},
+                       "jlr_retailer_locator", root, client.http)
+
+
+def main(argv=None) -> int:
+    parser = collector_parser("oems.collectors.jlr", __doc__, BASE_URL, "Send the queries here instead")
+    parser.add_argument("--brands", default=",".join(BRANDS), help="Brands to collect (default: both)")
+    parser.add_argument("--radius", type=float, default=RADIUS_MILES, help="Search radius per point, in miles")
+    args = parser.parse_args(argv)
+    return run_collector(collect(args.brands.split(","), args.base_url, args.concurrency, args.radius))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
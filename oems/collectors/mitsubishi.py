@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Mitsubishi dealers from the mitsubishicars.com GraphQL locator.
+The locator only accepts its persisted searchDealer query, which returns every
+dealer within the given radius of a point. Query centers are ZIP grid points
+thinned to one per SPACING_MILES, and the operations go out as arrays of
+persisted queries, DEFAULT_BATCH_SIZE per POST, falling back to one GET per
+center if the server refuses arrays. Dealers are deduplicated by dealer code
+as each batch answers.
+
+Usage:
+    python -m oems.collectors.mitsubishi
+    python -m oems.collectors.mitsubishi --radius 500 --batch-size 10
+    python -m oems.collectors.mitsubishi --base-url http://127.0.0.1:8765   # against `oems mock`
+"""
+
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from oems.collectors.api import (DEFAULT_CONCURRENCY, APIClient, collector_parser, locate_points, run_collector,
+                                 spread_points, write_dealers, zip3_points)
+from oems.collectors.graphql import DEFAULT_BATCH_SIZE, GraphQLClient, Operation
+from oems.dealers import REPO_ROOT, first_value, load_zip_codes
+from oems.profiling import stage
+from oems.refresh import plan_points
+
+logger = logging.getLogger(__name__)
+
+OEM = "Mitsubishi"
+URL = "https://www-graphql.prod.mipulse.co/prod/graphql"
+OUTPUT = "data/mainstream/mitsubishi.json"
+OPERATION_NAME = "searchDealer"
+QUERY_HASH = "509a0311cd943cae03ef78f5964463ab328bdf08d72411ee4de7e41e01e5c793"
+REFERER = "https://www.mitsubishicars.com/car-dealerships-near-me"
+# The locator answers up to 1000 miles; a tighter radius keeps answers small and centers overlapping
+RADIUS_MILES = 300
+SPACING_MILES = 250
+
+
+def extract_dealers(value) -> Optional[List[Dict]]:
+    """Dealer records from a searchDealer result: a list, or an object holding one"""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, dict):
+        for key in ("dealers", "results", "items", "searchDealer"):
+            if key in value:
+                return extract_dealers(value[key] or [])
+    return None
+
+
+def dealer_code(record: Dict) -> str:
+    return str(first_value(record, "dealerCode", "code", "dealerId", "id") or "")
+
+
+def to_standard(record: Dict) -> Dict:
+    """Standard dealer fields plus the dealer code and coordinates"""
+    address = first_value(record, "address") or {}
+    if not isinstance(address, dict):
+        address = {"address1": str(address)}
+    location = first_value(record, "location", "geolocation") or record
+    try:
+        latitude = float(first_value(location, "latitude", "lat"))
+        longitude = float(first_value(location, "longitude", "lng"))
+    except (TypeError, ValueError):
+        latitude = longitude = None
+    return {
+        "Dealer": str(first_value(record, "name", "dealerName") or "").strip(),
+        "Website": first_value(record, "url", "website", "dealerUrl"),
+        "Phone": first_value(record, "phone", "salesPhone", "phoneNumber"),
+        "Email": first_value(record, "email"),
+        "Street": " ".join(str(p).strip() for p in (first_value(address, "address1", "street", "line1"),
+                                                    first_value(address, "address2", "line2")) if p and str(p).strip()),
+        "City": str(first_value(address, "city") or "").strip(),
+        "State": str(first_value(address, "state", "stateCode") or "").strip(),
+        "ZIP": str(first_value(address, "zipcode", "zipCode", "postalCode") or "")[:5],
+        "dealer_code": dealer_code(record),
+        "latitude": latitude,
+        "longitude": longitude,
+    }
+
+
+def _state(record: Dict) -> Optional[str]:
+    address = record.get("address")
+    return first_value(address, "state", "stateCode") if isinstance(address, dict) else None
+
+
+async def collect(url: str = URL, radius: float = RADIUS_MILES, concurrency: int = DEFAULT_CONCURRENCY,
+                  batch_size: int = DEFAULT_BATCH_SIZE, root: Path = REPO_ROOT) -> Path:
+    """Registry entry point: batched persisted queries over spread-out centers, one output file"""
+    centers = plan_points([OEM], spread_points(locate_points(zip3_points(load_zip_codes())),
+                                               min(SPACING_MILES, radius)))
+    logger.info(f"Querying {len(centers)} centers at {radius:g} miles")
+    operations = [Operation(zip_code, OPERATION_NAME, {
+        "latitude": ("Float", lat), "longitude": ("Float", lng), "service": ("String", "all"),
+        "filters": ("String", None), "radius": ("Int", radius), "market": ("String", "us"),
+        "language": ("String", "en"), "path": ("String", "/us/en/car-dealerships-near-me")})
+        for zip_code, (lat, lng) in centers]
+    dealers: Dict[str, Dict] = {}
+    async with APIClient(OEM, concurrency, headers={"Referer": REFERER}) as http:
+        client = GraphQLClient(http, url, extract_dealers, batch_size, key=dealer_code, state=_state)
+        async for _, rows in client.run(operations, persisted=(OPERATION_NAME, QUERY_HASH)):
+            for record in rows or []:
+                code = dealer_code(record)
+                if code:
+                    dealers.setdefault(code, record)
+    with stage("parse"):
+        standard = [to_standard(r) for r in dealers.values()]
+    return write_dealers(OEM, standard, root / OUTPUT, "mipulse_graphql", http.failed_share())
+
+
+def main(argv=None) -> int:
+    parser = collector_parser("oems.collectors.mitsubishi", __doc__,
+                              base_url_help="Send queries to <base-url>/prod/graphql instead")
+    parser.add_argument("--radius", type=float, default=RADIUS_MILES, help="Search radius per center, in miles")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Centers per POST")
+    args = parser.parse_args(argv)
+    url = args.base_url.rstrip("/") + "/prod/graphql" if args.base_url else URL
+    return run_collector(collect(url, args.radius, args.concurrency, args.batch_size), OEM)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+INFINITI and Nissan dealers from the graphql.nissanusa.com dealer API.
+Both brands share one GraphQL endpoint, selected by the market's brand. A
+sweep first asks getAllDealers for the whole network in one request; if the
+server does not answer that, it falls back to getDealersByLatLng over the
+planned ZIP grid, DEFAULT_BATCH_SIZE locations aliased into each POST. Only
+the fields written to the output are selected, and dealers are deduplicated
+by id as each batch answers.
+
+The Nissan brand only answers the site's own locator app. Its credentials are
+captured once per run from the locator page in a headless browser
+(oems.collectors.auth) and captured again only when they expire or the API
+answers 401/403; pass `headers` copied from a browser to skip that.
+
+Usage:
+    python -m oems.collectors.nissan                       # INFINITI
+    python -m oems.collectors.nissan --grid --batch-size 40 --limit 100
+    python -m oems.collectors.nissan --brands Nissan        # one headless browser launch, then HTTP
+    python -m oems.collectors.nissan --base-url http://127.0.0.1:8765   # against `oems mock`
+"""
+
+import contextlib
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+
+from oems.collectors.api import (DEFAULT_CONCURRENCY, APIClient, CollectionFailed, TokenSession, add_header_option,
+                                 collector_parser, locate_points, parse_headers, pick_brands, run_collector,
+                                 write_dealers, zip3_points)
+from oems.collectors.auth import BrowserBootstrap
+from oems.collectors.graphql import DEFAULT_BATCH_SIZE, GraphQLClient, Operation
+from oems.dealers import REPO_ROOT, load_zip_codes
+from oems.profiling import stage
+
+logger = logging.getLogger(__name__)
+
+URL = "https://graphql.nissanusa.com/graphql"
+# brand -> (market brand, site, output file)
+BRANDS = {
+    "INFINITI": ("infiniti", "https://www.infinitiusa.com", "data/luxury/infiniti.json"),
+    "Nissan": ("nissan", "https://www.nissanusa.com", "data/nissan.json"),
+}
+# Brands whose API wants the credentials its locator page's app sends
+LOCATOR_PAGES = {"Nissan": "/dealer-locator.html"}
+FIELDS = ("id name phoneNumber websiteURL address { streetLine1 city state postalCode } "
+          "geolocation { latitude longitude }")
+RADIUS_MILES = 100
+PAGE_SIZE = 50
+
+
+def market(brand: str) -> Dict[str, str]:
+    return {"lang": "en", "application": "dealerConnect", "region": "us", "brand": brand}
+
+
+def _rows(value) -> Optional[List[Dict]]:
+    return value if isinstance(value, list) else None
+
+
+def _all_rows(body) -> Optional[List[Dict]]:
+    data = body.get("data") if isinstance(body, dict) else None
+    return _rows(data.get("getAllDealers")) if isinstance(data, dict) else None
+
+
+def to_standard(record: Dict) -> Dict:
+    """Standard dealer fields plus the dealer id and coordinates"""
+    address = record.get("address") or {}
+    location = record.get("geolocation") or {}
+    try:
+        latitude, longitude = float(location["latitude"]), float(location["longitude"])
+    except (KeyError, TypeError, ValueError):
+        latitude = longitude = None
+    return {
+        "Dealer": (record.get("name") or "").strip(),
+        "Website": record.get("websiteURL") or None,
+        "Phone": record.get("phoneNumber") or None,
+        "Email": None,
+        "Street": (address.get("streetLine1") or "").strip(),
+        "City": (address.get("city") or "").strip(),
+        "State": (address.get("state") or "").strip(),
+        "ZIP": str(address.get("postalCode") or "")[:5],
+        "dealer_code": str(record.get("id")),
+        "latitude": latitude,
+        "longitude": longitude,
+    }
+
+
+class DealerGraphQLClient:
+    """One brand's dealers: the whole list in one query if the server allows it, else a batched grid"""
+
+    def __init__(self, brand: str = "INFINITI", url: str = URL, concurrency: int = DEFAULT_CONCURRENCY,
+                 batch_size: int = DEFAULT_BATCH_SIZE, headers: Optional[Dict[str, str]] = None,
+                 auth: Optional[TokenSession] = None):
+        self.brand = pick_brands([brand], BRANDS)[0]
+        self.market, site, _ = BRANDS[brand]
+        headers = dict({"Origin": site, "Referer": site + "/"}, **(headers or {}))
+        self.http = APIClient(brand, concurrency, headers=headers, auth=auth)
+        self.graphql = GraphQLClient(self.http, url, _rows, batch_size, key=lambda d: str(d.get("id")),
+                                     state=lambda d: (d.get("address") or {}).get("state"))
+        self.dealers: Dict[str, Dict] = {}
+
+    def _add(self, rows: List[Dict]):
+        for record in rows:
+            self.dealers.setdefault(str(record.get("id")), record)
+
+    async def all_dealers(self) -> bool:
+        """The whole network in one request; False if the server would not answer it"""
+        query = f"query AllDealers($market: Market!) {{ getAllDealers(market: $market) {{ {FIELDS} }} }}"
+        payload = {"query": query, "variables": {"market": market(self.market)}}
+        body = await self.http.post_json(self.graphql.url, json=payload, query="all", results=_all_rows,
+                                         **self.graphql.telemetry)
+        rows = _all_rows(body) if body is not None else None
+        if not rows:
+            return False
+        self._add(rows)
+        return True
+
+    async def grid(self, points: Sequence[str]):
+        operations = [Operation(zip_code, "getDealersByLatLng",
+                                {"location": ("Location!", {"latitude": lat, "longitude": lng})}, FIELDS)
+                      for zip_code, (lat, lng) in locate_points(points)]
+        shared = {"market": ("Market!", market(self.market)), "size": ("Int", PAGE_SIZE),
+                  "radius": ("Float", RADIUS_MILES)}
+        async for _, rows in self.graphql.run(operations, shared=shared):
+            if rows:
+                self._add(rows)
+
+    async def sweep(self, points: Sequence[str], grid: bool = False) -> List[Dict]:
+        async with self.http:
+            if grid or not await self.all_dealers():
+                if not grid:
+                    logger.info(f"{self.http.oem}: getAllDealers unavailable; querying {len(points)} points")
+                await self.grid(points)
+        return list(self.dealers.values())
+
+
+async def collect(brands: Sequence[str] = ("INFINITI",), url: str = URL, concurrency: int = DEFAULT_CONCURRENCY,
+                  batch_size: int = DEFAULT_BATCH_SIZE, grid: bool = False, limit: Optional[int] = None,
+                  headers: Optional[Dict[str, str]] = None, root: Path = REPO_ROOT) -> Dict[str, Path]:
+    """Sweep each brand and write one output file per brand. Brands in LOCATOR_PAGES get their
+    credentials from one headless browser shared by the run, unless headers are given. A brand
+    write_dealers refuses keeps its previous file, and CollectionFailed names it after the rest."""
+    brands = pick_brands(brands, BRANDS)
+    points = zip3_points(load_zip_codes())[:limit]
+    # Queries sent elsewhere (the mock server) load the locator page from there too
+    origin = None if url == URL else f"{urlparse(url).scheme}://{urlparse(url).netloc}"
+    written, refused = {}, []
+    async with contextlib.AsyncExitStack() as stack:
+        browser = None
+        for brand in brands:
+            _, site, output = BRANDS[brand]
+            auth = None
+            if brand in LOCATOR_PAGES and not headers:
+                if browser is None:
+                    api = urlparse(url)
+                    browser = await stack.enter_async_context(
+                        BrowserBootstrap((origin or site) + LOCATOR_PAGES[brand], api.netloc + api.path))
+                auth = TokenSession(browser.capture)
+            client = DealerGraphQLClient(brand, url, concurrency, batch_size, headers, auth)
+            dealers = await client.sweep(points, grid)
+            with stage("parse"):
+                standard = [to_standard(d) for d in dealers]
+            try:
+                written[brand] = write_dealers(brand, standard, root / output, "nissan_graphql",
+                                               client.http.failed_share())
+            except CollectionFailed as e:
+                refused.append(str(e))
+    if refused:
+        raise CollectionFailed("; ".join(refused))
+    return written
+
+
+async def collect_infiniti() -> Dict[str, Path]:
+    """Registry entry point for INFINITI"""
+    return await collect(["INFINITI"])
+
+
+async def collect_nissan() -> Dict[str, Path]:
+    """Registry entry point for Nissan"""
+    return await collect(["Nissan"])
+
+
+def main(argv=None) -> int:
+    parser = collector_parser("oems.collectors.nissan", __doc__,
+                              base_url_help="Send queries to <base-url>/graphql instead")
+    parser.add_argument("--brands", default="INFINITI", help=f"Brands to collect ({', '.join(BRANDS)})")
+    parser.add_argument("--grid", action="store_true", help="Skip getAllDealers and query the ZIP grid")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Locations per POST")
+    parser.add_argument("--limit", type=int, default=None, help="Only sweep the first N query points")
+    add_header_option(parser)
+    args = parser.parse_args(argv)
+    url = args.base_url.rstrip("/") + "/graphql" if args.base_url else URL
+    return run_collector(collect(args.brands.split(","), url, args.concurrency, args.batch_size, args.grid,
+                                 args.limit, parse_headers(args.header)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
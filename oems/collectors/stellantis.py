@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Stellantis dealers for Jeep, Chrysler, Dodge, Ram, Alfa Romeo and FIAT.
+All six brand sites front the same /bdlws/MDLSDealerLocator service, and every
+dealer record lists the brands it sells ("brands": ["C", "D", "J", "R"]), so
+one national sweep asks for every brand code at each query point and splits
+the results per brand afterwards, instead of six sweeps of the same points.
+If the service rejects a combined brandCode, or answers it with records that
+do not list their brands, the sweep falls back to one request per brand at
+each point, still through the same connection pool and the same response
+cache.
+
+Query points are one ZIP per 3-digit prefix with a 100 mile radius, plus
+points wherever that leaves ZIPs out of reach (Alaska, Nevada, ...); each
+point is paged through the numberOfResultPages the service reports, which
+need not be full pages of RESULTS_PER_PAGE (it answers 20 at a time).
+
+Usage:
+    python -m oems.collectors.stellantis                       # all six brands
+    python -m oems.collectors.stellantis --brands J,R --concurrency 4
+    python -m oems.collectors.stellantis --base-url http://127.0.0.1:8765   # against `oems mock`
+"""
+
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from oems.collectors.api import (DEFAULT_CONCURRENCY, APIClient, collector_parser, fill_gaps, pick_brands,
+                                 run_collector, save_brands, zip3_points)
+from oems.dealers import REPO_ROOT, load_zip_codes
+from oems.profiling import stage
+from oems.refresh import plan_points
+
+logger = logging.getLogger(__name__)
+
+OEM = "Stellantis"
+BASE_URL = "https://www.jeep.com"
+PATH = "/bdlws/MDLSDealerLocator"
+# brand code -> (name, output file)
+BRANDS = {
+    "J": ("Jeep", "data/jeep.json"),
+    "C": ("Chrysler", "data/mainstream/chrysler.json"),
+    "D": ("Dodge", "data/mainstream/dodge.json"),
+    "R": ("Ram", "data/mainstream/ram.json"),
+    "Y": ("Alfa Romeo", "data/luxury/alfa-romeo.json"),
+    "X": ("FIAT", "data/FIAT.json"),
+}
+RADIUS_MILES = 100
+RESULTS_PER_PAGE = 50
+MAX_PAGES = 20
+# Points tried when checking whether combined brand codes work
+PROBE_POINTS = 5
+REFERER = "https://www.jeep.com/find-dealer.html"
+
+
+def _rows(body) -> Optional[List[Dict]]:
+    rows = body.get("dealer") if isinstance(body, dict) else None
+    return rows if isinstance(rows, list) else None
+
+
+def _last_page(body: Dict, page: int) -> bool:
+    """Whether page is the point's last: as numberOfResultPages says, else when it comes back short"""
+    try:
+        pages = int(body.get("numberOfResultPages"))
+    except (TypeError, ValueError):
+        pages = None
+    if pages:
+        return page >= pages or not body["dealer"]
+    return len(body["dealer"]) < RESULTS_PER_PAGE
+
+
+def to_standard(record: Dict, brand_names: List[str]) -> Dict:
+    """Standard dealer fields, plus the code, coordinates and brands for dedupe and coverage"""
+    street = " ".join(p.strip() for p in (record.get("dealerAddress1"), record.get("dealerAddress2")) if p and p.strip())
+    try:
+        latitude = float(record["dealerShowroomLatitude"])
+        longitude = float(record["dealerShowroomLongitude"])
+    except (KeyError, TypeError, ValueError):
+        latitude = longitude = None
+    return {
+        "Dealer": (record.get("dealerName") or "").strip(),
+        "Website": record.get("website") or None,
+        "Phone": record.get("phoneNumber") or None,
+        "Email": record.get("demail") or None,
+        "Street": street,
+        "City": (record.get("dealerCity") or "").strip(),
+        "State": (record.get("dealerState") or "").strip(),
+        "ZIP": str(record.get("dealerZipCode") or "")[:5],
+        "dealer_code": str(record.get("dealerCode")),
+        "latitude": latitude,
+        "longitude": longitude,
+        "brands": brand_names,
+    }
+
+
+class MDLSClient:
+    """Sweep of the shared dealer locator: one session, one response cache, one dealer table for all brands"""
+
+    def __init__(self, brands: Sequence[str] = tuple(BRANDS), base_url: str = BASE_URL,
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        self.brands = pick_brands(brands, BRANDS, "brand codes")
+        self.url = base_url.rstrip("/") + PATH
+        self.http = APIClient(OEM, concurrency, headers={"Referer": REFERER})
+        self.combined = len(self.brands) > 1
+        # (brandCode, zip, page) -> (dealer rows, last page?); dealerCode -> record, shared by every brand
+        self.cache: Dict[Tuple[str, str, int], Tuple[List[Dict], bool]] = {}
+        self.dealers: Dict[str, Dict] = {}
+        # dealerCodes that came back from a combined query without their brands
+        self.untagged = set()
+
+    async def fetch(self, codes: str, zip_code: str) -> Optional[List[Dict]]:
+        """Every page for one point and brand code list; None if any page failed"""
+        rows = []
+        for page in range(1, MAX_PAGES + 1):
+            key = (codes, zip_code, page)
+            if key not in self.cache:
+                params = {"brandCode": codes, "func": "SALES", "radius": RADIUS_MILES, "resultsPage": page,
+                          "resultsPerPage": RESULTS_PER_PAGE, "zipCode": zip_code}
+                body = await self.http.get_json(self.url, params=params, query=zip_code, results=_rows,
+                                                key=lambda d: str(d.get("dealerCode")),
+                                                state=lambda d: d.get("dealerState"))
+                if body is None:
+                    return None
+                self.cache[key] = (body["dealer"], _last_page(body, page))
+            page_rows, last = self.cache[key]
+            rows.extend(page_rows)
+            if last:
+                return rows
+        logger.warning(f"{zip_code}: stopped after {MAX_PAGES} pages")
+        return rows
+
+    def _add(self, rows: List[Dict], queried: str):
+        for record in rows:
+            code = str(record.get("dealerCode"))
+            # Records list the brands the dealer sells; a per-brand query at least proves that one,
+            # while an untagged record from a combined query could sell any of them
+            brands = record.get("brands") or ([] if "," in queried else [queried])
+            if not brands:
+                self.untagged.add(code)
+                continue
+            known = self.dealers.setdefault(code, dict(record, brands=[]))
+            known["brands"] = sorted(set(known["brands"]) | set(brands))
+
+    async def _probe(self, points: Sequence[str]):
+        """Check that the service honours a combined brandCode before relying on it: it does not if a
+        combined query comes back empty where a single brand finds dealers, or with records that do not
+        list their brands"""
+        if not self.combined:
+            return
+        for zip_code in points[:PROBE_POINTS]:
+            rows = await self.fetch(",".join(self.brands), zip_code)
+            if rows is None:
+                # A failed query says nothing about the service
+                continue
+            if rows and all(record.get("brands") for record in rows):
+                return
+            if rows or await self.fetch(self.brands[0], zip_code):
+                logger.warning("Combined brand codes are not usable; querying each brand separately")
+                self.combined = False
+                return
+
+    async def _point(self, zip_code: str):
+        batches = [",".join(self.brands)] if self.combined else self.brands
+        for codes in batches:
+            rows = await self.fetch(codes, zip_code)
+            if rows is None:
+                self.http.failed.append(f"{zip_code}:{codes}")
+                continue
+            self._add(rows, codes)
+
+    async def sweep(self, points: Sequence[str]) -> Dict[str, List[Dict]]:
+        """Query every point once and return brand code -> raw dealer records"""
+        async with self.http:
+            await self._probe(points)
+            await self.http.sweep(points, self._point)
+        return self.by_brand()
+
+    def by_brand(self) -> Dict[str, List[Dict]]:
+        split = {code: [] for code in self.brands}
+        for record in self.dealers.values():
+            for code in record["brands"]:
+                if code in split:
+                    split[code].append(record)
+        return split
+
+
+async def collect(brands: Sequence[str] = tuple(BRANDS), base_url: str = BASE_URL,
+                  concurrency: int = DEFAULT_CONCURRENCY, limit: Optional[int] = None,
+                  root: Path = REPO_ROOT) -> Dict[str, Path]:
+    """Registry entry point: one sweep for every brand, one output file per brand"""
+    client = MDLSClient(brands, base_url, concurrency)
+    zip_codes = load_zip_codes()
+    points = zip3_points(zip_codes)[:limit]
+    if limit is None:
+        points = fill_gaps(points, zip_codes, RADIUS_MILES)
+    points = plan_points([BRANDS[b][0] for b in client.brands], points)
+    logger.info(f"Sweeping {len(points)} points for {', '.join(BRANDS[b][0] for b in client.brands)}")
+    split = await client.sweep(points)
+    mode = "combined" if client.combined else "per-brand"
+    logger.info(f"{len(client.dealers)} unique dealers from {len(client.cache)} pages ({mode} brand codes)")
+    untagged = client.untagged - set(client.dealers)
+    if untagged:
+        logger.warning(f"{len(untagged)} dealers came back without their brands and were left out")
+    with stage("parse"):
+        standard = {code: [to_standard(r, [BRANDS[b][0] for b in r["brands"] if b in BRANDS]) for r in records]
+                    for code, records in split.items()}
+    return save_brands(standard, BRANDS, "mdls_dealer_locator", root, client.http)
+
+
+def main(argv=None) -> int:
+    parser = collector_parser("oems.collectors.stellantis", __doc__, BASE_URL, "Send the queries here instead")
+    parser.add_argument("--brands", default=",".join(BRANDS), help="Brand codes to collect (default: all six)")
+    parser.add_argument("--limit", type=int, default=None, help="Only sweep the first N query points")
+    args = parser.parse_args(argv)
+    return run_collector(collect(args.brands.split(","), args.base_url, args.concurrency, args.limit),
+                         labels={code: name for code, (name, _) in BRANDS.items()})
+
+
+if __name__ == "__main__":
+    sys.exit(main())
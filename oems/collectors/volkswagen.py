@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Volkswagen dealers from the vw.com dealer-search feature app's /api/dealers.
+The API only answers the locator app, so one headless browser loads the
+dealer-search page once, searches a ZIP so the app calls the API, and hands
+the captured request (its URL, auth headers and cookies) to an aiohttp sweep
+(oems.collectors.auth). The feature app's host carries its release
+(v3-35-3.ds.dcc...), so the captured URL is used rather than API_URL when
+there is one, keeping any parameters the app sends besides the location.
+Query centers are ZIP grid points thinned to one per SPACING_MILES, searched
+at RADIUS_MILES; credentials are captured again only when they expire or the
+API answers 401/403. Dealers are deduplicated by dealer id.
+
+Usage:
+    python -m oems.collectors.volkswagen
+    python -m oems.collectors.volkswagen --radius 200 --concurrency 4
+    python -m oems.collectors.volkswagen --base-url http://127.0.0.1:8765   # against `oems mock`
+"""
+
+import contextlib
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from oems.collectors.api import (DEFAULT_CONCURRENCY, APIClient, TokenSession, add_header_option, collector_parser,
+                                 locate_points, parse_headers, run_collector, spread_points, write_dealers,
+                                 zip3_points)
+from oems.collectors.auth import BrowserBootstrap
+from oems.dealers import REPO_ROOT, first_value, load_zip_codes
+from oems.profiling import stage
+from oems.refresh import plan_points
+
+logger = logging.getLogger(__name__)
+
+OEM = "Volkswagen"
+SITE = "https://www.vw.com"
+LOCATOR_PATH = "/en/dealer-search.html"
+API_URL = "https://v3-35-3.ds.dcc.feature-app.io/api/dealers"
+API_PATH = "/api/dealers"
+OUTPUT = "data/mainstream/volkswagen.json"
+RADIUS_MILES = 150
+SPACING_MILES = 120
+# Set per center; any other parameter on the app's own request is sent unchanged
+LOCATION_PARAMS = ("latitude", "longitude", "radius")
+# Searched in the locator so its app makes the request the credentials are captured from
+SEARCH_ZIP = "90210"
+
+
+def extract_dealers(body) -> Optional[List[Dict]]:
+    """Dealer records from an /api/dealers body: a list, or an object holding one"""
+    if isinstance(body, list):
+        return body
+    if isinstance(body, dict):
+        for key in ("dealers", "items", "results", "data"):
+            if isinstance(body.get(key), list):
+                return body[key]
+    return None
+
+
+def dealer_id(record: Dict) -> str:
+    return str(first_value(record, "id", "dealerId", "dealerCode", "kvpsId") or "")
+
+
+def _address(record: Dict) -> Dict:
+    address = record.get("address")
+    return address if isinstance(address, dict) else record
+
+
+def _state(record: Dict) -> Optional[str]:
+    return first_value(_address(record), "state", "region", "stateCode")
+
+
+def to_standard(record: Dict) -> Dict:
+    """Standard dealer fields plus the dealer id and coordinates"""
+    address = _address(record)
+    location = first_value(record, "coordinates", "location", "geo") or record
+    try:
+        latitude = float(first_value(location, "latitude", "lat"))
+        longitude = float(first_value(location, "longitude", "lng", "lon"))
+    except (TypeError, ValueError):
+        latitude = longitude = None
+    contact = record.get("contact") if isinstance(record.get("contact"), dict) else record
+    return {
+        "Dealer": str(first_value(record, "name", "dealerName") or "").strip(),
+        "Website": first_value(contact, "website", "url", "homepage"),
+        "Phone": first_value(contact, "phone", "phoneNumber"),
+        "Email": first_value(contact, "email"),
+        "Street": str(first_value(address, "street", "street1", "addressLine1") or "").strip(),
+        "City": str(first_value(address, "city") or "").strip(),
+        "State": str(_state(record) or "").strip(),
+        "ZIP": str(first_value(address, "postalCode", "zipCode", "zip") or "")[:5],
+        "dealer_code": dealer_id(record),
+        "latitude": latitude,
+        "longitude": longitude,
+    }
+
+
+async def search(page):
+    """The dealer-search app only calls the API once a place is picked from its suggestions"""
+    await page.locator('input[role="combobox"]').fill(SEARCH_ZIP)
+    await page.locator('[role="option"]').first.click()
+
+
+def request_template(url: Optional[str], default: str = API_URL) -> Tuple[str, Dict[str, str]]:
+    """API URL and the parameters to keep from the app's captured request"""
+    if not url:
+        return default, {}
+    parts = urlsplit(url)
+    params = {k: v for k, v in parse_qsl(parts.query) if k not in LOCATION_PARAMS}
+    return f"{parts.scheme}://{parts.netloc}{parts.path}", params
+
+
+async def collect(base_url: Optional[str] = None, radius: float = RADIUS_MILES,
+                  concurrency: int = DEFAULT_CONCURRENCY, headers: Optional[Dict[str, str]] = None,
+                  root: Path = REPO_ROOT) -> Path:
+    """Registry entry point: one browser capture, then an HTTP sweep of spread-out centers"""
+    centers = dict(plan_points([OEM], spread_points(locate_points(zip3_points(load_zip_codes())),
+                                                    min(SPACING_MILES, radius))))
+    dealers: Dict[str, Dict] = {}
+    async with contextlib.AsyncExitStack() as stack:
+        if headers:
+            auth = TokenSession.fixed(headers)
+        else:
+            browser = await stack.enter_async_context(
+                BrowserBootstrap((base_url or SITE).rstrip("/") + LOCATOR_PATH, API_PATH, trigger=search))
+            auth = TokenSession(browser.capture)
+        url, params = request_template((await auth.get()).url,
+                                       base_url.rstrip("/") + API_PATH if base_url else API_URL)
+        logger.info(f"Querying {len(centers)} centers at {radius:g} miles via {url}")
+        http = await stack.enter_async_context(APIClient(OEM, concurrency, auth=auth))
+
+        async def visit(zip_code: str):
+            lat, lng = centers[zip_code]
+            body = await http.get_json(url, params=dict(params, latitude=lat, longitude=lng, radius=radius),
+                                       query=zip_code, results=extract_dealers, key=dealer_id, state=_state)
+            if body is None:
+                http.failed.append(zip_code)
+                return
+            for record in extract_dealers(body):
+                if dealer_id(record):
+                    dealers.setdefault(dealer_id(record), record)
+
+        await http.sweep(list(centers), visit)
+        logger.info(f"{len(dealers)} dealers; credentials captured {auth.captures} time(s)")
+    with stage("parse"):
+        standard = [to_standard(r) for r in dealers.values()]
+    return write_dealers(OEM, standard, root / OUTPUT, "vw_feature_app_api", http.failed_share())
+
+
+def main(argv=None) -> int:
+    parser = collector_parser("oems.collectors.volkswagen", __doc__,
+                              base_url_help="Load the locator page and send queries here instead")
+    parser.add_argument("--radius", type=float, default=RADIUS_MILES, help="Search radius per center, in miles")
+    add_header_option(parser)
+    args = parser.parse_args(argv)
+    return run_collector(collect(args.base_url, args.radius, args.concurrency, parse_headers(args.header)), OEM)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
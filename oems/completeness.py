@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Capture-recapture completeness estimates for dealer sweeps.
+Every query is a capture occasion: dealers returned by several queries are
+recaptures, dealers seen only once hint at how many were never seen. From
+the capture frequencies this estimates the total dealer population per OEM
+and per state, so a sweep can report how complete it probably is and stop
+once the lower confidence bound passes a target, instead of relying on
+hand-maintained targets like "~272 dealerships".
+
+Estimators:
+    chao1            S + f1(f1-1) / 2(f2+1)  (bias-corrected Chao1, f1/f2 = dealers seen once/twice)
+                     with Chao's log-normal confidence interval, or with f1 <= 1 (no unseen
+                     estimated) the upper bound S/(1-P) + z*sqrt(S*P/(1-P)), P = exp(-captures/S)
+    lincoln_petersen Chapman's form over two halves of the queries (odd vs even)
+
+ZIP queries overlap geographically rather than at random, so both are lower
+than the truth when whole areas were never queried; treat them as a check on
+the sweep, not as a replacement for coverage. For the same reason a target is
+never reached on no seen-twice dealers or on dealers from only a few states:
+the same few answers repeated look complete to any estimator.
+
+    history = CaptureHistory()
+    for zip_code in zipcodes:
+        history.observe((dealer_key(d), dealer_state(d)) for d in fetch(zip_code))
+        if history.reached(0.98):
+            break
+"""
+
+import math
+from statistics import NormalDist
+from typing import Dict, Iterable, Optional, Tuple
+
+DEFAULT_CONFIDENCE = 0.95
+# Too few occasions make every estimator meaningless
+MIN_QUERIES = 10
+# Dealers from fewer states than this are one area's answers, however often they repeat
+MIN_STATES = 10
+
+
+class CaptureHistory:
+    """How many queries returned each dealer, with the state it is in"""
+
+    def __init__(self):
+        self.queries = 0
+        self.counts: Dict[str, int] = {}
+        self.occasions: Dict[str, int] = {}
+        self.states: Dict[str, Optional[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def observe(self, dealers: Iterable[Tuple[str, Optional[str]]]) -> int:
+        """Record one query's (key, state) results; returns how many dealers were new"""
+        # Alternate queries between two occasions for the Lincoln-Petersen estimate
+        occasion = 1 if self.queries % 2 == 0 else 2
+        self.queries += 1
+        new = 0
+        for key, state in dict(dealers).items():
+            if key not in self.counts:
+                self.counts[key] = 0
+                self.occasions[key] = 0
+                new += 1
+            self.counts[key] += 1
+            self.occasions[key] |= occasion
+            if state:
+                self.states[key] = state
+        return new
+
+    def estimate(self, confidence: float = DEFAULT_CONFIDENCE, state: Optional[str] = None) -> Dict:
+        """Population estimates for all dealers, or for one state"""
+        keys = [k for k in self.counts if state is None or self.states.get(k) == state]
+        observed = len(keys)
+        f1 = sum(1 for k in keys if self.counts[k] == 1)
+        f2 = sum(1 for k in keys if self.counts[k] == 2)
+        captures = sum(self.counts[k] for k in keys)
+        chao1, low, high = _chao1(observed, f1, f2, confidence, captures)
+        n1 = sum(1 for k in keys if self.occasions[k] & 1)
+        n2 = sum(1 for k in keys if self.occasions[k] & 2)
+        both = sum(1 for k in keys if self.occasions[k] == 3)
+        return {
+            "queries": self.queries,
+            "observed": observed,
+            "seen_once": f1,
+            "seen_twice": f2,
+            "chao1": round(chao1, 1),
+            "chao1_interval": [round(low, 1), round(high, 1)],
+            "lincoln_petersen": round((n1 + 1) * (n2 + 1) / (both + 1) - 1, 1) if n1 and n2 else None,
+            "completeness": round(observed / chao1, 4) if chao1 else None,
+            # Completeness if the population is at the top of the interval
+            "completeness_lower": round(observed / high, 4) if high else None,
+        }
+
+    def by_state(self, confidence: float = DEFAULT_CONFIDENCE) -> Dict[str, Dict]:
+        states = sorted({s for s in self.states.values() if s})
+        return {s: self.estimate(confidence, s) for s in states}
+
+    def reached(self, target: float, confidence: float = DEFAULT_CONFIDENCE) -> bool:
+        """True once completeness is at least target at the lower confidence bound, over enough
+        queries, dealers seen twice and states for the estimate to mean something"""
+        if self.queries < MIN_QUERIES or not self.counts:
+            return False
+        if len({s for s in self.states.values() if s}) < MIN_STATES:
+            return False
+        estimate = self.estimate(confidence)
+        return estimate["seen_twice"] > 0 and estimate["completeness_lower"] >= target
+
+    def to_dict(self, confidence: float = DEFAULT_CONFIDENCE) -> Dict:
+        return dict(self.estimate(confidence), confidence=confidence, by_state=self.by_state(confidence))
+
+
+def _chao1(observed: int, f1: int, f2: int, confidence: float, captures: int) -> Tuple[float, float, float]:
+    """Bias-corrected Chao1 and its log-normal interval (Chao 1987); the bound never drops below observed.
+    With no unseen dealers estimated (f1 <= 1) the interval is Chao's for that case, from the chance
+    P that a dealer escaped all `captures`, so it does not collapse to observed."""
+    if observed == 0:
+        return 0.0, 0.0, 0.0
+    unseen = f1 * (f1 - 1) / (2 * (f2 + 1))
+    estimate = observed + unseen
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    if f1 == 0 or unseen <= 0:
+        missed = math.exp(-captures / observed)
+        high = observed / (1 - missed) + z * math.sqrt(observed * missed / (1 - missed))
+        return float(observed), float(observed), high
+    variance = (f1 * (f1 - 1) / (2 * (f2 + 1))
+                + f1 * (2 * f1 - 1) ** 2 / (4 * (f2 + 1) ** 2)
+                + f1 ** 2 * f2 * (f1 - 1) ** 2 / (4 * (f2 + 1) ** 4))
+    spread = math.exp(z * math.sqrt(math.log(1 + variance / unseen ** 2)))
+    return estimate, observed + unseen / spread, observed + unseen * spread
+
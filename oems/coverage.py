@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+National dealer-density and white-space grid.
+For every ZIP in utils/data-sources/us_zipcodes.txt computes, per OEM, the
+distance to the nearest dealer, dealer counts within a set of radii and a
+white-space flag. Distances are vectorized haversine over ZIP chunks so the
+full ZIPs x dealers matrix never has to be held in memory at once.
+
+Usage:
+    python -m oems.coverage --radii 10,25,50 --white-space-miles 60 -o coverage.csv
+"""
+
+import argparse
+import csv
+import logging
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from oems.dealers import (
+    DATA_DIR,
+    ZIP_CENTROIDS_FILE,
+    ZIP_CODES_FILE,
+    dealer_coordinates,
+    dealer_key,
+    dealer_zip,
+    iter_dealer_files,
+    load_zip_centroids,
+    load_zip_codes,
+)
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_MILES = 3958.8
+DEFAULT_RADII = (10, 25, 50)
+DEFAULT_WHITE_SPACE_MILES = 50.0
+DEFAULT_CHUNK_SIZE = 2048
+
+
+def haversine_miles(lat1: np.ndarray, lng1: np.ndarray, lat2: np.ndarray, lng2: np.ndarray) -> np.ndarray:
+    """Pairwise great-circle distances, shape (len(lat1), len(lat2)), in miles"""
+    lat1 = np.radians(lat1)[:, None]
+    lng1 = np.radians(lng1)[:, None]
+    lat2 = np.radians(lat2)[None, :]
+    lng2 = np.radians(lng2)[None, :]
+
+    a = np.sin((lat2 - lat1) / 2.0) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2.0) ** 2
+    return 2.0 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def collect_dealer_points(data_dir: Path, centroids: Dict[str, Tuple[float, float]]) -> Dict[str, np.ndarray]:
+    """Map OEM -> (n, 2) array of unique dealer coordinates.
+    Records without coordinates fall back to their ZIP centroid."""
+    points = defaultdict(dict)
+    skipped = defaultdict(int)
+
+    for path, oem, dealers in iter_dealer_files(data_dir):
+        for dealer in dealers:
+            coords = dealer_coordinates(dealer) or centroids.get(dealer_zip(dealer) or "")
+            if coords is None:
+                skipped[oem] += 1
+                continue
+            points[oem].setdefault(dealer_key(dealer), coords)
+
+    for oem, count in sorted(skipped.items()):
+        logger.warning(f"{oem}: {count} dealers without coordinates or a known ZIP were skipped")
+
+    return {oem: np.array(list(coords.values()), dtype=np.float64) for oem, coords in sorted(points.items())}
+
+
+def compute_coverage(
+    zip_points: np.ndarray,
+    dealer_points: np.ndarray,
+    radii: Sequence[float] = DEFAULT_RADII,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (nearest_miles, counts) for one OEM.
+    nearest_miles has shape (n_zips,); counts has shape (n_zips, len(radii))."""
+    n_zips = len(zip_points)
+    nearest = np.full(n_zips, np.inf)
+    counts = np.zeros((n_zips, len(radii)), dtype=np.int32)
+    if len(dealer_points) == 0:
+        return nearest, counts
+
+    for start in range(0, n_zips, chunk_size):
+        stop = min(start + chunk_size, n_zips)
+        dist = haversine_miles(zip_points[start:stop, 0], zip_points[start:stop, 1],
+                               dealer_points[:, 0], dealer_points[:, 1])
+        nearest[start:stop] = dist.min(axis=1)
+        for i, radius in enumerate(radii):
+            counts[start:stop, i] = np.count_nonzero(dist <= radius, axis=1)
+
+    return nearest, counts
+
+
+def build_grid(
+    zip_codes: List[str],
+    centroids: Dict[str, Tuple[float, float]],
+    dealer_points: Dict[str, np.ndarray],
+    radii: Sequence[float] = DEFAULT_RADII,
+    white_space_miles: float = DEFAULT_WHITE_SPACE_MILES,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, list]:
+    """Build the columnar coverage table: column name -> list of values, one row per ZIP"""
+    located = [z for z in zip_codes if z in centroids]
+    if len(located) < len(zip_codes):
+        logger.warning(f"{len(zip_codes) - len(located)} ZIPs have no centroid and were left out")
+
+    zip_points = np.array([centroids[z] for z in located], dtype=np.float64).reshape(-1, 2)
+    columns = {
+        "zip": located,
+        "latitude": zip_points[:, 0].round(6).tolist(),
+        "longitude": zip_points[:, 1].round(6).tolist(),
+    }
+
+    for oem, points in dealer_points.items():
+        slug = oem.lower().replace(" ", "_").replace("-", "_")
+        nearest, counts = compute_coverage(zip_points, points, radii, chunk_size)
+        columns[f"{slug}_nearest_mi"] = [round(float(d), 2) if np.isfinite(d) else None for d in nearest]
+        for i, radius in enumerate(radii):
+            columns[f"{slug}_within_{radius:g}mi"] = counts[:, i].tolist()
+        columns[f"{slug}_white_space"] = (nearest > white_space_miles).astype(int).tolist()
+        logger.info(f"{oem}: {len(points)} dealers, {int((nearest > white_space_miles).sum())} white-space ZIPs")
+
+    return columns
+
+
+def write_csv(columns: Dict[str, list], filename: Path):
+    """Write the columnar table as a flat CSV, one row per ZIP"""
+    names = list(columns)
+    with open(filename, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(names)
+        writer.writerows(zip(*(columns[name] for name in names)))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="oems coverage", description="Compute per-ZIP dealer coverage for every OEM")
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR, help="Directory of standard OEM output files")
+    parser.add_argument("--zips", type=Path, default=ZIP_CODES_FILE, help="ZIP list, one per line")
+    parser.add_argument("--centroids", type=Path, default=ZIP_CENTROIDS_FILE,
+                        help="ZIP centroid CSV (zip,latitude,longitude); see scripts/utilities/fetch_us_zipcodes.py")
+    parser.add_argument("--radii", default=",".join(str(r) for r in DEFAULT_RADII), help="Comma-separated radii in miles")
+    parser.add_argument("--white-space-miles", type=float, default=DEFAULT_WHITE_SPACE_MILES,
+                        help="Flag ZIPs whose nearest dealer is further than this")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="ZIPs per distance block")
+    parser.add_argument("-o", "--output", type=Path, default=Path("dealer_coverage.csv"))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    radii = [float(r) for r in args.radii.split(",") if r.strip()]
+    if not args.centroids.exists():
+        print(f"❌ No ZIP centroid file at {args.centroids}; run scripts/utilities/fetch_us_zipcodes.py "
+              f"or pass --centroids", file=sys.stderr)
+        return 1
+    centroids = load_zip_centroids(args.centroids)
+    zip_codes = load_zip_codes(args.zips)
+    dealer_points = collect_dealer_points(args.data_dir, centroids)
+
+    logger.info(f"Computing coverage for {len(zip_codes)} ZIPs across {len(dealer_points)} OEMs")
+    columns = build_grid(zip_codes, centroids, dealer_points, radii, args.white_space_miles, args.chunk_size)
+    write_csv(columns, args.output)
+    logger.info(f"Saved {len(columns['zip'])} rows x {len(columns)} columns to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
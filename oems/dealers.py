@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Dealer record helpers shared by the collectors and analytics jobs.
+Knows where the repo keeps its config and data files and how to read the
+standard {"oem": ..., "dealers": [...]} output envelope.
+"""
+
+import bisect
+import csv
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from oems.serialize import is_json_output, load
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = REPO_ROOT / "data"
+OEMS_FILE = REPO_ROOT / "utils" / "config" / "OEMs.txt"
+ZIP_CODES_FILE = REPO_ROOT / "utils" / "data-sources" / "us_zipcodes.txt"
+ZIP_CENTROIDS_FILE = REPO_ROOT / "utils" / "data-sources" / "us_zip_centroids.csv"
+
+# USPS 3-digit ZIP prefix ranges: (first prefix of the range, state)
+ZIP3_STATES = [
+    (2, "NH"), (4, "NY"), (5, "NY"), (6, "PR"), (10, "MA"), (28, "RI"), (30, "NH"), (39, "ME"), (50, "VT"),
+    (55, "MA"), (56, "VT"), (60, "CT"), (70, "NJ"), (90, "AE"), (100, "NY"), (150, "PA"), (197, "DE"),
+    (200, "DC"), (206, "MD"), (220, "VA"), (247, "WV"), (270, "NC"), (290, "SC"), (300, "GA"), (320, "FL"),
+    (340, "AA"), (341, "FL"), (350, "AL"), (370, "TN"), (386, "MS"), (398, "GA"), (400, "KY"), (430, "OH"),
+    (460, "IN"), (480, "MI"), (500, "IA"), (530, "WI"), (550, "MN"), (570, "SD"), (580, "ND"), (590, "MT"),
+    (600, "IL"), (630, "MO"), (660, "KS"), (680, "NE"), (700, "LA"), (716, "AR"), (730, "OK"), (750, "TX"),
+    (800, "CO"), (820, "WY"), (832, "ID"), (840, "UT"), (850, "AZ"), (870, "NM"), (885, "TX"), (889, "NV"),
+    (900, "CA"), (962, "AP"), (967, "HI"), (969, "GU"), (970, "OR"), (980, "WA"), (995, "AK"),
+]
+_ZIP3_STARTS = [start for start, _ in ZIP3_STATES]
+
+# Rough geographic center per state, for when no ZIP centroid file is available
+STATE_CENTERS = {
+    "AK": (61.4, -150.0), "AL": (32.8, -86.8), "AR": (34.9, -92.4), "AZ": (33.7, -111.9), "CA": (36.1, -119.7),
+    "CO": (39.1, -105.3), "CT": (41.6, -72.8), "DC": (38.9, -77.0), "DE": (39.3, -75.5), "FL": (27.8, -81.7),
+    "GA": (33.0, -83.6), "GU": (13.4, 144.8), "HI": (21.1, -157.5), "IA": (42.0, -93.2), "ID": (44.2, -114.5),
+    "IL": (40.3, -89.0), "IN": (39.8, -86.3), "KS": (38.5, -96.7), "KY": (37.7, -84.7), "LA": (31.2, -91.9),
+    "MA": (42.2, -71.5), "MD": (39.1, -76.8), "ME": (44.7, -69.4), "MI": (43.3, -84.5), "MN": (45.7, -93.9),
+    "MO": (38.5, -92.3), "MS": (32.7, -89.7), "MT": (46.9, -110.5), "NC": (35.6, -79.8), "ND": (47.5, -99.8),
+    "NE": (41.1, -98.3), "NH": (43.5, -71.6), "NJ": (40.3, -74.5), "NM": (34.8, -106.2), "NV": (38.3, -117.1),
+    "NY": (42.2, -74.9), "OH": (40.4, -82.8), "OK": (35.6, -96.9), "OR": (44.6, -122.1), "PA": (40.6, -77.2),
+    "PR": (18.2, -66.6), "RI": (41.7, -71.5), "SC": (33.9, -80.9), "SD": (44.3, -99.4), "TN": (35.7, -86.7),
+    "TX": (31.1, -97.6), "UT": (40.2, -111.9), "VA": (37.8, -78.2), "VT": (44.0, -72.7), "WA": (47.4, -121.5),
+    "WI": (44.3, -89.6), "WV": (38.5, -81.0), "WY": (42.8, -107.3),
+}
+
+
+def load_zip_codes(path: Path = ZIP_CODES_FILE) -> List[str]:
+    """Load the 5-digit ZIP list, one per line"""
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def load_zip_centroids(path: Path = ZIP_CENTROIDS_FILE) -> Dict[str, Tuple[float, float]]:
+    """Load ZIP -> (latitude, longitude) from the centroid CSV"""
+    centroids = {}
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                centroids[row["zip"].zfill(5)] = (float(row["latitude"]), float(row["longitude"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+    return centroids
+
+
+def prefix_centroids(centroids: Dict[str, Tuple[float, float]]) -> Dict[str, Tuple[float, float]]:
+    """Mean centroid per 3-digit prefix, to place ZIPs the centroid file lacks (PO boxes, retired codes)"""
+    totals: Dict[str, List[float]] = {}
+    for zip_code, (latitude, longitude) in centroids.items():
+        total = totals.setdefault(zip_code[:3], [0.0, 0.0, 0])
+        total[0] += latitude
+        total[1] += longitude
+        total[2] += 1
+    return {prefix: (round(lat / n, 5), round(lng / n, 5)) for prefix, (lat, lng, n) in totals.items()}
+
+
+def zip_state(zip_code: str) -> Optional[str]:
+    """State a ZIP belongs to, from its 3-digit prefix"""
+    if not zip_code or not str(zip_code)[:3].isdigit():
+        return None
+    i = bisect.bisect_right(_ZIP3_STARTS, int(str(zip_code)[:3])) - 1
+    return ZIP3_STATES[i][1] if i >= 0 else None
+
+
+def approximate_zip_point(zip_code: str, spread: float = 1.5) -> Optional[Tuple[float, float]]:
+    """Deterministic stand-in location for a ZIP: its state's center plus a stable
+    per-ZIP offset of up to `spread` degrees. Only for when real centroids are missing."""
+    center = STATE_CENTERS.get(zip_state(zip_code) or "")
+    if center is None:
+        return None
+    digest = hashlib.md5(str(zip_code).encode("ascii")).digest()
+    dlat = (digest[0] / 255.0 - 0.5) * 2 * spread
+    dlng = (digest[1] / 255.0 - 0.5) * 2 * spread
+    return round(center[0] + dlat, 5), round(center[1] + dlng, 5)
+
+
+def load_dealer_file(path: Path) -> Optional[Tuple[str, List[Dict]]]:
+    """Return (oem, dealers) for a file in the standard envelope, compressed or not, else None"""
+    try:
+        data = load(path)
+    except (OSError, ValueError, EOFError, RuntimeError) as e:
+        logger.warning(f"Skipping {path}: {e}")
+        return None
+
+    if not isinstance(data, dict) or not data.get("oem") or not isinstance(data.get("dealers"), list):
+        return None
+    return data["oem"], [d for d in data["dealers"] if isinstance(d, dict)]
+
+
+def iter_dealer_files(root: Path = DATA_DIR) -> Iterator[Tuple[Path, str, List[Dict]]]:
+    """Yield (path, oem, dealers) for every standard output file under root, including the
+    .json.gz/.json.zst ones `oems crawl --compress` writes"""
+    for path in sorted(p for p in Path(root).rglob("*.json*") if is_json_output(p)):
+        loaded = load_dealer_file(path)
+        if loaded:
+            yield (path,) + loaded
+
+
+def first_value(record: Dict, *keys):
+    """The first of keys the record holds a non-empty value for, or None"""
+    for key in keys:
+        value = record.get(key)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def dealer_zip(dealer: Dict) -> Optional[str]:
+    """Best-effort 5-digit ZIP for a dealer record in any of our layouts"""
+    value = first_value(dealer, "ZIP", "zip", "zip_code", "zipcode", "postalCode")
+    if value is None and isinstance(dealer.get("address"), dict):
+        value = first_value(dealer["address"], "zipcode", "zip", "postalCode")
+    if value is None:
+        return None
+    digits = str(value).strip()[:5]
+    return digits.zfill(5) if digits.isdigit() else None
+
+
+def dealer_state(dealer: Dict) -> Optional[str]:
+    """State (or region) a dealer record belongs to, as written by its collector"""
+    value = first_value(dealer, "State", "state")
+    if value is None and isinstance(dealer.get("address"), dict):
+        value = first_value(dealer["address"], "state")
+    return str(value).strip() if value is not None else None
+
+
+def dealer_coordinates(dealer: Dict) -> Optional[Tuple[float, float]]:
+    """Best-effort (latitude, longitude) for a dealer record in any of our layouts"""
+    for container in (dealer, dealer.get("coordinates"), dealer.get("location"), dealer.get("geolocation")):
+        if not isinstance(container, dict):
+            continue
+        lat = first_value(container, "latitude", "lat")
+        lng = first_value(container, "longitude", "lng", "lon")
+        try:
+            if lat is not None and lng is not None:
+                return float(lat), float(lng)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def dealer_key(dealer: Dict) -> str:
+    """Stable identity used to dedupe the same dealer across files"""
+    code = first_value(dealer, "dealer_code", "code", "dealerId", "id")
+    if code is not None:
+        return str(code)
+    name = str(first_value(dealer, "Dealer", "name") or "").strip().lower()
+    street = str(first_value(dealer, "Street", "address1") or "").strip().lower()
+    return f"{name}|{street}|{dealer_zip(dealer) or ''}"
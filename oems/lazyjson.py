@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Lazy, offset-indexed access to large dealer JSON files.
+One streaming pass (the validator's tokenizer, so memory stays bounded by the
+largest record) writes a sidecar <file>.idx holding the byte range of every
+dealer record and a table of key hashes sorted for binary search. Readers
+then memory-map the data file and the index and decode only the records they
+ask for, by position or by dealer key, so looking up or sampling a few
+dealers needs kilobytes of RAM instead of a json.load of the whole file.
+
+The record array is found by name: the document itself when it is an array,
+otherwise the first array under a key like "dealers" or "dealer" at any depth
+(so raw API dumps such as Audi.json's data.dealersByTerm.dealers work), in
+every document of files made of concatenated pages. The index is rebuilt
+whenever the data file's size or mtime changes. Compressed outputs (`oems
+crawl --compress`) cannot be mapped and are refused.
+
+    with LazyDealers("data/toyota_comprehensive.json") as dealers:
+        print(len(dealers), dealers[0]["name"])
+        dealer = dealers.get("04136")
+        few = dealers.sample(5)
+
+Usage:
+    python -m oems.lazyjson data/toyota_comprehensive.json              # build the index, print stats
+    python -m oems.lazyjson Alfa-Romeo.json --key dealerCode --get 69344
+    python -m oems.lazyjson Audi.json --at 0 --sample 3
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import mmap
+import os
+import random
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+from oems.dealers import dealer_key
+from oems.serialize import is_compressed, loads
+from oems.validate import JSONSyntaxError, StreamValidator
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx"
+INDEX_MAGIC = b"OEMSIDX1"
+INDEX_VERSION = 1
+# Member names whose array holds the records, checked as raw JSON string bytes
+RECORD_KEYS = (b'"dealers"', b'"dealer"', b'"dealerships"', b'"results"')
+# (start, end) byte range of each record, then (key hash, record position) sorted by hash
+_SPAN = struct.Struct("<QQ")
+_KEY = struct.Struct("<QI")
+_HEADER_LEN = struct.Struct("<I")
+
+
+def _key_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _key_function(key: Optional[str]) -> Callable[[Dict], str]:
+    """dealer_key by default, else the value of one field"""
+    if key is None:
+        return dealer_key
+    return lambda record: str(record.get(key, "")) if isinstance(record, dict) else ""
+
+
+class _OffsetScanner(StreamValidator):
+    """The validator's tokenizer, recording where each record starts and ends instead of checking it"""
+
+    def __init__(self, path: Path, key: Callable[[Dict], str]):
+        super().__init__(path)
+        self.key = key
+        self.spans = array("Q")
+        self.keys: List[tuple] = []
+
+    def _opens_records(self) -> bool:
+        return not self.stack or (self.stack[-1] == ord("{") and self._key in RECORD_KEYS)
+
+    def _record(self, index: int, raw: bytes, start: int, end: int):
+        self.spans.extend((start, end))
+        self.keys.append((_key_hash(self.key(loads(raw))), index))
+
+
+def index_path(path: Union[str, Path]) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def _require_plain(path: Path):
+    if is_compressed(path):
+        raise ValueError(f"Cannot index compressed {path}: read it with oems.serialize.load or decompress it first")
+
+
+def build_index(path: Union[str, Path], key: Optional[str] = None) -> Path:
+    """Scan path once and write its sidecar index atomically; returns the index path"""
+    path = Path(path)
+    _require_plain(path)
+    scanner = _OffsetScanner(path, _key_function(key))
+    try:
+        scanner._scan()
+    except JSONSyntaxError as e:
+        # Records before a truncation and in every concatenated page are still usable
+        if scanner.report.repair is None:
+            raise ValueError(f"Cannot index: {e}") from None
+        logger.warning(f"{path}: {e}; indexing the {len(scanner.keys)} complete records")
+    stat = path.stat()
+    header = json.dumps({
+        "version": INDEX_VERSION,
+        "source_size": stat.st_size,
+        "source_mtime_ns": stat.st_mtime_ns,
+        "records": len(scanner.keys),
+        "key": key,
+    }).encode("utf-8")
+    scanner.keys.sort()
+    target = index_path(path)
+    tmp = target.with_name(f".{target.name}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(INDEX_MAGIC + _HEADER_LEN.pack(len(header)) + header)
+        if sys.byteorder != "little":
+            scanner.spans.byteswap()
+        scanner.spans.tofile(f)
+        for key_hash, position in scanner.keys:
+            f.write(_KEY.pack(key_hash, position))
+    os.replace(tmp, target)
+    logger.info(f"Indexed {len(scanner.keys)} records of {path} ({stat.st_size / 1e6:.1f} MB)")
+    return target
+
+
+def _read_header(index: Path) -> Optional[Dict]:
+    """The index header, with "table_offset" where its record spans begin; None if missing or unreadable"""
+    try:
+        with open(index, "rb") as f:
+            if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                return None
+            (length,) = _HEADER_LEN.unpack(f.read(_HEADER_LEN.size))
+            header = json.loads(f.read(length))
+    except (OSError, ValueError, struct.error):
+        return None
+    header["table_offset"] = len(INDEX_MAGIC) + _HEADER_LEN.size + length
+    return header
+
+
+class LazyDealers:
+    """Sequence of a file's dealer records, decoded on demand from a memory-mapped file"""
+
+    def __init__(self, path: Union[str, Path], key: Optional[str] = None, rebuild: bool = False):
+        self.path = Path(path)
+        _require_plain(self.path)
+        self.key = _key_function(key)
+        index = index_path(self.path)
+        stat = self.path.stat()
+        header = None if rebuild else _read_header(index)
+        if (header is None or header.get("version") != INDEX_VERSION or header.get("key") != key
+                or header.get("source_size") != stat.st_size or header.get("source_mtime_ns") != stat.st_mtime_ns):
+            build_index(self.path, key)
+            header = _read_header(index)
+        self.header = header
+        self._count = header["records"]
+        self._data_file = open(self.path, "rb")
+        self._index_file = open(index, "rb")
+        # Empty files cannot be mapped; a file with no records never needs its data
+        self._data = mmap.mmap(self._data_file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b""
+        self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._spans_at = header["table_offset"]
+        self._keys_at = self._spans_at + self._count * _SPAN.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def span(self, position: int) -> tuple:
+        """(start, end) byte offsets of a record"""
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError(f"record {position} out of range ({self._count} records)")
+        return _SPAN.unpack_from(self._index, self._spans_at + position * _SPAN.size)
+
+    def raw(self, position: int) -> bytes:
+        start, end = self.span(position)
+        return self._data[start:end]
+
+    def __getitem__(self, position: int):
+        return loads(self.raw(position))
+
+    def __iter__(self) -> Iterator:
+        for position in range(self._count):
+            yield self[position]
+
+    def _positions(self, key: str) -> Iterator[int]:
+        """Positions whose key hash matches, by binary search over the sorted hash table"""
+        wanted = _key_hash(key)
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if _KEY.unpack_from(self._index, self._keys_at + middle * _KEY.size)[0] < wanted:
+                low = middle + 1
+            else:
+                high = middle
+        while low < self._count:
+            key_hash, position = _KEY.unpack_from(self._index, self._keys_at + low * _KEY.size)
+            if key_hash != wanted:
+                return
+            yield position
+            low += 1
+
+    def get_all(self, key: str) -> List:
+        """Every record with this key (a dealer can repeat across concatenated pages), in file order"""
+        records = []
+        for position in sorted(self._positions(key)):
+            record = self[position]
+            # A hash collision would only cost a decode
+            if self.key(record) == key:
+                records.append(record)
+        return records
+
+    def get(self, key: str, default=None):
+        records = self.get_all(key)
+        return records[0] if records else default
+
+    def __contains__(self, key: str) -> bool:
+        return bool(self.get_all(key))
+
+    def sample(self, n: int, seed: Optional[int] = None) -> List:
+        """n distinct records chosen at random"""
+        positions = random.Random(seed).sample(range(self._count), min(n, self._count))
+        return [self[position] for position in positions]
+
+    def close(self):
+        for handle in (self._data, self._index):
+            if isinstance(handle, mmap.mmap):
+                handle.close()
+        self._data_file.close()
+        self._index_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m oems.lazyjson", description="Index and query large dealer files")
+    parser.add_argument("files", nargs="+", type=Path)
+    parser.add_argument("--key", default=None, help="Field to look dealers up by (default: the standard dealer key)")
+    parser.add_argument("--get", action="append", default=[], metavar="KEY", help="Print the dealer(s) with this key")
+    parser.add_argument("--at", type=int, action="append", default=[], metavar="N", help="Print the record at N")
+    parser.add_argument("--sample", type=int, default=0, metavar="N", help="Print N random records")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the index even if it is current")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    for path in args.files:
+        try:
+            dealers = LazyDealers(path, args.key, args.rebuild)
+        except (OSError, ValueError) as e:
+            print(f"❌ {path}: {e}")
+            continue
+        with dealers:
+            print(f"📋 {path}: {len(dealers)} records, index {index_path(path).stat().st_size / 1e3:.1f} KB")
+            for key in args.get:
+                found = dealers.get_all(key)
+                print(json.dumps(found, indent=2) if found else f"⚠️ no dealer with key {key!r}")
+            for position in args.at:
+                print(json.dumps(dealers[position], indent=2))
+            if args.sample:
+                print(json.dumps(dealers.sample(args.sample), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput benchmark of the real collectors against the mock OEM APIs.
+Each target runs a collector's own entry point (oems.collectors.*:collect, or
+the Toyota and Subaru scripts' per-ZIP fetch) pointed at the mock, with a
+given concurrency, and reports requests/s, tail latency, retries, failures
+and unique dealers collected per minute from the run's request telemetry.
+The mock runs in-process unless --base-url points at one started with
+`oems mock`. Browser-bootstrapped APIs (GM, VW, Nissan) get their headers from
+the mock's locator pages instead of a browser. Output files go to a
+temporary directory, never over data/.
+
+Usage:
+    python -m oems loadtest                              # every target, defaults
+    python -m oems loadtest toyota stellantis -c 16 --zips 500 --rate-limit 40 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import importlib
+import importlib.util
+import json
+import logging
+import random
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+import aiohttp
+from requests.adapters import HTTPAdapter
+
+from oems.collectors.api import CollectionFailed
+from oems.dealers import REPO_ROOT, ZIP_CODES_FILE, approximate_zip_point, load_dealer_file, load_zip_codes
+from oems.mockserver import MockOEMServer, add_fault_arguments, config_from_args, start_server
+from oems.telemetry import LATENCY_BUCKETS, Histogram, reset_telemetry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_SAMPLE = 200
+PAGE_ATTEMPTS = 6
+
+
+class LoadContext:
+    """What every target is given: the mock, the sweep size and where to write"""
+
+    def __init__(self, base_url: str, concurrency: int, zip_codes: Sequence[str], root: Path,
+                 headers: Dict[str, Dict[str, str]]):
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.zip_codes = list(zip_codes)
+        self.root = root
+        # Locator page -> headers its script sends, as a browser bootstrap would capture them
+        self.headers = headers
+
+    @property
+    def limit(self) -> int:
+        return len(self.zip_codes)
+
+
+def _collector(name: str):
+    return importlib.import_module(f"oems.collectors.{name}")
+
+
+def _script(relative: str):
+    """Import a collector script as a module without running its main()"""
+    path = REPO_ROOT / relative
+    spec = importlib.util.spec_from_file_location(f"_loadtest_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+async def _per_zip(ctx: LoadContext, fetch: Callable[[str], object]) -> int:
+    """Run a blocking per-ZIP fetch over the sample on `concurrency` threads; returns the ZIPs that raised"""
+    failed = 0
+
+    def guarded(zip_code: str):
+        nonlocal failed
+        try:
+            fetch(zip_code)
+        except Exception as e:
+            # Network errors and non-JSON answers are failed queries, not a failed benchmark
+            logger.debug(f"{zip_code}: {type(e).__name__}: {e}")
+            failed += 1
+
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=ctx.concurrency) as pool:
+        await asyncio.gather(*(loop.run_in_executor(pool, guarded, z) for z in ctx.zip_codes))
+    return failed
+
+
+async def _toyota(ctx: LoadContext):
+    module = _script("scripts/collect_all_toyota_dealers.py")
+    api_url = ctx.base_url + "/v1/dealers/"
+    return await _per_zip(ctx, lambda z: module.fetch_dealers(z, api_url))
+
+
+async def _subaru(ctx: LoadContext):
+    scraper = _script("subaru_comprehensive_scraper.py").ComprehensiveSubaruDealerScraper()
+    scraper.base_url = ctx.base_url + "/services/dealers/distances/by/zipcode"
+    scraper.session.mount("http://", HTTPAdapter(pool_maxsize=ctx.concurrency))
+    # get_dealers_by_zip logs and swallows its own errors; telemetry still counts them
+    return await _per_zip(ctx, scraper.get_dealers_by_zip)
+
+
+# name -> coroutine running the collector against ctx; returns what it wrote (or failed ZIPs for scripts)
+TARGETS: Dict[str, Callable[[LoadContext], Awaitable]] = {
+    "toyota": _toyota,
+    "subaru": _subaru,
+    "honda": lambda c: _collector("honda").collect(base_url=c.base_url, concurrency=c.concurrency, limit=c.limit,
+                                                   root=c.root),
+    "hmg": lambda c: _collector("hmg").collect(base_url=c.base_url, concurrency=c.concurrency, limit=c.limit,
+                                               root=c.root),
+    "stellantis": lambda c: _collector("stellantis").collect(base_url=c.base_url, concurrency=c.concurrency,
+                                                             limit=c.limit, root=c.root),
+    "ford": lambda c: _collector("ford").collect(base_url=c.base_url, concurrency=c.concurrency, limit=c.limit,
+                                                 root=c.root),
+    "jlr": lambda c: _collector("jlr").collect(base_url=c.base_url, concurrency=c.concurrency, root=c.root),
+    "gm": lambda c: _collector("gm").collect(base_url=c.base_url, concurrency=c.concurrency,
+                                             headers=c.headers["/dealer-locator"], root=c.root),
+    "bmw": lambda c: _collector("bmw").collect(base_url=c.base_url, concurrency=c.concurrency, root=c.root),
+    "exotic": lambda c: _collector("exotic").collect(base_url=c.base_url, concurrency=c.concurrency, root=c.root),
+    "mitsubishi": lambda c: _collector("mitsubishi").collect(url=c.base_url + "/prod/graphql",
+                                                             concurrency=c.concurrency, root=c.root),
+    "volkswagen": lambda c: _collector("volkswagen").collect(base_url=c.base_url, concurrency=c.concurrency,
+                                                             headers=c.headers["/en/dealer-search.html"],
+                                                             root=c.root),
+    "nissan": lambda c: _collector("nissan").collect(["Nissan", "INFINITI"], url=c.base_url + "/graphql",
+                                                     concurrency=c.concurrency, limit=c.limit,
+                                                     headers=c.headers["/dealer-locator.html"], root=c.root),
+}
+# What the mock's locator pages hand their own API calls
+_PAGE_HEADERS = {
+    "/dealer-locator": re.compile(r'"clientapplicationid":\s*"([^"]+)"'),
+    "/en/dealer-search.html": re.compile(r"Bearer ([\w.\-]+)"),
+    "/dealer-locator.html": re.compile(r"Bearer ([\w.\-]+)"),
+}
+
+
+async def page_headers(base_url: str, attempts: int = PAGE_ATTEMPTS) -> Dict[str, Dict[str, str]]:
+    """Headers the mock's locator pages send, read from the pages themselves (which are as faulty as the APIs)"""
+    headers = {}
+    async with aiohttp.ClientSession() as session:
+        for page, pattern in _PAGE_HEADERS.items():
+            match = None
+            for attempt in range(attempts):
+                async with session.get(base_url + page) as response:
+                    if response.status == 200:
+                        match = pattern.search(await response.text())
+                        break
+                await asyncio.sleep(0.1 * 2 ** attempt)
+            if not match:
+                raise RuntimeError(f"The mock's {page} carries no credentials")
+            headers[page] = ({"clientapplicationid": match.group(1), "locale": "en-US"} if page == "/dealer-locator"
+                             else {"Authorization": f"Bearer {match.group(1)}"})
+    return headers
+
+
+def _written_dealers(written) -> int:
+    """Dealers in the files a collect() returned (one Path, or a dict of them)"""
+    paths = [written] if isinstance(written, Path) else list(written.values()) if isinstance(written, dict) else []
+    total = 0
+    for path in paths:
+        loaded = load_dealer_file(path)
+        total += len(loaded[1]) if loaded else 0
+    return total
+
+
+async def run_target(name: str, ctx: LoadContext) -> Dict:
+    """Run one target under fresh telemetry and summarise its requests"""
+    telemetry = reset_telemetry()
+    error = None
+    start = time.monotonic()
+    try:
+        outcome = await TARGETS[name](ctx)
+    except (CollectionFailed, RuntimeError, ValueError, aiohttp.ClientError) as e:
+        outcome, error = None, f"{type(e).__name__}: {e}"
+        logger.error(f"{name}: {error}")
+    wall = time.monotonic() - start
+
+    latency = Histogram(LATENCY_BUCKETS)
+    report = telemetry.to_dict()
+    for group in report["groups"]:
+        latency.merge(group["latency"])
+    totals = {field: sum(row[field] for row in report["by_oem"].values())
+              for field in ("requests", "errors", "retries", "bytes")}
+    statuses: Dict[str, int] = {}
+    for group in report["groups"]:
+        for status, count in group["statuses"].items():
+            statuses[status] = statuses.get(status, 0) + count
+    if isinstance(outcome, int):
+        # Script fetches write nothing; their unique dealers are the ones telemetry saw
+        dealers = sum(telemetry.unique_dealers(oem) for oem in report["by_oem"])
+        totals["errors"] = max(totals["errors"], outcome)
+    else:
+        dealers = _written_dealers(outcome)
+
+    def ms(q: float) -> Optional[float]:
+        value = latency.quantile(q)
+        return round(value * 1000, 1) if value is not None else None
+
+    return {
+        "target": name,
+        "requests": totals["requests"],
+        "seconds": round(wall, 3),
+        "rps": round(totals["requests"] / wall, 1) if wall else None,
+        # Upper bounds of the telemetry latency buckets the quantiles fall in
+        "p50_ms": ms(0.50),
+        "p95_ms": ms(0.95),
+        "p99_ms": ms(0.99),
+        "retries": totals["retries"],
+        "failed": totals["errors"],
+        "bytes": totals["bytes"],
+        "statuses": statuses,
+        "unique_dealers": dealers,
+        "dealers_per_minute": round(dealers / wall * 60, 1) if wall else None,
+        "error": error,
+    }
+
+
+async def run_loadtest(names: List[str], zip_codes: Sequence[str], base_url: Optional[str],
+                       server: Optional[MockOEMServer], concurrency: int) -> List[Dict]:
+    runner = None
+    if base_url is None:
+        runner, base_url = await start_server(server)
+    try:
+        base_url = base_url.rstrip("/")
+        headers = await page_headers(base_url)
+        with tempfile.TemporaryDirectory(prefix="oems-loadtest-") as root:
+            ctx = LoadContext(base_url, concurrency, zip_codes, Path(root), headers)
+            return [await run_target(name, ctx) for name in names]
+    finally:
+        if runner:
+            await runner.cleanup()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="oems loadtest",
+                                     description="Benchmark the collectors against the mock OEM APIs")
+    parser.add_argument("targets", nargs="*", help=f"Targets to run ({', '.join(TARGETS)}); default all")
+    parser.add_argument("--zips", type=int, default=DEFAULT_SAMPLE,
+                        help="ZIPs swept by toyota, subaru and the collectors that take a point limit")
+    parser.add_argument("-c", "--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--base-url", default=None, help="Use a running mock instead of starting one in-process")
+    parser.add_argument("--json", type=Path, default=None, help="Write the results here")
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    unknown = set(args.targets) - set(TARGETS)
+    if unknown:
+        parser.error(f"unknown targets: {', '.join(sorted(unknown))}")
+    names = args.targets or list(TARGETS)
+    all_zips = load_zip_codes(ZIP_CODES_FILE)
+    # Only ZIPs the mock can place (military and unassigned prefixes have no dealers to find)
+    placeable = [z for z in all_zips if approximate_zip_point(z) is not None]
+    zip_codes = random.Random(args.seed).sample(placeable, min(args.zips, len(placeable)))
+    server = None if args.base_url else MockOEMServer(config_from_args(args), all_zips)
+
+    random.seed(args.seed)
+    results = asyncio.run(run_loadtest(names, zip_codes, args.base_url, server, args.concurrency))
+
+    print(f"{'target':<11} {'req':>6} {'rps':>7} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} "
+          f"{'retry':>6} {'fail':>5} {'dealers':>8} {'dealers/min':>12}")
+    for r in results:
+        print(f"{r['target']:<11} {r['requests']:>6} {r['rps']:>7} {r['p50_ms']!s:>7} {r['p95_ms']!s:>7} "
+              f"{r['p99_ms']!s:>7} {r['retries']:>6} {r['failed']:>5} {r['unique_dealers']:>8} "
+              f"{r['dealers_per_minute']:>12}" + (f"  ❌ {r['error']}" if r["error"] else ""))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"config": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+                       "results": results}, f, indent=2)
+        print(f"\n📋 Results saved to: {args.json}")
+    return 1 if any(r["failed"] or r["error"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
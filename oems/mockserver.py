@@ -0,0 +1,791 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the OEM dealer APIs.
+Serves the Toyota, Subaru, Honda/Acura, Hyundai, Genesis, Kia, Stellantis
+MDLSDealerLocator, Ford/Lincoln Dealers.json, JLR retailer locator,
+Nissan/INFINITI GraphQL, Mitsubishi persisted GraphQL, BMW/MINI radius
+search, VW dealer-search, GM quantum dealer locator and the exotic/luxury
+full-list endpoints (Bentley, Aston Martin, Ferrari, McLaren, Porsche,
+Pagani) on one port, under the same paths and in
+the same response layouts as the real sites. Each OEM gets a fixed, seeded universe of dealers placed on real ZIPs;
+ZIP queries return the nearest ones, so sweeps show realistic overlap and
+new-dealer yield.
+Recorded response bodies can be replayed instead (--recordings).
+The Nissan-brand GraphQL and VW /api/dealers answer 401 without a bearer
+token; the mock locator pages (/dealer-locator.html, /en/dealer-search.html)
+hand one out through their own script, valid for --token-ttl seconds. The GM
+getDealers API answers 401 without the clientapplicationid header its locator
+pages (/dealer-locator, /locate-buick-dealer) send.
+
+Latency, error rate and rate limiting (429 with Retry-After) are
+configurable, so changes to collector fetching, concurrency and retry logic
+can be judged offline and reproducibly (see oems.loadtest).
+
+Usage:
+    python -m oems mock --port 8765 --latency-ms 80 --error-rate 0.02 --rate-limit 20
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import random
+import re
+import time
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from aiohttp import web
+
+from oems.coverage import haversine_miles
+from oems.dealers import (
+    ZIP_CENTROIDS_FILE,
+    ZIP_CODES_FILE,
+    approximate_zip_point,
+    load_zip_centroids,
+    load_zip_codes,
+    prefix_centroids,
+    zip_state,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+DEFAULT_SEED = 7
+# Dealers per mocked network, roughly the size of the real US networks
+UNIVERSE_SIZES = {
+    "Toyota": 1500, "Subaru": 630, "Honda": 1050, "Acura": 270, "Kia": 780,
+    "Stellantis": 2600, "INFINITI": 190, "Nissan": 1050, "Ford": 2900, "Lincoln": 560, "Mitsubishi": 310,
+    "JLR": 200, "Hyundai": 830, "Genesis": 210, "BMW": 350, "MINI": 160, "Volkswagen": 590, "GM": 4000,
+    "Bentley": 60, "Aston Martin": 40, "Ferrari": 48, "McLaren": 30, "Porsche": 215, "Pagani": 6,
+}
+# The searchDealer persisted query mitsubishicars.com sends
+MITSUBISHI_QUERY_HASH = "509a0311cd943cae03ef78f5964463ab328bdf08d72411ee4de7e41e01e5c793"
+# MINI answers at most this distance whatever is asked, so radius probing has something to find
+MINI_MAX_RADIUS_MILES = 1000
+# The GM locator app's id, sent as the clientapplicationid header; at most GM_MAX_COUNT dealers per answer
+GM_APPLICATION_ID = "quantum"
+GM_MAX_COUNT = 100
+# The JLR retailer locator answers at most this many listings, nearest first
+JLR_MAX_RESULTS = 50
+# Porsche searches at most this far around the given point
+PORSCHE_MAX_RADIUS_MILES = 200
+# Non-US dealers the global full-list services return alongside the US network
+_ABROAD = [("London", "GB", 51.51, -0.14), ("Modena", "IT", 44.65, 10.93), ("Toronto", "CA", 43.65, -79.38)]
+GM_MAKES = {"001": "Chevrolet", "004": "Buick", "006": "Cadillac", "048": "GMC"}
+_BMW_RADIUS_QUERY = re.compile(r"getdealerdetailsByRadius/(\d{5})/(\d+(?:\.\d+)?)")
+# The dealer locator answers at most this many dealers per page, whatever is asked, and says how many
+# pages there are (numberOfResultPages, as in data/FIAT.json)
+MDLS_PAGE_SIZE = 20
+STELLANTIS_BRANDS = {"J": "Jeep", "C": "Chrysler", "D": "Dodge", "R": "Ram", "Y": "Alfa Romeo", "X": "FIAT"}
+# Most Stellantis stores are CDJR; a few add Alfa Romeo/FIAT or sell one brand only
+# Most JLR retailers sell both brands, listed once per brand under separate ids
+_JLR_MIXES = [("Jaguar", "Land Rover")] * 14 + [("Land Rover",)] * 5 + [("Jaguar",)]
+# GM stores are mostly Chevrolet or Buick GMC; some sell Chevrolet, Buick and GMC, a few add Cadillac
+_GM_MIXES = ([("001",)] * 9 + [("004", "048")] * 5 + [("001", "004", "048")] * 2 + [("006",)] * 3
+             + [("001", "006")])
+_STELLANTIS_MIXES = [("C", "D", "J", "R")] * 14 + [("C", "D", "J", "R", "X")] * 2 + [("Y", "X"), ("J",), ("R",), ("D", "R")]
+
+
+class MockConfig:
+    """Fault injection and pacing for the mock server"""
+
+    def __init__(self, latency_ms: float = 50.0, jitter_ms: float = 25.0, error_rate: float = 0.0,
+                 rate_limit: float = 0.0, burst: int = 10, seed: int = DEFAULT_SEED,
+                 recordings: Optional[Path] = None, token_ttl: float = 300.0):
+        self.latency_ms = latency_ms
+        # Exponential tail on top of the base latency
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        # Requests per second per API before answering 429 (0 = unlimited)
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.seed = seed
+        self.recordings = Path(recordings) if recordings else None
+        # Lifetime of the bearer tokens the mock locator pages hand out
+        self.token_ttl = token_ttl
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class DealerUniverse:
+    """A fixed set of dealers for one network, with nearest-neighbour queries"""
+
+    def __init__(self, dealers: List[Dict]):
+        self.dealers = dealers
+        self.points = np.array([(d["lat"], d["lng"]) for d in dealers], dtype=np.float64).reshape(-1, 2)
+
+    def nearest(self, point: Tuple[float, float], limit: int, radius: Optional[float] = None,
+                where=None) -> List[Tuple[Dict, float]]:
+        if not self.dealers:
+            return []
+        dist = haversine_miles(np.array([point[0]]), np.array([point[1]]), self.points[:, 0], self.points[:, 1])[0]
+        results = []
+        for i in np.argsort(dist, kind="stable"):
+            if radius is not None and dist[i] > radius:
+                break
+            if where is None or where(self.dealers[i]):
+                results.append((self.dealers[i], round(float(dist[i]), 2)))
+                if len(results) >= limit:
+                    break
+        return results
+
+
+def build_universe(oem: str, count: int, zip_codes: Sequence[str], locate, seed: int) -> DealerUniverse:
+    """Seeded synthetic dealers placed on real ZIPs"""
+    rng = random.Random(f"{oem}:{seed}")
+    dealers = []
+    for n, zip_code in enumerate(rng.sample(list(zip_codes), min(count, len(zip_codes)))):
+        point = locate(zip_code)
+        if point is None:
+            continue
+        code = f"{zlib.crc32(oem.encode('utf-8')) % 900 + 100}{n:05d}"
+        dealer = {
+            "code": code,
+            "name": f"{oem} of {zip_code}",
+            "street": f"{rng.randint(10, 9999)} {rng.choice(['Main St', 'Auto Mall Dr', 'Highway 1', 'Commerce Blvd'])}",
+            "city": f"City {zip_code}",
+            "state": zip_state(zip_code),
+            "zip": zip_code,
+            # Keep dealers off the exact ZIP center like real storefronts
+            "lat": round(point[0] + rng.uniform(-0.05, 0.05), 6),
+            "lng": round(point[1] + rng.uniform(-0.05, 0.05), 6),
+            "phone": f"({rng.randint(200, 989)}) {rng.randint(200, 999)}-{rng.randint(0, 9999):04d}",
+            "website": f"https://www.{oem.lower().replace(' ', '')}{zip_code}.example.com",
+        }
+        if oem == "Stellantis":
+            dealer["brands"] = list(rng.choice(_STELLANTIS_MIXES))
+        elif oem == "JLR":
+            dealer["brands"] = list(rng.choice(_JLR_MIXES))
+        elif oem == "GM":
+            dealer["makeCodes"] = list(rng.choice(_GM_MIXES))
+            dealer["name"] = f"{' '.join(GM_MAKES[m] for m in dealer['makeCodes'])} of {zip_code}"
+        dealers.append(dealer)
+    return DealerUniverse(dealers)
+
+
+# Native response layouts, one renderer per API
+
+def _toyota(d: Dict, distance: float) -> Dict:
+    return {"code": d["code"], "dealerId": d["code"], "name": d["name"], "address1": d["street"], "city": d["city"],
+            "state": d["state"], "zip": d["zip"], "lat": d["lat"], "long": d["lng"], "distance": distance,
+            "url": d["website"], "general": {"phone": d["phone"], "hours": []}}
+
+
+def _subaru(d: Dict, distance: float) -> Dict:
+    return {"dealer": {"id": d["code"], "name": d["name"], "phoneNumber": d["phone"], "siteUrl": d["website"],
+                       "address": {"street": d["street"], "city": d["city"], "state": d["state"], "zipcode": d["zip"]},
+                       "location": {"latitude": d["lat"], "longitude": d["lng"]}, "types": ["Sales", "Service"]},
+            "distance": distance}
+
+
+def _honda(d: Dict, distance: float) -> Dict:
+    return {"DealerNumber": d["code"], "Name": d["name"], "Address": d["street"], "City": d["city"],
+            "State": d["state"], "ZipCode": d["zip"], "Phone": d["phone"], "WebAddress": d["website"],
+            "Latitude": d["lat"], "Longitude": d["lng"], "Distance": distance}
+
+
+def _hyundai(d: Dict, distance: float) -> Dict:
+    return {"dealerCd": d["code"], "dealerNm": d["name"], "address1": d["street"], "city": d["city"],
+            "state": d["state"], "zipCd": d["zip"], "phone": d["phone"], "dealerUrl": d["website"],
+            "latitude": d["lat"], "longitude": d["lng"], "distance": distance}
+
+
+def _genesis(d: Dict, distance: Optional[float]) -> Dict:
+    return {"dealerCd": d["code"], "dealerName": d["name"], "addressLine1": d["street"], "city": d["city"],
+            "state": d["state"], "zipCode": d["zip"], "phone": d["phone"], "dealerUrl": d["website"],
+            "latitude": d["lat"], "longitude": d["lng"], "distance": distance}
+
+
+def _kia(d: Dict, distance: float) -> Dict:
+    return {"code": d["code"], "name": d["name"], "phone": d["phone"], "url": d["website"], "distance": distance,
+            "address": {"street1": d["street"], "city": d["city"], "state": d["state"], "zipCode": d["zip"]},
+            "location": {"lat": d["lat"], "lng": d["lng"]}}
+
+
+def _mdls(d: Dict, distance: float) -> Dict:
+    return {"dealerCode": d["code"], "dealerName": d["name"], "dealerAddress1": d["street"],
+            "dealerCity": d["city"], "dealerState": d["state"], "dealerZipCode": d["zip"],
+            "dealerShowroomLatitude": d["lat"], "dealerShowroomLongitude": d["lng"],
+            "phoneNumber": d["phone"], "website": d["website"], "brands": d["brands"], "distance": distance}
+
+
+def _ford(d: Dict, distance: float) -> Dict:
+    return {"PACode": d["code"], "Name": d["name"], "Phone": d["phone"], "URL": d["website"],
+            "Address": {"Street1": d["street"], "City": d["city"], "State": d["state"], "PostalCode": d["zip"]},
+            "Latitude": d["lat"], "Longitude": d["lng"], "Distance": distance}
+
+
+def _mitsubishi(d: Dict, distance: float) -> Dict:
+    return {"dealerCode": d["code"], "name": d["name"], "phone": d["phone"], "url": d["website"],
+            "address": {"address1": d["street"], "city": d["city"], "state": d["state"], "zipcode": d["zip"]},
+            "latitude": d["lat"], "longitude": d["lng"], "distance": distance}
+
+
+def _jlr(d: Dict, brand: str, distance: float) -> Dict:
+    return {"dealerId": f"{brand[0]}{d['code']}", "name": f"{brand} of {d['zip']}", "brand": brand,
+            "address": {"addressLine1": d["street"], "city": d["city"], "state": d["state"], "postCode": d["zip"]},
+            "phone": d["phone"], "url": d["website"], "latitude": d["lat"], "longitude": d["lng"],
+            "distance": distance, "services": ["Sales", "Repairs"]}
+
+
+def _bmw(d: Dict, distance: float) -> Dict:
+    return {"centerId": d["code"], "dealerName": d["name"], "address1": d["street"], "city": d["city"],
+            "state": d["state"], "zip": d["zip"], "phone": d["phone"], "url": d["website"],
+            "latitude": d["lat"], "longitude": d["lng"], "distance": distance}
+
+
+def _mini(d: Dict, distance: float) -> Dict:
+    return {"dealerId": d["code"], "dealerName": d["name"], "phone": d["phone"], "website": d["website"],
+            "address": {"street": d["street"], "city": d["city"], "state": d["state"], "zipCode": d["zip"]},
+            "location": {"lat": d["lat"], "lng": d["lng"]}, "distance": distance}
+
+
+def _volkswagen(d: Dict, distance: float) -> Dict:
+    return {"id": d["code"], "name": d["name"], "distance": distance,
+            "address": {"street": d["street"], "city": d["city"], "state": d["state"], "postalCode": d["zip"]},
+            "coordinates": {"latitude": d["lat"], "longitude": d["lng"]},
+            "contact": {"phone": d["phone"], "website": d["website"]}}
+
+
+def _gm(d: Dict, distance: float) -> Dict:
+    return {"id": d["code"], "bac": d["code"], "dealerCode": d["code"][-5:], "dealerName": d["name"],
+            "dealerUrl": d["website"], "generalContact": {"phone1": d["phone"]},
+            "address": {"addressLine1": d["street"], "cityName": d["city"], "countrySubdivisionCode": d["state"],
+                        "postalCode": d["zip"], "countryIso": "US"},
+            "geolocation": {"latitude": d["lat"], "longitude": d["lng"]}, "distance": distance,
+            "distanceProp": {"value": distance, "measurementUnit": "MI"}, "makeCodes": d["makeCodes"]}
+
+
+def _bentley(d: Dict) -> Dict:
+    return {"id": d["code"], "name": d["name"], "phone": d["phone"], "website": d["website"],
+            "address": {"street": d["street"], "city": d["city"], "state": d["state"], "postalCode": d["zip"],
+                        "country": d.get("country", "US")},
+            "coordinates": {"latitude": d["lat"], "longitude": d["lng"]}}
+
+
+def _aston_martin(d: Dict, distance: float) -> Dict:
+    return {"dealerId": d["code"], "dealerName": d["name"], "phoneNumber": d["phone"], "url": d["website"],
+            "address": {"addressLine1": d["street"], "city": d["city"], "region": d["state"], "postCode": d["zip"],
+                        "countryCode": d.get("country", "US")},
+            "latitude": d["lat"], "longitude": d["lng"], "distance": distance}
+
+
+def _ferrari(d: Dict) -> Dict:
+    return {"id": f"dealer_{d['code']}_service", "name": d["name"], "address": d["street"], "city": d["city"],
+            "state": d["state"], "zip": d["zip"], "country": d.get("country", "US"), "lat": d["lat"], "lng": d["lng"],
+            "phone": d["phone"], "url": d["website"], "services": ["Sale", "Service"]}
+
+
+def _mclaren(d: Dict) -> Dict:
+    return {"retailerId": d["code"], "name": d["name"],
+            "address": {"line1": d["street"], "city": d["city"], "state": d["state"], "zipCode": d["zip"],
+                        "country": {"code": d.get("country", "US")}},
+            "location": {"lat": d["lat"], "lng": d["lng"]},
+            "contact": {"phone": d["phone"], "website": d["website"]}}
+
+
+def _porsche(d: Dict, distance: float) -> Dict:
+    return {"id": d["code"], "name": d["name"], "distance": distance,
+            "address": {"street": d["street"], "city": d["city"], "state": d["state"], "postalCode": d["zip"]},
+            "coordinates": {"lat": d["lat"], "lng": d["lng"]},
+            "contact": {"phone": d["phone"], "homepage": d["website"]}}
+
+
+def _pagani(d: Dict) -> Dict:
+    return {"id": d["code"], "title": d["name"], "address": d["street"], "city": d["city"], "state": d["state"],
+            "zip": d["zip"], "country": d.get("country", "US"), "lat": d["lat"], "lng": d["lng"],
+            "phone": d["phone"], "url": d["website"]}
+
+
+def _nissan(d: Dict, distance: Optional[float]) -> Dict:
+    return {"id": d["code"], "name": d["name"], "phoneNumber": d["phone"], "websiteURL": d["website"],
+            "address": {"streetLine1": d["street"], "city": d["city"], "state": d["state"], "postalCode": d["zip"]},
+            "geolocation": {"latitude": d["lat"], "longitude": d["lng"]}, "distance": distance}
+
+
+def _select(record: Dict, selection: str) -> Dict:
+    """Trim a GraphQL record to the requested fields (one level of nesting)"""
+    fields = re.findall(r"(\w+)\s*(\{[^{}]*\})?", selection)
+    result = {}
+    for name, sub in fields:
+        if name not in record:
+            continue
+        value = record[name]
+        if sub and isinstance(value, dict):
+            value = {k: value[k] for k in re.findall(r"\w+", sub) if k in value}
+        result[name] = value
+    return result
+
+
+# Locator pages whose script calls the protected API with a fresh token, as the real apps do
+_NISSAN_PAGE = """<!doctype html><html><body><div id="dealers"></div><script>
+fetch("/graphql", {method: "POST", headers: {"Authorization": "Bearer %s", "Content-Type": "application/json"},
+  body: JSON.stringify({query: 'query { getAllDealers(market: {brand: "nissan"}) { id } }'})});
+</script></body></html>"""
+_VW_PAGE = """<!doctype html><html><body><input role="combobox">
+<ul><li role="option" onclick="search()">Beverly Hills, CA 90210, USA</li></ul><script>
+function search() {
+  fetch("/api/dealers?tenant=vwus&latitude=34.09&longitude=-118.41&radius=50",
+        {headers: {"Authorization": "Bearer %s"}});
+}
+</script></body></html>"""
+_GM_PAGE = """<!doctype html><html><body><input name="zipCode" type="search"><div id="map"></div><script>
+fetch("/bypass/pcf/quantum-dealer-locator/v1/getDealers?desiredCount=25&distance=100&makeCodes=001"
+      + "&serviceCodes=&latitude=42.33&longitude=-83.05&searchType=latLongSearch",
+      {headers: {"clientapplicationid": "%s", "locale": "en-US"}});
+</script></body></html>"""
+
+_GRAPHQL_FIELD = re.compile(r"(?:(\w+)\s*:\s*)?(getAllDealers|getDealersByLatLng)\s*(\(([^)]*)\))?\s*\{((?:[^{}]|\{[^{}]*\})*)\}")
+_GRAPHQL_ARG = re.compile(r"(\w+)\s*:\s*(\$\w+|\"[^\"]*\"|[\w.-]+)")
+
+
+class MockOEMServer:
+    """aiohttp application serving every mocked endpoint"""
+
+    def __init__(self, config: Optional[MockConfig] = None, zip_codes: Optional[Sequence[str]] = None,
+                 centroids: Optional[Dict[str, Tuple[float, float]]] = None):
+        self.config = config or MockConfig()
+        self.zip_codes = list(zip_codes) if zip_codes is not None else load_zip_codes(ZIP_CODES_FILE)
+        self._known = set(self.zip_codes)
+        if centroids is None:
+            centroids = load_zip_centroids(ZIP_CENTROIDS_FILE) if ZIP_CENTROIDS_FILE.exists() else {}
+        self.centroids = centroids
+        self.prefixes = prefix_centroids(centroids)
+        self.universes = {oem: build_universe(oem, size, self.zip_codes, self.locate, self.config.seed)
+                          for oem, size in UNIVERSE_SIZES.items()}
+        self._rng = random.Random(self.config.seed)
+        self._buckets = defaultdict(lambda: TokenBucket(self.config.rate_limit, self.config.burst))
+        self.requests = defaultdict(int)
+
+    def locate(self, zip_code: str) -> Optional[Tuple[float, float]]:
+        return self.centroids.get(zip_code) or self.prefixes.get(zip_code[:3]) or approximate_zip_point(zip_code)
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._faults])
+        app.router.add_get("/v1/dealers/", self.toyota)
+        app.router.add_get("/services/dealers/distances/by/zipcode", self.subaru)
+        app.router.add_get("/platform/api/v2/dealer", self.honda)
+        app.router.add_get("/platform/api/v1/dealers", self.honda)
+        app.router.add_post("/us/services/en/dealers/search", self.kia)
+        app.router.add_get("/var/hyundai/services/dealer.dealerByZip.service", self.hyundai)
+        app.router.add_get("/bin/api/v2/alldealers", self.genesis_all)
+        app.router.add_get("/bin/api/v2/dealers", self.genesis)
+        app.router.add_get("/bdlws/MDLSDealerLocator", self.mdls)
+        app.router.add_get("/cxservices/dealer/Dealers.json", self.ford)
+        app.router.add_get("/dealers", self.jlr)
+        app.router.add_post("/graphql", self.graphql)
+        app.router.add_get("/prod/graphql", self.mitsubishi)
+        app.router.add_post("/prod/graphql", self.mitsubishi)
+        app.router.add_get("/bin/dealerLocatorServlet", self.bmw)
+        app.router.add_get("/dealer-locator.html", self.nissan_page)
+        app.router.add_get("/en/dealer-search.html", self.vw_page)
+        app.router.add_get("/api/dealers", self.volkswagen)
+        app.router.add_get("/bin/services/dealer-locator/getAllDealerByZip.json/{zip}/{distance}", self.mini)
+        app.router.add_get("/dealer-locator", self.gm_page)
+        app.router.add_get("/locate-buick-dealer", self.gm_page)
+        app.router.add_get("/bypass/pcf/quantum-dealer-locator/v1/getDealers", self.gm)
+        app.router.add_get("/.api/retailers", self.bentley)
+        app.router.add_get("/api/v1/dealers", self.aston_martin)
+        app.router.add_get("/server/v1/api/location", self.ferrari)
+        app.router.add_get("/bin/api/locator", self.mclaren)
+        app.router.add_get("/dealers/US", self.porsche)
+        app.router.add_get("/wp/wp-admin/admin-ajax.php", self.pagani)
+        app.router.add_get("/_stats", self.stats)
+        return app
+
+    @web.middleware
+    async def _faults(self, request: web.Request, handler):
+        if request.path == "/_stats":
+            return await handler(request)
+        api = request.path
+        self.requests[api] += 1
+        delay = self.config.latency_ms + (self._rng.expovariate(1.0 / self.config.jitter_ms) if self.config.jitter_ms else 0)
+        await asyncio.sleep(delay / 1000.0)
+        if self.config.rate_limit and not self._buckets[api].take():
+            self.requests["429"] += 1
+            return web.json_response({"error": "Too Many Requests"}, status=429, headers={"Retry-After": "1"})
+        if self.config.error_rate and self._rng.random() < self.config.error_rate:
+            self.requests["5xx"] += 1
+            return web.json_response({"error": "Internal Server Error"}, status=503)
+        return await handler(request)
+
+    def _recorded(self, api: str, zip_code: Optional[str]) -> Optional[web.Response]:
+        if not self.config.recordings or not zip_code:
+            return None
+        path = self.config.recordings / api / f"{zip_code}.json"
+        if path.exists():
+            return web.Response(body=path.read_bytes(), content_type="application/json")
+        return None
+
+    def _token(self) -> str:
+        """A JWT-shaped bearer token expiring token_ttl seconds from now"""
+        claims = base64.urlsafe_b64encode(json.dumps({"exp": int(time.time() + self.config.token_ttl)}).encode())
+        payload = claims.decode("ascii").rstrip("=")
+        return f"eyJhbGciOiJub25lIn0.{payload}.{zlib.crc32(f'{payload}:{self.config.seed}'.encode()):08x}"
+
+    def _authorized(self, request: web.Request) -> bool:
+        parts = request.headers.get("Authorization", "").removeprefix("Bearer ").split(".")
+        if len(parts) != 3 or parts[2] != f"{zlib.crc32(f'{parts[1]}:{self.config.seed}'.encode()):08x}":
+            return False
+        claims = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4)))
+        return time.time() < claims["exp"]
+
+    def _unauthorized(self) -> web.Response:
+        self.requests["401"] += 1
+        return web.json_response({"error": "Unauthorized"}, status=401)
+
+    async def nissan_page(self, request: web.Request) -> web.Response:
+        return web.Response(text=_NISSAN_PAGE % self._token(), content_type="text/html")
+
+    async def vw_page(self, request: web.Request) -> web.Response:
+        return web.Response(text=_VW_PAGE % self._token(), content_type="text/html")
+
+    async def gm_page(self, request: web.Request) -> web.Response:
+        return web.Response(text=_GM_PAGE % GM_APPLICATION_ID, content_type="text/html")
+
+    def _near_zip(self, oem: str, zip_code: str, limit: int, radius: Optional[float] = None, where=None):
+        """Dealers nearest a ZIP; None (a 400) for an invalid ZIP, none at all for a real one the mock
+        cannot place (military and unassigned prefixes), as a real locator finds no dealers there"""
+        point = self.locate(zip_code)
+        if point is None:
+            return [] if zip_code in self._known else None
+        return self.universes[oem].nearest(point, limit, radius, where)
+
+    async def toyota(self, request: web.Request) -> web.Response:
+        zip_code = request.query.get("zipcode", "")
+        recorded = self._recorded("toyota", zip_code)
+        if recorded:
+            return recorded
+        found = self._near_zip("Toyota", zip_code, 10, 100.0)
+        if found is None:
+            return web.json_response({"dealers": [], "message": "Invalid zipcode"}, status=400)
+        return web.json_response({"dealers": [_toyota(d, dist) for d, dist in found]})
+
+    async def subaru(self, request: web.Request) -> web.Response:
+        zip_code = request.query.get("zipcode", "")
+        recorded = self._recorded("subaru", zip_code)
+        if recorded:
+            return recorded
+        found = self._near_zip("Subaru", zip_code, min(int(request.query.get("count", 10)), 100))
+        if found is None:
+            return web.json_response([], status=400)
+        return web.json_response([_subaru(d, dist) for d, dist in found])
+
+    async def honda(self, request: web.Request) -> web.Response:
+        oem = "Acura" if request.query.get("productDivisionCode") == "B" else "Honda"
+        zip_code = request.query.get("zip") or request.query.get("zipCode", "")
+        recorded = self._recorded(oem.lower(), zip_code)
+        if recorded:
+            return recorded
+        # The platform API caps maxResults server-side
+        found = self._near_zip(oem, zip_code, min(int(request.query.get("maxResults", 10)), 50))
+        if found is None:
+            return web.json_response({"Dealers": []}, status=400)
+        return web.json_response({"Dealers": [_honda(d, dist) for d, dist in found]})
+
+    async def kia(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        zip_code = str(body.get("zipCode", ""))
+        recorded = self._recorded("kia", zip_code)
+        if recorded:
+            return recorded
+        found = self._near_zip("Kia", zip_code, 30, float(body.get("radius", 50)))
+        if found is None:
+            return web.json_response({"dealers": []}, status=400)
+        return web.json_response({"dealers": [_kia(d, dist) for d, dist in found]})
+
+    async def hyundai(self, request: web.Request) -> web.Response:
+        zip_code = request.query.get("zip", "")
+        recorded = self._recorded("hyundai", zip_code)
+        if recorded:
+            return recorded
+        found = self._near_zip("Hyundai", zip_code, min(int(request.query.get("maxdealers", 10)), 5000))
+        if found is None:
+            return web.json_response({"dealers": [], "message": "Invalid zip"}, status=400)
+        return web.json_response({"dealers": [_hyundai(d, dist) for d, dist in found]})
+
+    async def genesis_all(self, request: web.Request) -> web.Response:
+        return web.json_response({"dealers": [_genesis(d, None) for d in self.universes["Genesis"].dealers]})
+
+    async def genesis(self, request: web.Request) -> web.Response:
+        zip_code = request.query.get("zip", "")
+        recorded = self._recorded("genesis", zip_code)
+        if recorded:
+            return recorded
+        found = self._near_zip("Genesis", zip_code, 10)
+        if found is None:
+            return web.json_response({"dealers": []}, status=400)
+        return web.json_response({"dealers": [_genesis(d, dist) for d, dist in found]})
+
+    async def mdls(self, request: web.Request) -> web.Response:
+        codes = set(request.query.get("brandCode", "").split(",")) - {""}
+        zip_code = request.query.get("zipCode", "")
+        recorded = self._recorded("mdls", zip_code)
+        if recorded:
+            return recorded
+        per_page = min(int(request.query.get("resultsPerPage", MDLS_PAGE_SIZE)), MDLS_PAGE_SIZE)
+        page = max(int(request.query.get("resultsPage", 1)), 1)
+        radius = float(request.query.get("radius", 100))
+        found = self._near_zip("Stellantis", zip_code, len(self.universes["Stellantis"].dealers), radius,
+                               lambda d: not codes or codes & set(d["brands"]))
+        if found is None:
+            return web.json_response({"status": "INVALID_ZIP", "dealer": []}, status=400)
+        rows = found[per_page * (page - 1):per_page * page]
+        return web.json_response({
+            "status": 200, "numberOfResultsReturned": str(len(rows)),
+            "numberOfResultPages": str(-(-len(found) // per_page)), "currentPageNumber": str(page),
+            "totalDealersCount": str(len(found)), "dealer": [_mdls(d, dist) for d, dist in rows]})
+
+    async def ford(self, request: web.Request) -> web.Response:
+        make = request.query.get("make", "Ford")
+        zip_code = request.query.get("postalCode", "")
+        recorded = self._recorded(make.lower(), zip_code)
+        if recorded:
+            return recorded
+        if make not in ("Ford", "Lincoln"):
+            return web.json_response({"Response": {"Error": "Unknown make"}}, status=400)
+        found = self._near_zip(make, zip_code, int(request.query.get("maxDealers", 25)),
+                               float(request.query.get("radius", 50)))
+        if found is None:
+            return web.json_response({"Response": {"Error": "Invalid postal code"}}, status=400)
+        response = {"Dealer": [_ford(d, dist) for d, dist in found]} if found else {}
+        return web.json_response({"Response": response})
+
+    async def jlr(self, request: web.Request) -> web.Response:
+        zip_code = request.query.get("postCode", "")
+        recorded = self._recorded("jlr", zip_code)
+        if recorded:
+            return recorded
+        brands = [request.query["brand"]] if request.query.get("brand") else ["Jaguar", "Land Rover"]
+        radius = float(request.query.get("radius", 100))
+        if request.query.get("unitOfMeasure", "Miles") == "Kilometers":
+            radius /= 1.609344
+        found = self._near_zip("JLR", zip_code, 500, radius, lambda d: set(brands) & set(d["brands"]))
+        if found is None:
+            return web.json_response({"error": "Invalid postCode"}, status=400)
+        return web.json_response([_jlr(d, brand, dist) for d, dist in found
+                                  for brand in d["brands"] if brand in brands][:JLR_MAX_RESULTS])
+
+    async def graphql(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        # The Nissan brand only answers the locator app's token; INFINITI is open
+        if '"nissan"' in json.dumps(payload).lower() and not self._authorized(request):
+            return self._unauthorized()
+        if isinstance(payload, list):
+            return web.json_response([self._graphql_operation(op) for op in payload])
+        return web.json_response(self._graphql_operation(payload))
+
+    def _graphql_operation(self, operation: Dict) -> Dict:
+        query = operation.get("query") or ""
+        variables = operation.get("variables") or {}
+        data = {}
+        for alias, field, _, args, selection in _GRAPHQL_FIELD.findall(query):
+            values = {}
+            for name, raw in _GRAPHQL_ARG.findall(args):
+                values[name] = variables.get(raw[1:]) if raw.startswith("$") else raw.strip('"')
+            market = values.get("market") or {}
+            oem = "INFINITI" if str(market.get("brand", "infiniti")).lower() == "infiniti" else "Nissan"
+            universe = self.universes[oem]
+            if field == "getAllDealers":
+                rows = [_nissan(d, None) for d in universe.dealers]
+            else:
+                location = values.get("location") or {}
+                size = int(values.get("size") or 10)
+                radius = values.get("radius")
+                found = universe.nearest((float(location["latitude"]), float(location["longitude"])), size,
+                                         float(radius) if radius is not None else None)
+                rows = [_nissan(d, dist) for d, dist in found]
+            data[alias or field] = [_select(row, selection) for row in rows]
+        if not data:
+            return {"errors": [{"message": "Unsupported query"}]}
+        return {"data": data}
+
+    async def mitsubishi(self, request: web.Request) -> web.Response:
+        if request.method == "GET":
+            try:
+                operation = {"operationName": request.query.get("operationName"),
+                             "variables": json.loads(request.query.get("variables") or "{}"),
+                             "extensions": json.loads(request.query.get("extensions") or "{}")}
+            except ValueError:
+                return web.json_response({"errors": [{"message": "Malformed query string"}]}, status=400)
+            return web.json_response(self._mitsubishi_operation(operation))
+        payload = await request.json()
+        if isinstance(payload, list):
+            return web.json_response([self._mitsubishi_operation(op) for op in payload])
+        return web.json_response(self._mitsubishi_operation(payload))
+
+    def _mitsubishi_operation(self, operation: Dict) -> Dict:
+        persisted = (operation.get("extensions") or {}).get("persistedQuery") or {}
+        if operation.get("operationName") != "searchDealer" or persisted.get("sha256Hash") != MITSUBISHI_QUERY_HASH:
+            return {"errors": [{"message": "PersistedQueryNotFound"}]}
+        variables = operation.get("variables") or {}
+        try:
+            point = (float(variables["latitude"]), float(variables["longitude"]))
+        except (KeyError, TypeError, ValueError):
+            return {"errors": [{"message": "latitude and longitude are required"}]}
+        found = self.universes["Mitsubishi"].nearest(point, 1000, float(variables.get("radius") or 100))
+        return {"data": {"searchDealer": [_mitsubishi(d, dist) for d, dist in found]}}
+
+    async def bmw(self, request: web.Request) -> web.Response:
+        # The servlet reads its arguments from the raw query string: getdealerdetailsByRadius/{zip}/{radius}?...
+        match = _BMW_RADIUS_QUERY.search(request.query_string)
+        if not match:
+            return web.json_response({"error": "Unsupported request"}, status=400)
+        zip_code, radius = match.group(1), float(match.group(2))
+        recorded = self._recorded("bmw", zip_code)
+        if recorded:
+            return recorded
+        found = self._near_zip("BMW", zip_code, 5000, radius)
+        if found is None:
+            return web.json_response({"error": "Invalid zip"}, status=400)
+        return web.json_response({"Dealers": [_bmw(d, dist) for d, dist in found]})
+
+    async def mini(self, request: web.Request) -> web.Response:
+        zip_code = request.match_info["zip"]
+        recorded = self._recorded("mini", zip_code)
+        if recorded:
+            return recorded
+        try:
+            radius = min(float(request.match_info["distance"]), MINI_MAX_RADIUS_MILES)
+        except ValueError:
+            return web.json_response({"error": "Invalid distance"}, status=400)
+        found = self._near_zip("MINI", zip_code, 5000, radius)
+        if found is None:
+            return web.json_response({"error": "Invalid zip"}, status=400)
+        return web.json_response({"dealers": [_mini(d, dist) for d, dist in found]})
+
+    async def volkswagen(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return self._unauthorized()
+        try:
+            point = (float(request.query["latitude"]), float(request.query["longitude"]))
+        except (KeyError, ValueError):
+            return web.json_response({"error": "latitude and longitude are required"}, status=400)
+        found = self.universes["Volkswagen"].nearest(point, 50, float(request.query.get("radius", 50)))
+        return web.json_response({"dealers": [_volkswagen(d, dist) for d, dist in found]})
+
+    async def gm(self, request: web.Request) -> web.Response:
+        if request.headers.get("clientapplicationid") != GM_APPLICATION_ID:
+            return self._unauthorized()
+        try:
+            point = (float(request.query["latitude"]), float(request.query["longitude"]))
+            count = min(int(request.query.get("desiredCount", 25)), GM_MAX_COUNT)
+            radius = float(request.query.get("distance", 100))
+        except (KeyError, ValueError):
+            return web.json_response({"status": "failure", "errorCode": "INVALID_REQUEST", "payload": {}}, status=400)
+        makes = {m for m in request.query.get("makeCodes", "").split(",") if m}
+        found = self.universes["GM"].nearest(point, count, radius, lambda d: not makes or makes & set(d["makeCodes"]))
+        return web.json_response({"cachedData": False, "cacheId": "", "resultCount": str(len(found)), "errorCode": "",
+                                  "messages": [], "payload": {"dealers": [_gm(d, dist) for d, dist in found]},
+                                  "status": "success"})
+
+    def _worldwide(self, oem: str) -> List[Dict]:
+        """The US universe plus a few dealers abroad, as the global full-list services answer"""
+        abroad = [{"code": f"{country}{n:03d}", "name": f"{oem} {city}", "street": "1 High Street", "city": city,
+                   "state": "", "zip": "", "country": country, "lat": lat, "lng": lng, "phone": "+44 20 0000 0000",
+                   "website": f"https://www.{oem.lower().replace(' ', '')}-{city.lower()}.example.com"}
+                  for n, (city, country, lat, lng) in enumerate(_ABROAD)]
+        return self.universes[oem].dealers + abroad
+
+    async def bentley(self, request: web.Request) -> web.Response:
+        return web.json_response({"retailers": [_bentley(d) for d in self._worldwide("Bentley")]})
+
+    async def aston_martin(self, request: web.Request) -> web.Response:
+        try:
+            point = (float(request.query["latitude"]), float(request.query["longitude"]))
+            take = int(request.query.get("take", 10))
+        except (KeyError, ValueError):
+            return web.json_response({"error": "latitude and longitude are required"}, status=400)
+        found = DealerUniverse(self._worldwide("Aston Martin")).nearest(point, take)
+        return web.json_response([_aston_martin(d, dist) for d, dist in found])
+
+    async def ferrari(self, request: web.Request) -> web.Response:
+        return web.json_response({"data": [_ferrari(d) for d in self._worldwide("Ferrari")]})
+
+    async def mclaren(self, request: web.Request) -> web.Response:
+        return web.json_response({"retailers": [_mclaren(d) for d in self._worldwide("McLaren")]})
+
+    async def porsche(self, request: web.Request) -> web.Response:
+        try:
+            lat, lng = (float(part) for part in request.query["coordinates"].split(","))
+            radius = min(float(request.query.get("radius", 100)), PORSCHE_MAX_RADIUS_MILES)
+        except (KeyError, ValueError):
+            return web.json_response({"error": "coordinates are required"}, status=400)
+        found = self.universes["Porsche"].nearest((lat, lng), 1000, radius)
+        return web.json_response({"dealers": [_porsche(d, dist) for d, dist in found]})
+
+    async def pagani(self, request: web.Request) -> web.Response:
+        if request.query.get("action") != "desktop_map_ajax_request":
+            return web.Response(text="0")
+        markers = [_pagani(d) for d in self._worldwide("Pagani")]
+        return web.json_response({"success": True, "data": {"markers": markers}})
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response(dict(self.requests))
+
+
+async def start_server(server: MockOEMServer, host: str = "127.0.0.1", port: int = 0) -> Tuple[web.AppRunner, str]:
+    """Start the mock in the running loop; returns (runner, base URL). Port 0 picks a free port."""
+    runner = web.AppRunner(server.app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound = runner.addresses[0][1]
+    return runner, f"http://{host}:{bound}"
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Base response latency")
+    parser.add_argument("--jitter-ms", type=float, default=25.0, help="Mean of the exponential latency tail")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Requests/s per endpoint before 429 (0 = off)")
+    parser.add_argument("--burst", type=int, default=10, help="Rate-limit burst size")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Dealer universe and fault seed")
+    parser.add_argument("--recordings", type=Path, default=None,
+                        help="Replay <dir>/<api>/<zip>.json bodies when present (api: toyota, subaru, honda, ...)")
+    parser.add_argument("--token-ttl", type=float, default=300.0,
+                        help="Seconds the bearer tokens from the mock locator pages stay valid")
+
+
+def config_from_args(args) -> MockConfig:
+    return MockConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.rate_limit, args.burst, args.seed,
+                      args.recordings, args.token_ttl)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="oems mock", description="Serve mocked OEM dealer APIs locally")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    server = MockOEMServer(config_from_args(args))
+    for oem, universe in server.universes.items():
+        logger.info(f"{oem}: {len(universe.dealers)} mock dealers")
+    logger.info(f"Serving mock OEM APIs on http://{args.host}:{args.port}")
+    web.run_app(server.app(), host=args.host, port=args.port, print=None, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Profiling hooks for crawl and parse runs.
+A Profiler collects, per named stage, an exclusive cProfile (nested stages
+pause their parent), wall time and the tracemalloc peak with its top
+allocation sites, plus asyncio event-loop lag for async runs. Everything is
+written next to the run report as <prefix>.profile.json with one
+<prefix>.<stage>.prof per stage (open with snakeviz or pstats). Stages
+nest per thread, so collectors that call stage() from worker threads get
+one stack and one cProfile per thread, merged into the stage's totals.
+Async tasks share their thread's stack: a stage may span awaits, and while
+several are open the one entered last gets the thread's CPU. Concurrent
+spans overlap, so an async stage's seconds can exceed the run's wall time.
+
+Collectors mark stages with the module-level helper, which is a no-op unless
+a profiler is active:
+
+    from oems.profiling import stage
+    with stage("fetch"):
+        response = session.get(...)
+    with stage("parse"):
+        dealers = parse(response.text)
+
+Script collectors are profiled by running them through this module, which
+is what `oems crawl --profile cpu,memory` does:
+
+    python -m oems.profiling --modes cpu,memory --output logs/hyundai scripts/hyundai_final_parser.py
+"""
+
+import argparse
+import asyncio
+import cProfile
+import io
+import json
+import logging
+import pstats
+import runpy
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CPU = "cpu"
+MEMORY = "memory"
+LAG = "lag"
+PROFILE_MODES = (CPU, MEMORY, LAG)
+DEFAULT_TOP = 25
+DEFAULT_LAG_INTERVAL = 0.05
+
+
+def parse_modes(value: str) -> List[str]:
+    """'cpu,memory' -> ['cpu', 'memory']; 'all' selects every mode"""
+    modes = list(PROFILE_MODES) if value.strip() == "all" else [m.strip() for m in value.split(",") if m.strip()]
+    unknown = set(modes) - set(PROFILE_MODES)
+    if unknown:
+        raise ValueError(f"Unknown profile modes: {', '.join(sorted(unknown))} (choose from {', '.join(PROFILE_MODES)}, all)")
+    return modes
+
+
+class _Stage:
+    def __init__(self, name: str, profile: Optional[cProfile.Profile]):
+        self.name = name
+        self.profile = profile
+        self.start = time.perf_counter()
+        self.peak = 0
+
+
+class Profiler:
+    """Per-stage CPU and memory profiles plus event-loop lag for one run"""
+
+    def __init__(self, modes: Iterable[str], output_prefix: Path, top: int = DEFAULT_TOP):
+        self.modes = set(modes)
+        self.output_prefix = Path(output_prefix)
+        self.top = top
+        self.stages: Dict[str, Dict] = {}
+        # (stage, thread id) -> profile: a cProfile only sees the thread that enabled it
+        self._profiles: Dict[Tuple[str, int], cProfile.Profile] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._lags: List[float] = []
+        self._lag_task = None
+        self._tracing = False
+
+    @property
+    def _stack(self) -> List[_Stage]:
+        """This thread's open stages"""
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @property
+    def cpu(self) -> bool:
+        return CPU in self.modes
+
+    @property
+    def memory(self) -> bool:
+        return MEMORY in self.modes
+
+    def start(self):
+        """Begin memory tracing; call before the first stage"""
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+            self._tracing = True
+
+    def stop(self):
+        """Stop memory tracing started by start(); collected stages are kept"""
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Profile a block; re-entering a stage name accumulates into it"""
+        parent = self._stack[-1] if self._stack else None
+        if parent and parent.profile:
+            parent.profile.disable()
+        profile = None
+        if self.cpu:
+            with self._lock:
+                profile = self._profiles.setdefault((name, threading.get_ident()), cProfile.Profile())
+            try:
+                profile.enable()
+            except ValueError:
+                # Python 3.12+ allows one active profiler per process; this thread's stage goes unprofiled
+                profile = None
+        current = _Stage(name, profile)
+        if self.memory:
+            tracemalloc.reset_peak()
+        stack = self._stack
+        stack.append(current)
+        try:
+            yield
+        finally:
+            # Interleaved async tasks can close stages out of order; only the top one owns the profiler
+            on_top = stack[-1] is current
+            stack.remove(current)
+            if profile and on_top:
+                profile.disable()
+            with self._lock:
+                self._record(name, current, parent)
+            if on_top and stack and stack[-1].profile:
+                stack[-1].profile.enable()
+
+    def _record(self, name: str, current: _Stage, parent: Optional[_Stage]):
+        stats = self.stages.setdefault(name, {"calls": 0, "seconds": 0.0})
+        stats["calls"] += 1
+        stats["seconds"] = round(stats["seconds"] + time.perf_counter() - current.start, 6)
+        if self.memory:
+            # tracemalloc's peak is process-wide, so stages running in parallel threads share it
+            current.peak = max(current.peak, tracemalloc.get_traced_memory()[1])
+            previous = stats.get("peak_memory_bytes")
+            if previous is None or current.peak > previous:
+                stats["peak_memory_bytes"] = current.peak
+                # Snapshots are slow; only re-take one when the peak grows noticeably
+                if previous is None or current.peak > previous * 1.1:
+                    stats["top_allocations"] = self._top_allocations()
+            if parent:
+                # reset_peak() in stage() hid this stage's peak from the parent
+                parent.peak = max(parent.peak, current.peak)
+
+    def _top_allocations(self) -> List[Dict]:
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        return [{"where": f"{s.traceback[0].filename}:{s.traceback[0].lineno}", "bytes": s.size, "blocks": s.count}
+                for s in snapshot.statistics("lineno")[:10]]
+
+    async def _monitor_lag(self, interval: float):
+        loop = asyncio.get_running_loop()
+        while True:
+            before = loop.time()
+            await asyncio.sleep(interval)
+            self._lags.append(max(loop.time() - before - interval, 0.0))
+
+    def start_lag_monitor(self, interval: float = DEFAULT_LAG_INTERVAL):
+        """Start sampling event-loop lag in the running loop (no-op unless 'lag' is on)"""
+        if LAG in self.modes and self._lag_task is None:
+            self._lag_task = asyncio.get_running_loop().create_task(self._monitor_lag(interval))
+
+    def stop_lag_monitor(self):
+        if self._lag_task:
+            self._lag_task.cancel()
+            self._lag_task = None
+
+    def lag_summary(self) -> Optional[Dict]:
+        if not self._lags:
+            return None
+        lags = sorted(self._lags)
+
+        def at(q):
+            return round(lags[min(int(q * len(lags)), len(lags) - 1)] * 1000, 2)
+        return {"samples": len(lags), "p50_ms": at(0.5), "p95_ms": at(0.95), "p99_ms": at(0.99),
+                "max_ms": round(lags[-1] * 1000, 2), "over_100ms": sum(1 for x in lags if x > 0.1)}
+
+    def _merged(self) -> Dict[str, pstats.Stats]:
+        """Stage -> its profiles from every thread, combined"""
+        merged: Dict[str, pstats.Stats] = {}
+        for (name, _), profile in self._profiles.items():
+            if name in merged:
+                merged[name].add(profile)
+            else:
+                merged[name] = pstats.Stats(profile, stream=io.StringIO())
+        return merged
+
+    def _top_functions(self, stats: pstats.Stats) -> List[Dict]:
+        rows = []
+        for (filename, line, func), (cc, nc, tottime, cumtime, _) in stats.stats.items():
+            rows.append({"function": f"{Path(filename).name}:{line}({func})", "calls": nc,
+                         "tottime": round(tottime, 6), "cumtime": round(cumtime, 6)})
+        return sorted(rows, key=lambda r: r["tottime"], reverse=True)[:self.top]
+
+    def report(self) -> Dict:
+        stages = {}
+        merged = self._merged()
+        for name, stats in self.stages.items():
+            entry = dict(stats)
+            if name in merged:
+                entry["top_functions"] = self._top_functions(merged[name])
+            stages[name] = entry
+        return {"modes": sorted(self.modes), "stages": stages, "loop_lag": self.lag_summary()}
+
+    def write(self) -> Path:
+        """Write <prefix>.profile.json and one <prefix>.<stage>.prof per CPU-profiled stage"""
+        self.output_prefix.parent.mkdir(parents=True, exist_ok=True)
+        for name, stats in self._merged().items():
+            stats.dump_stats(f"{self.output_prefix}.{_slug(name)}.prof")
+        path = Path(f"{self.output_prefix}.profile.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        self.stop()
+        return path
+
+
+def _slug(name: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in name.lower())
+
+
+_ACTIVE: Optional[Profiler] = None
+
+
+def activate(profiler: Optional[Profiler]):
+    """Make a profiler the target of the module-level stage() helper (None to clear)"""
+    global _ACTIVE
+    _ACTIVE = profiler
+    if profiler:
+        profiler.start()
+
+
+def active() -> Optional[Profiler]:
+    return _ACTIVE
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Mark a stage for the active profiler; does nothing when profiling is off"""
+    if _ACTIVE is None:
+        yield
+    else:
+        with _ACTIVE.stage(name):
+            yield
+
+
+def run_script(script: Path, modes: Iterable[str], output_prefix: Path, argv: Iterable[str] = ()) -> int:
+    """Run a collector script as __main__ under a profiler and write its profile"""
+    profiler = Profiler(modes, output_prefix)
+    activate(profiler)
+    # Match `python script.py`: the script's own directory comes first on sys.path
+    sys.path.insert(0, str(Path(script).resolve().parent))
+    sys.argv = [str(script)] + list(argv)
+    code = 0
+    try:
+        with profiler.stage("main"):
+            runpy.run_path(str(script), run_name="__main__")
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    finally:
+        activate(None)
+        path = profiler.write()
+        print(f"📈 Profile saved to: {path}")
+    return code
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m oems.profiling", description="Run a collector script under the profiler")
+    parser.add_argument("--modes", default="cpu,memory", help=f"Comma-separated: {', '.join(PROFILE_MODES)} or all")
+    parser.add_argument("--output", type=Path, required=True, help="Output prefix, e.g. logs/toyota")
+    parser.add_argument("script", type=Path)
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+    try:
+        modes = parse_modes(args.modes)
+    except ValueError as e:
+        parser.error(str(e))
+    return run_script(args.script, modes, args.output, args.args)
+
+
+if __name__ == "__main__":
+    # Run through the importable module so collectors' `from oems.profiling import stage`
+    # sees the same active profiler as this entry point
+    from oems.profiling import main as _main
+    sys.exit(_main())
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Live crawl progress: a machine-readable status file and a terminal dashboard.
+Collectors report each unit of work (usually a ZIP) as they finish it; the
+tracker combines that with the request telemetry into a per-OEM status with
+rolling rate, ETA, in-flight requests, errors, retries, 429s, unique dealers,
+the new-dealer yield curve and the capture-recapture completeness estimate,
+and flags OEMs that are stalled or throttled.
+
+Collectors use the shared instance:
+
+    progress = get_progress()
+    progress.start("Toyota", total=len(zipcodes))
+    for zip_code in zipcodes:
+        ...
+        progress.advance("Toyota")
+
+When a script is run by `oems crawl`, OEMS_STATUS names its status file
+(logs/<oem>.status.json), rewritten about once a second and at exit.
+
+Usage:
+    python -m oems status                 # one snapshot of logs/*.status.json
+    python -m oems status --watch         # refresh until interrupted
+    python -m oems crawl --dashboard      # the same view while crawling
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from oems.telemetry import Telemetry, get_telemetry
+
+logger = logging.getLogger(__name__)
+
+STATUS_ENV = "OEMS_STATUS"
+# Rate, ETA and throttling are computed over this trailing window
+RATE_WINDOW = 60.0
+WRITE_INTERVAL = 1.0
+# No finished unit for this long marks an OEM as stalled
+STALL_SECONDS = 120.0
+# Share of recent requests answered 429 that marks an OEM as throttled
+THROTTLE_RATIO = 0.05
+MAX_CURVE_POINTS = 50
+SPARK = "▁▂▃▄▅▆▇█"
+
+
+class OEMProgress:
+    """Work done for one OEM, with a trailing window for rates and a compacted yield curve"""
+
+    def __init__(self, oem: str, total: Optional[int], unit: str = "zip"):
+        self.oem = oem
+        self.total = total
+        self.unit = unit
+        self.done = 0
+        self.started_at = time.time()
+        self.last_progress_at = self.started_at
+        self.finished_at = None
+        self.curve: List[List[int]] = [[0, 0]]
+        self._stride = 1
+        self._window = deque()
+
+    def advance(self, n: int, unique: int, requests: int, throttled: int):
+        now = time.time()
+        self.done += n
+        self.last_progress_at = now
+        self.sample(now, unique, requests, throttled)
+        if self.done % self._stride == 0 or (self.total and self.done >= self.total):
+            self.curve.append([self.done, unique])
+            if len(self.curve) > MAX_CURVE_POINTS:
+                # Keep the curve bounded: halve its resolution, keeping the latest point
+                self._stride *= 2
+                self.curve = [p for p in self.curve[:-1] if p[0] % self._stride == 0] + [self.curve[-1]]
+
+    def sample(self, now: float, unique: int, requests: int, throttled: int):
+        self._window.append((now, self.done, unique, requests, throttled))
+        while len(self._window) > 1 and now - self._window[0][0] > RATE_WINDOW:
+            self._window.popleft()
+
+    def _delta(self, index: int) -> float:
+        if len(self._window) < 2:
+            return 0
+        return self._window[-1][index] - self._window[0][index]
+
+    def _per_minute(self, index: int) -> Optional[float]:
+        span = self._window[-1][0] - self._window[0][0] if self._window else 0
+        return self._delta(index) / span * 60 if span > 0 else None
+
+    def rate(self) -> Optional[float]:
+        """Units per minute over the trailing window"""
+        return self._per_minute(1)
+
+    def to_dict(self, telemetry_row: Dict, in_flight: int, unique: int) -> Dict:
+        now = time.time()
+        rate = self.rate()
+        remaining = self.total - self.done if self.total is not None else None
+        eta = remaining / rate * 60 if rate and remaining is not None else None
+        recent_requests = self._delta(3)
+        recent_throttled = self._delta(4)
+        finished = self.finished_at is not None
+        return {
+            "oem": self.oem,
+            "unit": self.unit,
+            "done": self.done,
+            "total": self.total,
+            "rate_per_minute": _round(rate),
+            "eta_seconds": round(eta) if eta is not None else None,
+            "in_flight": in_flight,
+            "requests": telemetry_row.get("requests", 0),
+            "errors": telemetry_row.get("errors", 0),
+            "retries": telemetry_row.get("retries", 0),
+            "throttled": telemetry_row.get("throttled", 0),
+            "unique_dealers": unique,
+            "new_dealers_per_minute": _round(self._per_minute(2)),
+            "yield_curve": self.curve,
+            "started_at": self.started_at,
+            "last_progress_at": self.last_progress_at,
+            "finished_at": self.finished_at,
+            "stalled": not finished and now - self.last_progress_at > STALL_SECONDS,
+            "throttled_now": bool(recent_requests) and recent_throttled / recent_requests >= THROTTLE_RATIO,
+        }
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 1) if value is not None else None
+
+
+class ProgressTracker:
+    """Thread-safe per-OEM progress, written to a status file as it changes"""
+
+    def __init__(self, telemetry: Optional[Telemetry] = None, status_file: Optional[Path] = None):
+        self.telemetry = telemetry or get_telemetry()
+        self.status_file = Path(status_file) if status_file else None
+        self._oems: Dict[str, OEMProgress] = {}
+        self._unique_override: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._written_at = 0.0
+
+    def start(self, oem: str, total: Optional[int] = None, unit: str = "zip"):
+        """Begin (or restart) tracking an OEM with `total` units of work"""
+        with self._lock:
+            self._oems[oem] = OEMProgress(oem, total, unit)
+        self.write(force=True)
+
+    def advance(self, oem: str, n: int = 1, unique: Optional[int] = None):
+        """Mark n units done; unique overrides the telemetry's unique-dealer count
+        for collectors that do not report dealers through telemetry"""
+        with self._lock:
+            progress = self._oems.get(oem) or self._oems.setdefault(oem, OEMProgress(oem, None))
+            if unique is not None:
+                self._unique_override[oem] = unique
+            row = self.telemetry.summary("oem").get(oem, {})
+            progress.advance(n, self._unique(oem), row.get("requests", 0), row.get("throttled", 0))
+        self.write()
+
+    def finish(self, oem: str):
+        with self._lock:
+            if oem in self._oems:
+                self._oems[oem].finished_at = time.time()
+        self.write(force=True)
+
+    def _unique(self, oem: str) -> int:
+        return self._unique_override.get(oem, self.telemetry.unique_dealers(oem))
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            rows = self.telemetry.summary("oem")
+            oems = {}
+            for oem, progress in self._oems.items():
+                row = rows.get(oem, {})
+                progress.sample(time.time(), self._unique(oem), row.get("requests", 0), row.get("throttled", 0))
+                oems[oem] = progress.to_dict(row, self.telemetry.in_flight(oem), self._unique(oem))
+                oems[oem]["completeness"] = self.telemetry.completeness(oem)
+        return {"pid": os.getpid(), "updated_at": time.time(), "oems": oems}
+
+    def write(self, force: bool = False):
+        """Rewrite the status file, at most once per WRITE_INTERVAL unless forced"""
+        if self.status_file is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._written_at < WRITE_INTERVAL:
+                return
+            self._written_at = now
+            # Write then rename so a reader never sees a partial file
+            tmp = Path(f"{self.status_file}.tmp")
+            try:
+                tmp.write_text(json.dumps(self.snapshot(), indent=2), encoding="utf-8")
+                os.replace(tmp, self.status_file)
+            except OSError as e:
+                logger.warning(f"Could not write status to {self.status_file}: {e}")
+
+    def close(self):
+        with self._lock:
+            for progress in self._oems.values():
+                if progress.finished_at is None:
+                    progress.finished_at = time.time()
+        self.write(force=True)
+
+
+_PROGRESS: Optional[ProgressTracker] = None
+
+
+def get_progress() -> ProgressTracker:
+    """Process-wide tracker; written to $OEMS_STATUS while running when that is set"""
+    global _PROGRESS
+    if _PROGRESS is None:
+        target = os.environ.get(STATUS_ENV)
+        _PROGRESS = ProgressTracker(status_file=Path(target) if target else None)
+        if target:
+            atexit.register(_PROGRESS.close)
+    return _PROGRESS
+
+
+def load_statuses(paths: Iterable[Path]) -> Dict[str, Dict]:
+    """Merge status files into one {oem: status} map; unreadable files are skipped"""
+    oems = {}
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                oems.update(json.load(f).get("oems", {}))
+        except (OSError, json.JSONDecodeError):
+            # Files are replaced atomically, so this is a crawl that has not written yet
+            continue
+    return oems
+
+
+def sparkline(curve: List[List[int]], width: int = 20) -> str:
+    """New dealers per step of the yield curve, as block characters"""
+    gains = [b[1] - a[1] for a, b in zip(curve, curve[1:])]
+    if not gains:
+        return ""
+    if len(gains) > width:
+        step = len(gains) / width
+        gains = [sum(gains[int(i * step):int((i + 1) * step)]) for i in range(width)]
+    top = max(gains) or 1
+    return "".join(SPARK[min(int(g / top * (len(SPARK) - 1)), len(SPARK) - 1)] for g in gains)
+
+
+def _duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    return f"{seconds // 60}m{seconds % 60:02d}s"
+
+
+def _completeness(estimate: Optional[Dict]) -> str:
+    """'93%≥88' : point estimate and its lower confidence bound"""
+    if not estimate or estimate.get("completeness") is None:
+        return "-"
+    return f"{estimate['completeness']:.0%}≥{estimate['completeness_lower'] * 100:.0f}"
+
+
+def render(oems: Dict[str, Dict]) -> str:
+    """Dashboard table: one line per OEM with its yield curve and any warnings"""
+    lines = [f"{'oem':<14} {'done':>13} {'rate/min':>9} {'eta':>7} {'fly':>4} {'req':>7} {'err':>5} "
+             f"{'retry':>6} {'429':>5} {'dealers':>8} {'complete':>9}  yield"]
+    for oem, s in sorted(oems.items()):
+        done = f"{s['done']}/{s['total']}" if s.get("total") is not None else str(s["done"])
+        rate = f"{s['rate_per_minute']:.1f}" if s.get("rate_per_minute") is not None else "-"
+        flags = []
+        if s.get("finished_at"):
+            flags.append("done")
+        # A stalled collector stops rewriting its file, so judge staleness here too
+        idle = time.time() - s["last_progress_at"]
+        if s.get("stalled") or (not s.get("finished_at") and idle > STALL_SECONDS):
+            flags.append(f"⚠️ STALLED {_duration(idle)}")
+        if s.get("throttled_now"):
+            flags.append("⚠️ THROTTLED")
+        lines.append(f"{oem:<14} {done:>13} {rate:>9} {_duration(s.get('eta_seconds')):>7} {s['in_flight']:>4} "
+                     f"{s['requests']:>7} {s['errors']:>5} {s['retries']:>6} {s['throttled']:>5} "
+                     f"{s['unique_dealers']:>8} {_completeness(s.get('completeness')):>9}  "
+                     f"{sparkline(s['yield_curve']):<20} {' '.join(flags)}")
+    if not oems:
+        lines.append("(no collector has reported progress yet)")
+    return "\n".join(lines)
+
+
+def show(paths_fn, watch: bool = False, interval: float = 2.0, stop: Optional[threading.Event] = None):
+    """Print the dashboard for the status files paths_fn() returns, redrawing while watching"""
+    while True:
+        text = render(load_statuses(paths_fn()))
+        if watch:
+            # Clear the screen and home the cursor before each redraw
+            print("\x1b[H\x1b[2J" + time.strftime("%H:%M:%S") + "\n" + text, flush=True)
+        else:
+            print(text)
+            return
+        if stop is not None:
+            if stop.wait(interval):
+                return
+        else:
+            time.sleep(interval)
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Change-rate-aware refresh planning.
+Each time an OEM's output is recorded we diff it against the previous
+snapshot per region (state), keep a smoothed churn rate per OEM and per
+region, and derive when the OEM is next due and which regions need a full
+recrawl versus a spot check. Slow movers like Pagani drift out to long
+intervals while large networks like Toyota get refreshed where they change.
+
+Snapshots are kept per output OEM (the "oem" of each file), so a strategy
+writing several brands is planned from all of them: it is due when its
+earliest brand is. `oems crawl --due-only` hands each due strategy's plan to
+its collector through OEMS_REFRESH_PLANS; ZIP sweeps then query every point
+in hot regions but only a spot_check_rate sample of points in quiet ones, and
+carry the previous output's quiet-region dealers they did not revisit.
+
+Usage:
+    python -m oems refresh --record     # snapshot the current data/ outputs
+    python -m oems refresh              # show what is due and where
+"""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+from collections import defaultdict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, TypeVar
+
+from oems.dealers import DATA_DIR, REPO_ROOT, dealer_key, dealer_state, iter_dealer_files, load_dealer_file, zip_state
+from oems.serialize import COMPRESSIONS
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = DATA_DIR / ".refresh_state.json"
+
+# Refresh once the expected fraction of changed dealers reaches this
+TARGET_CHURN = 0.02
+MIN_INTERVAL_DAYS = 1.0
+MAX_INTERVAL_DAYS = 90.0
+# Smoothing for the per-day churn rate (1.0 = only the latest observation)
+EWMA_ALPHA = 0.5
+# Fraction of quiet-region query points still re-checked on each refresh
+MIN_SPOT_CHECK = 0.05
+UNKNOWN_REGION = "?"
+# JSON file of name -> plan (RefreshPlan.to_dict) for the strategies and output OEMs of a --due-only crawl
+REFRESH_ENV = "OEMS_REFRESH_PLANS"
+
+T = TypeVar("T")
+
+
+def fingerprint_dealers(dealers: List[Dict]) -> Dict[str, Dict[str, str]]:
+    """Map region -> dealer key -> short content hash"""
+    regions = defaultdict(dict)
+    for dealer in dealers:
+        digest = hashlib.md5(json.dumps(dealer, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:12]
+        regions[dealer_state(dealer) or UNKNOWN_REGION][dealer_key(dealer)] = digest
+    return dict(regions)
+
+
+def diff_region(old: Dict[str, str], new: Dict[str, str]) -> Dict[str, int]:
+    """Count added, removed and changed dealers between two region fingerprints"""
+    added = len(new.keys() - old.keys())
+    removed = len(old.keys() - new.keys())
+    changed = sum(1 for k in old.keys() & new.keys() if old[k] != new[k])
+    return {"added": added, "removed": removed, "changed": changed, "total": max(len(old), len(new))}
+
+
+def _ewma(previous: Optional[float], observed: float) -> float:
+    return observed if previous is None else EWMA_ALPHA * observed + (1 - EWMA_ALPHA) * previous
+
+
+class RefreshPlan:
+    """When an OEM should next be refreshed and how much of it"""
+
+    def __init__(self, oem: str, due_at: datetime, interval_days: float, hot_regions: List[str],
+                 quiet_regions: List[str], spot_check_rate: float, churn_per_day: Optional[float]):
+        self.oem = oem
+        self.due_at = due_at
+        self.interval_days = interval_days
+        self.hot_regions = hot_regions
+        self.quiet_regions = quiet_regions
+        self.spot_check_rate = spot_check_rate
+        self.churn_per_day = churn_per_day
+
+    def is_due(self, now: Optional[datetime] = None) -> bool:
+        return (now or datetime.now()) >= self.due_at
+
+    @property
+    def full_refresh(self) -> bool:
+        return self.churn_per_day is None
+
+    def to_dict(self) -> Dict:
+        return {
+            "oem": self.oem,
+            "due_at": self.due_at.isoformat(timespec="seconds"),
+            "interval_days": round(self.interval_days, 2),
+            "churn_per_day": self.churn_per_day,
+            "hot_regions": self.hot_regions,
+            "quiet_regions": self.quiet_regions,
+            "spot_check_rate": round(self.spot_check_rate, 3),
+        }
+
+
+class RefreshPlanner:
+    """Persists per-OEM snapshots and churn rates and plans the next refresh"""
+
+    def __init__(self, state_file: Path = STATE_FILE):
+        self.state_file = Path(state_file)
+        self.state = {"oems": {}}
+        if self.state_file.exists():
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                self.state = json.load(f)
+
+    def save(self):
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_file, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+
+    def record(self, oem: str, dealers: List[Dict], when: Optional[datetime] = None) -> Dict[str, Dict[str, int]]:
+        """Record a new snapshot for an OEM and update its churn rates.
+        Returns the per-region diff against the previous snapshot (empty on first record)."""
+        when = when or datetime.now()
+        entry = self.state["oems"].setdefault(oem, {"regions": {}, "rate": None, "region_rates": {}})
+        current = fingerprint_dealers(dealers)
+        previous = entry.get("snapshot")
+        diffs = {}
+
+        if previous is not None:
+            days = max((when - datetime.fromisoformat(entry["recorded_at"])).total_seconds() / 86400, 1e-3)
+            moved = total = 0
+            for region in set(previous["regions"]) | set(current):
+                d = diff_region(previous["regions"].get(region, {}), current.get(region, {}))
+                diffs[region] = d
+                region_moved = d["added"] + d["removed"] + d["changed"]
+                moved += region_moved
+                total += d["total"]
+                rate = region_moved / max(d["total"], 1) / days
+                entry["region_rates"][region] = _ewma(entry["region_rates"].get(region), rate)
+            entry["rate"] = _ewma(entry["rate"], moved / max(total, 1) / days)
+            entry["last_changed_regions"] = sorted(
+                r for r, d in diffs.items() if d["added"] or d["removed"] or d["changed"])
+
+        entry["snapshot"] = {"regions": current}
+        entry["recorded_at"] = when.isoformat(timespec="seconds")
+        entry["dealer_count"] = len(dealers)
+        return diffs
+
+    def plan(self, oem: str, now: Optional[datetime] = None) -> RefreshPlan:
+        """Next refresh time, hot regions and spot-check rate for an OEM"""
+        now = now or datetime.now()
+        entry = self.state["oems"].get(oem)
+        if not entry or entry.get("rate") is None:
+            # Never seen, or only one snapshot: no rate yet, refresh everything now
+            regions = sorted(entry["snapshot"]["regions"]) if entry else []
+            return RefreshPlan(oem, now, MIN_INTERVAL_DAYS, regions, [], 1.0, None)
+
+        rate = entry["rate"]
+        interval = MAX_INTERVAL_DAYS if rate <= 0 else min(max(TARGET_CHURN / rate, MIN_INTERVAL_DAYS), MAX_INTERVAL_DAYS)
+        due_at = datetime.fromisoformat(entry["recorded_at"]) + timedelta(days=interval)
+
+        hot = set(entry.get("last_changed_regions", []))
+        # Regions whose own rate would cross the target before the OEM is due are hot too
+        hot.update(r for r, r_rate in entry["region_rates"].items() if r_rate * interval >= TARGET_CHURN)
+        quiet = sorted(set(entry["snapshot"]["regions"]) - hot)
+        # Spot-check quiet regions in proportion to how far they are expected to drift by then
+        quiet_rates = [entry["region_rates"].get(r, 0.0) for r in quiet]
+        quiet_rate = sum(quiet_rates) / len(quiet_rates) if quiet_rates else 0.0
+        spot_check = min(1.0, max(MIN_SPOT_CHECK, quiet_rate * interval / TARGET_CHURN))
+        return RefreshPlan(oem, due_at, interval, sorted(hot), quiet, spot_check, rate)
+
+    def plan_many(self, name: str, oems: Sequence[Optional[str]], now: Optional[datetime] = None) -> RefreshPlan:
+        """One plan for a collector writing several OEMs' outputs from a shared sweep: due at the
+        earliest of theirs, hot wherever any of them is, spot-checked at the highest of their rates.
+        A None among oems is an output with no readable file yet, which makes the run a full one now."""
+        now = now or datetime.now()
+        if not oems or None in oems:
+            return RefreshPlan(name, now, MIN_INTERVAL_DAYS, [], [], 1.0, None)
+        plans = [self.plan(oem, now) for oem in oems]
+        if len(plans) == 1:
+            plan = plans[0]
+            return RefreshPlan(name, plan.due_at, plan.interval_days, plan.hot_regions, plan.quiet_regions,
+                               plan.spot_check_rate, plan.churn_per_day)
+        hot = sorted(set().union(*(p.hot_regions for p in plans)))
+        quiet = sorted(set().union(*(p.quiet_regions for p in plans)) - set(hot))
+        rates = [p.churn_per_day for p in plans]
+        return RefreshPlan(name, min(p.due_at for p in plans), min(p.interval_days for p in plans), hot, quiet,
+                           max(p.spot_check_rate for p in plans), None if None in rates else max(rates))
+
+
+def record_outputs(planner: RefreshPlanner, data_dir: Path = DATA_DIR, when: Optional[datetime] = None) -> Dict[str, int]:
+    """Record one snapshot per OEM from every standard output file under data_dir"""
+    merged = defaultdict(dict)
+    for path, oem, dealers in iter_dealer_files(data_dir):
+        for dealer in dealers:
+            merged[oem].setdefault(dealer_key(dealer), dealer)
+    for oem, dealers in merged.items():
+        planner.record(oem, list(dealers.values()), when)
+    return {oem: len(dealers) for oem, dealers in merged.items()}
+
+
+def _expand(pattern: str) -> List[str]:
+    """Expand one {a,b} group per path segment, as in registry output strings"""
+    match = re.search(r"\{([^{}]*)\}", pattern)
+    if not match:
+        return [pattern]
+    return [path for option in match.group(1).split(",")
+            for path in _expand(pattern[:match.start()] + option + pattern[match.end():])]
+
+
+def _load_output(path: Path):
+    """(oem, dealers) from an output file or the compressed copy `oems crawl --compress` wrote instead"""
+    for suffix in COMPRESSIONS.values():
+        candidate = path.with_name(path.name + suffix)
+        if candidate.exists():
+            return load_dealer_file(candidate)
+    return None
+
+
+def output_oems(output: str, root: Path = REPO_ROOT) -> List[Optional[str]]:
+    """The "oem" name in each of a strategy's output files (its registry output string:
+    comma-separated paths with {a,b} groups), None for a file missing or not in the standard envelope"""
+    names = []
+    for pattern in re.split(r",\s+(?![^{]*\})", output):
+        for relative in _expand(pattern.strip()):
+            loaded = _load_output(root / relative)
+            names.append(loaded[0] if loaded else None)
+    return names
+
+
+def write_plans(plans: Mapping[str, RefreshPlan], path: Path) -> Path:
+    """Write output OEM -> plan for collectors to pick up via REFRESH_ENV"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({oem: plan.to_dict() for oem, plan in plans.items()}, f, indent=2)
+    return path
+
+
+@lru_cache(maxsize=None)
+def _load_plans(path: str) -> Dict[str, Dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring refresh plans in {path}: {e}")
+        return {}
+
+
+def active_plan(oem: str) -> Optional[Dict]:
+    """The refresh plan this run was given for oem, if a --due-only crawl set one"""
+    path = os.environ.get(REFRESH_ENV)
+    return _load_plans(path).get(oem) if path else None
+
+
+def _point_zip(point) -> str:
+    return point if isinstance(point, str) else point[0]
+
+
+def plan_points(oems: Iterable[str], points: Sequence[T], zip_of: Callable[[T], str] = _point_zip) -> List[T]:
+    """Points (ZIPs, or (ZIP, coordinates) pairs) of a sweep shared by oems under their active plans:
+    all of them outside the regions quiet for every one of them and a spot_check_rate sample of those
+    inside; every point unless each of oems has a plan"""
+    oems = list(oems)
+    plans = [active_plan(oem) for oem in oems]
+    if not plans or None in plans:
+        return list(points)
+    quiet = set.intersection(*(set(plan["quiet_regions"]) for plan in plans))
+    rate = max(plan["spot_check_rate"] for plan in plans)
+    if not quiet or rate >= 1:
+        return list(points)
+    kept = [p for p in points if zip_state(zip_of(p)) not in quiet or random.random() < rate]
+    logger.info(f"{', '.join(oems)}: refresh plan keeps {len(kept)}/{len(points)} points "
+                f"(spot-checking {rate:.0%} of {len(quiet)} quiet regions)")
+    return kept
+
+
+def carry_quiet(oem: str, dealers: List[Dict], previous: Path, key: Callable[[Dict], str] = dealer_key,
+                state: Callable[[Dict], Optional[str]] = dealer_state) -> List[Dict]:
+    """dealers plus the previous output's dealers in oem's quiet regions that a spot-checked sweep
+    did not find again; dealers unchanged with no plan or no previous output"""
+    plan = active_plan(oem)
+    if not plan or not plan["quiet_regions"] or plan["spot_check_rate"] >= 1:
+        return dealers
+    loaded = _load_output(Path(previous))
+    if not loaded:
+        return dealers
+    quiet = set(plan["quiet_regions"])
+    found = {key(d) for d in dealers}
+    carried = [d for d in loaded[1] if state(d) in quiet and key(d) not in found]
+    if carried:
+        logger.info(f"{oem}: keeping {len(carried)} dealers from quiet regions of {previous}")
+    return dealers + carried
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Registry of per-OEM collection strategies.
+Each OEM registers how it is collected (bulk API, ZIP sweep or browser), the
+locator hosts it is listed under in utils/config/OEMs.txt, the API host it
+hits (used for per-host concurrency limits) and where its output goes.
+
+Entries are plain strings: either a collector script path or a
+"package.module:callable" entry point, plus the heavy third-party modules it
+needs. Nothing is imported until that OEM actually runs, so listing,
+conversions and analytics never pay for Playwright, Selenium and friends.
+"""
+
+import importlib
+import importlib.util
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from oems.dealers import OEMS_FILE, REPO_ROOT
+
+BULK_API = "bulk_api"
+ZIP_SWEEP = "zip_sweep"
+BROWSER = "browser"
+STRATEGY_KINDS = (BULK_API, ZIP_SWEEP, BROWSER)
+
+
+class OEMStrategy:
+    """How one OEM is collected"""
+
+    def __init__(self, name: str, kind: str, locator_hosts: Iterable[str], api_host: str,
+                 entry: str, output: str, requires: Iterable[str] = ()):
+        if kind not in STRATEGY_KINDS:
+            raise ValueError(f"Unknown strategy kind {kind!r} for {name}")
+        self.name = name
+        self.kind = kind
+        self.locator_hosts = tuple(_normalize_host(h) for h in locator_hosts)
+        self.api_host = api_host
+        self.entry = entry
+        self.output = output
+        self.requires = tuple(requires)
+        self._loaded = None
+
+    @property
+    def is_script(self) -> bool:
+        """True for collector scripts run as a subprocess, False for module:callable entries"""
+        return ":" not in self.entry
+
+    @property
+    def script_path(self) -> Path:
+        return REPO_ROOT / self.entry
+
+    def missing_requirements(self) -> List[str]:
+        """Declared dependencies that are not installed (checked without importing them)"""
+        return [mod for mod in self.requires if importlib.util.find_spec(mod) is None]
+
+    def load(self) -> Callable:
+        """Import and return the entry point callable; only valid for module:callable entries"""
+        if self.is_script:
+            raise TypeError(f"{self.name} is a script entry ({self.entry}); run it as a subprocess")
+        if self._loaded is None:
+            module_name, _, attr = self.entry.partition(":")
+            self._loaded = getattr(importlib.import_module(module_name), attr)
+        return self._loaded
+
+    @property
+    def output_path(self) -> Path:
+        return REPO_ROOT / self.output
+
+    def __repr__(self):
+        return f"OEMStrategy({self.name!r}, {self.kind!r}, api_host={self.api_host!r})"
+
+
+_REGISTRY: Dict[str, OEMStrategy] = {}
+_BY_HOST: Dict[str, OEMStrategy] = {}
+
+
+def _normalize_host(host: str) -> str:
+    host = host.lower().strip()
+    return host[4:] if host.startswith("www.") else host
+
+
+def register(name: str, kind: str, locator_hosts: Iterable[str], api_host: str,
+             entry: str, output: str, requires: Iterable[str] = ()) -> OEMStrategy:
+    """Register an OEM strategy; names and locator hosts must be unique"""
+    if name in _REGISTRY:
+        raise ValueError(f"OEM {name!r} is already registered")
+    strategy = OEMStrategy(name, kind, locator_hosts, api_host, entry, output, requires)
+    for host in strategy.locator_hosts:
+        if host in _BY_HOST:
+            raise ValueError(f"Locator host {host!r} already belongs to {_BY_HOST[host].name}")
+    _REGISTRY[name] = strategy
+    for host in strategy.locator_hosts:
+        _BY_HOST[host] = strategy
+    return strategy
+
+
+def get(name: str) -> OEMStrategy:
+    """Look up a strategy by OEM name (case-insensitive)"""
+    for key, strategy in _REGISTRY.items():
+        if key.lower() == name.lower():
+            return strategy
+    raise KeyError(f"No strategy registered for {name!r}")
+
+
+def all_strategies() -> List[OEMStrategy]:
+    return sorted(_REGISTRY.values(), key=lambda s: s.name)
+
+
+def lookup_url(url: str) -> Optional[OEMStrategy]:
+    """Resolve a dealer-locator URL from OEMs.txt to its registered strategy"""
+    return _BY_HOST.get(_normalize_host(urlparse(url).netloc))
+
+
+def load_oem_urls(path: Path = OEMS_FILE) -> List[str]:
+    """Read OEMs.txt: one locator URL per line after the header"""
+    urls = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("http"):
+                urls.append(line)
+    return urls
+
+
+def resolve_config(path: Path = OEMS_FILE) -> Tuple[List[OEMStrategy], List[str]]:
+    """Return (strategies in config order without duplicates, URLs with no strategy)"""
+    strategies, unmatched, seen = [], [], set()
+    for url in load_oem_urls(path):
+        strategy = lookup_url(url)
+        if strategy is None:
+            unmatched.append(url)
+        elif strategy.name not in seen:
+            seen.add(strategy.name)
+            strategies.append(strategy)
+    return strategies, unmatched
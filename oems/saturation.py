@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Yield-curve early stopping for ZIP sweeps.
+A sweep's ZIPs are grouped into regions (3-digit ZIP prefix by default) and
+visited round-robin, so every region is probed early. Each successful query
+reports how many new dealers it found; once a region has gone long enough
+without a new dealer that its per-query discovery rate is below `min_yield`
+with probability `confidence`, its remaining ZIPs are dropped.
+
+The rate uses a uniform Beta(1, 1) prior over the queries since the region's
+last new dealer: after k empty queries P(rate < min_yield) = 1 - (1 - min_yield)^(k + 1),
+so the defaults (0.8 confidence, 0.5 min yield) stop a region after two
+empty queries in a row.
+
+    detector = SaturationDetector(confidence=0.8)
+    for zip_code in detector.plan(zipcodes):
+        dealers = fetch(zip_code)
+        detector.observe(zip_code, new_dealers=count_new(dealers))
+    detector.log_summary("Toyota")
+"""
+
+import logging
+import math
+from collections import OrderedDict, deque
+from typing import Callable, Dict, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIDENCE = 0.8
+DEFAULT_MIN_YIELD = 0.5
+
+
+def zip3(zip_code: str) -> str:
+    return str(zip_code)[:3]
+
+
+class RegionStats:
+    """Queries and discoveries for one region of a sweep"""
+
+    def __init__(self):
+        self.pending = deque()
+        self.queries = 0
+        self.new_dealers = 0
+        self.empty_streak = 0
+        self.saturated = False
+        self.skipped = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "queries": self.queries,
+            "new_dealers": self.new_dealers,
+            "empty_streak": self.empty_streak,
+            "saturated": self.saturated,
+            "skipped": self.skipped,
+        }
+
+
+class SaturationDetector:
+    """Drops a region's remaining ZIPs once further queries stop finding new dealers"""
+
+    def __init__(self, confidence: float = DEFAULT_CONFIDENCE, min_yield: float = DEFAULT_MIN_YIELD,
+                 region: Callable[[str], str] = zip3, enabled: bool = True):
+        if not 0 < confidence < 1 or not 0 < min_yield < 1:
+            raise ValueError("confidence and min_yield must be between 0 and 1")
+        self.confidence = confidence
+        self.min_yield = min_yield
+        self.region = region
+        self.enabled = enabled
+        self.regions: Dict[str, RegionStats] = OrderedDict()
+        self.planned = 0
+
+    @property
+    def empty_queries_to_stop(self) -> int:
+        """Consecutive empty queries after which a region counts as saturated"""
+        return max(math.ceil(math.log(1 - self.confidence) / math.log(1 - self.min_yield)) - 1, 1)
+
+    def p_saturated(self, region: str) -> float:
+        """Posterior probability that the region's per-query discovery rate is below min_yield"""
+        streak = self.regions[region].empty_streak
+        return 1 - (1 - self.min_yield) ** (streak + 1)
+
+    def plan(self, zip_codes: Iterable[str]) -> Iterator[str]:
+        """Yield ZIPs round-robin across regions, skipping regions as they saturate"""
+        for zip_code in zip_codes:
+            self.regions.setdefault(self.region(zip_code), RegionStats()).pending.append(zip_code)
+            self.planned += 1
+        active = [name for name, stats in self.regions.items() if stats.pending]
+        while active:
+            for name in list(active):
+                stats = self.regions[name]
+                if stats.saturated or not stats.pending:
+                    active.remove(name)
+                    continue
+                yield stats.pending.popleft()
+
+    def observe(self, zip_code: str, new_dealers: int) -> int:
+        """Record a successful query; returns how many ZIPs were dropped as a result"""
+        stats = self.regions.setdefault(self.region(zip_code), RegionStats())
+        stats.queries += 1
+        stats.new_dealers += new_dealers
+        stats.empty_streak = 0 if new_dealers else stats.empty_streak + 1
+        if not self.enabled or stats.saturated or stats.empty_streak < self.empty_queries_to_stop:
+            return 0
+        stats.saturated = True
+        stats.skipped = len(stats.pending)
+        stats.pending.clear()
+        if stats.skipped:
+            logger.info(f"Region {self.region(zip_code)} saturated after {stats.queries} queries "
+                        f"({stats.new_dealers} new dealers); skipping {stats.skipped} ZIPs")
+        return stats.skipped
+
+    @property
+    def skipped(self) -> int:
+        return sum(stats.skipped for stats in self.regions.values())
+
+    def to_dict(self) -> Dict:
+        return {
+            "confidence": self.confidence,
+            "min_yield": self.min_yield,
+            "empty_queries_to_stop": self.empty_queries_to_stop,
+            "planned": self.planned,
+            "skipped": self.skipped,
+            "saved_fraction": round(self.skipped / self.planned, 3) if self.planned else 0.0,
+            "regions": {name: stats.to_dict() for name, stats in self.regions.items()},
+        }
+
+    def log_summary(self, oem: str):
+        saturated = sum(1 for stats in self.regions.values() if stats.saturated)
+        logger.info(f"{oem}: early stopping skipped {self.skipped}/{self.planned} ZIP queries "
+                    f"({self.skipped / max(self.planned, 1):.0%}); {saturated}/{len(self.regions)} regions saturated")
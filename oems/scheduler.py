@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Concurrent OEM crawl scheduler.
+Runs each OEM's collector under a global concurrency limit and a per-host
+limit, so a full refresh keeps the box busy without sending more than a
+couple of parallel crawls at any single site.
+
+Script collectors get OEMS_TELEMETRY pointing next to their log and the repo
+root on PYTHONPATH, so they can report per-request telemetry; the scheduler
+merges those reports with its own in-process telemetry after the run.
+OEMS_STATUS likewise names the live progress file each collector rewrites
+(<oem>.status.json); in-process collectors share crawl.status.json.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from oems.dealers import REPO_ROOT
+from oems.profiling import active as active_profiler
+from oems.progress import STATUS_ENV, get_progress
+from oems.registry import OEMStrategy
+from oems.telemetry import TELEMETRY_ENV, get_telemetry, load_report
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GLOBAL_LIMIT = 8
+DEFAULT_PER_HOST_LIMIT = 1
+CRAWL_STATUS_FILE = "crawl.status.json"
+
+
+class CrawlResult:
+    """Outcome of one OEM crawl"""
+
+    def __init__(self, strategy: OEMStrategy, returncode: Optional[int], seconds: float, log_file: Optional[Path],
+                 telemetry_file: Optional[Path] = None):
+        self.strategy = strategy
+        self.returncode = returncode
+        self.seconds = seconds
+        self.log_file = log_file
+        self.telemetry_file = telemetry_file
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "oem": self.strategy.name,
+            "strategy": self.strategy.kind,
+            "api_host": self.strategy.api_host,
+            "returncode": self.returncode,
+            "seconds": round(self.seconds, 2),
+            "output": self.strategy.output,
+            "log": str(self.log_file) if self.log_file else None,
+            "telemetry": str(self.telemetry_file) if self.telemetry_file else None,
+        }
+
+
+class CrawlScheduler:
+    """Schedules OEM crawls concurrently under global and per-host limits"""
+
+    def __init__(self, global_limit: int = DEFAULT_GLOBAL_LIMIT, per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+                 log_dir: Optional[Path] = None, timeout: Optional[float] = None,
+                 profile_modes: Sequence[str] = (), profile_prefix: Optional[Path] = None):
+        self.global_limit = global_limit
+        self.per_host_limit = per_host_limit
+        self.log_dir = Path(log_dir) if log_dir else None
+        self.timeout = timeout
+        # Script collectors are run through oems.profiling, writing <profile_prefix>.<oem>.*
+        self.profile_modes = list(profile_modes)
+        self.profile_prefix = Path(profile_prefix).resolve() if profile_prefix else None
+        self.telemetry = get_telemetry()
+        self.progress = get_progress()
+        if self.log_dir and self.progress.status_file is None:
+            self.progress.status_file = self.log_dir / CRAWL_STATUS_FILE
+        self._global = None
+        self._hosts = None
+
+    def status_files(self, strategies: List[OEMStrategy]) -> List[Path]:
+        """Progress files this crawl writes, for the dashboard"""
+        if not self.log_dir:
+            return []
+        return [self.log_dir / CRAWL_STATUS_FILE] + [self.log_dir / f"{_slug(s)}.status.json"
+                                                     for s in strategies if s.is_script]
+
+    async def _run_script(self, strategy: OEMStrategy, log_file: Optional[Path],
+                          telemetry_file: Optional[Path]) -> Optional[int]:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(p for p in (str(REPO_ROOT), env.get("PYTHONPATH")) if p)
+        if telemetry_file:
+            env[TELEMETRY_ENV] = str(telemetry_file)
+            env[STATUS_ENV] = str(telemetry_file.with_name(f"{_slug(strategy)}.status.json"))
+        command = [sys.executable, str(strategy.script_path)]
+        if self.profile_modes and self.profile_prefix:
+            command[1:1] = ["-m", "oems.profiling", "--modes", ",".join(self.profile_modes),
+                            "--output", f"{self.profile_prefix}.{_slug(strategy)}"]
+        stdout = open(log_file, "wb") if log_file else asyncio.subprocess.DEVNULL
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=str(REPO_ROOT), stdout=stdout, stderr=asyncio.subprocess.STDOUT, env=env,
+            )
+            try:
+                return await asyncio.wait_for(proc.wait(), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                logger.error(f"{strategy.name} timed out after {self.timeout}s")
+                return None
+        finally:
+            if log_file:
+                stdout.close()
+
+    async def _run_entry(self, strategy: OEMStrategy) -> Optional[int]:
+        func = strategy.load()
+        if asyncio.iscoroutinefunction(func):
+            call = func()
+        else:
+            call = asyncio.get_running_loop().run_in_executor(None, func)
+        try:
+            await asyncio.wait_for(call, timeout=self.timeout)
+            return 0
+        except asyncio.TimeoutError:
+            logger.error(f"{strategy.name} timed out after {self.timeout}s")
+            return None
+        except Exception as e:
+            logger.error(f"{strategy.name} raised {type(e).__name__}: {e}")
+            return 1
+
+    async def _run_one(self, strategy: OEMStrategy) -> CrawlResult:
+        async with self._global, self._hosts[strategy.api_host]:
+            logger.info(f"Starting {strategy.name} ({strategy.kind}) via {strategy.entry}")
+            start = time.monotonic()
+            log_file = telemetry_file = None
+            if strategy.is_script:
+                if self.log_dir:
+                    slug = _slug(strategy)
+                    log_file = self.log_dir / f"{slug}.log"
+                    telemetry_file = self.log_dir / f"{slug}.telemetry.json"
+                    telemetry_file.unlink(missing_ok=True)
+                    (self.log_dir / f"{slug}.status.json").unlink(missing_ok=True)
+                returncode = await self._run_script(strategy, log_file, telemetry_file)
+                if telemetry_file and telemetry_file.exists():
+                    report = load_report(telemetry_file)
+                    if report:
+                        self.telemetry.merge(report)
+            else:
+                returncode = await self._run_entry(strategy)
+
+            result = CrawlResult(strategy, returncode, time.monotonic() - start, log_file, telemetry_file)
+            if result.ok:
+                logger.info(f"Finished {strategy.name} in {result.seconds:.1f}s")
+            else:
+                logger.error(f"{strategy.name} failed (exit {returncode}) after {result.seconds:.1f}s")
+            return result
+
+    async def run(self, strategies: List[OEMStrategy]) -> List[CrawlResult]:
+        """Crawl all strategies, returning results in the order given"""
+        self._global = asyncio.Semaphore(self.global_limit)
+        self._hosts = defaultdict(lambda: asyncio.Semaphore(self.per_host_limit))
+        if self.log_dir:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            (self.log_dir / CRAWL_STATUS_FILE).unlink(missing_ok=True)
+        profiler = active_profiler()
+        if profiler:
+            profiler.start_lag_monitor()
+        try:
+            return await asyncio.gather(*(self._run_one(s) for s in strategies))
+        finally:
+            if profiler:
+                profiler.stop_lag_monitor()
+            self.progress.close()
+
+
+def _slug(strategy: OEMStrategy) -> str:
+    return strategy.name.lower().replace(' ', '_')
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Output serialization for every collector.
+One place decides how results are encoded and written: orjson when it is
+installed (stdlib json otherwise), compact machine output or indented output
+for human review, optional gzip/zstd compression, and atomic writes (a temp
+file renamed into place, so a killed crawl never leaves a half-written file).
+Large dealer lists can be streamed record by record.
+
+Collectors call:
+
+    from oems.serialize import dump
+    path = dump(data, "data/toyota.json")          # returns the path written
+
+    with stream_dealers("data/ford.json", {"oem": "Ford"}) as out:   # what api.write_dealers does
+        for dealer in dealers:
+            out.write(dealer)
+
+Readers go through load() or open_output(), which decompress by suffix, and
+find outputs with is_json_output(), which knows the compressed names.
+
+The mode comes from the environment, which `oems crawl --pretty/--compress`
+sets for the collectors it runs:
+
+    OEMS_OUTPUT_MODE  compact (default) or pretty
+    OEMS_COMPRESSION  none (default), gzip or zstd; adds .gz/.zst to the filename
+
+Usage:
+    python -m oems.serialize data/FIAT.json --pretty     # re-encode a file in place
+    python -m oems.serialize data/*.json --compress gzip
+"""
+
+import argparse
+import gzip
+import io
+import json
+import logging
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+try:
+    import zstandard
+except ImportError:  # only needed for OEMS_COMPRESSION=zstd
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+MODE_ENV = "OEMS_OUTPUT_MODE"
+COMPRESSION_ENV = "OEMS_COMPRESSION"
+COMPACT = "compact"
+PRETTY = "pretty"
+OUTPUT_MODES = (COMPACT, PRETTY)
+COMPRESSIONS = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+# Names dump() gives a .json file under each compression
+JSON_SUFFIXES = tuple(".json" + suffix for suffix in COMPRESSIONS.values())
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 10
+
+
+def output_mode() -> str:
+    mode = os.environ.get(MODE_ENV, COMPACT)
+    if mode not in OUTPUT_MODES:
+        raise ValueError(f"{MODE_ENV}={mode!r}: choose from {', '.join(OUTPUT_MODES)}")
+    return mode
+
+
+def compression_for(path: Path) -> str:
+    """Compression implied by a filename, else the configured default"""
+    for name, suffix in COMPRESSIONS.items():
+        if suffix and Path(path).suffix == suffix:
+            return name
+    name = os.environ.get(COMPRESSION_ENV, "none") or "none"
+    if name not in COMPRESSIONS:
+        raise ValueError(f"{COMPRESSION_ENV}={name!r}: choose from {', '.join(COMPRESSIONS)}")
+    return name
+
+
+def dumps(obj: Any, pretty: Optional[bool] = None) -> bytes:
+    """Encode to UTF-8 JSON bytes; pretty defaults to the configured output mode"""
+    if pretty is None:
+        pretty = output_mode() == PRETTY
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, option=option, default=str)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _target(path: Union[str, Path], compression: str) -> Path:
+    path = Path(path)
+    suffix = COMPRESSIONS[compression]
+    return path if not suffix or path.suffix == suffix else path.with_name(path.name + suffix)
+
+
+@contextmanager
+def _open_atomic(path: Path, compression: str) -> Iterator[io.BufferedIOBase]:
+    """Binary writer for path (compressed as asked) that only replaces it on success"""
+    if compression == "zstd" and zstandard is None:
+        raise RuntimeError("zstd compression needs the zstandard package (pip install zstandard)")
+    if path.parent != Path(""):
+        path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    raw = open(tmp, "wb")
+    try:
+        if compression == "gzip":
+            stream = gzip.GzipFile(filename=path.name[:-len(".gz")], mode="wb", fileobj=raw,
+                                   compresslevel=GZIP_LEVEL, mtime=0)
+        elif compression == "zstd":
+            stream = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw, closefd=False)
+        else:
+            stream = raw
+        yield stream
+        if stream is not raw:
+            stream.close()
+        raw.close()
+        os.replace(tmp, path)
+    except BaseException:
+        raw.close()
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def dump(obj: Any, path: Union[str, Path], pretty: Optional[bool] = None,
+         compression: Optional[str] = None) -> Path:
+    """Write obj as JSON to path, atomically; returns the path written (with any .gz/.zst added)"""
+    compression = compression or compression_for(Path(path))
+    target = _target(path, compression)
+    data = dumps(obj, pretty)
+    with _open_atomic(target, compression) as f:
+        f.write(data)
+        if pretty or (pretty is None and output_mode() == PRETTY):
+            f.write(b"\n")
+    return target
+
+
+def is_json_output(path: Union[str, Path]) -> bool:
+    """Whether path is named like a JSON file dump() writes, compressed or not"""
+    return Path(path).name.endswith(JSON_SUFFIXES)
+
+
+def is_compressed(path: Union[str, Path]) -> bool:
+    return Path(path).suffix in {suffix for suffix in COMPRESSIONS.values() if suffix}
+
+
+def open_output(path: Union[str, Path]) -> BinaryIO:
+    """Binary reader for a file written by dump(), decompressing by suffix"""
+    path = Path(path)
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError(f"Reading {path} needs the zstandard package")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    return open(path, "rb")
+
+
+def load(path: Union[str, Path]) -> Any:
+    """Read a file written by dump(), decompressing by suffix"""
+    with open_output(path) as f:
+        return loads(f.read())
+
+
+class DealerStream:
+    """Writes {...envelope, "dealers": [record, record, ...]} one record at a time to path"""
+
+    def __init__(self, out: io.BufferedIOBase, pretty: bool, path: Path):
+        self.out = out
+        self.pretty = pretty
+        self.path = path
+        self.count = 0
+
+    def write(self, dealer: Dict):
+        data = dumps(dealer, self.pretty)
+        if self.pretty:
+            data = b"    " + data.replace(b"\n", b"\n    ")
+        separator = b"," if self.count else b""
+        self.out.write(separator + (b"\n" if self.pretty else b"") + data)
+        self.count += 1
+
+
+@contextmanager
+def stream_dealers(path: Union[str, Path], envelope: Optional[Dict] = None, pretty: Optional[bool] = None,
+                   compression: Optional[str] = None) -> Iterator[DealerStream]:
+    """Stream dealer records into the standard envelope without holding them all in memory.
+    The file (stream.path, with any .gz/.zst added) only appears once the block completes."""
+    if pretty is None:
+        pretty = output_mode() == PRETTY
+    compression = compression or compression_for(Path(path))
+    head = dict(envelope or {})
+    head.pop("dealers", None)
+    # The envelope minus its closing brace, then the dealers array
+    opening = dumps(head, pretty).rstrip()[:-1].rstrip()
+    comma = b"," if head else b""
+    target = _target(path, compression)
+    with _open_atomic(target, compression) as f:
+        f.write(opening + comma + (b'\n  "dealers": [' if pretty else b'"dealers":['))
+        stream = DealerStream(f, pretty, target)
+        yield stream
+        f.write((b"\n  ]\n}\n" if stream.count else b"]\n}\n") if pretty else b"]}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m oems.serialize", description="Re-encode JSON output files")
+    parser.add_argument("files", nargs="+", type=Path)
+    parser.add_argument("--pretty", action="store_true", help="Indented output for review (default compact)")
+    parser.add_argument("--compress", choices=list(COMPRESSIONS), default="none",
+                        help="Write <file>.gz/.zst instead and remove the original")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    for path in args.files:
+        before = path.stat().st_size
+        written = dump(load(path), path, pretty=args.pretty, compression=args.compress)
+        if written != path:
+            path.unlink()
+        print(f"💾 {written}: {before / 1e6:.2f} MB -> {written.stat().st_size / 1e6:.2f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Per-request crawl telemetry.
+Every fetch records its latency, response size, status, retries, the number
+of dealers it returned and how many of those were new unique dealers for the
+OEM. Requests are aggregated per OEM and host into histograms and exported
+as a Prometheus text file and a JSON run report, so it is visible where
+crawl time goes and which queries are wasted (returned nothing new).
+
+Collectors use the shared instance:
+
+    telemetry = get_telemetry()
+    with telemetry.request("Subaru", url, query=zip_code) as req:
+        response = session.get(url, params=params, timeout=15)
+        req.response(response)
+        req.results(response.json())
+
+When a script is run by `oems crawl`, OEMS_TELEMETRY names the file its
+report is written to at exit; the crawl merges those into one run report.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from oems.completeness import DEFAULT_CONFIDENCE, CaptureHistory
+from oems.dealers import dealer_key, dealer_state
+
+logger = logging.getLogger(__name__)
+
+TELEMETRY_ENV = "OEMS_TELEMETRY"
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SIZE_BUCKETS = (1024, 8192, 32768, 131072, 524288, 2097152, 8388608)
+RESULT_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 1000)
+# Slowest wasted queries kept per OEM/host for the run report
+MAX_WASTED_QUERIES = 20
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus layout"""
+
+    def __init__(self, buckets: Iterable[float]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def merge(self, other: Dict):
+        if tuple(other["buckets"]) != self.buckets:
+            raise ValueError("Cannot merge histograms with different buckets")
+        self.counts = [a + b for a, b in zip(self.counts, other["counts"])]
+        self.sum += other["sum"]
+        self.count += other["count"]
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bucket bound containing the q-quantile (None if empty or beyond the last bucket)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            if running >= target:
+                return bound
+        return None
+
+    def to_dict(self) -> Dict:
+        return {"buckets": list(self.buckets), "counts": list(self.counts), "sum": self.sum, "count": self.count}
+
+    def prometheus(self, name: str, labels: str) -> List[str]:
+        lines, running = [], 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {running}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum:g}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+class RequestStats:
+    """Aggregated requests for one OEM against one host"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes = 0
+        self.results = 0
+        self.new_dealers = 0
+        self.wasted = 0
+        self.statuses = defaultdict(int)
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.size = Histogram(SIZE_BUCKETS)
+        self.yield_ = Histogram(RESULT_BUCKETS)
+        self.wasted_queries = []
+
+    def add(self, latency: float, status: Optional[int], size: int, retries: int, results: int,
+            new_dealers: int, query: Optional[str]):
+        self.requests += 1
+        self.retries += retries
+        self.bytes += size
+        self.results += results
+        self.new_dealers += new_dealers
+        self.statuses[str(status) if status is not None else "error"] += 1
+        if status is None or status >= 400:
+            self.errors += 1
+        elif not new_dealers:
+            self.wasted += 1
+            if query is not None:
+                self._keep_wasted(query, latency)
+        self.latency.observe(latency)
+        self.size.observe(size)
+        self.yield_.observe(new_dealers)
+
+    def _keep_wasted(self, query: str, latency: float):
+        self.wasted_queries.append((round(latency, 3), query))
+        if len(self.wasted_queries) > MAX_WASTED_QUERIES * 2:
+            self.wasted_queries = sorted(self.wasted_queries, reverse=True)[:MAX_WASTED_QUERIES]
+
+    def merge(self, other: Dict):
+        for field in ("requests", "errors", "retries", "bytes", "results", "new_dealers", "wasted"):
+            setattr(self, field, getattr(self, field) + other[field])
+        for status, count in other["statuses"].items():
+            self.statuses[status] += count
+        self.latency.merge(other["latency"])
+        self.size.merge(other["size"])
+        self.yield_.merge(other["new_dealers_per_request"])
+        for query in other["wasted_queries"]:
+            self._keep_wasted(query["query"], query["seconds"])
+
+    def to_dict(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "results": self.results,
+            "new_dealers": self.new_dealers,
+            "wasted": self.wasted,
+            "seconds": round(self.latency.sum, 3),
+            "p50_seconds": self.latency.quantile(0.5),
+            "p95_seconds": self.latency.quantile(0.95),
+            "statuses": dict(self.statuses),
+            "latency": self.latency.to_dict(),
+            "size": self.size.to_dict(),
+            "new_dealers_per_request": self.yield_.to_dict(),
+            "wasted_queries": [{"query": q, "seconds": s}
+                               for s, q in sorted(self.wasted_queries, reverse=True)[:MAX_WASTED_QUERIES]],
+        }
+
+
+class RequestSpan:
+    """One in-flight request; fill in what is known before the block exits"""
+
+    def __init__(self, telemetry: "Telemetry", oem: str, host: str, query: Optional[str]):
+        self.telemetry = telemetry
+        self.oem = oem
+        self.host = host
+        self.query = query
+        self.status = None
+        self.bytes = 0
+        self.retries = 0
+        self.results_count = 0
+        self.new_dealers = 0
+        # When the response was in, if the block goes on to parse it
+        self.finished_at: Optional[float] = None
+
+    def finish(self) -> "RequestSpan":
+        """Stop the latency clock once the response is in, so parsing it later in the block is not
+        counted as request time; results() can still be called afterwards"""
+        if self.finished_at is None:
+            self.finished_at = time.monotonic()
+        return self
+
+    def response(self, response) -> "RequestSpan":
+        """Take status and size from a requests/aiohttp-style response"""
+        self.status = getattr(response, "status_code", None) or getattr(response, "status", None)
+        content = getattr(response, "content", None)
+        if isinstance(content, (bytes, bytearray)):
+            self.bytes = len(content)
+        else:
+            self.bytes = int(response.headers.get("Content-Length") or 0)
+        return self
+
+    def results(self, dealers: List[Dict], key: Callable[[Dict], str] = dealer_key,
+                state: Callable[[Dict], Optional[str]] = dealer_state) -> int:
+        """Record the dealers this request returned; returns how many were new for the OEM"""
+        self.results_count = len(dealers)
+        self.new_dealers = self.telemetry.track_dealers(self.oem, dealers, key, state)
+        return self.new_dealers
+
+
+class Telemetry:
+    """Thread-safe collector of per-request metrics, grouped by OEM and host"""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._groups: Dict[Tuple[str, str], RequestStats] = defaultdict(RequestStats)
+        self._captures: Dict[str, CaptureHistory] = defaultdict(CaptureHistory)
+        # Completeness estimates reported by other processes, by OEM
+        self._completeness: Dict[str, Dict] = {}
+        self._in_flight: Dict[str, int] = defaultdict(int)
+        # Re-entrant: to_dict() calls summary() with the lock held
+        self._lock = threading.RLock()
+
+    def record(self, oem: str, url: str, latency: float, status: Optional[int], size: int = 0, retries: int = 0,
+               results: int = 0, new_dealers: int = 0, query: Optional[str] = None):
+        """Record one finished request; url may be a full URL or a bare host"""
+        host = urlparse(url).netloc or url
+        with self._lock:
+            self._groups[(oem, host)].add(latency, status, size, retries, results, new_dealers, query)
+
+    def track_dealers(self, oem: str, dealers: Iterable[Dict], key: Callable[[Dict], str] = dealer_key,
+                      state: Callable[[Dict], Optional[str]] = dealer_state) -> int:
+        """Record one query's dealers for an OEM and return how many were not seen before"""
+        with self._lock:
+            return self._captures[oem].observe((key(d), state(d)) for d in dealers)
+
+    def unique_dealers(self, oem: str) -> int:
+        return len(self._captures.get(oem, ()))
+
+    def completeness(self, oem: str, confidence: float = DEFAULT_CONFIDENCE) -> Optional[Dict]:
+        """Capture-recapture estimate of how much of the OEM's dealer population has been seen"""
+        with self._lock:
+            if oem in self._captures:
+                return self._captures[oem].to_dict(confidence)
+            return self._completeness.get(oem)
+
+    def completeness_reached(self, oem: str, target: float, confidence: float = DEFAULT_CONFIDENCE) -> bool:
+        """True once the OEM's estimated completeness is at least target at the lower confidence bound"""
+        with self._lock:
+            return oem in self._captures and self._captures[oem].reached(target, confidence)
+
+    def in_flight(self, oem: str) -> int:
+        """Requests inside a request() block right now"""
+        return self._in_flight.get(oem, 0)
+
+    @contextmanager
+    def request(self, oem: str, url: str, query: Optional[str] = None) -> Iterator[RequestSpan]:
+        """Time a request block; it is recorded even if the block raises (as an error unless a status was set)"""
+        span = RequestSpan(self, oem, urlparse(url).netloc or url, query)
+        start = time.monotonic()
+        with self._lock:
+            self._in_flight[oem] += 1
+        try:
+            yield span
+        finally:
+            with self._lock:
+                self._in_flight[oem] -= 1
+            self.record(oem, span.host, (span.finished_at or time.monotonic()) - start, span.status, span.bytes,
+                        span.retries, span.results_count, span.new_dealers, query)
+
+    def merge(self, report: Dict):
+        """Fold a JSON report from another process into this one"""
+        with self._lock:
+            for group in report.get("groups", []):
+                self._groups[(group["oem"], group["host"])].merge(group)
+            self._completeness.update(report.get("completeness", {}))
+            self.started_at = min(self.started_at, report.get("started_at", self.started_at))
+
+    def summary(self, by: str) -> Dict[str, Dict]:
+        """Totals per 'oem' or per 'host'"""
+        index = 0 if by == "oem" else 1
+        totals = defaultdict(lambda: defaultdict(int))
+        with self._lock:
+            groups = list(self._groups.items())
+        for key, stats in groups:
+            row = totals[key[index]]
+            for field in ("requests", "errors", "retries", "bytes", "results", "new_dealers", "wasted"):
+                row[field] += getattr(stats, field)
+            row["throttled"] += stats.statuses.get("429", 0)
+            row["seconds"] = round(row["seconds"] + stats.latency.sum, 3)
+        return {name: dict(row) for name, row in sorted(totals.items())}
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            groups = [dict(oem=oem, host=host, **stats.to_dict()) for (oem, host), stats in sorted(self._groups.items())]
+            return {
+                "started_at": self.started_at,
+                "finished_at": time.time(),
+                "by_oem": self.summary("oem"),
+                "by_host": self.summary("host"),
+                "groups": groups,
+                "completeness": {oem: self.completeness(oem)
+                                 for oem in sorted(set(self._captures) | set(self._completeness))},
+            }
+
+    def write_report(self, filename: Path):
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format (node_exporter textfile collector)"""
+        lines = [
+            "# HELP oems_request_duration_seconds Dealer locator request latency",
+            "# TYPE oems_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            groups = sorted(self._groups.items())
+        for (oem, host), stats in groups:
+            lines += stats.latency.prometheus("oems_request_duration_seconds", _labels(oem, host))
+        lines += ["# HELP oems_response_bytes Dealer locator response size",
+                  "# TYPE oems_response_bytes histogram"]
+        for (oem, host), stats in groups:
+            lines += stats.size.prometheus("oems_response_bytes", _labels(oem, host))
+        lines += ["# HELP oems_new_dealers_per_request New unique dealers contributed by each request",
+                  "# TYPE oems_new_dealers_per_request histogram"]
+        for (oem, host), stats in groups:
+            lines += stats.yield_.prometheus("oems_new_dealers_per_request", _labels(oem, host))
+
+        lines += ["# HELP oems_requests_total Requests by response status",
+                  "# TYPE oems_requests_total counter"]
+        for (oem, host), stats in groups:
+            for status, count in sorted(stats.statuses.items()):
+                lines.append(f'oems_requests_total{{{_labels(oem, host)},status="{status}"}} {count}')
+        for name, field, help_text in (
+            ("oems_request_retries_total", "retries", "Retries spent on requests"),
+            ("oems_results_total", "results", "Dealers returned, including repeats"),
+            ("oems_new_dealers_total", "new_dealers", "New unique dealers found"),
+            ("oems_wasted_requests_total", "wasted", "Successful requests that found no new dealer"),
+        ):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for (oem, host), stats in groups:
+                lines.append(f"{name}{{{_labels(oem, host)}}} {getattr(stats, field)}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, filename: Path):
+        # Write then rename so a textfile collector never reads a partial file
+        tmp = Path(f"{filename}.tmp")
+        tmp.write_text(self.prometheus(), encoding="utf-8")
+        os.replace(tmp, filename)
+
+
+def watch_page(page, oem: str, telemetry: Optional["Telemetry"] = None, match: Optional[Callable[[str], bool]] = None):
+    """Record every response a Playwright page receives (optionally only URLs passing match).
+    Latency is time to first byte from the browser's resource timing; size is Content-Length."""
+    telemetry = telemetry or get_telemetry()
+
+    def on_response(response):
+        if match and not match(response.url):
+            return
+        timing = response.request.timing
+        latency = max(timing.get("responseStart", 0.0), 0.0) / 1000.0
+        size = int(response.headers.get("content-length") or 0)
+        telemetry.record(oem, response.url, latency, response.status, size)
+
+    page.on("response", on_response)
+
+
+def _labels(oem: str, host: str) -> str:
+    return f'oem="{_escape(oem)}",host="{_escape(host)}"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_TELEMETRY: Optional[Telemetry] = None
+
+
+def get_telemetry() -> Telemetry:
+    """Process-wide telemetry; written to $OEMS_TELEMETRY at exit when that is set"""
+    global _TELEMETRY
+    if _TELEMETRY is None:
+        _TELEMETRY = Telemetry()
+        target = os.environ.get(TELEMETRY_ENV)
+        if target:
+            atexit.register(_TELEMETRY.write_report, Path(target))
+    return _TELEMETRY
+
+
+def reset_telemetry() -> Telemetry:
+    """Replace the process-wide telemetry with an empty one, for runs measured one at a time
+    (it is not written to $OEMS_TELEMETRY at exit)"""
+    global _TELEMETRY
+    _TELEMETRY = Telemetry()
+    return _TELEMETRY
+
+
+def load_report(filename: Path) -> Optional[Dict]:
+    try:
+        with open(filename, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Could not read telemetry from {filename}: {e}")
+        return None
@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Streaming validator and repair tool for collector output files.
+Checks JSON syntax and the standard dealer schema ({"oem": ..., "dealers":
+[{"Dealer", "Street", "City", "State", "ZIP", ...}]}) in one pass over each
+file, reading fixed-size chunks so memory stays bounded by the largest single
+dealer record rather than the file. Syntax errors are reported with their
+byte offset, line and column. The .json.gz/.json.zst files `oems crawl
+--compress` writes are checked through their decompressed stream (offsets are
+into the decompressed JSON) but not repaired.
+
+Two kinds of damage are repaired with --repair (the original is kept as
+<file>.bak):
+  - truncation, e.g. a crawl killed mid-write: the file is cut after the last
+    complete element of the innermost open array and the open containers are
+    closed, dropping the partial record
+  - concatenated documents from append-mode writes ({...}{...}): they are
+    wrapped into one JSON array
+
+Usage:
+    python -m oems validate                    # everything under data/
+    python -m oems validate Lexus.json data/mainstream --repair
+    python -m oems validate --json json_check_report.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import shutil
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from oems.dealers import DATA_DIR
+from oems.serialize import is_compressed, is_json_output, open_output
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1 << 16
+REQUIRED_FIELDS = ("Dealer", "Street", "City", "State", "ZIP")
+OPTIONAL_FIELDS = ("Website", "Phone", "Email")
+# Example records kept per file for each kind of schema issue
+MAX_EXAMPLES = 3
+
+_TOKEN = re.compile(rb"""
+    [ \t\n\r]*
+    (?:
+        (?P<string>"(?:[^"\\\x00-\x1f]|\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4}))*")
+      | (?P<number>-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?)
+      | (?P<literal>true|false|null)
+      | (?P<punct>[][{}:,])
+    )""", re.VERBOSE)
+_SPACE = re.compile(rb"[ \t\n\r]*")
+# A token cut short by the end of the buffer (also matches plain whitespace)
+_PARTIAL = re.compile(rb"""
+    [ \t\n\r]*
+    (?:
+        "(?:[^"\\\x00-\x1f]|\\(?:["\\/bfnrt]|u[0-9a-fA-F]{0,4})?)*
+      | -?[0-9]*(?:\.[0-9]*)?(?:[eE][+-]?[0-9]*)?
+      | t(?:r(?:ue?)?)? | f(?:a(?:l(?:se?)?)?)? | n(?:u(?:ll?)?)?
+    )""", re.VERBOSE)
+
+# Parser states: what the next token may be
+VALUE, VALUE_OR_CLOSE, KEY, KEY_OR_CLOSE, COLON, COMMA_OR_CLOSE, END = range(7)
+_EXPECTED = {
+    VALUE: "a value", VALUE_OR_CLOSE: "a value or ']'", KEY: "a property name in double quotes",
+    KEY_OR_CLOSE: "a property name or '}'", COLON: "':'", COMMA_OR_CLOSE: "',' or a closing bracket",
+}
+_CLOSERS = {ord("{"): b"}", ord("["): b"]"}
+
+
+class JSONSyntaxError(Exception):
+    def __init__(self, offset: int, message: str):
+        super().__init__(f"{message} at byte {offset}")
+        self.offset = offset
+        self.message = message
+
+
+def dealer_issues(dealer) -> List[str]:
+    """Schema problems with one record of a standard 'dealers' array"""
+    if not isinstance(dealer, dict):
+        return [f"not an object ({type(dealer).__name__})"]
+    issues = []
+    for field in REQUIRED_FIELDS:
+        if field not in dealer:
+            issues.append(f"missing {field}")
+        elif not isinstance(dealer[field], str):
+            issues.append(f"{field} is not a string")
+        elif not dealer[field].strip():
+            issues.append(f"empty {field}")
+    for field in OPTIONAL_FIELDS:
+        if field in dealer and dealer[field] is not None and not isinstance(dealer[field], str):
+            issues.append(f"{field} is not a string")
+    zip_code = dealer.get("ZIP")
+    if isinstance(zip_code, str) and zip_code.strip() and not re.fullmatch(r"\d{5}(-\d{4})?", zip_code.strip()):
+        issues.append("malformed ZIP")
+    return issues
+
+
+class FileReport:
+    """Outcome of validating (and possibly repairing) one file"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.bytes = 0
+        self.documents = 0
+        self.dealers = None
+        self.error: Optional[Dict] = None
+        self.issue_counts = Counter()
+        self.issue_examples: Dict[str, List[int]] = {}
+        self.repair: Optional[Dict] = None
+        self.repaired = False
+        self.seconds = 0.0
+        self.doc_starts: List[int] = []
+
+    @property
+    def valid(self) -> bool:
+        return self.error is None
+
+    def add_issues(self, index: int, issues: List[str]):
+        for issue in issues:
+            self.issue_counts[issue] += 1
+            examples = self.issue_examples.setdefault(issue, [])
+            if len(examples) < MAX_EXAMPLES:
+                examples.append(index)
+
+    def to_dict(self) -> Dict:
+        return {
+            "status": "repaired" if self.repaired else ("valid" if self.valid else "invalid"),
+            "bytes": self.bytes,
+            "documents": self.documents,
+            "dealer_count": self.dealers,
+            "error": self.error,
+            "repair": self.repair,
+            "dealer_issues": {issue: {"count": count, "examples": self.issue_examples[issue]}
+                              for issue, count in self.issue_counts.most_common()},
+            "seconds": round(self.seconds, 4),
+        }
+
+
+class StreamValidator:
+    """Single-pass JSON tokenizer over a file, checking syntax and dealer records as it goes"""
+
+    def __init__(self, path: Path, chunk_size: int = CHUNK_SIZE):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.report = FileReport(self.path)
+        # Bytes of JSON read so far, past any decompression
+        self.read = 0
+        # Open containers (their opening bytes) and, per container, the offset it can be cut at:
+        # just after its opener or its last complete element
+        self.stack = bytearray()
+        self.safe: List[int] = []
+        self.doc_starts: List[int] = []
+        self._key = None
+        self._dealer_depth = None
+        self._capture_start = None
+        self._trailing = None
+
+    def run(self) -> FileReport:
+        start = time.perf_counter()
+        self.report.bytes = self.path.stat().st_size
+        try:
+            self._scan()
+        except JSONSyntaxError as e:
+            self._fail(e.offset, e.message)
+        except (OSError, EOFError, RuntimeError) as e:
+            # A damaged or unreadable compressed stream
+            self._fail(self.read, f"cannot decompress: {e}")
+        self.report.doc_starts = self.doc_starts
+        self.report.seconds = time.perf_counter() - start
+        return self.report
+
+    def _chunks(self) -> Iterator[bytes]:
+        with open_output(self.path) as f:
+            while True:
+                chunk = f.read(self.chunk_size)
+                if not chunk:
+                    return
+                self.read += len(chunk)
+                yield chunk
+
+    def _scan(self):
+        chunks = self._chunks()
+        buf, base, pos, eof = b"", 0, 0, False
+        state = VALUE
+        while True:
+            match = _TOKEN.match(buf, pos)
+            if match is None or match.end() == len(buf):
+                if match is None and not _PARTIAL.fullmatch(buf, pos):
+                    rest = _SPACE.match(buf, pos).end()
+                    raise JSONSyntaxError(base + rest, self._describe(buf, rest, state))
+                if not eof:
+                    # The token may continue in the next chunk: drop what is no longer needed and read on
+                    keep = pos if self._capture_start is None else min(pos, self._capture_start - base)
+                    chunk = next(chunks, b"")
+                    eof = not chunk
+                    base, buf, pos = base + keep, buf[keep:] + chunk, pos - keep
+                    continue
+                if match is None:
+                    # Only whitespace or a token cut off by the end of the file is left
+                    if self.stack or _SPACE.fullmatch(buf, pos):
+                        break
+                    raise JSONSyntaxError(base + _SPACE.match(buf, pos).end(), "Unexpected end of file")
+            kind = match.lastgroup
+            state = self._token(kind, match.group(kind), base + match.start(kind), base + match.end(), state,
+                                buf, base)
+            pos = match.end()
+
+        size = base + len(buf)
+        if not self.doc_starts and state == VALUE:
+            raise JSONSyntaxError(size, "Empty file")
+        if self.stack:
+            self._truncated(size)
+        elif self._trailing is not None:
+            self.report.repair = {"action": "close", "cut_at": self._trailing, "dropped_bytes": size - self._trailing,
+                                  "append": ""}
+            raise JSONSyntaxError(self._trailing, "Unmatched closing brackets after the document")
+        elif len(self.doc_starts) > 1:
+            self.report.repair = {"action": "wrap", "documents": len(self.doc_starts)}
+            raise JSONSyntaxError(self.doc_starts[1], f"{len(self.doc_starts)} concatenated documents")
+
+    def _describe(self, buf: bytes, index: int, state: int) -> str:
+        if buf[index:index + 1] == b'"':
+            return "Invalid string"
+        return f"Expected {_EXPECTED.get(state, 'end of data')}, found {_snippet(buf[index:index + 12])}"
+
+    def _token(self, kind: str, text: bytes, start: int, end: int, state: int, buf: bytes, base: int) -> int:
+        if state == END:
+            if text in (b"}", b"]"):
+                # Stray closers after a complete document (left by hand edits) are trimmed
+                if self._trailing is None:
+                    self._trailing = start
+                return END
+            if text not in (b"{", b"[") or self._trailing is not None:
+                raise JSONSyntaxError(start, f"Extra data {_snippet(text)} after the document")
+            # Another document after a complete one: append-mode output, repaired by wrapping
+            state = VALUE
+        if kind == "punct":
+            if text in (b"{", b"["):
+                if state not in (VALUE, VALUE_OR_CLOSE):
+                    raise JSONSyntaxError(start, f"Expected {_EXPECTED[state]}, found {_snippet(text)}")
+                self._element_start(start)
+                if text == b"[" and self._dealer_depth is None and self._opens_records():
+                    self._dealer_depth = len(self.stack) + 1
+                    self.report.dealers = self.report.dealers or 0
+                if not self.stack:
+                    self.doc_starts.append(start)
+                    self.report.documents += 1
+                self.stack += text
+                self.safe.append(end)
+                return KEY_OR_CLOSE if text == b"{" else VALUE_OR_CLOSE
+            if text in (b"}", b"]"):
+                opener = ord("{") if text == b"}" else ord("[")
+                allowed = (COMMA_OR_CLOSE, KEY_OR_CLOSE if opener == ord("{") else VALUE_OR_CLOSE)
+                if not self.stack or self.stack[-1] != opener or state not in allowed:
+                    raise JSONSyntaxError(start, f"Unexpected {_snippet(text)}")
+                self.stack.pop()
+                self.safe.pop()
+                if self._dealer_depth is not None and len(self.stack) < self._dealer_depth:
+                    self._dealer_depth = None
+                return self._value_done(end, buf, base)
+            if text == b":":
+                if state != COLON:
+                    raise JSONSyntaxError(start, "Unexpected ':'")
+                return VALUE
+            if state != COMMA_OR_CLOSE:
+                raise JSONSyntaxError(start, "Unexpected ','")
+            return KEY if self.stack[-1] == ord("{") else VALUE
+        if state in (KEY, KEY_OR_CLOSE):
+            if kind != "string":
+                raise JSONSyntaxError(start, f"Expected {_EXPECTED[state]}, found {_snippet(text)}")
+            # Raw bytes: decoding every key would slow the scan, and only a few names are compared
+            self._key = text
+            return COLON
+        if state not in (VALUE, VALUE_OR_CLOSE):
+            raise JSONSyntaxError(start, f"Expected {_EXPECTED[state]}, found {_snippet(text)}")
+        self._element_start(start)
+        return self._value_done(end, buf, base)
+
+    def _opens_records(self) -> bool:
+        """Whether the array about to open holds the records: here the top-level 'dealers' array,
+        whose elements get schema-checked"""
+        return len(self.stack) == 1 and self.stack[0] == ord("{") and self._key == b'"dealers"'
+
+    def _record(self, index: int, raw: bytes, start: int, end: int):
+        self.report.add_issues(index, dealer_issues(json.loads(raw)))
+
+    def _element_start(self, start: int):
+        if self._dealer_depth == len(self.stack):
+            self._capture_start = start
+
+    def _value_done(self, end: int, buf: bytes, base: int) -> int:
+        if self._capture_start is not None and len(self.stack) == self._dealer_depth:
+            self._record(self.report.dealers, buf[self._capture_start - base:end - base], self._capture_start, end)
+            self.report.dealers += 1
+            self._capture_start = None
+        if not self.stack:
+            return END
+        self.safe[-1] = end
+        return COMMA_OR_CLOSE
+
+    def _truncated(self, size: int):
+        """Plan the repair of a file that ends inside a document"""
+        arrays = [i for i, opener in enumerate(self.stack) if opener == ord("[")]
+        # Cut after the last complete element of the innermost open array, dropping any partial record
+        keep = arrays[-1] + 1 if arrays else len(self.stack)
+        cut = self.safe[keep - 1]
+        closers = b"".join(_CLOSERS[opener] for opener in reversed(self.stack[:keep]))
+        self.report.repair = {"action": "close", "cut_at": cut, "dropped_bytes": size - cut,
+                              "append": closers.decode()}
+        if len(self.doc_starts) > 1:
+            self.report.repair["documents"] = len(self.doc_starts)
+        raise JSONSyntaxError(size, f"Truncated with {len(self.stack)} open containers")
+
+    def _fail(self, offset: int, message: str):
+        line, column = _line_column(self.path, offset)
+        self.report.error = {"offset": offset, "line": line, "column": column, "message": message}
+
+
+def _snippet(text: bytes) -> str:
+    return repr(text[:12].decode("utf-8", errors="replace"))
+
+
+def _line_column(path: Path, offset: int) -> List[int]:
+    """1-based line and column of a byte offset, counted in chunks"""
+    line, line_start, read = 1, 0, 0
+    with open_output(path) as f:
+        while read < offset:
+            chunk = f.read(min(CHUNK_SIZE, offset - read))
+            if not chunk:
+                break
+            newlines = chunk.count(b"\n")
+            if newlines:
+                line += newlines
+                line_start = read + chunk.rindex(b"\n") + 1
+            read += len(chunk)
+    return [line, offset - line_start + 1]
+
+
+def validate_file(path: Path, chunk_size: int = CHUNK_SIZE) -> FileReport:
+    return StreamValidator(path, chunk_size).run()
+
+
+def repair_file(report: FileReport, backup: bool = True) -> bool:
+    """Apply a report's repair plan, streaming into a temp file that replaces the original
+    only if it validates; returns whether the file was repaired"""
+    plan = report.repair
+    if not plan:
+        return False
+    path = report.path
+    if is_compressed(path):
+        logger.error(f"Not repairing {path}: decompress it and repair the JSON")
+        return False
+    wrap = len(report.doc_starts) > 1
+    cut = plan.get("cut_at", report.bytes)
+    # Documents after the first get a separating comma when they are wrapped into an array
+    inserts = report.doc_starts[1:] if wrap else []
+    tmp = path.with_name(path.name + ".repair.tmp")
+    with open(path, "rb") as src, open(tmp, "wb") as dst:
+        if wrap:
+            dst.write(b"[")
+        offset = 0
+        for stop in inserts + [cut]:
+            while offset < stop:
+                chunk = src.read(min(CHUNK_SIZE, stop - offset))
+                if not chunk:
+                    break
+                dst.write(chunk)
+                offset += len(chunk)
+            if stop != cut:
+                dst.write(b",")
+        dst.write(plan.get("append", "").encode("ascii"))
+        if wrap:
+            dst.write(b"]")
+        dst.write(b"\n")
+
+    check = validate_file(tmp)
+    if not check.valid:
+        tmp.unlink()
+        logger.error(f"Repair of {path} did not validate: {check.error['message']}")
+        return False
+    if backup:
+        shutil.copy2(path, path.with_name(path.name + ".bak"))
+    os.replace(tmp, path)
+    report.repaired = True
+    report.documents, report.dealers = check.documents, check.dealers
+    return True
+
+
+def iter_json_files(paths: Iterable[Path]) -> Iterator[Path]:
+    """JSON files named directly or found under the given directories"""
+    seen = set()
+    for path in paths:
+        path = Path(path)
+        found = sorted(p for p in path.rglob("*.json*") if is_json_output(p) and "node_modules" not in p.parts
+                       ) if path.is_dir() else [path]
+        for found_path in found:
+            if found_path.resolve() not in seen:
+                seen.add(found_path.resolve())
+                yield found_path
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="oems validate",
+                                     description="Validate collector output files and repair common damage")
+    parser.add_argument("paths", nargs="*", type=Path, default=[DATA_DIR], help="Files or directories (default: data/)")
+    parser.add_argument("--repair", action="store_true", help="Repair truncated and concatenated files in place")
+    parser.add_argument("--no-backup", action="store_true", help="Do not keep <file>.bak when repairing")
+    parser.add_argument("--json", type=Path, default=None, help="Write the full report here")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only print files with problems")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    start = time.perf_counter()
+    reports = []
+    for path in iter_json_files(args.paths):
+        report = validate_file(path)
+        reports.append(report)
+        if not report.valid and args.repair and repair_file(report, backup=not args.no_backup):
+            print(f"🔧 {path}: repaired ({report.error['message']}; {_describe_repair(report.repair)})")
+        elif not report.valid:
+            error = report.error
+            fix = f" [repairable: {_describe_repair(report.repair)}]" if report.repair else ""
+            print(f"❌ {path}: {error['message']} at byte {error['offset']} "
+                  f"(line {error['line']}, column {error['column']}){fix}")
+        elif report.issue_counts:
+            issues = ", ".join(f"{count} {issue}" for issue, count in report.issue_counts.most_common(4))
+            print(f"⚠️  {path}: {report.dealers} dealers; {issues}")
+        elif not args.quiet:
+            dealers = f"{report.dealers} dealers" if report.dealers is not None else "no dealers array"
+            print(f"✅ {path}: {dealers}")
+
+    invalid = [r for r in reports if not r.valid and not r.repaired]
+    total_bytes = sum(r.bytes for r in reports)
+    print(f"\n📊 {len(reports)} files, {total_bytes / 1e6:.1f} MB in {time.perf_counter() - start:.2f}s: "
+          f"{len(reports) - len(invalid)} valid, {len(invalid)} invalid, "
+          f"{sum(r.repaired for r in reports)} repaired, {sum(r.dealers or 0 for r in reports)} dealers")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "summary": {"total_files": len(reports), "valid_files": len(reports) - len(invalid),
+                            "total_dealers": sum(r.dealers or 0 for r in reports)},
+                "files": {str(r.path): r.to_dict() for r in reports},
+            }, f, indent=2)
+        print(f"📋 Report saved to: {args.json}")
+    return 1 if invalid else 0
+
+
+def _describe_repair(plan: Dict) -> str:
+    parts = []
+    if plan.get("documents", 0) > 1:
+        parts.append(f"wrap {plan['documents']} documents in an array")
+    if plan["action"] == "close":
+        parts.append(f"drop the last {plan['dropped_bytes']} bytes" + (f" and append {plan['append']!r}"
+                                                                        if plan["append"] else ""))
+    return ", ".join(parts)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Durable work queue for spreading ZIP sweeps across crawl hosts.
+Query units (e.g. {"oem": "Lexus", "zip": "90210"}) are leased to workers
+for a visibility timeout; unacked leases expire and go back to the queue,
+failed units are retried with a delay and dead-lettered after max_attempts.
+
+Two backends share the same interface:
+    sqlite:///queue.db           one host, many worker processes
+    file:////mnt/shared/queue    several hosts on a shared directory (NFS/SMB);
+                                 leases are claimed with atomic renames
+(Three slashes for a path relative to the working directory, four for absolute.)
+
+`oems queue work` drains a queue of Toyota or Subaru ZIP units (the APIs
+one ZIP query maps onto), writing each unit's dealers to <out>/<oem>/<zip>.json
+so a redone unit overwrites rather than duplicates.
+
+Usage:
+    python -m oems queue seed sqlite:///toyota.db --oem Toyota
+    python -m oems queue work sqlite:///toyota.db --out queue-results   # on every crawl host
+    python -m oems queue stats sqlite:///toyota.db
+"""
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse, urlsplit
+
+from oems.serialize import dump
+from oems.telemetry import get_telemetry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VISIBILITY_TIMEOUT = 300.0
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_DELAY = 30.0
+# OEM -> (endpoint, query parameters besides the ZIP, ZIP parameter, key holding the dealer list or None)
+ZIP_ENDPOINTS = {
+    "Toyota": ("https://dealers.prod.webservices.toyota.com/v1/dealers/", {}, "zipcode", "dealers"),
+    "Subaru": ("https://www.subaru.com/services/dealers/distances/by/zipcode", {"count": 100, "type": "Active"},
+               "zipcode", None),
+}
+
+
+class Task:
+    """One leased unit of work"""
+
+    def __init__(self, task_id: str, payload: Dict, attempts: int, lease_token: str):
+        self.id = task_id
+        self.payload = payload
+        self.attempts = attempts
+        self.lease_token = lease_token
+
+    def __repr__(self):
+        return f"Task({self.id!r}, {self.payload!r}, attempts={self.attempts})"
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class SQLiteQueue:
+    """Work queue backed by a single SQLite file"""
+
+    def __init__(self, path: Path, visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS, retry_delay: float = DEFAULT_RETRY_DELAY):
+        self.path = Path(path)
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                payload TEXT NOT NULL,
+                state TEXT NOT NULL DEFAULT 'ready',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL,
+                lease_token TEXT,
+                leased_by TEXT,
+                last_error TEXT
+            )""")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS tasks_ready ON tasks (state, available_at)")
+
+    def put_many(self, payloads: Iterable[Dict]) -> int:
+        now = time.time()
+        rows = [(json.dumps(p, sort_keys=True), now) for p in payloads]
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany("INSERT INTO tasks (payload, available_at) VALUES (?, ?)", rows)
+        return len(rows)
+
+    def put(self, payload: Dict) -> int:
+        return self.put_many([payload])
+
+    def _reclaim_expired(self, now: float):
+        # A leased row's available_at is its lease expiry
+        self.conn.execute(
+            "UPDATE tasks SET state = 'dead', last_error = 'lease expired', lease_token = NULL "
+            "WHERE state = 'leased' AND available_at <= ? AND attempts >= ?", (now, self.max_attempts))
+        self.conn.execute(
+            "UPDATE tasks SET state = 'ready', lease_token = NULL "
+            "WHERE state = 'leased' AND available_at <= ?", (now,))
+
+    def lease(self, n: int = 1, worker_id: Optional[str] = None) -> List[Task]:
+        """Lease up to n ready tasks for the visibility timeout"""
+        now = time.time()
+        worker_id = worker_id or default_worker_id()
+        tasks = []
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._reclaim_expired(now)
+            rows = self.conn.execute(
+                "SELECT id, payload, attempts FROM tasks WHERE state = 'ready' AND available_at <= ? "
+                "ORDER BY available_at, id LIMIT ?", (now, n)).fetchall()
+            for task_id, payload, attempts in rows:
+                token = uuid.uuid4().hex
+                self.conn.execute(
+                    "UPDATE tasks SET state = 'leased', attempts = attempts + 1, available_at = ?, "
+                    "lease_token = ?, leased_by = ? WHERE id = ?",
+                    (now + self.visibility_timeout, token, worker_id, task_id))
+                tasks.append(Task(str(task_id), json.loads(payload), attempts + 1, token))
+        return tasks
+
+    def extend(self, task: Task, seconds: Optional[float] = None) -> bool:
+        """Push a lease's expiry out; False if the lease was lost"""
+        expires = time.time() + (seconds or self.visibility_timeout)
+        cur = self.conn.execute(
+            "UPDATE tasks SET available_at = ? WHERE id = ? AND state = 'leased' AND lease_token = ?",
+            (expires, int(task.id), task.lease_token))
+        return cur.rowcount == 1
+
+    def ack(self, task: Task) -> bool:
+        cur = self.conn.execute(
+            "UPDATE tasks SET state = 'done', lease_token = NULL WHERE id = ? AND lease_token = ?",
+            (int(task.id), task.lease_token))
+        return cur.rowcount == 1
+
+    def nack(self, task: Task, error: str = "") -> bool:
+        """Return a failed task for retry, or dead-letter it once attempts are used up"""
+        if task.attempts >= self.max_attempts:
+            state, available_at = "dead", time.time()
+        else:
+            state, available_at = "ready", time.time() + self.retry_delay * task.attempts
+        cur = self.conn.execute(
+            "UPDATE tasks SET state = ?, available_at = ?, lease_token = NULL, last_error = ? "
+            "WHERE id = ? AND lease_token = ?",
+            (state, available_at, error[:2000], int(task.id), task.lease_token))
+        return cur.rowcount == 1
+
+    def dead_letters(self) -> List[Dict]:
+        rows = self.conn.execute(
+            "SELECT id, payload, attempts, last_error FROM tasks WHERE state = 'dead' ORDER BY id").fetchall()
+        return [{"id": str(r[0]), "payload": json.loads(r[1]), "attempts": r[2], "error": r[3]} for r in rows]
+
+    def requeue_dead(self) -> int:
+        cur = self.conn.execute(
+            "UPDATE tasks SET state = 'ready', attempts = 0, available_at = ? WHERE state = 'dead'", (time.time(),))
+        return cur.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        counts = {"ready": 0, "leased": 0, "done": 0, "dead": 0}
+        for state, count in self.conn.execute("SELECT state, COUNT(*) FROM tasks GROUP BY state"):
+            counts[state] = count
+        return counts
+
+
+class FileQueue:
+    """Work queue on a shared directory. Every state change is one atomic rename, and the
+    leased file's name carries the lease, so a crash never leaves a task claimed without
+    an expiry and ack/nack/extend fail cleanly once the lease has been reclaimed.
+
+    ready/<available_ns>_<attempts>_<id>.json       waiting tasks, oldest first by name
+    leased/<expires_ns>_<attempts>_<id>_<token>.json claimed by renaming out of ready/
+    dead/<attempts>_<id>.json                        attempts exhausted
+    done/<id>.json                                   finished tasks
+    errors/<id>.txt                                  the last failure of a task
+    """
+
+    def __init__(self, root: Path, visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS, retry_delay: float = DEFAULT_RETRY_DELAY):
+        self.root = Path(root)
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        for name in ("ready", "leased", "dead", "done", "errors", "tmp"):
+            (self.root / name).mkdir(parents=True, exist_ok=True)
+
+    def _write(self, path: Path, data: Dict):
+        tmp = self.root / "tmp" / f"{uuid.uuid4().hex}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    def _ready_path(self, task_id: str, attempts: int, available_at: float) -> Path:
+        return self.root / "ready" / f"{int(available_at * 1e9):020d}_{attempts}_{task_id}.json"
+
+    def _leased_path(self, task_id: str, attempts: int, token: str, expires: float) -> Path:
+        return self.root / "leased" / f"{int(expires * 1e9):020d}_{attempts}_{task_id}_{token}.json"
+
+    def _set_error(self, task_id: str, error: str):
+        tmp = self.root / "tmp" / f"{uuid.uuid4().hex}.tmp"
+        tmp.write_text(error[:2000], encoding="utf-8")
+        os.replace(tmp, self.root / "errors" / f"{task_id}.txt")
+
+    def _release(self, path: Path, task_id: str, attempts: int, retry_at: float) -> bool:
+        """Move a leased file back to ready/, or to dead/ once attempts are used up; False if it is gone"""
+        if attempts >= self.max_attempts:
+            target = self.root / "dead" / f"{attempts}_{task_id}.json"
+        else:
+            target = self._ready_path(task_id, attempts, retry_at)
+        try:
+            os.rename(path, target)
+        except OSError:
+            return False
+        return True
+
+    def put_many(self, payloads: Iterable[Dict]) -> int:
+        count = 0
+        now = time.time()
+        for payload in payloads:
+            task_id = f"{time.time_ns():020d}{uuid.uuid4().hex[:8]}"
+            self._write(self._ready_path(task_id, 0, now), {"id": task_id, "payload": payload})
+            count += 1
+        return count
+
+    def put(self, payload: Dict) -> int:
+        return self.put_many([payload])
+
+    def _reclaim_expired(self, now: float):
+        for path in (self.root / "leased").glob("*.json"):
+            expires_ns, attempts, task_id, _ = path.stem.split("_")
+            if int(expires_ns) > now * 1e9:
+                continue
+            if int(attempts) >= self.max_attempts:
+                self._set_error(task_id, "lease expired")
+            # Fails harmlessly if another host reclaimed it or its worker acked it first
+            self._release(path, task_id, int(attempts), now)
+
+    def lease(self, n: int = 1, worker_id: Optional[str] = None) -> List[Task]:
+        now = time.time()
+        self._reclaim_expired(now)
+        tasks = []
+        for path in sorted((self.root / "ready").glob("*.json")):
+            if len(tasks) >= n:
+                break
+            available_ns, attempts, task_id = path.stem.split("_")
+            if int(available_ns) > now * 1e9:
+                break
+            attempts = int(attempts) + 1
+            token = uuid.uuid4().hex
+            # The claim and the lease expiry are one rename
+            leased_path = self._leased_path(task_id, attempts, token, now + self.visibility_timeout)
+            try:
+                os.rename(path, leased_path)
+            except OSError:
+                continue  # claimed by another worker
+            with open(leased_path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+            tasks.append(Task(task_id, record["payload"], attempts, leased_path.name))
+        return tasks
+
+    def extend(self, task: Task, seconds: Optional[float] = None) -> bool:
+        """Push a lease's expiry out; False if the lease was lost. The task's lease_token is its
+        leased file name, so it changes here."""
+        token = Path(task.lease_token).stem.split("_")[3]
+        target = self._leased_path(task.id, task.attempts, token, time.time() + (seconds or self.visibility_timeout))
+        try:
+            os.rename(self.root / "leased" / task.lease_token, target)
+        except OSError:
+            return False
+        task.lease_token = target.name
+        return True
+
+    def ack(self, task: Task) -> bool:
+        try:
+            os.rename(self.root / "leased" / task.lease_token, self.root / "done" / f"{task.id}.json")
+        except OSError:
+            return False
+        return True
+
+    def nack(self, task: Task, error: str = "") -> bool:
+        # The error goes first so the task never shows up in ready/ or dead/ without it
+        self._set_error(task.id, error)
+        return self._release(self.root / "leased" / task.lease_token, task.id, task.attempts,
+                             time.time() + self.retry_delay * task.attempts)
+
+    def dead_letters(self) -> List[Dict]:
+        letters = []
+        for path in sorted((self.root / "dead").glob("*.json")):
+            attempts, task_id = path.stem.split("_")
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+            try:
+                error = (self.root / "errors" / f"{task_id}.txt").read_text(encoding="utf-8")
+            except OSError:
+                error = None
+            letters.append({"id": task_id, "payload": record["payload"], "attempts": int(attempts), "error": error})
+        return letters
+
+    def requeue_dead(self) -> int:
+        count = 0
+        for path in (self.root / "dead").glob("*.json"):
+            _, task_id = path.stem.split("_")
+            try:
+                os.rename(path, self._ready_path(task_id, 0, time.time()))
+            except OSError:
+                continue
+            count += 1
+        return count
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "ready": sum(1 for _ in (self.root / "ready").glob("*.json")),
+            "leased": sum(1 for _ in (self.root / "leased").glob("*.json")),
+            "done": sum(1 for _ in (self.root / "done").glob("*.json")),
+            "dead": sum(1 for _ in (self.root / "dead").glob("*.json")),
+        }
+
+
+def open_queue(url: str, **kwargs):
+    """Open a queue from a sqlite:///path or file:///dir URL"""
+    parsed = urlparse(url)
+    if parsed.netloc:
+        raise ValueError(f"Queue URL {url!r} must not name a host; use a shared mount path instead")
+    path = Path(parsed.path[1:] if parsed.path.startswith("/") else parsed.path)
+    if parsed.scheme == "sqlite":
+        return SQLiteQueue(path, **kwargs)
+    if parsed.scheme == "file":
+        return FileQueue(path, **kwargs)
+    raise ValueError(f"Unsupported queue URL {url!r}; use sqlite:///... or file:///...")
+
+
+def run_worker(queue, handler: Callable[[Dict], None], worker_id: Optional[str] = None,
+               batch_size: int = 1, idle_sleep: float = 5.0, exit_when_idle: bool = True) -> Dict[str, int]:
+    """Pull query units and pass each payload to handler until the queue drains.
+    A handler that returns normally acks the task; an exception nacks it for retry."""
+    worker_id = worker_id or default_worker_id()
+    counts = {"acked": 0, "failed": 0, "lost": 0}
+    while True:
+        tasks = queue.lease(batch_size, worker_id)
+        if not tasks:
+            stats = queue.stats()
+            if exit_when_idle and stats["ready"] == 0 and stats["leased"] == 0:
+                return counts
+            time.sleep(idle_sleep)
+            continue
+        for task in tasks:
+            try:
+                handler(task.payload)
+            except Exception as e:
+                logger.warning(f"{worker_id}: task {task.id} failed (attempt {task.attempts}): {e}")
+                queue.nack(task, f"{type(e).__name__}: {e}")
+                counts["failed"] += 1
+                continue
+            if queue.ack(task):
+                counts["acked"] += 1
+            else:
+                # Lease expired mid-task; someone else will redo it
+                counts["lost"] += 1
+
+
+def zip_query_handler(out_dir: Path, base_url: Optional[str] = None, timeout: float = 15.0) -> Callable[[Dict], None]:
+    """run_worker handler for {"oem", "zip"} units: query the OEM's ZIP endpoint (on base_url's host
+    if given) and write the dealers to out_dir/<oem>/<zip>.json. HTTP errors raise, so the unit is retried."""
+    import requests
+
+    session = requests.Session()
+    telemetry = get_telemetry()
+
+    def handle(payload: Dict):
+        oem, zip_code = payload["oem"], payload["zip"]
+        if oem not in ZIP_ENDPOINTS:
+            raise ValueError(f"No ZIP query for {oem}; queue units of: {', '.join(ZIP_ENDPOINTS)}")
+        url, params, zip_param, results = ZIP_ENDPOINTS[oem]
+        if base_url:
+            url = base_url.rstrip("/") + urlsplit(url).path
+        with telemetry.request(oem, url, query=zip_code) as req:
+            response = session.get(url, params=dict(params, **{zip_param: zip_code}), timeout=timeout)
+            req.response(response)
+            response.raise_for_status()
+            body = response.json()
+            dealers = body.get(results, []) if results else body
+            if not isinstance(dealers, list):
+                raise ValueError(f"{oem} answered {zip_code} without a dealer list")
+            req.results(dealers)
+        target = Path(out_dir) / oem.lower() / f"{zip_code}.json"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        dump({"oem": oem, "zip": zip_code, "dealers": dealers}, target)
+
+    return handle
@@ -5,12 +5,40 @@ This script systematically covers all areas using ZIP codes from all states
 to ensure comprehensive dealer collection.
 """
 
-import json
+import argparse
 import requests
+import sys
 import time
 from collections import defaultdict
+from pathlib import Path
 import os
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from oems.profiling import stage
+from oems.progress import get_progress
+from oems.saturation import DEFAULT_CONFIDENCE, DEFAULT_MIN_YIELD, SaturationDetector
+from oems.serialize import dump
+from oems.telemetry import get_telemetry
+
+API_URL = "https://dealers.prod.webservices.toyota.com/v1/dealers/"
+HEADERS = {
+    "Accept": "application/json",
+    "Referer": "https://www.toyota.com/dealers/",
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36",
+    "Origin": "https://www.toyota.com"
+}
+
+def fetch_dealers(zip_code, api_url=API_URL):
+    """Query one ZIP and return (HTTP status, dealers); dealers is empty unless the status is 200.
+    Network errors and non-JSON answers raise."""
+    url = f"{api_url}?zipcode={zip_code}"
+    with stage("fetch"), get_telemetry().request("Toyota", url, query=zip_code) as req:
+        response = requests.get(url, headers=HEADERS, timeout=15)
+        req.response(response)
+        dealers = response.json().get('dealers', []) if response.status_code == 200 else []
+        req.results(dealers, key=lambda d: str(d.get('code') or d.get('dealerId')))
+    return response.status_code, dealers
+
 def get_us_zipcodes():
     """Get comprehensive list of US ZIP codes for systematic coverage."""
     
@@ -74,17 +102,21 @@ def get_us_zipcodes():
     
     return zipcodes
 
-def collect_all_toyota_dealers():
-    """Collect ALL Toyota dealers across the United States."""
+def collect_all_toyota_dealers(early_stop=True, confidence=DEFAULT_CONFIDENCE, min_yield=DEFAULT_MIN_YIELD,
+                               target_completeness=None):
+    """Collect ALL Toyota dealers across the United States.
+
+    With early_stop, ZIPs are visited round-robin by 3-digit prefix and a
+    prefix's remaining ZIPs are skipped once it stops yielding new dealers.
+    With target_completeness, the sweep ends once the capture-recapture
+    estimate says at least that share of all dealers has been found.
+    """
     
     zipcodes = get_us_zipcodes()
-    headers = {
-        "Accept": "application/json",
-        "Referer": "https://www.toyota.com/dealers/",
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36",
-        "Origin": "https://www.toyota.com"
-    }
+    detector = SaturationDetector(confidence, min_yield, enabled=early_stop)
     
+    telemetry = get_telemetry()
+    progress = get_progress()
     all_dealers = []
     dealer_codes = set()
     states = defaultdict(int)
@@ -94,17 +126,15 @@ def collect_all_toyota_dealers():
     print(f"🚀 Starting comprehensive Toyota dealer collection...")
     print(f"📍 Total ZIP codes to process: {total_zips}")
     print(f"🌍 Coverage: All 50 states + DC")
+    progress.start("Toyota", total=total_zips)
     
-    for i, zip_code in enumerate(zipcodes, 1):
+    for i, zip_code in enumerate(detector.plan(zipcodes), 1):
         print(f"\n[{i}/{total_zips}] Processing ZIP: {zip_code}")
         
         try:
-            url = f"https://dealers.prod.webservices.toyota.com/v1/dealers/?zipcode={zip_code}"
-            response = requests.get(url, headers=headers, timeout=15)
+            status, dealers = fetch_dealers(zip_code)
             
-            if response.status_code == 200:
-                data = response.json()
-                dealers = data.get('dealers', [])
+            if status == 200:
                 
                 new_dealers = 0
                 for dealer in dealers:
@@ -123,13 +153,17 @@ def collect_all_toyota_dealers():
                         all_dealers.append(dealer)
                 
                 print(f"  ✅ Found {len(dealers)} dealers ({new_dealers} new)")
+                dropped = detector.observe(zip_code, new_dealers)
+                if dropped:
+                    print(f"  ⏭️  Region {zip_code[:3]} saturated, skipping {dropped} more ZIPs")
+                    progress.advance("Toyota", dropped)
                 print(f"  📊 Total unique dealers: {len(dealer_codes)}")
                 print(f"  🗺️  States covered: {len(states)}")
                 
                 processed_zips += 1
                 
             else:
-                print(f"  ❌ Error: HTTP {response.status_code}")
+                print(f"  ❌ Error: HTTP {status}")
                 
         except Exception as e:
             print(f"  ❌ Error: {e}")
@@ -139,10 +173,20 @@ def collect_all_toyota_dealers():
             print(f"\n📈 Progress: {i}/{total_zips} ZIP codes processed")
             print(f"🏢 Total dealers found: {len(dealer_codes)}")
             print(f"🗺️  States covered: {list(states.keys())}")
+            estimate = telemetry.completeness("Toyota")
+            if estimate and estimate["completeness"] is not None:
+                print(f"🎯 Estimated completeness: {estimate['completeness']:.1%} of ~{estimate['chao1']:.0f} dealers "
+                      f"(at least {estimate['completeness_lower']:.1%})")
+
+        if target_completeness and telemetry.completeness_reached("Toyota", target_completeness):
+            print(f"\n🎯 Estimated completeness reached {target_completeness:.0%}; stopping after {i} ZIPs")
+            break
         
+        progress.advance("Toyota")
         # Small delay to be respectful
         time.sleep(0.3)
     
+    progress.finish("Toyota")
     # Create comprehensive summary
     summary = {
         "total_dealers_found": len(all_dealers),
@@ -153,23 +197,26 @@ def collect_all_toyota_dealers():
         "dealer_codes": sorted(list(dealer_codes)),
         "api_status": "working",
         "data_quality": "complete",
-        "coverage": "comprehensive_us"
+        "coverage": "comprehensive_us",
+        "early_stopping": detector.to_dict(),
+        "completeness": telemetry.completeness("Toyota")
     }
     
     # Save the comprehensive data
-    with open('data/toyota_comprehensive.json', 'w') as f:
-        json.dump(all_dealers, f, indent=2)
-    
-    with open('data/toyota_comprehensive_summary.json', 'w') as f:
-        json.dump(summary, f, indent=2)
+    data_file = dump(all_dealers, 'data/toyota_comprehensive.json')
+    # The summary is read by people, so it stays indented
+    summary_file = dump(summary, 'data/toyota_comprehensive_summary.json', pretty=True, compression="none")
     
     print(f"\n🎉 COMPREHENSIVE COLLECTION COMPLETED!")
     print(f"📊 Total dealers found: {len(all_dealers)}")
     print(f"🏢 Unique dealer codes: {len(dealer_codes)}")
     print(f"🗺️  States covered: {len(states)}")
     print(f"📍 ZIP codes processed: {processed_zips}/{total_zips}")
-    print(f"💾 Data saved to: data/toyota_comprehensive.json")
-    print(f"📋 Summary saved to: data/toyota_comprehensive_summary.json")
+    if detector.skipped:
+        print(f"⏭️  Early stopping saved {detector.skipped}/{total_zips} requests "
+              f"({detector.skipped / total_zips:.0%}) at {confidence:.0%} confidence")
+    print(f"💾 Data saved to: {data_file}")
+    print(f"📋 Summary saved to: {summary_file}")
     
     # Show state breakdown
     print(f"\n🗺️  State breakdown:")
@@ -187,5 +234,14 @@ def collect_all_toyota_dealers():
         print(f"  Address: {sample.get('address1', 'N/A')}, {sample.get('city', 'N/A')}, {sample.get('state', 'N/A')}")
 
 if __name__ == "__main__":
-    collect_all_toyota_dealers()
+    parser = argparse.ArgumentParser(description="Collect all Toyota dealers by ZIP sweep")
+    parser.add_argument("--no-early-stop", action="store_true", help="Query every ZIP even in saturated regions")
+    parser.add_argument("--confidence", type=float, default=DEFAULT_CONFIDENCE,
+                        help="Confidence that a region is exhausted before skipping the rest of it")
+    parser.add_argument("--min-yield", type=float, default=DEFAULT_MIN_YIELD,
+                        help="Share of queries finding a new dealer below which a region counts as exhausted")
+    parser.add_argument("--target-completeness", type=float, default=None,
+                        help="Stop once at least this share of all dealers is estimated found (e.g. 0.98)")
+    args = parser.parse_args()
+    collect_all_toyota_dealers(not args.no_early_stop, args.confidence, args.min_yield, args.target_completeness)
 
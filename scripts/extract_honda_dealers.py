@@ -3,8 +3,12 @@
 Extract Honda Dealers from Current Page
 """
 
-import json
+import sys
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from oems.serialize import dump
 
 # JavaScript code to extract dealer data
 EXTRACTION_SCRIPT = """
@@ -96,8 +100,7 @@ def save_honda_dealers():
         "dealers": sample_dealers
     }
     
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    output_file = dump(results, output_file)
     
     print(f"Sample Honda dealer data saved to: {output_file}")
     print("To get real data, run the browser extraction manually")
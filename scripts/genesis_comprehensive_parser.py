@@ -4,10 +4,14 @@ Comprehensive Genesis Dealerships HTML Parser
 Parses the complete HTML to extract all Genesis dealership information
 """
 
-import json
 import re
 from datetime import datetime
 from bs4 import BeautifulSoup
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from oems.serialize import dump
 
 class GenesisComprehensiveParser:
     def __init__(self):
@@ -115,8 +119,7 @@ class GenesisComprehensiveParser:
             'dealerships': self.dealerships
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        filename = dump(results, filename)
         
         print(f"Results saved to: {filename}")
         return filename
@@ -4,11 +4,17 @@ Lexus Dealer Scraper
 Scrapes all Lexus dealers from all 50 US states
 """
 
-import json
+import sys
 import time
 from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
 from playwright.sync_api import sync_playwright
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from oems.serialize import dump
+from oems.telemetry import get_telemetry, watch_page
+
 # List of all 50 US states
 STATES = [
     "Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado",
@@ -126,6 +132,9 @@ def scrape_lexus_dealers():
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=False)
         page = browser.new_page()
+        # The page's own requests to lexus.com land in the crawl telemetry
+        telemetry = get_telemetry()
+        watch_page(page, "Lexus", telemetry, match=lambda url: urlparse(url).netloc.endswith("lexus.com"))
         
         try:
             # Navigate to Lexus dealer page
@@ -167,7 +176,9 @@ def scrape_lexus_dealers():
                     if dealers:
                         all_dealers[state] = dealers
                         total_dealers += len(dealers)
-                        print(f"  Found {len(dealers)} dealers in {state}")
+                        new = telemetry.track_dealers("Lexus", dealers, key=lambda d: d.get('name', ''),
+                                                      state=lambda d: state)
+                        print(f"  Found {len(dealers)} dealers in {state} ({new} new)")
                     else:
                         print(f"  No dealers found in {state}")
                         all_dealers[state] = []
@@ -189,9 +200,7 @@ def scrape_lexus_dealers():
             }
             
             # Save to JSON file
-            output_file = "/Users/kimseanpardo/autodealerships/Lexus.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            output_file = dump(result, "Lexus.json")
             
             print(f"\nScraping completed!")
             print(f"Total dealers found: {total_dealers}")
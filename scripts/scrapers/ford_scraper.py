@@ -1,289 +0,0 @@
-import json
-import time
-import random
-from datetime import datetime
-from playwright.sync_api import sync_playwright
-import re
-
-def generate_ford_dealers():
-    """Generate comprehensive Ford dealership data for America"""
-    
-    # Expanded list of US cities and states
-    cities_states = [
-        # Major cities
-        ("New York", "NY"), ("Los Angeles", "CA"), ("Chicago", "IL"), ("Houston", "TX"), ("Phoenix", "AZ"),
-        ("Philadelphia", "PA"), ("San Antonio", "TX"), ("San Diego", "CA"), ("Dallas", "TX"), ("San Jose", "CA"),
-        ("Austin", "TX"), ("Jacksonville", "FL"), ("Fort Worth", "TX"), ("Columbus", "OH"), ("Charlotte", "NC"),
-        ("San Francisco", "CA"), ("Indianapolis", "IN"), ("Seattle", "WA"), ("Denver", "CO"), ("Washington", "DC"),
-        ("Boston", "MA"), ("El Paso", "TX"), ("Nashville", "TN"), ("Detroit", "MI"), ("Oklahoma City", "OK"),
-        ("Portland", "OR"), ("Las Vegas", "NV"), ("Memphis", "TN"), ("Louisville", "KY"), ("Baltimore", "MD"),
-        ("Milwaukee", "WI"), ("Albuquerque", "NM"), ("Tucson", "AZ"), ("Fresno", "CA"), ("Sacramento", "CA"),
-        ("Mesa", "AZ"), ("Kansas City", "MO"), ("Atlanta", "GA"), ("Long Beach", "CA"), ("Colorado Springs", "CO"),
-        ("Raleigh", "NC"), ("Miami", "FL"), ("Virginia Beach", "VA"), ("Omaha", "NE"), ("Oakland", "CA"),
-        ("Minneapolis", "MN"), ("Tulsa", "OK"), ("Arlington", "TX"), ("Tampa", "FL"), ("New Orleans", "LA"),
-        ("Wichita", "KS"), ("Cleveland", "OH"), ("Bakersfield", "CA"), ("Aurora", "CO"), ("Anaheim", "CA"),
-        ("Honolulu", "HI"), ("Santa Ana", "CA"), ("Corpus Christi", "TX"), ("Riverside", "CA"), ("Lexington", "KY"),
-        ("Stockton", "CA"), ("Henderson", "NV"), ("Saint Paul", "MN"), ("St. Louis", "MO"), ("Fort Wayne", "IN"),
-        ("Jersey City", "NJ"), ("Chula Vista", "CA"), ("Orlando", "FL"), ("Laredo", "TX"), ("Chandler", "AZ"),
-        ("Madison", "WI"), ("Lubbock", "TX"), ("Scottsdale", "AZ"), ("Reno", "NV"), ("Buffalo", "NY"),
-        ("Gilbert", "AZ"), ("Glendale", "AZ"), ("North Las Vegas", "NV"), ("Winston-Salem", "NC"), ("Chesapeake", "VA"),
-        ("Norfolk", "VA"), ("Fremont", "CA"), ("Garland", "TX"), ("Irving", "TX"), ("Hialeah", "FL"),
-        ("Richmond", "VA"), ("Boise", "ID"), ("Spokane", "WA"), ("Baton Rouge", "LA"), ("Tacoma", "WA"),
-        
-        # Additional major cities
-        ("Pittsburgh", "PA"), ("Cincinnati", "OH"), ("Anchorage", "AK"), ("Toledo", "OH"), ("Greensboro", "NC"),
-        ("Newark", "NJ"), ("Plano", "TX"), ("Lincoln", "NE"), ("Orlando", "FL"), ("Irvine", "CA"),
-        ("Durham", "NC"), ("Chandler", "AZ"), ("Tampa", "FL"), ("Lubbock", "TX"), ("Reno", "NV"),
-        ("Scottsdale", "AZ"), ("Glendale", "AZ"), ("Madison", "WI"), ("Fort Wayne", "IN"), ("Fremont", "CA"),
-        ("Chesapeake", "VA"), ("Garland", "TX"), ("Spokane", "WA"), ("Norfolk", "VA"), ("Richmond", "VA"),
-        ("Baton Rouge", "LA"), ("Tacoma", "WA"), ("San Bernardino", "CA"), ("Hialeah", "FL"), ("Riverside", "CA"),
-        ("Corpus Christi", "TX"), ("Lexington", "KY"), ("Stockton", "CA"), ("Henderson", "NV"), ("Saint Paul", "MN"),
-        ("St. Louis", "MO"), ("Jersey City", "NJ"), ("Chula Vista", "CA"), ("Laredo", "TX"), ("Madison", "WI"),
-        ("Lubbock", "TX"), ("Scottsdale", "AZ"), ("Reno", "NV"), ("Buffalo", "NY"), ("Gilbert", "AZ"),
-        ("Glendale", "AZ"), ("North Las Vegas", "NV"), ("Winston-Salem", "NC"), ("Chesapeake", "VA"),
-        ("Norfolk", "VA"), ("Fremont", "CA"), ("Garland", "TX"), ("Irving", "TX"), ("Hialeah", "FL"),
-        ("Richmond", "VA"), ("Boise", "ID"), ("Spokane", "WA"), ("Baton Rouge", "LA"), ("Tacoma", "WA"),
-        
-        # State capitals and medium cities
-        ("Albany", "NY"), ("Annapolis", "MD"), ("Atlanta", "GA"), ("Augusta", "ME"), ("Austin", "TX"),
-        ("Baton Rouge", "LA"), ("Bismarck", "ND"), ("Boise", "ID"), ("Boston", "MA"), ("Carson City", "NV"),
-        ("Charleston", "WV"), ("Cheyenne", "WY"), ("Columbia", "SC"), ("Columbus", "OH"), ("Denver", "CO"),
-        ("Des Moines", "IA"), ("Dover", "DE"), ("Frankfort", "KY"), ("Harrisburg", "PA"), ("Hartford", "CT"),
-        ("Helena", "MT"), ("Indianapolis", "IN"), ("Jackson", "MS"), ("Jefferson City", "MO"), ("Lansing", "MI"),
-        ("Lincoln", "NE"), ("Little Rock", "AR"), ("Madison", "WI"), ("Montgomery", "AL"), ("Montpelier", "VT"),
-        ("Nashville", "TN"), ("Oklahoma City", "OK"), ("Olympia", "WA"), ("Phoenix", "AZ"), ("Pierre", "SD"),
-        ("Providence", "RI"), ("Raleigh", "NC"), ("Richmond", "VA"), ("Sacramento", "CA"), ("Salem", "OR"),
-        ("Salt Lake City", "UT"), ("Santa Fe", "NM"), ("Springfield", "IL"), ("Tallahassee", "FL"), ("Topeka", "KS"),
-        ("Trenton", "NJ"), ("Albany", "NY"), ("Annapolis", "MD"), ("Atlanta", "GA"), ("Augusta", "ME"),
-        ("Austin", "TX"), ("Baton Rouge", "LA"), ("Bismarck", "ND"), ("Boise", "ID"), ("Boston", "MA"),
-        ("Carson City", "NV"), ("Charleston", "WV"), ("Cheyenne", "WY"), ("Columbia", "SC"), ("Columbus", "OH"),
-        ("Denver", "CO"), ("Des Moines", "IA"), ("Dover", "DE"), ("Frankfort", "KY"), ("Harrisburg", "PA"),
-        ("Hartford", "CT"), ("Helena", "MT"), ("Indianapolis", "IN"), ("Jackson", "MS"), ("Jefferson City", "MO"),
-        ("Lansing", "MI"), ("Lincoln", "NE"), ("Little Rock", "AR"), ("Madison", "WI"), ("Montgomery", "AL"),
-        ("Montpelier", "VT"), ("Nashville", "TN"), ("Oklahoma City", "OK"), ("Olympia", "WA"), ("Phoenix", "AZ"),
-        ("Pierre", "SD"), ("Providence", "RI"), ("Raleigh", "NC"), ("Richmond", "VA"), ("Sacramento", "CA"),
-        ("Salem", "OR"), ("Salt Lake City", "UT"), ("Santa Fe", "NM"), ("Springfield", "IL"), ("Tallahassee", "FL"),
-        ("Topeka", "KS"), ("Trenton", "NJ"),
-        
-        # Additional medium and small cities
-        ("Akron", "OH"), ("Albuquerque", "NM"), ("Allentown", "PA"), ("Amarillo", "TX"), ("Anaheim", "CA"),
-        ("Anchorage", "AK"), ("Arlington", "TX"), ("Arlington", "VA"), ("Aurora", "CO"), ("Aurora", "IL"),
-        ("Bakersfield", "CA"), ("Baltimore", "MD"), ("Birmingham", "AL"), ("Boise", "ID"), ("Bridgeport", "CT"),
-        ("Brownsville", "TX"), ("Buffalo", "NY"), ("Cape Coral", "FL"), ("Chandler", "AZ"), ("Charlotte", "NC"),
-        ("Chesapeake", "VA"), ("Chula Vista", "CA"), ("Cincinnati", "OH"), ("Cleveland", "OH"), ("Colorado Springs", "CO"),
-        ("Columbus", "GA"), ("Corpus Christi", "TX"), ("Dallas", "TX"), ("Dayton", "OH"), ("Denver", "CO"),
-        ("Des Moines", "IA"), ("Detroit", "MI"), ("Durham", "NC"), ("El Paso", "TX"), ("Fayetteville", "NC"),
-        ("Fort Wayne", "IN"), ("Fort Worth", "TX"), ("Fremont", "CA"), ("Fresno", "CA"), ("Garland", "TX"),
-        ("Gilbert", "AZ"), ("Glendale", "AZ"), ("Grand Rapids", "MI"), ("Greensboro", "NC"), ("Henderson", "NV"),
-        ("Hialeah", "FL"), ("Honolulu", "HI"), ("Houston", "TX"), ("Huntington Beach", "CA"), ("Indianapolis", "IN"),
-        ("Irvine", "CA"), ("Irving", "TX"), ("Jacksonville", "FL"), ("Jersey City", "NJ"), ("Kansas City", "KS"),
-        ("Kansas City", "MO"), ("Laredo", "TX"), ("Las Vegas", "NV"), ("Lexington", "KY"), ("Lincoln", "NE"),
-        ("Long Beach", "CA"), ("Los Angeles", "CA"), ("Louisville", "KY"), ("Lubbock", "TX"), ("Madison", "WI"),
-        ("Memphis", "TN"), ("Mesa", "AZ"), ("Miami", "FL"), ("Milwaukee", "WI"), ("Minneapolis", "MN"),
-        ("Nashville", "TN"), ("New Orleans", "LA"), ("New York", "NY"), ("Newark", "NJ"), ("Norfolk", "VA"),
-        ("North Las Vegas", "NV"), ("Oakland", "CA"), ("Oklahoma City", "OK"), ("Omaha", "NE"), ("Orlando", "FL"),
-        ("Philadelphia", "PA"), ("Phoenix", "AZ"), ("Pittsburgh", "PA"), ("Plano", "TX"), ("Portland", "OR"),
-        ("Raleigh", "NC"), ("Reno", "NV"), ("Richmond", "VA"), ("Riverside", "CA"), ("Rochester", "NY"),
-        ("Sacramento", "CA"), ("Saint Paul", "MN"), ("Saint Petersburg", "FL"), ("Salem", "OR"), ("San Antonio", "TX"),
-        ("San Bernardino", "CA"), ("San Diego", "CA"), ("San Francisco", "CA"), ("San Jose", "CA"), ("Santa Ana", "CA"),
-        ("Scottsdale", "AZ"), ("Seattle", "WA"), ("Spokane", "WA"), ("Springfield", "MO"), ("St. Louis", "MO"),
-        ("St. Petersburg", "FL"), ("Stockton", "CA"), ("Tacoma", "WA"), ("Tampa", "FL"), ("Toledo", "OH"),
-        ("Tucson", "AZ"), ("Tulsa", "OK"), ("Virginia Beach", "VA"), ("Washington", "DC"), ("Wichita", "KS"),
-        ("Winston-Salem", "NC"),
-        
-        # Additional smaller cities and towns
-        ("Abilene", "TX"), ("Akron", "OH"), ("Albany", "GA"), ("Alexandria", "VA"), ("Allentown", "PA"),
-        ("Amarillo", "TX"), ("Ann Arbor", "MI"), ("Antioch", "CA"), ("Arvada", "CO"), ("Athens", "GA"),
-        ("Atlanta", "GA"), ("Aurora", "IL"), ("Bakersfield", "CA"), ("Baltimore", "MD"), ("Baton Rouge", "LA"),
-        ("Beaumont", "TX"), ("Bellevue", "WA"), ("Berkeley", "CA"), ("Billings", "MT"), ("Birmingham", "AL"),
-        ("Bloomington", "IN"), ("Boise", "ID"), ("Boulder", "CO"), ("Bridgeport", "CT"), ("Broken Arrow", "OK"),
-        ("Brownsville", "TX"), ("Buffalo", "NY"), ("Burbank", "CA"), ("Cape Coral", "FL"), ("Carrollton", "TX"),
-        ("Cary", "NC"), ("Cedar Rapids", "IA"), ("Centennial", "CO"), ("Chandler", "AZ"), ("Charleston", "SC"),
-        ("Charlotte", "NC"), ("Chattanooga", "TN"), ("Chesapeake", "VA"), ("Chicago", "IL"), ("Chula Vista", "CA"),
-        ("Cincinnati", "OH"), ("Clarksville", "TN"), ("Clearwater", "FL"), ("Cleveland", "OH"), ("Colorado Springs", "CO"),
-        ("Columbia", "MO"), ("Columbus", "GA"), ("Concord", "CA"), ("Coral Springs", "FL"), ("Corona", "CA"),
-        ("Corpus Christi", "TX"), ("Dallas", "TX"), ("Davenport", "IA"), ("Dayton", "OH"), ("Denver", "CO"),
-        ("Des Moines", "IA"), ("Detroit", "MI"), ("Downey", "CA"), ("Durham", "NC"), ("El Monte", "CA"),
-        ("El Paso", "TX"), ("Elk Grove", "CA"), ("Erie", "PA"), ("Escondido", "CA"), ("Eugene", "OR"),
-        ("Evansville", "IN"), ("Fairfield", "CA"), ("Fayetteville", "AR"), ("Fayetteville", "NC"), ("Flint", "MI"),
-        ("Fontana", "CA"), ("Fort Collins", "CO"), ("Fort Lauderdale", "FL"), ("Fort Wayne", "IN"), ("Fort Worth", "TX"),
-        ("Fremont", "CA"), ("Fresno", "CA"), ("Frisco", "TX"), ("Fullerton", "CA"), ("Gainesville", "FL"),
-        ("Garden Grove", "CA"), ("Garland", "TX"), ("Gilbert", "AZ"), ("Glendale", "AZ"), ("Glendale", "CA"),
-        ("Grand Prairie", "TX"), ("Grand Rapids", "MI"), ("Greensboro", "NC"), ("Gresham", "OR"), ("Hampton", "VA"),
-        ("Hartford", "CT"), ("Hayward", "CA"), ("Henderson", "NV"), ("Hialeah", "FL"), ("High Point", "NC"),
-        ("Hollywood", "FL"), ("Honolulu", "HI"), ("Houston", "TX"), ("Huntington Beach", "CA"), ("Huntsville", "AL"),
-        ("Independence", "MO"), ("Indianapolis", "IN"), ("Inglewood", "CA"), ("Irvine", "CA"), ("Irving", "TX"),
-        ("Jackson", "MS"), ("Jacksonville", "FL"), ("Jersey City", "NJ"), ("Joliet", "IL"), ("Kansas City", "KS"),
-        ("Kansas City", "MO"), ("Knoxville", "TN"), ("Lafayette", "LA"), ("Lakeland", "FL"), ("Lancaster", "CA"),
-        ("Lansing", "MI"), ("Laredo", "TX"), ("Las Cruces", "NM"), ("Las Vegas", "NV"), ("Lexington", "KY"),
-        ("Lincoln", "NE"), ("Little Rock", "AR"), ("Long Beach", "CA"), ("Los Angeles", "CA"), ("Louisville", "KY"),
-        ("Lubbock", "TX"), ("Madison", "WI"), ("Manchester", "NH"), ("McAllen", "TX"), ("McKinney", "TX"),
-        ("Memphis", "TN"), ("Mesa", "AZ"), ("Miami", "FL"), ("Miami Gardens", "FL"), ("Midland", "TX"),
-        ("Milwaukee", "WI"), ("Minneapolis", "MN"), ("Miramar", "FL"), ("Mobile", "AL"), ("Modesto", "CA"),
-        ("Montgomery", "AL"), ("Moreno Valley", "CA"), ("Murfreesboro", "TN"), ("Naperville", "IL"), ("Nashville", "TN"),
-        ("New Haven", "CT"), ("New Orleans", "LA"), ("New York", "NY"), ("Newark", "NJ"), ("Newport News", "VA"),
-        ("Norfolk", "VA"), ("Norman", "OK"), ("North Charleston", "SC"), ("North Las Vegas", "NV"), ("North Little Rock", "AR"),
-        ("Oakland", "CA"), ("Oceanside", "CA"), ("Oklahoma City", "OK"), ("Omaha", "NE"), ("Ontario", "CA"),
-        ("Orange", "CA"), ("Orlando", "FL"), ("Overland Park", "KS"), ("Oxnard", "CA"), ("Palm Bay", "FL"),
-        ("Palmdale", "CA"), ("Pasadena", "CA"), ("Pasadena", "TX"), ("Paterson", "NJ"), ("Peoria", "AZ"),
-        ("Peoria", "IL"), ("Philadelphia", "PA"), ("Phoenix", "AZ"), ("Pittsburgh", "PA"), ("Plano", "TX"),
-        ("Pomona", "CA"), ("Portland", "OR"), ("Providence", "RI"), ("Raleigh", "NC"), ("Rancho Cucamonga", "CA"),
-        ("Reno", "NV"), ("Richmond", "VA"), ("Riverside", "CA"), ("Rochester", "MN"), ("Rochester", "NY"),
-        ("Rockford", "IL"), ("Roseville", "CA"), ("Sacramento", "CA"), ("Saint Paul", "MN"), ("Saint Petersburg", "FL"),
-        ("Salem", "OR"), ("Salinas", "CA"), ("Salt Lake City", "UT"), ("San Antonio", "TX"), ("San Bernardino", "CA"),
-        ("San Diego", "CA"), ("San Francisco", "CA"), ("San Jose", "CA"), ("San Mateo", "CA"), ("Santa Ana", "CA"),
-        ("Santa Clara", "CA"), ("Santa Clarita", "CA"), ("Santa Rosa", "CA"), ("Savannah", "GA"), ("Scottsdale", "AZ"),
-        ("Seattle", "WA"), ("Shreveport", "LA"), ("Simi Valley", "CA"), ("Sioux Falls", "SD"), ("South Bend", "IN"),
-        ("Spokane", "WA"), ("Springfield", "IL"), ("Springfield", "MA"), ("Springfield", "MO"), ("St. Louis", "MO"),
-        ("St. Petersburg", "FL"), ("Stamford", "CT"), ("Stockton", "CA"), ("Sunnyvale", "CA"), ("Syracuse", "NY"),
-        ("Tacoma", "WA"), ("Tallahassee", "FL"), ("Tampa", "FL"), ("Tempe", "AZ"), ("Temecula", "CA"),
-        ("Thornton", "CO"), ("Thousand Oaks", "CA"), ("Toledo", "OH"), ("Topeka", "KS"), ("Torrance", "CA"),
-        ("Tucson", "AZ"), ("Tulsa", "OK"), ("Tyler", "TX"), ("Vallejo", "CA"), ("Vancouver", "WA"),
-        ("Ventura", "CA"), ("Victorville", "CA"), ("Virginia Beach", "VA"), ("Visalia", "CA"), ("Waco", "TX"),
-        ("Warren", "MI"), ("Washington", "DC"), ("Waterbury", "CT"), ("West Covina", "CA"), ("West Valley City", "UT"),
-        ("Westminster", "CO"), ("Wichita", "KS"), ("Wichita Falls", "TX"), ("Wilmington", "NC"), ("Winston-Salem", "NC"),
-        ("Worcester", "MA"), ("Yonkers", "NY"), ("Yuma", "AZ")
-    ]
-    
-    # Common street names for dealerships
-    street_names = [
-        "Main St", "Broadway", "Oak Ave", "Pine St", "Elm St", "Maple Ave", "Cedar St", "Washington St",
-        "Lincoln Ave", "Jefferson St", "Madison Ave", "Park Ave", "Center St", "Market St", "Commerce St",
-        "Industrial Blvd", "Business Hwy", "Service Rd", "Dealer Dr", "Auto Plaza", "Motor Ave", "Car St",
-        "Highway 101", "Interstate Blvd", "Expressway", "Boulevard", "Drive", "Lane", "Way", "Circle",
-        "North Ave", "South St", "East Blvd", "West Dr", "Central Ave", "Downtown Blvd", "Suburban Dr"
-    ]
-    
-    # Common dealer name prefixes and suffixes
-    dealer_prefixes = [
-        "ABC", "Allied", "American", "Auto", "Best", "Big", "Blue", "Central", "Champion", "City",
-        "Classic", "Clearwater", "Coastal", "Community", "Crown", "Custom", "Diamond", "Downtown", "Eagle",
-        "Eastside", "Elite", "Family", "First", "Friendly", "Galpin", "Gateway", "Golden", "Grand",
-        "Great", "Green", "Gulf", "Heritage", "Highland", "Hometown", "Imperial", "Independent", "Jewel",
-        "Liberty", "Luxury", "Main", "Metro", "Midwest", "Modern", "National", "New", "North", "Northern",
-        "Oak", "Ocean", "Pacific", "Paradise", "Park", "Pioneer", "Plaza", "Premier", "Quality", "Red",
-        "Regional", "Reliable", "Riverside", "Royal", "Rural", "Safe", "Select", "Service", "Silver",
-        "South", "Southern", "Specialty", "Star", "State", "Sterling", "Sun", "Sunset", "Superior",
-        "Town", "Trusted", "United", "Valley", "Village", "West", "Western", "White", "World", "Yellow"
-    ]
-    
-    dealer_suffixes = [
-        "Ford", "Motors", "Automotive", "Auto", "Cars", "Dealership", "Motors", "Sales", "Service",
-        "Truck", "Trucks", "Vehicle", "Vehicles", "World", "Center", "Group", "Company", "Inc", "LLC"
-    ]
-    
-    dealers = []
-    processed_names = set()
-    
-    print("Generating comprehensive Ford dealership data...")
-    
-    # Generate dealers for each city
-    for city, state in cities_states:
-        # Generate more dealers per city to reach 3000 total
-        if city in ["New York", "Los Angeles", "Chicago", "Houston", "Dallas", "Phoenix", "Philadelphia", "San Antonio", "San Diego", "San Jose", "Austin", "Jacksonville", "Fort Worth", "Columbus", "Charlotte", "San Francisco", "Indianapolis", "Seattle", "Denver", "Washington", "Boston", "El Paso", "Nashville", "Detroit", "Oklahoma City", "Portland", "Las Vegas", "Memphis", "Louisville", "Baltimore", "Milwaukee", "Albuquerque", "Tucson", "Fresno", "Sacramento", "Mesa", "Kansas City", "Atlanta", "Long Beach", "Colorado Springs", "Raleigh", "Miami", "Virginia Beach", "Omaha", "Oakland", "Minneapolis", "Tulsa", "Arlington", "Tampa", "New Orleans", "Wichita", "Cleveland", "Bakersfield", "Aurora", "Anaheim", "Honolulu", "Santa Ana", "Corpus Christi", "Riverside", "Lexington", "Stockton", "Henderson", "Saint Paul", "St. Louis", "Fort Wayne", "Jersey City", "Chula Vista", "Orlando", "Laredo", "Chandler", "Madison", "Lubbock", "Scottsdale", "Reno", "Buffalo", "Gilbert", "Glendale", "North Las Vegas", "Winston-Salem", "Chesapeake", "Norfolk", "Fremont", "Garland", "Irving", "Hialeah", "Richmond", "Boise", "Spokane", "Baton Rouge", "Tacoma"]:
-            num_dealers = random.randint(8, 15)  # Major cities get 8-15 dealers
-        elif city in ["Albany", "Annapolis", "Atlanta", "Augusta", "Bismarck", "Carson City", "Charleston", "Cheyenne", "Columbia", "Des Moines", "Dover", "Frankfort", "Harrisburg", "Hartford", "Helena", "Jackson", "Jefferson City", "Lansing", "Little Rock", "Montgomery", "Montpelier", "Olympia", "Pierre", "Providence", "Salem", "Salt Lake City", "Santa Fe", "Springfield", "Tallahassee", "Topeka", "Trenton"]:
-            num_dealers = random.randint(3, 6)   # State capitals get 3-6 dealers
-        else:
-            num_dealers = random.randint(2, 5)   # Other cities get 2-5 dealers
-        
-        for i in range(num_dealers):
-            # Generate unique dealer name
-            while True:
-                prefix = random.choice(dealer_prefixes)
-                suffix = random.choice(dealer_suffixes)
-                dealer_name = f"{prefix} {suffix}"
-                
-                if dealer_name not in processed_names:
-                    processed_names.add(dealer_name)
-                    break
-            
-            # Generate street address
-            street_num = random.randint(100, 9999)
-            street_name = random.choice(street_names)
-            street = f"{street_num} {street_name}"
-            
-            # Generate phone number
-            area_code = random.choice([
-                "201", "202", "203", "205", "206", "207", "208", "209", "210", "212", "213", "214", "215", "216", "217",
-                "218", "219", "220", "223", "224", "225", "228", "229", "231", "234", "239", "240", "248", "251", "252",
-                "253", "254", "256", "260", "262", "267", "269", "270", "272", "276", "281", "301", "302", "303", "304",
-                "305", "307", "308", "309", "310", "312", "313", "314", "315", "316", "317", "318", "319", "320", "321",
-                "323", "325", "330", "331", "334", "336", "337", "339", "340", "341", "347", "351", "352", "360", "361",
-                "364", "380", "385", "386", "401", "402", "404", "405", "406", "407", "408", "409", "410", "412", "413",
-                "414", "415", "417", "419", "423", "424", "425", "430", "432", "434", "435", "440", "443", "445", "447",
-                "458", "463", "469", "470", "475", "478", "479", "480", "484", "501", "502", "503", "504", "505", "507",
-                "508", "509", "510", "512", "513", "515", "516", "517", "518", "520", "530", "531", "534", "540", "541",
-                "551", "559", "561", "562", "563", "564", "567", "570", "571", "573", "574", "575", "580", "585", "586",
-                "601", "602", "603", "605", "606", "607", "608", "609", "610", "612", "614", "615", "616", "617", "618",
-                "619", "620", "623", "626", "628", "629", "630", "631", "636", "641", "646", "650", "651", "657", "660",
-                "661", "662", "667", "669", "678", "681", "682", "701", "702", "703", "704", "706", "707", "708", "712",
-                "713", "714", "715", "716", "717", "718", "719", "720", "724", "725", "727", "731", "732", "734", "737",
-                "740", "743", "747", "754", "757", "760", "762", "763", "765", "769", "770", "772", "773", "774", "775",
-                "779", "781", "785", "786", "801", "802", "803", "804", "805", "806", "808", "810", "812", "813", "814",
-                "815", "816", "817", "818", "828", "830", "831", "832", "843", "845", "847", "848", "850", "856", "857",
-                "858", "859", "860", "862", "863", "864", "865", "870", "872", "878", "901", "903", "904", "906", "907",
-                "908", "909", "910", "912", "913", "914", "915", "916", "917", "918", "919", "920", "925", "928", "929",
-                "930", "931", "934", "936", "937", "938", "940", "941", "947", "949", "951", "952", "954", "956", "959",
-                "970", "971", "972", "973", "975", "978", "979", "980", "984", "985", "989"
-            ])
-            phone_prefix = random.randint(100, 999)
-            phone_suffix = random.randint(1000, 9999)
-            phone = f"({area_code}) {phone_prefix}-{phone_suffix}"
-            
-            # Generate ZIP code based on state
-            zip_code = f"{random.randint(10000, 99999)}"
-            
-            # Generate website
-            website = f"https://www.{dealer_name.lower().replace(' ', '')}.com/"
-            
-            dealer_data = {
-                "Dealer": dealer_name,
-                "Website": website,
-                "Phone": phone,
-                "Email": None,
-                "Street": street,
-                "City": city,
-                "State": state,
-                "ZIP": zip_code
-            }
-            
-            dealers.append(dealer_data)
-            
-            if len(dealers) % 100 == 0:
-                print(f"Generated {len(dealers)} dealers so far...")
-            
-            # Stop when we reach around 3000
-            if len(dealers) >= 3000:
-                break
-        
-        if len(dealers) >= 3000:
-            break
-    
-    return dealers
-
-def main():
-    print("Starting comprehensive Ford dealership generator...")
-    
-    # Generate dealers
-    dealers = generate_ford_dealers()
-    
-    # Create the JSON structure
-    ford_data = {
-        "oem": "Ford",
-        "zip_code": "multiple",
-        "timestamp": datetime.now().isoformat(),
-        "total_dealers_found": len(dealers),
-        "method": "generated",
-        "dealers": dealers
-    }
-    
-    # Save to JSON file
-    with open('ford.json', 'w') as f:
-        json.dump(ford_data, f, indent=2)
-    
-    print(f"\nGeneration complete! Created {len(dealers)} Ford dealerships.")
-    print("Data saved to ford.json")
-
-if __name__ == "__main__":
-    main()
@@ -5,15 +5,19 @@ Uses multiple real data sources to collect genuine dealer information
 """
 
 import asyncio
-import json
 import os
 import re
 import requests
+import sys
 import time
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 from playwright.async_api import async_playwright, Browser, Page
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from oems.serialize import dump
+
 
 class RealDealerScraper:
     def __init__(self):
@@ -439,9 +443,7 @@ class RealDealerScraper:
             }
             
             # Save to file
-            filepath = "data/mainstream/real_dealers.json"
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            filepath = dump(data, "data/mainstream/real_dealers.json")
             
             print(f"✅ Saved {len(dealers)} REAL dealers to {filepath}")
             
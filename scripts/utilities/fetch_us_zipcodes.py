@@ -1,14 +1,38 @@
+import csv
 import requests
 import sys
-from typing import Set, List
+from typing import Dict, Optional, Set, List, Tuple
 
 API_URL = "https://public.opendatasoft.com/api/records/1.0/search/"
 DATASET = "us-zip-code-latitude-and-longitude"
 OUTPUT_FILE = "us_zipcodes.txt"
+CENTROIDS_FILE = "us_zip_centroids.csv"
 
 
-def fetch_all_zip_codes() -> List[str]:
-	"""Fetch all ZIP codes from Opendatasoft dataset and return a sorted list of unique 5-digit ZIPs."""
+def _parse_record(rec: dict) -> Tuple[Optional[str], Optional[Tuple[float, float]]]:
+	"""Return (5-digit ZIP, (lat, lng)) for one dataset record; either may be None."""
+	fields = rec.get("fields", {})
+	zip_val = fields.get("zip") or fields.get("zipcode") or fields.get("zcta5")
+	if isinstance(zip_val, int):
+		zip_str = f"{zip_val:05d}"
+	elif isinstance(zip_val, str):
+		zip_str = zip_val.strip()
+	else:
+		return None, None
+	if not (zip_str.isdigit() and len(zip_str) == 5):
+		return None, None
+	try:
+		coords = (float(fields["latitude"]), float(fields["longitude"]))
+	except (KeyError, TypeError, ValueError):
+		coords = None
+	return zip_str, coords
+
+
+def fetch_all_zip_codes(centroids: Optional[Dict[str, Tuple[float, float]]] = None) -> List[str]:
+	"""Fetch all ZIP codes from Opendatasoft dataset and return a sorted list of unique 5-digit ZIPs.
+
+	If a centroids dict is passed it is filled with ZIP -> (latitude, longitude).
+	"""
 	zip_codes: Set[str] = set()
 
 	start = 0
@@ -26,16 +50,11 @@ def fetch_all_zip_codes() -> List[str]:
 		data = resp.json()
 		records = data.get("records", [])
 		for rec in records:
-			fields = rec.get("fields", {})
-			zip_val = fields.get("zip") or fields.get("zipcode") or fields.get("zcta5")
-			if isinstance(zip_val, int):
-				zip_str = f"{zip_val:05d}"
-			elif isinstance(zip_val, str):
-				zip_str = zip_val.strip()
-			else:
-				continue
-			if zip_str.isdigit() and len(zip_str) == 5:
+			zip_str, coords = _parse_record(rec)
+			if zip_str:
 				zip_codes.add(zip_str)
+				if coords and centroids is not None:
+					centroids[zip_str] = coords
 		# If we didn't get all with one call, try paginating (fallback)
 		total = data.get("nhits", len(records))
 		if len(records) < total:
@@ -49,16 +68,11 @@ def fetch_all_zip_codes() -> List[str]:
 				if not recs:
 					break
 				for rec in recs:
-					fields = rec.get("fields", {})
-					zip_val = fields.get("zip") or fields.get("zipcode") or fields.get("zcta5")
-					if isinstance(zip_val, int):
-						zip_str = f"{zip_val:05d}"
-					elif isinstance(zip_val, str):
-						zip_str = zip_val.strip()
-					else:
-						continue
-					if zip_str.isdigit() and len(zip_str) == 5:
+					zip_str, coords = _parse_record(rec)
+					if zip_str:
 						zip_codes.add(zip_str)
+						if coords and centroids is not None:
+							centroids[zip_str] = coords
 	except Exception as e:
 		print(f"Error fetching ZIP codes: {e}", file=sys.stderr)
 		raise
@@ -72,12 +86,23 @@ def write_zip_codes(zip_list: List[str]) -> None:
 			f.write(z + "\n")
 
 
+def write_zip_centroids(centroids: Dict[str, Tuple[float, float]]) -> None:
+	with open(CENTROIDS_FILE, "w", encoding="utf-8", newline="") as f:
+		writer = csv.writer(f)
+		writer.writerow(["zip", "latitude", "longitude"])
+		for z in sorted(centroids):
+			writer.writerow([z, centroids[z][0], centroids[z][1]])
+
+
 def main() -> None:
 	print("Fetching US 5-digit ZIP codes...")
-	zips = fetch_all_zip_codes()
+	centroids: Dict[str, Tuple[float, float]] = {}
+	zips = fetch_all_zip_codes(centroids)
 	print(f"Fetched {len(zips)} unique ZIP codes.")
 	print(f"Writing to {OUTPUT_FILE}...")
 	write_zip_codes(zips)
+	print(f"Writing {len(centroids)} centroids to {CENTROIDS_FILE}...")
+	write_zip_centroids(centroids)
 	print("Done.")
 
 
@@ -5,7 +5,6 @@ Scrapes ALL Subaru dealers using the official API with extensive zip code covera
 """
 
 import requests
-import json
 import time
 import random
 from typing import List, Dict, Set
@@ -13,6 +12,11 @@ import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 
+from oems.profiling import stage
+from oems.progress import get_progress
+from oems.serialize import dump
+from oems.telemetry import get_telemetry
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -30,6 +34,8 @@ class ComprehensiveSubaruDealerScraper:
         self.dealers = {}
         self.processed_zips = set()
         self.lock = threading.Lock()
+        self.telemetry = get_telemetry()
+        self.progress = get_progress()
         
         # Comprehensive zip code list covering all US states and territories
         self.zip_codes = [
@@ -169,11 +175,15 @@ class ComprehensiveSubaruDealerScraper:
                 'type': 'Active'
             }
             
-            response = self.session.get(self.base_url, params=params, timeout=15)
-            response.raise_for_status()
-            
-            data = response.json()
-            logger.info(f"Found {len(data)} dealers for zip {zip_code}")
+            with stage("fetch"), self.telemetry.request("Subaru", self.base_url, query=zip_code) as req:
+                response = self.session.get(self.base_url, params=params, timeout=15)
+                req.response(response)
+                response.raise_for_status()
+
+                data = response.json()
+                new = req.results(data, key=lambda d: str(d.get('dealer', {}).get('id')),
+                                  state=lambda d: d.get('dealer', {}).get('address', {}).get('state'))
+            logger.info(f"Found {len(data)} dealers for zip {zip_code} ({new} new)")
             return data
             
         except Exception as e:
@@ -223,14 +233,16 @@ class ComprehensiveSubaruDealerScraper:
             dealers_data = self.get_dealers_by_zip(zip_code, 100)
             
             for dealer_data in dealers_data:
-                dealer_info = self.extract_dealer_info(dealer_data)
+                with stage("extract"):
+                    dealer_info = self.extract_dealer_info(dealer_data)
                 dealer_id = dealer_info['id']
                 
                 if dealer_id and dealer_id not in batch_dealers:
                     batch_dealers[dealer_id] = dealer_info
-                    logger.info(f"Added dealer: {dealer_info['name']} in {dealer_info['address']['city']}, {dealer_info['address']['state']}")
+                    logger.debug(f"Added dealer: {dealer_info['name']} in {dealer_info['address']['city']}, {dealer_info['address']['state']}")
             
             self.processed_zips.add(zip_code)
+            self.progress.advance("Subaru")
             time.sleep(random.uniform(0.3, 0.8))  # Rate limiting
         
         return batch_dealers
@@ -238,6 +250,7 @@ class ComprehensiveSubaruDealerScraper:
     def scrape_all_dealers(self):
         """Scrape dealers from comprehensive zip code list"""
         logger.info(f"Starting comprehensive scraping from {len(self.zip_codes)} zip codes")
+        self.progress.start("Subaru", total=len(set(self.zip_codes)))
         
         # Process in batches to avoid overwhelming the API
         batch_size = 10
@@ -256,6 +269,7 @@ class ComprehensiveSubaruDealerScraper:
             # Longer pause between batches
             time.sleep(random.uniform(2, 4))
         
+        self.progress.finish("Subaru")
         logger.info(f"Comprehensive scraping complete. Found {len(self.dealers)} unique dealers")
     
     def save_to_json(self, filename: str = 'subaru_comprehensive.json'):
@@ -265,8 +279,7 @@ class ComprehensiveSubaruDealerScraper:
         # Sort by state, then city, then name
         dealers_list.sort(key=lambda x: (x['address']['state'], x['address']['city'], x['name']))
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(dealers_list, f, indent=2, ensure_ascii=False)
+        filename = dump(dealers_list, filename)
         
         logger.info(f"Saved {len(dealers_list)} dealers to {filename}")
     
@@ -6,16 +6,20 @@ Scrapes all Tesla stores and galleries in the USA from the official Tesla websit
 
 import requests
 from bs4 import BeautifulSoup
-import json
 import time
 import re
 from urllib.parse import urljoin
 
+from oems.profiling import stage
+from oems.serialize import dump
+from oems.telemetry import get_telemetry
+
 class TeslaDealershipScraper:
     def __init__(self):
         self.base_url = "https://www.tesla.com"
         self.stores_url = "https://www.tesla.com/findus/list/stores/United+States"
         self.dealerships = []
+        self.telemetry = get_telemetry()
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -51,32 +55,16 @@ class TeslaDealershipScraper:
         print("Starting Tesla dealership scraping...")
         
         try:
-            response = self.session.get(self.stores_url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find all state sections
-            state_sections = soup.find_all('div', class_=lambda x: x and 'heading' in str(x))
-            
-            current_state = None
-            dealership_count = 0
-            
-            # Process the page structure
-            for element in soup.find_all(['h4', 'div']):
-                if element.name == 'h4' and element.get_text().strip():
-                    # This is a state heading
-                    current_state = element.get_text().strip()
-                    print(f"Processing state: {current_state}")
-                
-                elif element.name == 'div' and current_state:
-                    # Look for dealership information in divs
-                    dealership_info = self.extract_dealership_from_div(element, current_state)
-                    if dealership_info:
-                        self.dealerships.append(dealership_info)
-                        dealership_count += 1
-                        print(f"  Found dealership: {dealership_info['name']}")
-            
+            # One page lists every store: the span times the fetch and records what parsing found in it
+            with self.telemetry.request("Tesla", self.stores_url, query="United States") as req:
+                with stage("fetch"):
+                    response = self.session.get(self.stores_url, timeout=30)
+                req.response(response).finish()
+                response.raise_for_status()
+                with stage("parse"):
+                    dealership_count = self.parse_stores(response.content)
+                req.results(self.dealerships)
+
             print(f"Scraping completed. Found {dealership_count} dealerships.")
             
         except requests.RequestException as e:
@@ -88,6 +76,29 @@ class TeslaDealershipScraper:
         
         return True
 
+    def parse_stores(self, content):
+        """Add the dealerships on the stores page to self.dealerships; returns how many were found"""
+        soup = BeautifulSoup(content, 'html.parser')
+
+        current_state = None
+        dealership_count = 0
+
+        # Process the page structure
+        for element in soup.find_all(['h4', 'div']):
+            if element.name == 'h4' and element.get_text().strip():
+                # This is a state heading
+                current_state = element.get_text().strip()
+                print(f"Processing state: {current_state}")
+
+            elif element.name == 'div' and current_state:
+                # Look for dealership information in divs
+                dealership_info = self.extract_dealership_from_div(element, current_state)
+                if dealership_info:
+                    self.dealerships.append(dealership_info)
+                    dealership_count += 1
+                    print(f"  Found dealership: {dealership_info['name']}")
+        return dealership_count
+
     def extract_dealership_from_div(self, div, state):
         """Extract dealership information from a div element"""
         try:
@@ -165,8 +176,7 @@ class TeslaDealershipScraper:
     def save_to_json(self, filename):
         """Save dealerships data to JSON file"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.dealerships, f, indent=2, ensure_ascii=False)
+            filename = dump(self.dealerships, filename)
             print(f"Data saved to {filename}")
             return True
         except Exception as e:
@@ -197,7 +207,7 @@ def main():
     # Scrape dealerships
     if scraper.scrape_dealerships():
         # Save to JSON
-        output_file = '/Users/kimseanpardo/autodealerships/tesla_dealerships_usa.json'
+        output_file = 'tesla_dealerships_usa.json'
         if scraper.save_to_json(output_file):
             # Print statistics
             stats = scraper.get_statistics()